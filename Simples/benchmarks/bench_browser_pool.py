@@ -0,0 +1,61 @@
+"""
+Benchmark: un lanzamiento de navegador por prueba vs. pool de navegadores de sesión.
+
+Ejecuta la suite 'Simples/test/test_textBox.py' dos veces en subprocesos independientes,
+una con el pool deshabilitado (BROWSER_POOL=0, comportamiento anterior) y otra con el pool
+habilitado, y compara el tiempo total, el número de pruebas y los lanzamientos de navegador.
+
+Uso (desde la raíz del proyecto):
+    python -m Simples.benchmarks.bench_browser_pool
+"""
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SUITE = os.path.join("Simples", "test", "test_textBox.py")
+
+def ejecutar_suite(pool_habilitado: bool) -> Dict[str, Optional[float]]:
+    """
+    Ejecuta la suite en un subproceso y devuelve duración, pruebas ejecutadas y lanzamientos de navegador.
+    """
+    env = dict(os.environ, BROWSER_POOL="1" if pool_habilitado else "0")
+    inicio = time.perf_counter()
+    proceso = subprocess.run(
+        [sys.executable, "-m", "pytest", SUITE, "-q", "-p", "no:cacheprovider"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    duracion = time.perf_counter() - inicio
+
+    salida = proceso.stdout
+    lanzamientos = re.search(r"Lanzamientos de navegador: (\d+)", salida)
+    pruebas = re.search(r"(\d+) passed", salida)
+    fallos = re.search(r"(\d+) failed", salida)
+    return {
+        "duracion_s": duracion,
+        "pruebas": int(pruebas.group(1)) if pruebas else 0,
+        "fallos": int(fallos.group(1)) if fallos else 0,
+        "lanzamientos": int(lanzamientos.group(1)) if lanzamientos else None,
+    }
+
+def main() -> int:
+    resultados = {
+        "lanzamiento por prueba": ejecutar_suite(pool_habilitado=False),
+        "pool de sesión": ejecutar_suite(pool_habilitado=True),
+    }
+
+    print(f"\n{'Modo':<25}{'Duración (s)':>15}{'Pruebas':>10}{'Fallos':>10}{'Lanzamientos':>15}")
+    for modo, r in resultados.items():
+        print(f"{modo:<25}{r['duracion_s']:>15.2f}{r['pruebas']:>10}{r['fallos']:>10}{str(r['lanzamientos']):>15}")
+
+    base = resultados["lanzamiento por prueba"]["duracion_s"]
+    pool = resultados["pool de sesión"]["duracion_s"]
+    if pool:
+        print(f"\nAceleración con el pool: {base / pool:.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
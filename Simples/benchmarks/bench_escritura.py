@@ -0,0 +1,136 @@
+"""
+Benchmark: escritura de un archivo de resultados de N líneas con el enfoque anterior de 'escribir_texto'
+(`delimiter.join(content)` y una única escritura) frente a la escritura por bloques actual.
+
+Variantes (todas generan las mismas N líneas de ~80 caracteres y las escriben separadas por '\\n'):
+- join:                 lista de líneas, join y un solo write (comportamiento anterior de escribir_texto).
+- bloques (lista):      escribir_texto() con la misma lista.
+- bloques (generador):  escribir_texto() con un generador de líneas (sin lista en memoria).
+- bloques+atómico:      ídem con atomico=True (archivo temporal + os.replace).
+- bloques+gzip:         ídem con comprimir=True.
+
+Para cada variante se mide el tiempo (mínimo y p50 de varias repeticiones, con el harness de benchmarks), el
+rendimiento en MB/s de texto escrito y, ejecutándola una vez en un proceso aparte, el pico de memoria residente
+(RSS) que añade sobre el proceso ya preparado: en 'join' crece con el tamaño del archivo (la lista y además
+el texto unido) y con un generador escrito por bloques se mantiene plano.
+
+Uso (desde la raíz del proyecto):
+    python -m Simples.benchmarks.bench_escritura
+    python -m Simples.benchmarks.bench_escritura --lineas 100000,1000000,3000000 --repeticiones 3
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Iterator, Optional
+
+from Simples.benchmarks.bench_helpers import _PaginaSinNavegador
+from Simples.benchmarks.harness import medir
+from Simples.pages.base_page import Funciones_Globales
+from Simples.utils import config
+from Simples.utils.logger import setup_logger
+
+LINEAS = (100_000, 1_000_000)
+
+def generar_lineas(n: int) -> Iterator[str]:
+    for i in range(n):
+        yield f"{i};Nombre{i};Apellido{i};{5000000000 + i};correo{i}@ejemplo.com;{i * 1.5:.2f};OK"
+
+def escribir_con_join(ruta: str, content: list, delimiter: str) -> None:
+    # Comportamiento anterior de escribir_texto: todo el contenido unido en memoria antes de escribir
+    text_to_write = delimiter.join(content)
+    with open(ruta, "w", encoding="utf-8") as file:
+        file.write(text_to_write)
+
+def variantes(fg: Funciones_Globales, directorio: str, n: int) -> dict:
+    ruta = os.path.join(directorio, f"resultados_{n}.txt")
+    return {
+        "join": lambda: escribir_con_join(ruta, list(generar_lineas(n)), "\n"),
+        "bloques (lista)": lambda: fg.escribir_texto(ruta, list(generar_lineas(n)), delimiter="\n"),
+        "bloques (generador)": lambda: fg.escribir_texto(ruta, generar_lineas(n), delimiter="\n"),
+        "bloques+atómico": lambda: fg.escribir_texto(ruta, generar_lineas(n), delimiter="\n", atomico=True),
+        "bloques+gzip": lambda: fg.escribir_texto(ruta + ".gz", generar_lineas(n), delimiter="\n", comprimir=True),
+    }
+
+def preparar() -> Funciones_Globales:
+    config.establecer_perfil("ci-fast")
+    setup_logger(name="Funciones_Globales", console_level=logging.WARNING, file_level=logging.INFO)
+    return Funciones_Globales(_PaginaSinNavegador())
+
+def _reiniciar_pico_rss() -> None:
+    # En Linux el pico de getrusage se hereda del proceso padre: se reinicia el de /proc (VmHWM) si está disponible
+    try:
+        with open("/proc/self/clear_refs", "w") as archivo:
+            archivo.write("5")
+    except OSError:
+        pass
+
+def _rss_pico_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/status") as archivo:
+            for linea in archivo:
+                if linea.startswith("VmHWM:"):
+                    return int(linea.split()[1]) / 1024 # KiB
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError: # Windows: sin getrusage
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024 # bytes en macOS, KiB en Linux
+
+def medir_rss(variante: str, n: int, directorio: str) -> Optional[float]:
+    """
+    Ejecuta la variante una vez en un proceso nuevo y devuelve cuánto RSS pico (MB) añadió sobre el del proceso
+    ya preparado (None si el sistema no permite medirlo).
+    """
+    resultado = subprocess.run([sys.executable, "-m", "Simples.benchmarks.bench_escritura", "--rss-variante", variante,
+                                "--lineas", str(n), "--directorio", directorio],
+                               capture_output=True, text=True, check=True)
+    salida = resultado.stdout.strip().splitlines()[-1]
+    return None if salida == "n/d" else float(salida)
+
+def _ejecutar_variante_rss(variante: str, n: int, directorio: str) -> None:
+    fg = preparar()
+    funcion = variantes(fg, directorio, n)[variante]
+    _reiniciar_pico_rss()
+    antes = _rss_pico_mb()
+    funcion()
+    despues = _rss_pico_mb()
+    print("n/d" if antes is None else f"{despues - antes:.1f}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de escribir_texto: join frente a escritura por bloques.")
+    parser.add_argument("--lineas", default=",".join(map(str, LINEAS)), help="Tamaños separados por comas.")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones medidas por variante.")
+    parser.add_argument("--rss-variante", help=argparse.SUPPRESS) # Uso interno: ejecución aislada para medir RSS
+    parser.add_argument("--directorio", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    tamanios = [int(t) for t in args.lineas.split(",") if t.strip()]
+
+    if args.rss_variante:
+        _ejecutar_variante_rss(args.rss_variante, tamanios[0], args.directorio)
+        return 0
+
+    fg = preparar()
+    print(f"\n{'Líneas':>10}  {'Variante':<22}{'MB texto':>10}{'min (ms)':>12}{'p50 (ms)':>12}{'MB/s':>9}{'RSS añadido (MB)':>19}")
+    with tempfile.TemporaryDirectory(prefix="bench_escritura_") as directorio:
+        for n in tamanios:
+            tamano_mb = sum(len(linea.encode("utf-8")) + 1 for linea in generar_lineas(n)) / (1024 * 1024)
+            for nombre, funcion in variantes(fg, directorio, n).items():
+                resumen = medir(funcion, args.repeticiones, calentamiento=0)
+                rss = medir_rss(nombre, n, directorio)
+                rss_texto = "n/d" if rss is None else f"{rss:.1f}"
+                print(f"{n:>10}  {nombre:<22}{tamano_mb:>10.1f}{resumen['min']:>12.1f}{resumen['p50']:>12.1f}"
+                      f"{tamano_mb / (resumen['min'] / 1000):>9.1f}{rss_texto:>19}", flush=True)
+            with open(os.path.join(directorio, f"resultados_{n}.txt"), encoding="utf-8") as archivo:
+                if sum(1 for _ in archivo) != n:
+                    print(f"❌ El archivo de {n} líneas no tiene las líneas esperadas.", file=sys.stderr)
+                    return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+Benchmark de los helpers más usados de 'Funciones_Globales' contra datos y páginas locales,
+con comparación contra una línea base guardada en JSON.
+
+Casos (a varios tamaños: 10, 1 000 y 10 000 filas/opciones):
+- lectores de archivos de datos: num_Filas_csv, dato_Columna_csv, num_Filas_excel, dato_Columna_excel,
+  leer_json, iterar_json (primer elemento), leer_json_columnar, leer_texto y leer_xml, sobre archivos generados
+  en un directorio temporal.
+- helpers de navegador (Chromium headless contra el sitio local de pruebas, sin red):
+  hacer_click_en_elemento, rellenar_campo_de_texto, presionar_Tab_y_verificar_foco, los helpers de tabla
+  (obtener_dimensiones_tabla, verificar_encabezados_tabla, busqueda_estricta_imprimir_fila,
+  verificar_precios_son_numeros) y los de desplegables (obtener_valores_dropdown, seleccionar_opcion_por_valor).
+  Si los navegadores de Playwright no están instalados, estos casos se omiten.
+
+Se ejecuta con el perfil 'ci-fast' (sin slow_mo, pausas, resaltado ni capturas) para medir el coste
+de los helpers y no el de las esperas de demostración. Si algún caso empeora más del umbral respecto
+a la línea base ('linea_base_helpers.json'), o si algún caso medido no tiene valor en ella (salvo con
+'--permitir-sin-linea-base'), el proceso termina con código 1. La línea base solo es comparable en la
+máquina en la que se generó: regenérala con '--actualizar-linea-base'. La línea base incluida solo tiene
+los lectores de archivos: los casos de navegador fallan hasta que se genera en una máquina con Chromium.
+
+Uso (desde la raíz del proyecto):
+    python -m Simples.benchmarks.bench_helpers
+    python -m Simples.benchmarks.bench_helpers --filtro csv --tamanios 10,1000
+    python -m Simples.benchmarks.bench_helpers --actualizar-linea-base
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import List
+
+import openpyxl
+
+from Simples.pages.base_page import Funciones_Globales
+from Simples.benchmarks.harness import (CasoBenchmark, UMBRAL_REGRESION, cargar_linea_base, comparar,
+                                        ejecutar_casos, guardar_linea_base, imprimir_informe)
+from Simples.utils import config
+from Simples.utils.logger import setup_logger
+
+RUTA_LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base_helpers.json")
+TAMANIOS = (10, 1000, 10000)
+COLUMNAS = ("id", "nombre", "email", "precio")
+HOJA = "Datos"
+
+class _PaginaSinNavegador:
+    """
+    Objeto con lo que usa el constructor de 'Funciones_Globales' ('page.context.on') para medir
+    los lectores de archivos, que no interactúan con el navegador.
+    """
+
+    class _Contexto:
+        def on(self, evento, manejador):
+            pass
+
+    context = _Contexto()
+
+def _fila(i: int) -> list:
+    return [i, f"Usuario {i}", f"usuario{i}@example.com", f"{(i * 7919) % 100000 / 100:.2f}"]
+
+def generar_archivos(directorio: str, filas: int) -> dict:
+    """
+    Genera los archivos de datos (CSV, XLSX, JSON, XML y TXT) con 'filas' filas de datos y devuelve sus rutas.
+    """
+    base = os.path.join(directorio, f"datos_{filas}")
+    rutas = {extension: f"{base}.{extension}" for extension in ("csv", "xlsx", "json", "xml", "txt")}
+
+    with open(rutas["csv"], "w", encoding="utf-8", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(COLUMNAS)
+        escritor.writerows(_fila(i) for i in range(1, filas + 1))
+
+    libro = openpyxl.Workbook(write_only=True)
+    hoja = libro.create_sheet(HOJA)
+    hoja.append(COLUMNAS)
+    for i in range(1, filas + 1):
+        hoja.append(_fila(i))
+    libro.save(rutas["xlsx"])
+
+    with open(rutas["json"], "w", encoding="utf-8") as archivo:
+        json.dump([dict(zip(COLUMNAS, _fila(i))) for i in range(1, filas + 1)], archivo)
+
+    raiz = ET.Element("usuarios")
+    for i in range(1, filas + 1):
+        usuario = ET.SubElement(raiz, "usuario", id=str(i))
+        for columna, valor in zip(COLUMNAS[1:], _fila(i)[1:]):
+            ET.SubElement(usuario, columna).text = str(valor)
+    ET.ElementTree(raiz).write(rutas["xml"], encoding="utf-8", xml_declaration=True)
+
+    with open(rutas["txt"], "w", encoding="utf-8") as archivo:
+        archivo.writelines(f"{';'.join(map(str, _fila(i)))}\n" for i in range(1, filas + 1))
+    return rutas
+
+def casos_archivos(fg, directorio: str, tamanios) -> List[CasoBenchmark]:
+    """
+    Casos de los lectores de archivos de datos (la celda leída es siempre la de la última fila).
+    """
+    casos = []
+    for n in tamanios:
+        r = generar_archivos(directorio, n)
+        casos += [
+            CasoBenchmark(f"num_Filas_csv[{n}]", lambda r=r: fg.num_Filas_csv(r["csv"], has_header=True)),
+            CasoBenchmark(f"dato_Columna_csv[{n}]", lambda r=r, n=n: fg.dato_Columna_csv(r["csv"], n, 3, has_header=True)),
+            CasoBenchmark(f"num_Filas_excel[{n}]", lambda r=r: fg.num_Filas_excel(r["xlsx"], HOJA, has_header=True)),
+            CasoBenchmark(f"dato_Columna_excel[{n}]", lambda r=r, n=n: fg.dato_Columna_excel(r["xlsx"], HOJA, n, "email", has_header_excel=True)),
+            CasoBenchmark(f"leer_json[{n}]", lambda r=r: fg.leer_json(r["json"])),
+            CasoBenchmark(f"iterar_json_primero[{n}]", lambda r=r: next(fg.iterar_json(r["json"]))),
+            CasoBenchmark(f"leer_json_columnar[{n}]", lambda r=r: fg.leer_json_columnar(r["json"]).columna("email")[-1]),
+            CasoBenchmark(f"leer_texto[{n}]", lambda r=r: fg.leer_texto(r["txt"], delimiter=";")),
+            CasoBenchmark(f"leer_xml[{n}]", lambda r=r: fg.leer_xml(r["xml"])),
+        ]
+    return casos
+
+def casos_navegador(fg, page, url: str, directorio: str, tamanios) -> List[CasoBenchmark]:
+    """
+    Casos de los helpers de navegador contra el sitio local. Cada caso navega a su página en 'preparar'.
+    """
+    def abrir(ruta: str):
+        return lambda: page.goto(f"{url}{ruta}", wait_until="domcontentloaded")
+
+    def tab_a_email():
+        page.focus("#userName")
+        fg.presionar_Tab_y_verificar_foco("#userEmail", "bench_tab", directorio)
+
+    casos = [
+        CasoBenchmark("hacer_click_en_elemento", lambda: fg.hacer_click_en_elemento("#submit", "bench_click", directorio), abrir("/text-box")),
+        CasoBenchmark("rellenar_campo_de_texto", lambda: fg.rellenar_campo_de_texto("#userName", "Usuario de prueba", "bench_rellenar", directorio), abrir("/text-box")),
+        CasoBenchmark("presionar_Tab_y_verificar_foco", tab_a_email, abrir("/text-box")),
+    ]
+    tabla = page.locator("#tabla")
+    desplegable = page.locator("#desplegableGrande")
+    for n in tamanios:
+        # Los casos de 10 000 filas/opciones tardan segundos por llamada: se miden menos veces
+        repeticiones = 3 if n >= 10000 else None
+        casos += [
+            CasoBenchmark(f"obtener_dimensiones_tabla[{n}]", lambda: fg.obtener_dimensiones_tabla(tabla, "bench_dimensiones", directorio),
+                          abrir(f"/tabla?filas={n}"), repeticiones),
+            CasoBenchmark(f"verificar_encabezados_tabla[{n}]",
+                          lambda: fg.verificar_encabezados_tabla(tabla, ["ID", "Producto", "Precio", "Stock", "Seleccionar"], "bench_encabezados", directorio),
+                          abrir(f"/tabla?filas={n}"), repeticiones),
+            CasoBenchmark(f"busqueda_estricta_imprimir_fila[{n}]",
+                          lambda n=n: fg.busqueda_estricta_imprimir_fila(tabla, f"Producto {n}", "bench_busqueda", directorio),
+                          abrir(f"/tabla?filas={n}"), repeticiones),
+            CasoBenchmark(f"verificar_precios_son_numeros[{n}]", lambda: fg.verificar_precios_son_numeros(tabla, "Precio", "bench_precios", directorio),
+                          abrir(f"/tabla?filas={n}"), repeticiones),
+            CasoBenchmark(f"obtener_valores_dropdown[{n}]", lambda: fg.obtener_valores_dropdown(desplegable, "bench_dropdown", directorio),
+                          abrir(f"/desplegables?opciones={n}"), repeticiones),
+            CasoBenchmark(f"seleccionar_opcion_por_valor[{n}]",
+                          lambda n=n: fg.seleccionar_opcion_por_valor(desplegable, f"opcion-{n}", "bench_seleccionar", directorio),
+                          abrir(f"/desplegables?opciones={n}"), repeticiones),
+        ]
+    return casos
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de los helpers de Funciones_Globales.")
+    parser.add_argument("--tamanios", default=",".join(map(str, TAMANIOS)), help="Tamaños separados por comas (filas/opciones).")
+    parser.add_argument("--repeticiones", type=int, default=10, help="Repeticiones medidas por caso.")
+    parser.add_argument("--calentamiento", type=int, default=1, help="Ejecuciones sin medir antes de cada caso.")
+    parser.add_argument("--filtro", default=None, help="Solo los casos cuyo nombre contiene este texto.")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_REGRESION, help="Empeoramiento relativo máximo (0.30 = 30 %%).")
+    parser.add_argument("--sin-navegador", action="store_true", help="Solo los lectores de archivos de datos.")
+    parser.add_argument("--linea-base", default=RUTA_LINEA_BASE, help="Ruta del JSON de la línea base.")
+    parser.add_argument("--actualizar-linea-base", action="store_true", help="Guarda los resultados como nueva línea base.")
+    parser.add_argument("--permitir-sin-linea-base", action="store_true",
+                        help="No falla por los casos medidos que no tienen valor en la línea base (solo avisa).")
+    args = parser.parse_args()
+    tamanios = [int(t) for t in args.tamanios.split(",") if t.strip()]
+
+    # Sin slow_mo, pausas, resaltado ni capturas. El logger se configura antes de la primera instancia de
+    # Funciones_Globales: archivo en INFO (como 'ci-fast') y consola solo con advertencias, para no mezclar el log con el informe.
+    config.establecer_perfil("ci-fast")
+    setup_logger(name="Funciones_Globales", console_level=logging.WARNING, file_level=logging.INFO)
+
+    resultados = {}
+    with tempfile.TemporaryDirectory(prefix="bench_helpers_") as directorio:
+        print("\nLectores de archivos de datos:")
+        fg_archivos = Funciones_Globales(_PaginaSinNavegador())
+        resultados.update(ejecutar_casos(casos_archivos(fg_archivos, directorio, tamanios),
+                                         args.repeticiones, args.calentamiento, args.filtro))
+
+        if not args.sin_navegador:
+            from playwright.sync_api import Error, sync_playwright
+            from Simples.utils.local_site import ServidorSitioLocal
+            with ServidorSitioLocal(config.SITIO_LOCAL_DIR) as url, sync_playwright() as p:
+                try:
+                    navegador = p.chromium.launch(headless=True)
+                except Error as e:
+                    print(f"\n⚠️ Se omiten los casos de navegador: no se pudo lanzar Chromium ({str(e).splitlines()[0]}).")
+                else:
+                    print("\nHelpers de navegador (sitio local):")
+                    page = navegador.new_page(viewport={"width": 1920, "height": 1080})
+                    page.set_default_timeout(30000)
+                    fg = Funciones_Globales(page)
+                    resultados.update(ejecutar_casos(casos_navegador(fg, page, url, directorio, tamanios),
+                                                     args.repeticiones, args.calentamiento, args.filtro))
+                    navegador.close()
+
+    if args.actualizar_linea_base:
+        print(f"\nLínea base actualizada: {guardar_linea_base(args.linea_base, resultados)}")
+        return 0
+    fallos = imprimir_informe(comparar(resultados, cargar_linea_base(args.linea_base), args.umbral), args.umbral,
+                              exigir_linea_base=not args.permitir_sin_linea_base)
+    return 1 if fallos else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
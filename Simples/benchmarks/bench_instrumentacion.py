@@ -0,0 +1,83 @@
+"""
+Micro-benchmark: coste por llamada del decorador 'accion_instrumentada'.
+
+Compara una acción vacía (el coste de Playwright queda fuera) en tres variantes:
+- sin decorar:             la llamada al método tal cual.
+- instrumentación activa:  medición con perf_counter_ns, registro en el registro de métricas
+                           y línea 'PERFORMANCE' en el log (INFO).
+- instrumentación inactiva (INSTRUMENTACION=0): solo queda el marco del decorador y su try/except.
+
+El logger escribe en un NullHandler para medir el coste de construir y despachar la línea,
+no la E/S del archivo de log.
+
+Uso (desde la raíz del proyecto):
+    python -m Simples.benchmarks.bench_instrumentacion
+"""
+import logging
+import sys
+import timeit
+
+from Simples.utils import config
+from Simples.utils.instrumentation import accion_instrumentada
+from Simples.utils.logger import LoggerPerezoso
+from Simples.utils.metrics import RegistroMetricas
+import Simples.utils.metrics as metrics
+
+ITERACIONES = 100_000
+
+class _PaginaSimulada:
+    """
+    Objeto con los atributos que usa el decorador ('logger' y 'tomar_captura').
+    """
+
+    def __init__(self):
+        logger = logging.getLogger("bench_instrumentacion")
+        logger.handlers[:] = [logging.NullHandler()]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        self.logger = LoggerPerezoso(logger)
+
+    def tomar_captura(self, nombre_base, directorio):
+        pass
+
+    def accion_sin_decorar(self, selector, nombre_base, directorio, tiempo=0.5):
+        return True
+
+    @accion_instrumentada
+    def accion_decorada(self, selector, nombre_base, directorio, tiempo=0.5):
+        return True
+
+def medir() -> dict:
+    """
+    Devuelve los nanosegundos por llamada de cada variante.
+    """
+    pagina = _PaginaSimulada()
+    habilitada_original = config.INSTRUMENTACION_HABILITADA
+    # Registro propio para no acumular muestras en el del proceso
+    metrics._registro = RegistroMetricas()
+    resultados = {}
+    try:
+        variantes = (
+            ("sin decorar", pagina.accion_sin_decorar, True),
+            ("instrumentación activa", pagina.accion_decorada, True),
+            ("instrumentación inactiva", pagina.accion_decorada, False),
+        )
+        for nombre, accion, habilitada in variantes:
+            config.INSTRUMENTACION_HABILITADA = habilitada
+            segundos = min(timeit.repeat(lambda: accion("#campo", "bench", "/tmp"), number=ITERACIONES, repeat=3))
+            resultados[nombre] = segundos / ITERACIONES * 1e9
+    finally:
+        config.INSTRUMENTACION_HABILITADA = habilitada_original
+        metrics._registro = None
+    return resultados
+
+def main() -> int:
+    resultados = medir()
+    base = resultados["sin decorar"]
+    print(f"\n{'Variante':<28}{'ns/llamada':>12}{'sobrecoste':>14}")
+    for variante, ns in resultados.items():
+        print(f"{variante:<28}{ns:>12.1f}{ns - base:>12.1f}ns")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
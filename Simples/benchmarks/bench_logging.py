@@ -0,0 +1,81 @@
+"""
+Micro-benchmark: mensajes de log construidos con f-strings vs. la fachada LoggerPerezoso.
+
+Reproduce los mensajes típicos de los helpers más usados de 'Funciones_Globales'
+(validar_elemento_visible, hacer_click_en_elemento, rellenar_campo_de_texto,
+obtener_snapshot_tabla...), que incluyen el `repr` de un Locator, y mide el coste por llamada:
+- antes:   `logger.debug(f"...")`, que construye el mensaje aunque DEBUG esté deshabilitado.
+- después: `LoggerPerezoso.debug(lambda: f"...")`, que solo lo construye si DEBUG está habilitado.
+
+Se mide con DEBUG deshabilitado (perfil 'ci-fast', nivel de archivo INFO) y habilitado
+(perfiles 'demo'/'debug'). Los mensajes se envían a un NullHandler para medir solo el coste
+de construirlos y despacharlos, no la E/S.
+
+Uso (desde la raíz del proyecto):
+    python -m Simples.benchmarks.bench_logging
+"""
+import logging
+import sys
+import timeit
+
+from Simples.utils.logger import LoggerPerezoso
+
+ITERACIONES = 200_000
+
+class _LocatorSimulado:
+    """
+    Objeto con un `repr` equivalente al de un Locator de Playwright
+    ('<Locator frame=<Frame name= url='...'> selector='...'>').
+    """
+
+    def __init__(self, selector: str):
+        self._url = "https://demoqa.com/text-box"
+        self._selector = selector
+
+    def __repr__(self):
+        frame = f"<Frame name= url={self._url!r}>"
+        return f"<Locator frame={frame} selector={self._selector!r}>"
+
+def _crear_logger(nivel: int) -> logging.Logger:
+    logger = logging.getLogger(f"bench_logging_{logging.getLevelName(nivel)}")
+    logger.handlers[:] = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(nivel)
+    return logger
+
+def medir(nivel: int) -> dict:
+    """
+    Devuelve los nanosegundos por llamada de ambos estilos para el nivel de logger indicado.
+    """
+    logger = _crear_logger(nivel)
+    perezoso = LoggerPerezoso(logger)
+    selector = _LocatorSimulado("internal:role=textbox[name=\"Full Name\"i]")
+    tiempo = 5.0
+    fila = 17
+
+    def antes():
+        logger.debug(f"\n--> Esperando que el elemento '{selector}' sea visible (timeout: {tiempo}s).")
+        logger.debug(f"\nAnalizando fila {fila+1} del selector {selector}: 'texto de la fila'.")
+
+    def despues():
+        perezoso.debug(lambda: f"\n--> Esperando que el elemento '{selector}' sea visible (timeout: {tiempo}s).")
+        perezoso.debug(lambda: f"\nAnalizando fila {fila+1} del selector {selector}: 'texto de la fila'.")
+
+    resultados = {}
+    for nombre, funcion in (("antes (f-string)", antes), ("después (perezoso)", despues)):
+        segundos = min(timeit.repeat(funcion, number=ITERACIONES, repeat=3))
+        resultados[nombre] = segundos / (ITERACIONES * 2) * 1e9
+    return resultados
+
+def main() -> int:
+    print(f"\n{'Nivel del logger':<20}{'Estilo':<22}{'ns/llamada':>12}")
+    for nivel in (logging.INFO, logging.DEBUG):
+        resultados = medir(nivel)
+        for estilo, ns in resultados.items():
+            print(f"{logging.getLevelName(nivel):<20}{estilo:<22}{ns:>12.1f}")
+        antes, despues = resultados.values()
+        print(f"{'':<20}{'aceleración':<22}{antes / despues:>11.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
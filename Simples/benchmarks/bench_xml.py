@@ -0,0 +1,99 @@
+"""
+Benchmark: lectura completa ('leer_xml', ET.parse) frente a lectura en streaming ('iterar_registros_xml', iterparse)
+de un XML con N registros como los de 'dataset.xml' (<record><Nombre/><Apellido/><Teléfono/></record>).
+
+Variantes (todas recorren los registros y extraen sus tres campos):
+- completo:          leer_xml() y recorrido de los hijos de la raíz.
+- streaming:         iterar_registros_xml(etiqueta_registro='record'), leyendo los campos de cada elemento.
+- streaming+campos:  iterar_registros_xml(..., campos=(...)), proyección directa a tuplas con nombre.
+
+Para cada variante se mide el tiempo (mínimo y p50 de varias repeticiones, con el harness de benchmarks) y,
+en una ejecución aparte con `tracemalloc`, el pico de memoria asignada: en la lectura completa crece con
+el tamaño del archivo y en streaming se mantiene plano.
+
+Uso (desde la raíz del proyecto):
+    python -m Simples.benchmarks.bench_xml
+    python -m Simples.benchmarks.bench_xml --registros 10000,100000,1000000 --repeticiones 3
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from Simples.benchmarks.bench_helpers import _PaginaSinNavegador
+from Simples.benchmarks.harness import medir
+from Simples.pages.base_page import Funciones_Globales
+from Simples.utils import config
+from Simples.utils.logger import setup_logger
+
+REGISTROS = (10_000, 100_000, 250_000)
+CAMPOS = ("Nombre", "Apellido", "Teléfono")
+
+def generar_xml(ruta: str, registros: int) -> str:
+    """
+    Escribe un XML con 'registros' elementos <record> en streaming (sin construir el árbol en memoria).
+    """
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("<?xml version='1.0' encoding='UTF-8'?>\n<dataset>\n")
+        for i in range(registros):
+            archivo.write(f"<record><Nombre>Nombre{i}</Nombre><Apellido>Apellido{i}</Apellido>"
+                          f"<Teléfono>{5000000000 + i}</Teléfono></record>\n")
+        archivo.write("</dataset>\n")
+    return ruta
+
+def variantes(fg: Funciones_Globales, ruta: str) -> dict:
+    def completo():
+        raiz = fg.leer_xml(ruta)
+        return sum(1 for registro in raiz if registro.findtext("Nombre") is not None
+                   and registro.findtext("Apellido") is not None and registro.findtext("Teléfono") is not None)
+
+    def streaming():
+        return sum(1 for registro in fg.iterar_registros_xml(ruta, "record") if registro.findtext("Nombre") is not None
+                   and registro.findtext("Apellido") is not None and registro.findtext("Teléfono") is not None)
+
+    def streaming_campos():
+        return sum(1 for registro in fg.iterar_registros_xml(ruta, "record", CAMPOS) if registro.Nombre is not None)
+
+    return {"completo": completo, "streaming": streaming, "streaming+campos": streaming_campos}
+
+def pico_memoria_mb(funcion) -> float:
+    """
+    Pico de memoria asignada (MB) durante la ejecución de la función, según tracemalloc.
+    """
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / (1024 * 1024)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de leer_xml frente a iterar_registros_xml.")
+    parser.add_argument("--registros", default=",".join(map(str, REGISTROS)), help="Tamaños separados por comas.")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones medidas por variante.")
+    args = parser.parse_args()
+    tamanios = [int(t) for t in args.registros.split(",") if t.strip()]
+
+    config.establecer_perfil("ci-fast")
+    setup_logger(name="Funciones_Globales", console_level=logging.WARNING, file_level=logging.INFO)
+    fg = Funciones_Globales(_PaginaSinNavegador())
+
+    print(f"\n{'Registros':>10}  {'Variante':<18}{'MB archivo':>11}{'min (ms)':>12}{'p50 (ms)':>12}{'Pico memoria (MB)':>20}")
+    with tempfile.TemporaryDirectory(prefix="bench_xml_") as directorio:
+        for n in tamanios:
+            ruta = generar_xml(os.path.join(directorio, f"dataset_{n}.xml"), n)
+            tamano_mb = os.path.getsize(ruta) / (1024 * 1024)
+            for nombre, funcion in variantes(fg, ruta).items():
+                if funcion() != n:
+                    print(f"❌ La variante '{nombre}' no devolvió los {n} registros.", file=sys.stderr)
+                    return 1
+                resumen = medir(funcion, args.repeticiones, calentamiento=0)
+                pico = pico_memoria_mb(funcion)
+                print(f"{n:>10}  {nombre:<18}{tamano_mb:>11.1f}{resumen['min']:>12.1f}{resumen['p50']:>12.1f}{pico:>20.1f}", flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Harness de benchmarks: mide casos de forma repetible, guarda una línea base en JSON y compara contra ella.
+
+Cada caso es una función sin argumentos que se ejecuta 'calentamiento' veces sin medir y 'repeticiones'
+veces midiendo con `time.perf_counter_ns`. De cada caso se guarda el resumen en milisegundos (mínimo,
+media, máximo y p50/p95/p99, ver `metrics.resumir`). La comparación usa por defecto el mínimo, el
+estadístico menos sensible al ruido de la máquina (otros procesos, frecuencia de la CPU, recolector
+de basura): un caso es una regresión si supera al de la línea base en más del umbral relativo y,
+además, en más de un margen absoluto (para no marcar como regresión el ruido de los casos de microsegundos).
+"""
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from Simples.utils.metrics import resumir
+
+# Umbral relativo de regresión por defecto (0.30 = el caso empeora más de un 30 %)
+UMBRAL_REGRESION = float(os.environ.get("BENCH_UMBRAL", "0.30"))
+
+# Diferencia absoluta mínima (ms) para considerar una variación como regresión o mejora
+MARGEN_MINIMO_MS = float(os.environ.get("BENCH_MARGEN_MS", "0.5"))
+
+# Estadístico del resumen con el que se compara cada caso ('min', 'p50', 'media', ...)
+ESTADISTICO_COMPARACION = "min"
+
+# Estados de la comparación de un caso con la línea base
+REGRESION = "regresion"
+MEJORA = "mejora"
+ESTABLE = "estable"
+SIN_LINEA_BASE = "sin_linea_base"
+
+class CasoBenchmark:
+    """
+    Un caso de benchmark: nombre único ('<helper>[<tamaño>]'), función a medir y, opcionalmente,
+    una preparación que se ejecuta una vez antes de medir (p. ej. navegar a la página del caso).
+    """
+
+    def __init__(self, nombre: str, ejecutar: Callable[[], object], preparar: Optional[Callable[[], object]] = None,
+                 repeticiones: Optional[int] = None):
+        self.nombre = nombre
+        self.ejecutar = ejecutar
+        self.preparar = preparar
+        # Repeticiones propias del caso (los casos lentos pueden pedir menos que las de la suite)
+        self.repeticiones = repeticiones
+
+def medir(funcion: Callable[[], object], repeticiones: int = 5, calentamiento: int = 1) -> Dict[str, Optional[float]]:
+    """
+    Ejecuta la función 'calentamiento' veces sin medir y 'repeticiones' veces midiendo.
+    Como `timeit`, desactiva el recolector de basura durante las mediciones para que sus pausas
+    (que dependen de lo que hayan asignado los casos anteriores) no se atribuyan al caso medido.
+    Devuelve el resumen de las duraciones en milisegundos.
+    """
+    for _ in range(calentamiento):
+        funcion()
+    duraciones_ms = []
+    gc.collect()
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter_ns()
+            funcion()
+            duraciones_ms.append((time.perf_counter_ns() - inicio) / 1_000_000)
+    finally:
+        if gc_activo:
+            gc.enable()
+    return resumir(duraciones_ms)
+
+def ejecutar_casos(casos: Iterable[CasoBenchmark], repeticiones: int = 5, calentamiento: int = 1,
+                   filtro: Optional[str] = None) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Mide todos los casos (o solo los que contienen 'filtro' en el nombre) y muestra el progreso por consola.
+    """
+    resultados = {}
+    for caso in casos:
+        if filtro and filtro not in caso.nombre:
+            continue
+        if caso.preparar is not None:
+            caso.preparar()
+        resultados[caso.nombre] = medir(caso.ejecutar, caso.repeticiones or repeticiones, calentamiento)
+        print(f"  {caso.nombre:<55}min {resultados[caso.nombre]['min']:>12.3f} ms   p50 {resultados[caso.nombre]['p50']:>12.3f} ms", flush=True)
+    return resultados
+
+def entorno() -> Dict[str, str]:
+    """
+    Datos del entorno en el que se midió (las líneas base solo son comparables en la misma máquina).
+    """
+    return {"python": platform.python_version(), "plataforma": platform.platform(), "procesador": platform.machine()}
+
+def cargar_linea_base(ruta: str) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Devuelve los casos de la línea base guardada o un diccionario vacío si no existe.
+    """
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo).get("casos", {})
+
+def guardar_linea_base(ruta: str, resultados: Dict[str, Dict[str, Optional[float]]], conservar: bool = True) -> str:
+    """
+    Guarda los resultados como línea base. Con 'conservar', los casos que no se midieron en esta
+    ejecución (p. ej. por un filtro) mantienen su valor anterior.
+    """
+    casos = cargar_linea_base(ruta) if conservar else {}
+    casos.update(resultados)
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({
+            "generado": datetime.now().isoformat(timespec="seconds"),
+            "entorno": entorno(),
+            "unidad": "ms",
+            "casos": dict(sorted(casos.items())),
+        }, archivo, ensure_ascii=False, indent=2)
+    return ruta
+
+def comparar(resultados: Dict[str, Dict[str, Optional[float]]], linea_base: Dict[str, Dict[str, Optional[float]]],
+             umbral: float = UMBRAL_REGRESION, margen_minimo_ms: float = MARGEN_MINIMO_MS,
+             estadistico: str = ESTADISTICO_COMPARACION) -> List[Dict]:
+    """
+    Compara el estadístico indicado (por defecto, el mínimo) de cada caso con el de la línea base.
+    """
+    comparacion = []
+    for nombre, resumen in resultados.items():
+        actual = resumen[estadistico]
+        base = linea_base.get(nombre, {}).get(estadistico)
+        if base is None:
+            comparacion.append({"caso": nombre, "base_ms": None, "actual_ms": actual, "variacion": None, "estado": SIN_LINEA_BASE})
+            continue
+        variacion = (actual - base) / base if base else 0.0
+        estado = ESTABLE
+        if abs(actual - base) > margen_minimo_ms:
+            if variacion > umbral:
+                estado = REGRESION
+            elif variacion < -umbral:
+                estado = MEJORA
+        comparacion.append({"caso": nombre, "base_ms": base, "actual_ms": actual, "variacion": variacion, "estado": estado})
+    return comparacion
+
+def imprimir_informe(comparacion: List[Dict], umbral: float = UMBRAL_REGRESION, exigir_linea_base: bool = True) -> int:
+    """
+    Imprime la comparación y devuelve el número de casos que hacen fallar la ejecución: las regresiones y,
+    con 'exigir_linea_base', los casos medidos sin valor en la línea base (que, si no, nunca se comprobarían).
+    """
+    print(f"\n{'Caso':<55}{'Base (ms)':>14}{'Actual (ms)':>14}{'Variación':>12}  Estado")
+    for fila in comparacion:
+        base = f"{fila['base_ms']:.3f}" if fila["base_ms"] is not None else "-"
+        variacion = f"{fila['variacion']:+.1%}" if fila["variacion"] is not None else "-"
+        print(f"{fila['caso']:<55}{base:>14}{fila['actual_ms']:>14.3f}{variacion:>12}  {fila['estado']}")
+    regresiones = sum(1 for fila in comparacion if fila["estado"] == REGRESION)
+    if regresiones:
+        print(f"\n❌ {regresiones} caso(s) empeoran más de un {umbral:.0%} respecto a la línea base.", file=sys.stderr)
+    else:
+        print(f"\n✅ Ningún caso empeora más de un {umbral:.0%} respecto a la línea base.")
+    sin_linea_base = [fila["caso"] for fila in comparacion if fila["estado"] == SIN_LINEA_BASE]
+    if sin_linea_base:
+        print(f"\n{'❌' if exigir_linea_base else '⚠️'} {len(sin_linea_base)} caso(s) sin línea base, no se comprueban: "
+              f"{', '.join(sin_linea_base)}.\n   Genera su línea base en esta máquina con '--actualizar-linea-base'.", file=sys.stderr)
+    return regresiones + (len(sin_linea_base) if exigir_linea_base else 0)
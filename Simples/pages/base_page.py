@@ -4,16 +4,123 @@ import random # Importa el módulo para generar números aleatorios
 from playwright.sync_api import Page, expect, Error, TimeoutError, sync_playwright, Response, Dialog, Locator, BrowserContext # Importa clases y excepciones necesarias de Playwright
 from datetime import datetime # Importa la clase datetime para trabajar con fechas y horas
 import os # Importa el módulo os para interactuar con el sistema operativo (rutas de archivos, directorios)
-from typing import List, Dict, Union, Callable, Tuple, Optional, Any # Importa tipos para mejorar la legibilidad y validación del código
+from typing import List, Dict, Union, Callable, Tuple, Optional, Any, Iterator, Iterable, Sequence # Importa tipos para mejorar la legibilidad y validación del código
 from Simples.utils.config import LOGGER_DIR # Importa la ruta del directorio de logs desde config.py
-from Simples.utils.logger import setup_logger # Importa la función setup_logger desde logger.py
+from Simples.utils import config # Importa la configuración (perfiles de ejecución)
+from Simples.utils.logger import setup_logger, LoggerPerezoso # Importa la función setup_logger y la fachada de logging perezoso desde logger.py
+from Simples.utils.screenshot_writer import obtener_escritor_capturas # Escritor de capturas en segundo plano
+from Simples.utils.capture_policy import obtener_politica_capturas, DESCARTAR, RETENER # Política de captura de evidencias
+from Simples.utils.metrics import obtener_registro_metricas # Registro de métricas de rendimiento del proceso
+from Simples.utils.instrumentation import accion_instrumentada, MedicionBloque, RELANZAR # Instrumentación de las acciones de página (tiempos, métricas y errores)
+from Simples.utils.workbook_cache import obtener_cache_libros # Caché de libros de Excel de los lectores de datos
+from Simples.utils.csv_index import obtener_cache_indices_csv # Índice de filas de CSV (acceso aleatorio con mmap)
+from Simples.utils.xml_stream import iterar_registros_xml # Lectura de registros XML en streaming (iterparse)
+from Simples.utils.json_stream import iterar_elementos_json, obtener_cache_columnar_json, TablaColumnarJson # Lectura de arrays JSON en streaming y caché columnar
+from Simples.utils.chunked_writer import escribir_por_bloques # Escritura de texto por bloques (atómica y gzip opcionales)
 import logging # Importa el módulo logging para configurar y usar loggers
-import openpyxl # Librería para hacer uso del excel (para archivos .xlsx)
-import csv # Importa la librería csv para manejar archivos CSV (para archivos .csv)
 import json # Importa la librería json para manejar archivos JSON
 import xml.etree.ElementTree as ET # Importa el módulo para trabajar con XML
 import math
 
+# Script que se ejecuta dentro del navegador para obtener una "foto" completa de una tabla
+# (encabezados, textos de filas, textos de celdas y estado de checkboxes) en un solo viaje de ida y vuelta.
+# Las celdas y checkboxes se devuelven indexados por columna: columnas[j][i] es la celda j de la fila i.
+_JS_SNAPSHOT_TABLA = """
+(tabla) => {
+    const texto = (el) => (el.textContent || "").trim();
+    let encabezadosEls = tabla.querySelectorAll("thead th");
+    if (encabezadosEls.length === 0) {
+        encabezadosEls = tabla.querySelectorAll("th");
+    }
+    const encabezados = Array.from(encabezadosEls, texto);
+    const filas = Array.from(tabla.querySelectorAll("tbody tr"));
+    const celdasPorFila = filas.map((fila) => fila.querySelectorAll("td").length);
+    const numColumnas = celdasPorFila.reduce((max, n) => (n > max ? n : max), encabezados.length);
+    const columnas = Array.from({ length: numColumnas }, () => new Array(filas.length).fill(null));
+    const checkboxes = Array.from({ length: numColumnas }, () => new Array(filas.length).fill(null));
+    filas.forEach((fila, i) => {
+        fila.querySelectorAll("td").forEach((celda, j) => {
+            columnas[j][i] = texto(celda);
+            const checkbox = celda.querySelector("input[type='checkbox']");
+            if (checkbox) {
+                checkboxes[j][i] = checkbox.checked;
+            }
+        });
+    });
+    const primeraFila = tabla.querySelector("tr");
+    return {
+        encabezados: encabezados,
+        filas: filas.map((fila) => fila.textContent || ""),
+        columnas: columnas,
+        checkboxes: checkboxes,
+        celdas_por_fila: celdasPorFila,
+        num_filas: filas.length,
+        num_columnas: numColumnas,
+        td_primera_fila: primeraFila ? primeraFila.querySelectorAll("td").length : 0,
+    };
+}
+"""
+
+# Scripts para verificar la secuencia de tabulación en un solo pase del navegador.
+# Los elementos esperados se guardan por identidad en 'window.__secuenciaTab.esperados' y un listener
+# de 'keyup' (capturing) registra 'document.activeElement' después de cada pulsación de Tab/Shift+Tab.
+_JS_MARCAR_ELEMENTO_TAB = """
+(el, indice) => {
+    if (!window.__secuenciaTab) {
+        window.__secuenciaTab = { esperados: [], registro: [], listener: null };
+    }
+    window.__secuenciaTab.esperados[indice] = el;
+}
+"""
+
+_JS_INICIAR_REGISTRO_TAB = """
+() => {
+    const estado = window.__secuenciaTab;
+    const activo = () => {
+        let el = document.activeElement;
+        while (el && el.shadowRoot && el.shadowRoot.activeElement) {
+            el = el.shadowRoot.activeElement;
+        }
+        return el;
+    };
+    estado.registro = [];
+    estado.listener = (evento) => {
+        if (evento.key === "Tab") {
+            estado.registro.push(activo());
+        }
+    };
+    document.addEventListener("keyup", estado.listener, true);
+}
+"""
+
+_JS_LEER_REGISTRO_TAB = """
+() => {
+    const estado = window.__secuenciaTab;
+    if (!estado) {
+        return { esperados: [], registro: [] };
+    }
+    document.removeEventListener("keyup", estado.listener, true);
+    const describir = (el) => {
+        if (!el) {
+            return "(ninguno)";
+        }
+        let descripcion = el.tagName.toLowerCase();
+        if (el.id) {
+            descripcion += "#" + el.id;
+        } else if (el.getAttribute("name")) {
+            descripcion += "[name='" + el.getAttribute("name") + "']";
+        }
+        return descripcion;
+    };
+    const resultado = {
+        esperados: estado.esperados.map(describir),
+        registro: estado.registro.map((el) => ({ indice: estado.esperados.indexOf(el), descripcion: describir(el) })),
+    };
+    delete window.__secuenciaTab;
+    return resultado;
+}
+"""
+
 class Funciones_Globales:
     
     #1- Creamos una función incial 'Constructor'-----ES IMPORTANTE TENER ESTE INICIADOR-----
@@ -43,8 +150,17 @@ class Funciones_Globales:
         # Una estrategia es limpiar la lista antes de la acción que abre la nueva ventana,
         # y luego recopilar las páginas.
         
-        # Configurar el logger para esta clase
-        self.logger = setup_logger(name='Funciones_Globales', console_level=logging.INFO, file_level=logging.DEBUG)
+        # Perfil de ejecución activo (slow_mo, pausas, resaltado, capturas y nivel de log). Ver config.PERFILES_EJECUCION
+        self.perfil = config.obtener_perfil()
+
+        # Obtener el logger de esta clase (se configura una sola vez por proceso; las instancias lo comparten).
+        # La fachada LoggerPerezoso evita construir los mensajes de niveles deshabilitados.
+        nivel_archivo = logging.getLevelName(self.perfil.get("nivel_log_archivo", "DEBUG"))
+        self.logger = LoggerPerezoso(setup_logger(name='Funciones_Globales', console_level=logging.INFO, file_level=nivel_archivo))
+
+        # Registro de métricas del proceso: cada punto 'PERFORMANCE' registra también su duración,
+        # indexada por acción y por la prueba, navegador y dispositivo en curso.
+        self.metricas = obtener_registro_metricas()
         
     #2- Función para generar el nombre de archivo con marca de tiempo
     def _generar_nombre_archivo_con_timestamp(self, prefijo):
@@ -53,46 +169,160 @@ class Funciones_Globales:
         return f"{timestamp}_{prefijo}"
     
     #3- Función para tomar captura de pantalla
-    def tomar_captura(self, nombre_base, directorio):
+    def tomar_captura(self, nombre_base, directorio, page_to_capture: Optional[Page] = None):
         """
         Toma una captura de pantalla de la página y la guarda en el directorio especificado.
         Por defecto, usa SCREENSHOT_DIR de config.py.
 
+        Con CAPTURAS_ASINCRONAS habilitado (valor por defecto), el hilo de la prueba solo obtiene
+        los bytes de la imagen; la escritura en disco (y la transcodificación a WebP, si aplica)
+        la realiza el escritor de capturas en segundo plano.
+
+        La política de capturas activa (config.CAPTURA_POLITICA o '--politica-capturas') decide si
+        la captura se escribe, se descarta sin tomarla o se retiene en memoria hasta saber si la
+        prueba falló.
+
         Args:
             nombre_base (str): El nombre base para el archivo de la captura de pantalla.
             directorio (str): El directorio donde se guardará la captura. Por defecto, SCREENSHOT_DIR.
-        """
+            page_to_capture (Page, opcional): La página a capturar (p. ej. una pestaña nueva). Por defecto, `self.page`.
+        """
+        # El perfil de ejecución activo puede deshabilitar las capturas (p. ej. 'ci-fast')
+        if not self.perfil["capturas"]:
+            return
+        pagina = page_to_capture or self.page
+        politica = obtener_politica_capturas()
+        decision = politica.decidir()
+        self.metricas.incrementar(f"capturas.{decision}")
+        if decision == DESCARTAR:
+            self.logger.debug(lambda: f"\n Captura '{nombre_base}' omitida por la política de capturas '{politica.politica}'.")
+            return
         try:
+            if decision == RETENER:
+                # Se guardan solo los bytes en memoria; se escribirán al terminar la prueba si corresponde
+                nombre_archivo = self._generar_nombre_archivo_con_timestamp(nombre_base)
+                datos = pagina.screenshot(**obtener_escritor_capturas().opciones_captura())
+                politica.retener(os.path.join(directorio, nombre_archivo), datos)
+                self.logger.debug(lambda: f"\n 📸 Captura '{nombre_base}' retenida en memoria (política '{politica.politica}').")
+                return
+
             if not os.path.exists(directorio):
-                os.makedirs(directorio)
+                os.makedirs(directorio, exist_ok=True)
                 self.logger.info(f"\n Directorio creado para capturas de pantalla: {directorio}") #
 
             nombre_archivo = self._generar_nombre_archivo_con_timestamp(nombre_base) #
-            ruta_completa = os.path.join(directorio, f"{nombre_archivo}.png") # Cambiado a .png para mejor calidad
-            self.page.screenshot(path=ruta_completa) #
-            self.logger.info(f"\n 📸 Captura de pantalla guardada en: {ruta_completa}") #
+            ruta_sin_extension = os.path.join(directorio, nombre_archivo)
+            if config.CAPTURAS_ASINCRONAS:
+                escritor = obtener_escritor_capturas()
+                datos = pagina.screenshot(**escritor.opciones_captura()) # Solo se paga la captura en el hilo de la prueba
+                ruta_completa = escritor.encolar(ruta_sin_extension, datos)
+                self.logger.info(f"\n 📸 Captura de pantalla encolada para guardarse en: {ruta_completa}") #
+            else:
+                ruta_completa = f"{ruta_sin_extension}.png" # Cambiado a .png para mejor calidad
+                pagina.screenshot(path=ruta_completa) #
+                self.logger.info(f"\n 📸 Captura de pantalla guardada en: {ruta_completa}") #
         except Exception as e:
             self.logger.error(f"\n ❌ Error al tomar captura de pantalla '{nombre_base}': {e}") #
         
     #4- unción basica para tiempo de espera que espera recibir el parametro tiempo
     #En caso de no pasar el tiempo por parametro, el mismo tendra un valor de medio segundo
-    def esperar_fijo(self, tiempo=0.5):
+    def esperar_fijo(self, tiempo=None):
         """
-        Espera un tiempo fijo en segundos.
+        Espera un tiempo fijo en segundos, ajustado según el perfil de ejecución activo.
+        Si no se indica 'tiempo' se usa la pausa por defecto del perfil ('pausa_post_accion'),
+        y en cualquier caso el valor se multiplica por su 'escala_pausas' (0 en 'ci-fast',
+        lo que elimina las pausas artificiales sin modificar las llamadas).
 
         Args:
-            tiempo (Union[int, float]): El tiempo en segundos a esperar. Por defecto, 0.5 segundos.
+            tiempo (Union[int, float]): El tiempo en segundos a esperar. Por defecto, la pausa del perfil activo.
         """
-        self.logger.debug(f"\n Esperando fijo por {tiempo} segundos...") #
+        if tiempo is None:
+            tiempo = self.perfil["pausa_post_accion"]
         try:
-            time.sleep(tiempo) #
-            self.logger.info(f"Espera fija de {tiempo} segundos completada.") #
+            tiempo_efectivo = tiempo * self.perfil["escala_pausas"]
+            if tiempo_efectivo <= 0:
+                return
+            self.logger.debug(lambda: f"\n Esperando fijo por {tiempo_efectivo} segundos...") #
+            time.sleep(tiempo_efectivo) #
+            self.logger.info(f"Espera fija de {tiempo_efectivo} segundos completada.") #
         except TypeError:
             self.logger.error(f"\n ❌ Error: El tiempo de espera debe ser un número. Se recibió: {tiempo}") #
         except Exception as e:
             self.logger.error(f"\n ❌ Ocurrió un error inesperado durante la espera fija: {e}") #
-        
+    
+    #4.1- Función para resaltar un elemento según el perfil de ejecución activo
+    def _resaltar(self, locator: Locator):
+        """
+        Resalta visualmente un elemento solo si el perfil de ejecución activo lo permite.
+        En perfiles sin resaltado (p. ej. 'ci-fast') se evita el viaje de ida y vuelta al navegador.
+
+        Args:
+            locator (Locator): El elemento a resaltar.
+        """
+        if self.perfil["resaltar"]:
+            locator.highlight()
+
+    #4.1.1- Función para medir una fase dentro de una acción instrumentada
+    def _medir(self, accion: str, descripcion: str = "") -> MedicionBloque:
+        """
+        Devuelve un context manager que mide el bloque, registra su duración con el nombre
+        'accion' en el registro de métricas y la escribe en el log como línea 'PERFORMANCE'.
+
+        Args:
+            accion (str): Nombre de la métrica (p. ej. "hacer_click_en_elemento.click").
+            descripcion (str, opcional): Descripción legible de la fase para el log. Por defecto, el nombre de la métrica.
+        """
+        return MedicionBloque(self, accion, descripcion)
+
+    #4.2- Primitiva para esperar un evento de Playwright disparado por una acción
+    def _esperar_evento(self, evento: str, accion: Callable[[], Any], timeout_s: Union[int, float], emisor: Any = None, predicado: Optional[Callable[[Any], bool]] = None, si_no_llega: Any = RELANZAR) -> Any:
+        """
+        Ejecuta 'accion' y devuelve el primer evento 'evento' emitido por 'emisor' (por defecto, la página actual),
+        sin bucles de sondeo. El listener se registra ANTES de la acción, por lo que no se pierden eventos emitidos
+        mientras la acción se ejecuta; si el evento aún no llegó cuando la acción termina, se espera con
+        `wait_for_event` de Playwright, que sigue despachando eventos mientras espera.
+
+        Args:
+            evento (str): Nombre del evento de Playwright (p. ej. 'dialog', 'page', 'popup', 'download').
+            accion (Callable[[], Any]): Acción que dispara el evento (p. ej. `locator.click`).
+            timeout_s (Union[int, float]): Tiempo máximo de espera (en segundos) desde que termina la acción.
+            emisor (Any): Objeto que emite el evento (`Page` o `BrowserContext`). Por defecto, `self.page`.
+            predicado (Optional[Callable[[Any], bool]]): Filtro opcional que debe cumplir el payload del evento.
+            si_no_llega (Any): Valor a devolver si el evento no se emite dentro del tiempo indicado. Por defecto,
+                               se lanza `TimeoutError`. Los errores de 'accion' (p. ej. un clic que agota su
+                               propio timeout) se propagan siempre, para no confundirlos con el evento ausente.
+
+        Returns:
+            Any: El payload capturado del evento (p. ej. el `Dialog` o la nueva `Page`), o 'si_no_llega'.
+
+        Raises:
+            TimeoutError: Si el evento no se emite dentro del tiempo indicado y no se indicó 'si_no_llega'.
+        """
+        emisor = emisor or self.page
+        capturados = []
+
+        def _capturar(payload):
+            if predicado is None or predicado(payload):
+                capturados.append(payload)
+
+        emisor.on(evento, _capturar)
+        try:
+            accion()
+            if capturados:
+                return capturados[0]
+            # Con la API síncrona los eventos solo se despachan mientras Playwright está en ejecución,
+            # así que no puede llegar ningún evento entre la comprobación anterior y esta espera.
+            try:
+                return emisor.wait_for_event(evento, predicate=predicado, timeout=timeout_s * 1000)
+            except TimeoutError:
+                if si_no_llega is RELANZAR:
+                    raise
+                return si_no_llega
+        finally:
+            emisor.remove_listener(evento, _capturar)
+
     #5- Función para indicar el tiempo que se tardará en hacer el scroll
+    @accion_instrumentada(en_timeout=None, en_error=None)
     def scroll_pagina(self, horz, vert, tiempo: Union[int, float] = 0.5):
         """
         Realiza un scroll en la página.
@@ -102,22 +332,16 @@ class Funciones_Globales:
             vert (int): Cantidad de scroll vertical. Por defecto, 0.
             tiempo (Union[int, float]): Tiempo de espera después del scroll en segundos. Por defecto, 0.5.
         """
-        self.logger.debug(f"Realizando scroll - Horizontal: {horz}, Vertical: {vert}. Espera: {tiempo} segundos.") #
-        try:
-            # --- Medición de rendimiento: Inicio de la acción de scroll ---
-            start_time_scroll_action = time.time()
+        self.logger.debug(lambda: f"Realizando scroll - Horizontal: {horz}, Vertical: {vert}. Espera: {tiempo} segundos.") #
+        # Los errores solo se registran (el decorador devuelve None): un scroll fallido no hace fallar la prueba.
+        with self._medir("scroll_pagina.scroll_action", "la acción de scroll (Playwright API)"):
             self.page.mouse.wheel(horz, vert)
-            # --- Medición de rendimiento: Fin de la acción de scroll ---
-            end_time_scroll_action = time.time()
-            duration_scroll_action = end_time_scroll_action - start_time_scroll_action
-            self.logger.info(f"PERFORMANCE: Duración de la acción de scroll (Playwright API): {duration_scroll_action:.4f} segundos.")
-            
-            self.esperar_fijo(tiempo) # Reutiliza la función esperar_fijo para el log y manejo de errores
-            self.logger.info(f"Scroll completado (H: {horz}, V: {vert}).") #
-        except Exception as e:
-            self.logger.error(f"❌ Error al realizar scroll en la página: {e}") #
-            
+
+        self.esperar_fijo(tiempo) # Reutiliza la función esperar_fijo para el log y manejo de errores
+        self.logger.info(f"Scroll completado (H: {horz}, V: {vert}).") #
+
     # 6- Función para validar que un elemento es visible
+    @accion_instrumentada(en_timeout=False)
     def validar_elemento_visible(self, selector, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, resaltar: bool = True) -> bool:
         """
         Valida que un elemento sea visible en la página dentro de un tiempo límite especificado.
@@ -150,91 +374,29 @@ class Funciones_Globales:
 
         # Asegura que 'selector' sea un objeto Locator de Playwright.
         # Si 'selector' es una cadena, lo convierte a Locator; de lo contrario, usa el objeto directamente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-        
-        # --- Medición de rendimiento: Inicio de la espera por visibilidad ---
-        # Registra el tiempo justo antes de iniciar la espera activa de Playwright.
-        start_time_visible_check = time.time()
-
-        try:
-            # Espera explícita a que el elemento cumpla la condición de ser visible.
-            # Playwright reintenta automáticamente hasta que la condición se cumple o
-            # el 'timeout' (expresado en milisegundos) expira.
-            expect(locator).to_be_visible() 
-
-            # --- Medición de rendimiento: Fin de la espera por visibilidad ---
-            # Registra el tiempo inmediatamente después de que el elemento se vuelve visible.
-            end_time_visible_check = time.time()
-            # Calcula la duración total que tardó el elemento en ser visible.
-            duration_visible_check = end_time_visible_check - start_time_visible_check
-            # Registra la métrica de rendimiento. Un tiempo elevado aquí puede indicar
-            # problemas de carga o renderizado en la aplicación.
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ser visible: {duration_visible_check:.4f} segundos.")
-
-            if resaltar:
-                # Resalta visualmente el elemento en la página para ayudar en el debugging o demostraciones.
-                locator.highlight()
-                self.logger.debug(f"Elemento '{selector}' resaltado.")
-
-            # Toma una captura de pantalla para documentar que el elemento es visible.
-            self.tomar_captura(f"{nombre_base}_visible", directorio)
-            self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' es visible en la página.")
-            
-            # Realiza una espera fija adicional. Esto es útil para pausas visuales
-            # o si el siguiente paso en la prueba requiere un breve momento después
-            # de la aparición del elemento. Considera si esta espera es estrictamente
-            # necesaria para la lógica de la prueba o si es solo para observación.
-            self.esperar_fijo(tiempo) 
-
-            return True
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
-        except TimeoutError as e:
-            # Manejo específico para cuando el elemento no se vuelve visible dentro del 'timeout'.
-            # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_visible_check = time.time()
-            duration_visible_check = end_time_visible_check - start_time_visible_check
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' NO fue visible "
-                f"después de {duration_visible_check:.4f} segundos (timeout configurado: {tiempo}s). Detalles: {e}"
-            )
-            self.logger.warning(error_msg)
-            # Toma una captura de pantalla en caso de timeout para depuración.
-            self.tomar_captura(f"{nombre_base}_NO_visible_timeout", directorio)
-            return False
+        # Espera explícita a que el elemento cumpla la condición de ser visible. Un tiempo elevado aquí
+        # puede indicar problemas de carga o renderizado en la aplicación.
+        # Si no lo es a tiempo, el decorador toma la captura del fallo y devuelve False.
+        with self._medir("validar_elemento_visible.visible_check", f"espera a que el elemento '{selector}' sea visible"):
+            expect(locator).to_be_visible()
 
-        except Error as e:
-            # Manejo específico para errores generados por Playwright (ej. selector malformado,
-            # elemento que se desprende del DOM antes de la verificación).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar la visibilidad de '{selector}'. "
-                f"Posibles causas: Selector inválido, elemento desprendido del DOM. Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # exc_info=True para incluir la traza completa.
-            # Toma una captura de pantalla para el error de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            raise # Re-lanza la excepción para asegurar que la prueba falle.
+        if resaltar:
+            # Resalta visualmente el elemento en la página para ayudar en el debugging o demostraciones.
+            self._resaltar(locator)
+            self.logger.debug(lambda: f"Elemento '{selector}' resaltado.")
 
-        except Exception as e:
-            # Manejo general para cualquier otra excepción inesperada que no sea de Playwright o Timeout.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al validar la visibilidad de '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa critical para errores graves y exc_info.
-            # Toma una captura para errores inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise # Re-lanza la excepción.
+        # Toma una captura de pantalla para documentar que el elemento es visible.
+        self.tomar_captura(f"{nombre_base}_visible", directorio)
+        self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' es visible en la página.")
 
-        finally:
-            # El bloque finally se ejecuta siempre, independientemente de si hubo una excepción o no.
-            # En este caso, no hay operaciones finales específicas necesarias aquí que no estén ya
-            # manejadas en los bloques try/except.
-            pass
+        # Realiza una espera fija adicional (pausa visual o margen para el siguiente paso de la prueba).
+        self.esperar_fijo(tiempo)
+        return True
 
     # 7- Función para validar que un elemento NO es visible
+    @accion_instrumentada
     def validar_elemento_no_visible(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Valida que un elemento NO es visible en la página dentro de un tiempo límite especificado.
@@ -258,86 +420,20 @@ class Funciones_Globales:
         self.logger.info(f"\nValidando que el elemento con selector '{selector}' NO es visible. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para su uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la espera por no visibilidad ---
-        # Registra el tiempo justo antes de iniciar la espera activa de Playwright
-        # para que el elemento se oculte.
-        start_time_hidden_check = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Espera explícita a que el elemento cumpla la condición de estar oculto (no visible)
-            # o de no existir en el DOM. Playwright reintenta automáticamente.
-            # El 'timeout' se especifica en milisegundos.
-            expect(locator).to_be_hidden()
-
-            # --- Medición de rendimiento: Fin de la espera por no visibilidad ---
-            # Registra el tiempo inmediatamente después de que el elemento se oculta.
-            end_time_hidden_check = time.time()
-            # Calcula la duración total que tardó el elemento en ocultarse.
-            duration_hidden_check = end_time_hidden_check - start_time_hidden_check
-            # Registra la métrica de rendimiento. Un tiempo elevado aquí podría indicar
-            # que la aplicación tarda en ocultar elementos o en limpiar el DOM.
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ocultarse/desaparecer: {duration_hidden_check:.4f} segundos.")
-
+            # Espera explícita a que el elemento esté oculto o no exista en el DOM. Un tiempo elevado
+            # aquí podría indicar que la aplicación tarda en ocultar elementos o en limpiar el DOM.
+            with self._medir("validar_elemento_no_visible.hidden_check", f"espera a que el elemento '{selector}' se oculte/desaparezca"):
+                expect(locator).to_be_hidden()
             self.logger.info(f"\n✔ ÉXITO: El elemento con selector '{selector}' NO es visible.")
-            # La captura de éxito se maneja en el bloque `finally` para asegurar que se tome.
-
-        except TimeoutError as e:
-            # Captura específica para el error de tiempo de espera de Playwright.
-            # Esto ocurre si el elemento sigue visible después del 'timeout' especificado.
-            end_time_hidden_check = time.time() # Registra el tiempo al fallar el timeout.
-            duration_hidden_check = end_time_hidden_check - start_time_hidden_check
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' AÚN ES VISIBLE "
-                f"después de {duration_hidden_check:.4f} segundos (timeout configurado: {tiempo}s). Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla en caso de fallo por timeout para depuración.
-            self.tomar_captura(f"{nombre_base}_fallo_no_visible_timeout", directorio)
-            raise # Re-lanza la excepción para que la prueba falle.
-
-        except AssertionError as e:
-            # Captura específica para AssertionErrors. Esto podría ocurrir si la aserción
-            # es `to_be_hidden` y el elemento inesperadamente no se oculta.
-            error_msg = (
-                f"\n❌ FALLO (Assertion): El elemento con selector '{selector}' aún es visible o no se ocultó a tiempo. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_no_visible_assertion", directorio)
-            raise # Re-lanza la excepción para que la prueba falle.
-            
-        except Error as e:
-            # Captura específica para errores internos de Playwright (ej., selector inválido,
-            # o problemas con el contexto de la página).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar que '{selector}' NO es visible. "
-                f"Posibles causas: Selector inválido, problema de contexto de la página. Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_no_visible", directorio)
-            raise # Re-lanza la excepción para que la prueba falle.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al validar que '{selector}' NO es visible. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_no_visible", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente de si la validación fue exitosa o falló.
-            # Es un buen lugar para tomar una captura de pantalla final que muestre el estado de la página.
+            # Captura final del estado de la página, tanto si la validación fue exitosa como si falló.
             self.tomar_captura(f"{nombre_base}_estado_final_no_visible", directorio=directorio)
 
     # 8- Función para verificar que un elemento (o elementos) localizado en una página web contiene un texto específico
+    @accion_instrumentada
     def verificar_texto_contenido(self, selector: Union[str, Page.locator], texto_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Verifica que un elemento localizado en una página web **contiene un texto específico**.
@@ -368,112 +464,29 @@ class Funciones_Globales:
         self.logger.info(f"Verificando que el elemento con selector '{selector}' contiene el texto: '{texto_esperado}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Playwright Locator.
-        # Esto permite una interacción consistente, ya sea que se pase una cadena de selector
-        # o un Locator ya definido.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
-        # --- Medición de rendimiento: Inicio de la espera por visibilidad ---
-        # Registra el tiempo en que comienza la operación de esperar a que el elemento sea visible.
-        start_time_visible_check = time.time()
-        try:
-            # Playwright espera implícitamente a que el elemento cumpla la condición de visibilidad.
-            # El `timeout` se convierte de segundos a milisegundos, como lo requiere Playwright.
+        # Primera fase: latencia de renderizado hasta que el elemento es visible.
+        with self._medir("verificar_texto_contenido.visible_check", f"espera a que el elemento '{selector}' sea visible"):
             expect(locator).to_be_visible()
-            
-            # Registra el tiempo una vez que el elemento se ha vuelto visible.
-            end_time_visible_check = time.time()
-            # Calcula la duración de esta fase. Esta métrica es vital para entender
-            # la latencia de renderizado de la UI.
-            duration_visible_check = end_time_visible_check - start_time_visible_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ser visible: {duration_visible_check:.4f} segundos.")
-            self.logger.debug(f"Elemento con selector '{selector}' es visible.")
-
-            # Opcional: **Resalta visualmente el elemento** en la página del navegador.
-            # Esto es extremadamente útil para el debugging o para demos visuales de la prueba.
-            locator.highlight()
-            # Toma una captura de pantalla del estado actual de la página, antes de verificar el texto,
-            # para documentar la visibilidad del elemento.
-            self.tomar_captura(f"{nombre_base}_antes_verificacion_texto", directorio)
-
-            # --- Medición de rendimiento: Inicio de la espera por el texto ---
-            # Registra el tiempo en que comienza la operación de esperar a que el elemento contenga el texto.
-            start_time_text_check = time.time()
-            # Verifica que el elemento contiene el `texto_esperado`. Playwright también reintenta
-            # esta aserción hasta que el texto coincide o el `timeout` se agota.
-            expect(locator).to_contain_text(texto_esperado)
-            
-            # Registra el tiempo una vez que el texto esperado se ha encontrado.
-            end_time_text_check = time.time()
-            # Calcula la duración de esta fase. Esta métrica es importante si el texto se carga
-            # dinámicamente o tarda en aparecer después de que el elemento base es visible.
-            duration_text_check = end_time_text_check - start_time_text_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en contener el texto '{texto_esperado}': {duration_text_check:.4f} segundos.")
+        self.logger.debug(lambda: f"Elemento con selector '{selector}' es visible.")
 
-            self.logger.info(f"\n✔ ÉXITO: Elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
+        # Resalta visualmente el elemento y documenta su visibilidad antes de verificar el texto.
+        self._resaltar(locator)
+        self.tomar_captura(f"{nombre_base}_antes_verificacion_texto", directorio)
 
-            # Toma una captura de pantalla final para documentar la verificación exitosa del texto.
-            self.tomar_captura(nombre_base=f"{nombre_base}_despues_verificacion_texto", directorio=directorio)
-            
-            # Realiza una **espera fija** después de la verificación. Esto puede ser útil para
-            # propósitos de sincronización con el siguiente paso de la prueba o para permitir
-            # una observación visual si la prueba se ejecuta en modo interactivo.
-            self.esperar_fijo(tiempo)
-
-        except TimeoutError as e:
-            # Este bloque se ejecuta si el elemento no se hizo visible O no contenía el texto esperado
-            # dentro del `tiempo` total especificado.
-            end_time_fail = time.time() # Registra el tiempo final de la operación.
-            # Calcula la duración total que tardó la operación completa hasta el fallo.
-            duration_fail = end_time_fail - start_time_visible_check
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' no se hizo visible o no contenía "
-                f"el texto '{texto_esperado}' después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout para depuración.
-            self.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_timeout", directorio)
-            raise # Re-lanza la excepción para asegurar que la prueba falle.
-
-        except AssertionError as e:
-            # Este bloque se ejecuta si el elemento era visible, pero el texto real no coincidía
-            # con el `texto_esperado` después de las reintentos de `to_contain_text`.
-            error_msg = (
-                f"\n❌ FALLO (Aserción): El elemento con selector '{selector}' NO contiene el texto esperado: "
-                f"'{texto_esperado}'. Contenido actual: '{locator.text_content() if locator else 'N/A'}' Detalle: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_contenido", directorio)
-            raise # Re-lanza la excepción.
+        # Segunda fase: tiempo hasta que el texto (posiblemente cargado dinámicamente) aparece.
+        with self._medir("verificar_texto_contenido.text_check", f"espera a que el elemento '{selector}' contenga el texto '{texto_esperado}'"):
+            expect(locator).to_contain_text(texto_esperado)
 
-        except Error as e:
-            # Este bloque maneja errores específicos de Playwright que no son timeouts ni aserciones fallidas,
-            # como un selector malformado o un problema de comunicación con el navegador.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar texto para '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto", directorio)
-            raise # Re-lanza la excepción.
+        self.logger.info(f"\n✔ ÉXITO: Elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
+        self.tomar_captura(nombre_base=f"{nombre_base}_despues_verificacion_texto", directorio=directorio)
 
-        except Exception as e:
-            # Este bloque captura cualquier otra excepción inesperada que pueda ocurrir.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar el texto para el selector '{selector}'. "
-                f"Detalles: {e}"
-            )
-            # Usa `critical` para errores graves e `exc_info=True` para incluir la traza completa.
-            self.logger.critical(error_msg, exc_info=True)
-            # Toma una captura para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto", directorio)
-            raise # Re-lanza la excepción.
+        # Espera fija para sincronizar con el siguiente paso o permitir una observación visual.
+        self.esperar_fijo(tiempo)
 
     # 9- Función para rellenar campo de texto, tomar capturas y medir rendimiento
+    @accion_instrumentada
     def rellenar_campo_de_texto(self, selector: Union[str, Page.locator], texto, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Rellena un campo de texto con el valor especificado y toma capturas de pantalla
@@ -503,92 +516,29 @@ class Funciones_Globales:
         """
         self.logger.info(f"\nRellenando campo con selector '{selector}' con el texto: '{texto}'.")
 
-        # Asegura que 'selector' sea un objeto Locator de Playwright. Esto garantiza que
-        # las interacciones (como 'highlight' y 'fill') se realicen de manera consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
+        # Asegura que 'selector' sea un objeto Locator de Playwright.
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el campo de texto en el navegador. Esto es una ayuda visual
-            # excelente durante la ejecución de la prueba o el debugging.
-            locator.highlight()
-            # Toma una captura de pantalla del estado del campo *antes* de introducir el texto.
+            # Resalta visualmente el campo y toma una captura *antes* de introducir el texto.
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_de_rellenar_texto", directorio)
 
-            # --- Medición de rendimiento: Inicio de la operación de rellenado ---
-            # Registra el momento exacto en que comenzamos la operación de 'fill'.
-            start_time_fill = time.time()
-            
-            # Rellena el campo de texto con el valor proporcionado. El método `fill()` de Playwright
-            # es robusto: espera automáticamente a que el elemento sea visible, habilitado y editable
-            # antes de intentar escribir, lo que reduce la necesidad de esperas explícitas adicionales.
-            locator.fill(texto) # Convertimos el 'texto' a cadena para asegurar compatibilidad.
-            
-            # --- Medición de rendimiento: Fin de la operación de rellenado ---
-            # Registra el momento en que la operación de 'fill' ha finalizado.
-            end_time_fill = time.time()
-            # Calcula la duración total que tomó la operación de rellenado.
-            # Esta métrica es fundamental para evaluar la **reactividad de los campos de entrada**
-            # y el rendimiento percibido por el usuario.
-            duration_fill = end_time_fill - start_time_fill
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en rellenar el campo '{selector}': {duration_fill:.4f} segundos.")
+            # `fill()` espera automáticamente a que el elemento sea visible, habilitado y editable.
+            # Su duración mide la reactividad del campo de entrada.
+            with self._medir("rellenar_campo_de_texto.fill", f"rellenado del campo '{selector}'"):
+                locator.fill(texto)
 
             self.logger.info(f"\n✔ ÉXITO: Campo '{selector}' rellenado con éxito con el texto: '{texto}'.")
-
             # Toma una captura de pantalla del estado del campo *después* de introducir el texto.
             self.tomar_captura(f"{nombre_base}_despues_de_rellenar_texto", directorio)
-
-        except TimeoutError as e:
-            # Este bloque se ejecuta si la operación `locator.fill()` no pudo completarse
-            # dentro del tiempo de espera implícito de Playwright (que se basa en el timeout
-            # global de la página o el definido por el usuario para el locator).
-            error_msg = (
-                f"\n❌ ERROR (Timeout): El tiempo de espera se agotó al interactuar con el selector '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible, habilitado o editable a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa para depuración.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_rellenar", directorio)
-            # Re-lanza la excepción como un Error de Playwright para mantener la coherencia en el manejo de errores.
-            raise Error(error_msg) from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright que no son timeouts. Esto incluye problemas como
-            # un selector malformado, un elemento que se desprende del DOM, o fallos de comunicación con el navegador.
-            error_msg = (
-                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al interactuar con el selector '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_rellenar", directorio)
-            raise # Re-lanza la excepción para que la prueba se marque como fallida.
-
-        except Exception as e:
-            # Este es un bloque de captura general para cualquier otra excepción inesperada
-            # que no haya sido manejada por los tipos de errores anteriores.
-            error_msg = (
-                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al interactuar con el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel 'critical' para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_rellenar", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # El bloque `finally` se ejecuta siempre, independientemente de si la operación fue exitosa
-            # o si se produjo una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para permitir
-            # que la UI se actualice completamente o para propósitos de observación visual.
+            # Espera fija posterior a la operación, haya o no una excepción, para que la UI se actualice.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 10- Función para rellenar campo numérico positivo y hacer captura de la imagen con medición de rendimiento
+    @accion_instrumentada
     def rellenar_campo_numerico_positivo(self, selector: Union[str, Page.locator], valor_numerico: Union[int, float], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Rellena un campo de texto con un **valor numérico positivo** (entero o flotante)
@@ -621,110 +571,41 @@ class Funciones_Globales:
         # --- Validaciones de entrada ---
         # 1. Valida que el 'valor_numerico' sea de tipo numérico (int o float).
         if not isinstance(valor_numerico, (int, float)):
-            error_msg = f"\n❌ ERROR: El valor proporcionado '{valor_numerico}' no es un tipo numérico (int o float) válido."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_valor_no_numerico", directorio)
-            raise ValueError(error_msg)
+            raise ValueError(f"\n❌ ERROR: El valor proporcionado '{valor_numerico}' no es un tipo numérico (int o float) válido.")
 
         # 2. Valida que el 'valor_numerico' sea positivo (mayor o igual a cero).
         if valor_numerico < 0:
-            error_msg = f"\n❌ ERROR: El valor numérico '{valor_numerico}' no es positivo. Se esperaba un número mayor o igual a cero."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_valor_negativo", directorio)
-            raise ValueError(error_msg)
-
-        # Convierte el valor numérico a una cadena para poder rellenar el campo de texto.
-        valor_a_rellenar_str = str(valor_numerico)
+            raise ValueError(f"\n❌ ERROR: El valor numérico '{valor_numerico}' no es positivo. Se esperaba un número mayor o igual a cero.")
 
-        # Asegura que 'selector' sea un objeto Locator de Playwright.
-        # Esto permite una interacción consistente con Playwright.
+        # 3. Asegura que 'selector' sea una cadena o un objeto Locator de Playwright.
         if isinstance(selector, str):
             locator = self.page.locator(selector)
-        elif isinstance(selector, Page.locator): # Asegura que sea un objeto Locator válido
+        elif isinstance(selector, Locator):
             locator = selector
         else:
-            error_msg = f"\n❌ ERROR: El selector proporcionado '{type(selector)}' no es una cadena ni un objeto Locator válido."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_selector_numerico", directorio)
-            raise TypeError(error_msg)
+            raise TypeError(f"\n❌ ERROR: El selector proporcionado '{type(selector)}' no es una cadena ni un objeto Locator válido.")
+
+        # Convierte el valor numérico a una cadena para poder rellenar el campo de texto.
+        valor_a_rellenar_str = str(valor_numerico)
 
         try:
-            # Resalta visualmente el campo de texto en el navegador.
-            locator.highlight()
-            # Toma una captura de pantalla del estado del campo *antes* de rellenarlo.
+            # Resalta visualmente el campo y toma una captura *antes* de rellenarlo.
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_de_rellenar_numerico", directorio)
 
-            # --- Medición de rendimiento: Inicio de la operación de rellenado ---
-            # Registra el tiempo justo antes de ejecutar la acción de 'fill'.
-            start_time_fill = time.time()
-            
-            # Rellena el campo de texto con el valor numérico convertido a cadena.
-            # El método `fill()` de Playwright esperará automáticamente a que el elemento
-            # esté visible, habilitado y editable.
-            locator.fill(valor_a_rellenar_str)
-            
-            # --- Medición de rendimiento: Fin de la operación de rellenado ---
-            # Registra el tiempo inmediatamente después de que la operación de 'fill' se ha completado.
-            end_time_fill = time.time()
-            # Calcula la duración total de la operación de rellenado.
-            # Esta métrica es crucial para evaluar la **reactividad de los campos de entrada**,
-            # especialmente en formularios donde el rendimiento es crítico.
-            duration_fill = end_time_fill - start_time_fill
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en rellenar el campo '{selector}' con '{valor_a_rellenar_str}': {duration_fill:.4f} segundos.")
+            with self._medir("rellenar_campo_numerico_positivo.fill", f"rellenado del campo '{selector}' con '{valor_a_rellenar_str}'"):
+                locator.fill(valor_a_rellenar_str)
 
             self.logger.info(f"\n✔ ÉXITO: Campo '{selector}' rellenado con éxito con el valor: '{valor_a_rellenar_str}'.")
-
             # Toma una captura de pantalla del estado del campo *después* de rellenarlo.
             self.tomar_captura(f"{nombre_base}_despues_de_rellenar_numerico", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para errores de tiempo de espera de Playwright.
-            # Esto indica que el elemento no estaba listo (visible, habilitado, editable)
-            # dentro del tiempo implícito de espera de Playwright para la operación `fill()`.
-            error_msg = (
-                f"\n❌ ERROR (Timeout): El tiempo de espera se agotó al interactuar con el selector '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado/editable a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_numerico", directorio)
-            # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
-            raise Error(error_msg) from e
-
-        except Error as e:
-            # Captura específica para errores de Playwright que no son timeouts (ej., selector malformado,
-            # elemento desprendido del DOM, problemas con el contexto del navegador).
-            error_msg = (
-                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al interactuar con el selector '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_numerico", directorio)
-            raise # Re-lanza la excepción.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir durante la operación.
-            error_msg = (
-                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al interactuar con el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_numerico", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para
-            # observar los cambios en la UI o para dar tiempo a la aplicación a procesar
-            # la entrada antes de la siguiente acción de la prueba.
+            # Espera fija posterior a la operación, haya o no una excepción.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
-                
+
     # 11- Función para validar el título de una página con medición de rendimiento
+    @accion_instrumentada
     def validar_titulo_de_web(self, titulo_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Valida el título de la página web actual. Esta función espera hasta que el título
@@ -750,66 +631,17 @@ class Funciones_Globales:
         """
         self.logger.info(f"\nValidando que el título de la página sea: '{titulo_esperado}'. Tiempo máximo de espera: {tiempo}s.")
 
-        # --- Medición de rendimiento: Inicio de la espera por el título ---
-        # Registra el tiempo justo antes de iniciar la espera activa de Playwright.
-        start_time_title_check = time.time()
-
-        try:
-            # Playwright espera a que el título de la página coincida con el `titulo_esperado`.
-            # El `timeout` se especifica en milisegundos.
+        # Playwright espera a que el título coincida; su duración es un indicador de la
+        # velocidad de carga y actualización de la página.
+        with self._medir("validar_titulo_de_web.title_check", f"validación del título de la página a '{titulo_esperado}'"):
             expect(self.page).to_have_title(titulo_esperado)
-            
-            # --- Medición de rendimiento: Fin de la espera por el título ---
-            # Registra el tiempo una vez que el título ha sido validado con éxito.
-            end_time_title_check = time.time()
-            # Calcula la duración total que tardó la validación del título.
-            # Esta métrica es importante para evaluar la **velocidad de carga y actualización**
-            # del título de la página, un indicador clave del rendimiento de navegación.
-            duration_title_check = end_time_title_check - start_time_title_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en validar el título de la página a '{titulo_esperado}': {duration_title_check:.4f} segundos.")
-
-            self.logger.info(f"\n✔ ÉXITO: Título de la página '{self.page.title()}' validado exitosamente.")
-            # Toma una captura de pantalla al validar el título con éxito.
-            self.tomar_captura(f"{nombre_base}_exito_titulo", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para cuando el título no coincide dentro del tiempo especificado.
-            # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_title_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El título de la página no coincidió con '{titulo_esperado}' "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). Título actual: '{self.page.title()}'. Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_titulo_timeout", directorio)
-            raise # Re-lanza la excepción para que la prueba falle.
-
-        except AssertionError as e:
-            # Captura si la aserción de título falla por alguna otra razón (menos común con `to_have_title`
-            # y timeout, ya que `TimeoutError` suele ser lo primero).
-            error_msg = (
-                f"\n❌ FALLO (Aserción): El título de la página NO coincide con '{titulo_esperado}'. "
-                f"Título actual: '{self.page.title()}'. Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_titulo_no_coincide", directorio)
-            raise # Re-lanza la excepción.
 
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir durante la validación del título.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al validar el título de la página. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura para errores inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_titulo", directorio)
-            raise # Re-lanza la excepción.
-        
+        self.logger.info(f"\n✔ ÉXITO: Título de la página '{self.page.title()}' validado exitosamente.")
+        # Toma una captura de pantalla al validar el título con éxito.
+        self.tomar_captura(f"{nombre_base}_exito_titulo", directorio)
+
     # 12- Función para validar URL actual con medición de rendimiento
+    @accion_instrumentada
     def validar_url_actual(self, patron_url: str, tiempo: Union[int, float] = 0.5):
         """
         Valida la URL actual de la página usando un patrón de expresión regular.
@@ -836,73 +668,16 @@ class Funciones_Globales:
         """
         self.logger.info(f"\nValidando que la URL actual coincida con el patrón: '{patron_url}'. Tiempo máximo de espera: {tiempo}s.")
 
-        # --- Medición de rendimiento: Inicio de la espera por la URL ---
-        # Registra el tiempo justo antes de iniciar la espera activa de Playwright para la URL.
-        start_time_url_check = time.time()
-
-        try:
-            # Playwright espera a que la URL de la página coincida con el patrón de expresión regular.
-            # El `timeout` se especifica en milisegundos.
-            # `re.compile(patron_url)` convierte la cadena del patrón en un objeto de expresión regular
-            # que `to_have_url` puede utilizar.
+        # Playwright espera a que la URL coincida con el patrón; su duración mide la velocidad
+        # de navegación y enrutado. Esta función no recibe 'nombre_base' ni directorio, así que
+        # en caso de fallo el decorador solo registra el error (sin captura).
+        with self._medir("validar_url_actual.url_check", f"validación de la URL con el patrón '{patron_url}'"):
             expect(self.page).to_have_url(re.compile(patron_url))
-            
-            # --- Medición de rendimiento: Fin de la espera por la URL ---
-            # Registra el tiempo una vez que la URL ha sido validada con éxito.
-            end_time_url_check = time.time()
-            # Calcula la duración total que tardó la validación de la URL.
-            # Esta métrica es crucial para evaluar la **velocidad de navegación y carga de la página**,
-            # ya que la URL a menudo cambia una vez que la página está completamente cargada o enrutada.
-            duration_url_check = end_time_url_check - start_time_url_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en validar la URL a '{patron_url}': {duration_url_check:.4f} segundos.")
-
-            self.logger.info(f"\n✔ ÉXITO: URL '{self.page.url}' validada exitosamente con el patrón: '{patron_url}'.")
-            # Nota sobre capturas de pantalla para URL:
-            # Generalmente, una captura de pantalla no es visualmente útil para validar una URL,
-            # ya que la URL se encuentra en la barra de direcciones del navegador.
-            # Sin embargo, si deseas tener un registro visual del estado de la página
-            # en el momento de la validación exitosa, podrías descomentar la siguiente línea
-            # y asegurarte de pasar `nombre_base` y `directorio` como argumentos a esta función.
-            # self.tomar_captura(f"{nombre_base}_exito_url", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para cuando la URL no coincide con el patrón dentro del tiempo especificado.
-            # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_url_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): La URL actual '{self.page.url}' no coincidió con el patrón "
-                f"'{patron_url}' después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Podrías añadir una captura de pantalla aquí en caso de fallo, si es necesario para depuración.
-            # self.tomar_captura(f"{nombre_base}_fallo_url_timeout", directorio)
-            raise # Re-lanza la excepción para asegurar que la prueba falle.
-
-        except AssertionError as e:
-            # Captura si la aserción de URL falla por alguna otra razón que no sea un timeout directo
-            # (aunque con `to_have_url` y `timeout`, `TimeoutError` es más común).
-            error_msg = (
-                f"\n❌ FALLO (Aserción): La URL actual '{self.page.url}' NO coincide con el patrón: "
-                f"'{patron_url}'. Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Podrías añadir una captura de pantalla aquí en caso de fallo de aserción.
-            # self.tomar_captura(f"{nombre_base}_fallo_url_no_coincide", directorio)
-            raise # Re-lanza la excepción.
-        
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir durante la validación de la URL.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al validar la URL. "
-                f"URL actual: '{self.page.url}', Patrón esperado: '{patron_url}'. Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Podrías añadir una captura de pantalla aquí para errores inesperados.
-            # self.tomar_captura(f"{nombre_base}_error_inesperado_url", directorio)
-            raise # Re-lanza la excepción.
-        
+
+        self.logger.info(f"\n✔ ÉXITO: URL '{self.page.url}' validada exitosamente con el patrón: '{patron_url}'.")
+
     # 13- Función para hacer click en un elemento, con capturas y medición de rendimiento
+    @accion_instrumentada
     def hacer_click_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5):
         """
         Realiza un click en un elemento de la página web. La función incluye
@@ -936,100 +711,34 @@ class Funciones_Globales:
         self.logger.info(f"\nIntentando hacer click en el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
-            # Toma una captura de pantalla del estado de la página *antes* de realizar el clic.
+            # Resalta el elemento y toma una captura del estado de la página *antes* de la acción.
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_click", directorio)
 
-            # Si se proporciona 'texto_esperado', valida que el elemento contenga ese texto.
-            # Esta aserción también espera a que el texto esté presente.
+            # Si se proporciona 'texto_esperado', valida (esperando) que el elemento contenga ese texto.
             if texto_esperado:
-                # Registra el tiempo antes de la aserción de texto.
-                start_time_text_check = time.time()
-                expect(locator).to_have_text(texto_esperado)
-                # Registra el tiempo después de la aserción de texto y calcula la duración.
-                end_time_text_check = time.time()
-                duration_text_check = end_time_text_check - start_time_text_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en contener el texto '{texto_esperado}': {duration_text_check:.4f} segundos.")
+                with self._medir("hacer_click_en_elemento.text_check", f"espera a que el elemento '{selector}' contenga el texto '{texto_esperado}'"):
+                    expect(locator).to_have_text(texto_esperado)
                 self.logger.info(f"\n✅ El elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
 
-            # --- Medición de rendimiento: Inicio de la operación de clic ---
-            # Registra el tiempo justo antes de ejecutar la acción de 'click'.
-            start_time_click = time.time()
-
-            # Realiza el clic en el elemento. El método `click()` de Playwright
-            # esperará automáticamente a que el elemento sea visible, habilitado y clicable.
-            # El `timeout` aquí es para esta operación específica.
-            locator.click()
-
-            # --- Medición de rendimiento: Fin de la operación de clic ---
-            # Registra el tiempo inmediatamente después de que la operación de clic se ha completado.
-            end_time_click = time.time()
-            # Calcula la duración total de la operación de clic.
-            # Esta métrica es crucial para evaluar la **reactividad de los botones/enlaces**
-            # y el rendimiento percibido por el usuario al interactuar.
-            duration_click = end_time_click - start_time_click
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el clic en el elemento '{selector}': {duration_click:.4f} segundos.")
+            # Playwright espera automáticamente a que el elemento sea visible, habilitado y clicable.
+            # Esta métrica evalúa la reactividad de los botones/enlaces percibida por el usuario.
+            with self._medir("hacer_click_en_elemento.click", f"click en el elemento '{selector}'"):
+                locator.click()
 
             self.logger.info(f"\n✔ ÉXITO: Click realizado exitosamente en el elemento con selector '{selector}'.")
-            # Toma una captura de pantalla del estado de la página *después* de realizar el clic.
+            # Toma una captura de pantalla del estado de la página *después* de la acción.
             self.tomar_captura(f"{nombre_base}_despues_click", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para errores de tiempo de espera de Playwright.
-            # Esto indica que el elemento no estaba listo (visible, habilitado, clicable)
-            # o que el texto esperado no apareció a tiempo.
-            error_msg = (
-                f"\n❌ ERROR (Timeout): El tiempo de espera se agotó al intentar hacer click en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado/clicable a tiempo, "
-                f"o no contenía el texto esperado (si se especificó).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_click", directorio)
-            # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
-            raise Error(error_msg) from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright que no son timeouts (ej., selector malformado,
-            # elemento desprendido del DOM, problemas con el contexto del navegador).
-            error_msg = (
-                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al hacer click en el selector '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_click", directorio)
-            raise # Re-lanza la excepción.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir durante la operación de clic.
-            error_msg = (
-                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al intentar hacer click en el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_click", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para
-            # observar los cambios en la UI que ocurran después del clic (ej., una navegación,
-            # un modal apareciendo) o para dar tiempo a la aplicación a procesar la acción.
+            # Espera fija posterior para observar los cambios en la UI (navegación, modales...).
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 14- Función para hacer doble click en un elemento, con capturas y medición de rendimiento
+    @accion_instrumentada
     def hacer_doble_click_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5):
         """
         Realiza un **doble click** en un elemento de la página web. La función incluye
@@ -1063,99 +772,34 @@ class Funciones_Globales:
         self.logger.info(f"\nIntentando hacer doble click en el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
-            # Toma una captura de pantalla del estado de la página *antes* de realizar el doble clic.
+            # Resalta el elemento y toma una captura del estado de la página *antes* de la acción.
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_doble_click", directorio)
 
-            # Si se proporciona 'texto_esperado', valida que el elemento contenga ese texto.
-            # Esta aserción también espera a que el texto esté presente.
+            # Si se proporciona 'texto_esperado', valida (esperando) que el elemento contenga ese texto.
             if texto_esperado:
-                # Registra el tiempo antes de la aserción de texto.
-                start_time_text_check = time.time()
-                expect(locator).to_have_text(texto_esperado)
-                # Registra el tiempo después de la aserción de texto y calcula la duración.
-                end_time_text_check = time.time()
-                duration_text_check = end_time_text_check - start_time_text_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en contener el texto '{texto_esperado}' antes del doble clic: {duration_text_check:.4f} segundos.")
+                with self._medir("hacer_doble_click_en_elemento.text_check", f"espera a que el elemento '{selector}' contenga el texto '{texto_esperado}'"):
+                    expect(locator).to_have_text(texto_esperado)
                 self.logger.info(f"\n✅ El elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
 
-            # --- Medición de rendimiento: Inicio de la operación de doble clic ---
-            # Registra el tiempo justo antes de ejecutar la acción de 'dblclick'.
-            start_time_dblclick = time.time()
-
-            # Realiza el doble clic en el elemento. El método `dblclick()` de Playwright
-            # esperará automáticamente a que el elemento sea visible, habilitado y doble-clicable.
-            # El `timeout` aquí es para esta operación específica.
-            locator.dblclick()
-
-            # --- Medición de rendimiento: Fin de la operación de doble clic ---
-            # Registra el tiempo inmediatamente después de que la operación de doble clic se ha completado.
-            end_time_dblclick = time.time()
-            # Calcula la duración total de la operación de doble clic.
-            # Esta métrica es crucial para evaluar la **reactividad de la UI**
-            # ante interacciones más complejas como el doble clic.
-            duration_dblclick = end_time_dblclick - start_time_dblclick
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el doble clic en el elemento '{selector}': {duration_dblclick:.4f} segundos.")
+            # Playwright espera automáticamente a que el elemento sea visible, habilitado y clicable.
+            # Esta métrica evalúa la reactividad de los botones/enlaces percibida por el usuario.
+            with self._medir("hacer_doble_click_en_elemento.dblclick", f"doble click en el elemento '{selector}'"):
+                locator.dblclick()
 
             self.logger.info(f"\n✔ ÉXITO: Doble click realizado exitosamente en el elemento con selector '{selector}'.")
-            # Toma una captura de pantalla del estado de la página *después* de realizar el doble clic.
+            # Toma una captura de pantalla del estado de la página *después* de la acción.
             self.tomar_captura(f"{nombre_base}_despues_doble_click", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para errores de tiempo de espera de Playwright.
-            # Esto indica que el elemento no estaba listo (visible, habilitado, doble-clicable)
-            # o que el texto esperado no apareció a tiempo.
-            error_msg = (
-                f"\n❌ ERROR (Timeout): El tiempo de espera se agotó al intentar hacer doble click en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado/doble-clicable a tiempo, "
-                f"o no contenía el texto esperado (si se especificó).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_doble_click", directorio)
-            # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
-            raise Error(error_msg) from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright que no son timeouts (ej., selector malformado,
-            # elemento desprendido del DOM, problemas con el contexto del navegador).
-            error_msg = (
-                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al hacer doble click en el selector '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_doble_click", directorio)
-            raise # Re-lanza la excepción.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir durante la operación de doble clic.
-            error_msg = (
-                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al intentar hacer doble click en el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_doble_click", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para
-            # observar los cambios en la UI que ocurran después del doble clic.
+            # Espera fija posterior para observar los cambios en la UI (navegación, modales...).
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
-                
+
     # 15- Función para hacer hover sobre un elemento, con capturas y medición de rendimiento
+    @accion_instrumentada
     def hacer_hover_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Realiza una acción de **hover (pasar el ratón por encima)** sobre un elemento
@@ -1181,89 +825,31 @@ class Funciones_Globales:
             Error: Si ocurre un error específico de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando hacer hover sobre el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info(f"\nIntentando hacer hover en el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
-            # Toma una captura de pantalla del estado de la página *antes* de realizar el hover.
+            # Resalta el elemento y toma una captura del estado de la página *antes* de la acción.
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_hover", directorio)
 
-            # --- Medición de rendimiento: Inicio de la operación de hover ---
-            # Registra el tiempo justo antes de ejecutar la acción de 'hover'.
-            start_time_hover = time.time()
-
-            # Realiza el hover sobre el elemento. El método `hover()` de Playwright
-            # esperará automáticamente a que el elemento sea visible y esté listo para la interacción.
-            # El `timeout` aquí es para esta operación específica.
-            locator.hover()
-
-            # --- Medición de rendimiento: Fin de la operación de hover ---
-            # Registra el tiempo inmediatamente después de que la operación de hover se ha completado.
-            end_time_hover = time.time()
-            # Calcula la duración total de la operación de hover.
-            # Esta métrica es importante para evaluar la **reactividad de la UI**
-            # ante interacciones que revelan tooltips, menús desplegables, etc.
-            duration_hover = end_time_hover - start_time_hover
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el hover en el elemento '{selector}': {duration_hover:.4f} segundos.")
+            # Playwright espera automáticamente a que el elemento sea visible e interactuable.
+            # Esta métrica evalúa la reactividad de los botones/enlaces percibida por el usuario.
+            with self._medir("hacer_hover_en_elemento.hover", f"hover en el elemento '{selector}'"):
+                locator.hover()
 
             self.logger.info(f"\n✔ ÉXITO: Hover realizado exitosamente en el elemento con selector '{selector}'.")
-            # Toma una captura de pantalla del estado de la página *después* de realizar el hover.
-            # Esta captura es especialmente útil si el hover revela nuevos elementos (ej., un menú).
+            # Toma una captura de pantalla del estado de la página *después* de la acción.
             self.tomar_captura(f"{nombre_base}_despues_hover", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para errores de tiempo de espera de Playwright.
-            # Esto indica que el elemento no estaba visible o interactuable a tiempo para el hover.
-            error_msg = (
-                f"\n❌ ERROR (Timeout): El tiempo de espera se agotó al intentar hacer hover en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció o no fue visible/habilitado a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_hover", directorio)
-            # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
-            raise Error(error_msg) from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright que no son timeouts (ej., selector malformado,
-            # elemento desprendido del DOM, problemas con el contexto del navegador).
-            error_msg = (
-                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al hacer hover en el selector '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_hover", directorio)
-            raise # Re-lanza la excepción.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir durante la operación de hover.
-            error_msg = (
-                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al intentar hacer hover en el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_hover", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto es útil para
-            # observar los cambios en la UI que puedan activarse por el hover (ej., tooltips, menús).
+            # Espera fija posterior para observar los cambios en la UI (navegación, modales...).
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 16- Función para verificar si un elemento está habilitado (enabled) con medición de rendimiento
+    @accion_instrumentada(en_timeout=False, en_verificacion=False)
     def verificar_elemento_habilitado(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica si un elemento está **habilitado (enabled)** en la página web.
@@ -1294,99 +880,25 @@ class Funciones_Globales:
         """
         self.logger.info(f"\nVerificando si el elemento con selector '{selector}' está habilitado. Tiempo máximo de espera: {tiempo}s.")
 
-        # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la verificación de habilitación ---
-        # Registra el tiempo justo antes de iniciar la aserción de habilitación.
-        start_time_enabled_check = time.time()
+        # Asegura que 'selector' sea un objeto Locator de Playwright.
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
-
-            # Playwright espera a que el elemento esté habilitado.
-            # El `timeout` se especifica en milisegundos.
-            expect(locator).to_be_enabled()
-            
-            # --- Medición de rendimiento: Fin de la verificación ---
-            # Registra el tiempo una vez que la aserción de habilitación ha sido exitosa.
-            end_time_enabled_check = time.time()
-            # Calcula la duración total de la verificación de habilitación.
-            # Esta métrica es importante para evaluar la **velocidad con la que los elementos
-            # interactivos de la UI se vuelven funcionales**. Un tiempo de habilitación
-            # prolongado podría indicar problemas de carga de JavaScript o de renderizado.
-            duration_enabled_check = end_time_enabled_check - start_time_enabled_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el elemento '{selector}' está habilitado: {duration_enabled_check:.4f} segundos.")
+            self._resaltar(locator)
+            # Si el elemento no se habilita a tiempo, el decorador toma la captura del fallo y devuelve
+            # False; los errores de Playwright o inesperados sí se relanzan.
+            with self._medir("verificar_elemento_habilitado.enabled_check", f"verificación de que el elemento '{selector}' está habilitado"):
+                expect(locator).to_be_enabled()
 
             self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' está habilitado.")
-            # Toma una captura de pantalla al verificar que el elemento está habilitado con éxito.
             self.tomar_captura(f"{nombre_base}_habilitado", directorio)
             return True
-
-        except TimeoutError as e:
-            # Captura específica para cuando el elemento no está habilitado dentro del tiempo especificado.
-            # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_enabled_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' NO está habilitado "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). "
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False en lugar de fallar la prueba.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_NO_habilitado_timeout", directorio)
-            return False
-
-        except AssertionError as e:
-            # Captura si la aserción de habilitación falla por alguna otra razón.
-            # Con `to_be_enabled` y un timeout, `TimeoutError` es más común, pero `AssertionError`
-            # podría ocurrir si el elemento existe pero la aserción de Playwright lo considera inhabilitado
-            # sin agotar el timeout.
-            error_msg = (
-                f"\n❌ FALLO (Aserción): El elemento con selector '{selector}' NO está habilitado. "
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg) # Usa 'warning' aquí también.
-            # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_NO_habilitado_fallo", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright que no son timeouts ni AssertionErrors (ej., selector malformado).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar habilitación de '{selector}'. "
-                f"Esto indica un problema fundamental con el selector o el navegador. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_habilitado", directorio)
-            raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar la habilitación de '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_habilitado", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
-            # el estado del elemento o esperar efectos secundarios en la UI.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 17- Función para mover el mouse a coordenadas X, Y y hacer clic, con medición de rendimiento
+    @accion_instrumentada
     def mouse_mueve_y_hace_clic_xy(self, x: int, y: int, nombre_base: str, directorio: str, tiempo: Union[int, float] = 1.0):
         """
         Mueve el cursor del mouse a las coordenadas de pantalla (X, Y) especificadas y luego
@@ -1417,71 +929,30 @@ class Funciones_Globales:
         # --- Validaciones de entrada ---
         # Asegura que las coordenadas sean de tipo entero para evitar errores inesperados con mouse.move/click.
         if not isinstance(x, int) or not isinstance(y, int):
-            error_msg = f"\n❌ ERROR: Las coordenadas X ({x}) e Y ({y}) deben ser números enteros."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_coordenadas_invalidas", directorio)
-            raise ValueError(error_msg)
+            raise ValueError(f"\n❌ ERROR: Las coordenadas X ({x}) e Y ({y}) deben ser números enteros.")
 
         try:
             # Toma una captura de pantalla del estado de la página *antes* de mover y hacer clic.
             self.tomar_captura(f"{nombre_base}_antes_mouse_click_xy", directorio)
-            
-            # --- Medición de rendimiento: Inicio de la operación del mouse ---
-            # Registra el tiempo justo antes de iniciar el movimiento y clic del mouse.
-            start_time_mouse_action = time.time()
-
-            # Mueve el cursor del mouse a las coordenadas especificadas.
-            # `steps=5` hace que el movimiento sea más suave, simulando un usuario real.
-            self.page.mouse.move(x, y, steps=5) 
-            self.logger.debug(f"\nMouse movido a X:{x}, Y:{y}.")
-            
-            # Realiza un clic en las mismas coordenadas.
-            self.page.mouse.click(x, y)
 
-            # --- Medición de rendimiento: Fin de la operación del mouse ---
-            # Registra el tiempo inmediatamente después de que el clic se ha completado.
-            end_time_mouse_action = time.time()
-            # Calcula la duración total de la secuencia de movimiento y clic.
             # Esta métrica es relevante para acciones de UI que dependen de interacciones
             # de ratón muy precisas y para evaluar la latencia percibida en estas acciones.
-            duration_mouse_action = end_time_mouse_action - start_time_mouse_action
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en mover y hacer clic en X:{x}, Y:{y}: {duration_mouse_action:.4f} segundos.")
+            with self._medir("mouse_mueve_y_hace_clic_xy.mouse_action", f"mover y hacer clic en X:{x}, Y:{y}"):
+                # `steps=5` hace que el movimiento sea más suave, simulando un usuario real.
+                self.page.mouse.move(x, y, steps=5)
+                self.logger.debug(lambda: f"\nMouse movido a X:{x}, Y:{y}.")
+                self.page.mouse.click(x, y)
 
             self.logger.info(f"\n✔ ÉXITO: Click realizado en X:{x}, Y:{y}.")
             # Toma una captura de pantalla del estado de la página *después* de la acción del mouse.
             self.tomar_captura(f"{nombre_base}_despues_mouse_click_xy", directorio)
-
-        except Error as e:
-            # Captura errores específicos de Playwright relacionados con la interacción del mouse.
-            error_msg = (
-                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al mover el mouse y hacer clic en X:{x}, Y:{y}.\n"
-                f"Esto puede deberse a problemas con la ventana del navegador o el contexto de ejecución.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla en el momento del fallo.
-            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_click_xy", directorio)
-            raise # Re-lanza la excepción.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al mover el mouse y hacer clic en X:{x}, Y:{y}.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_click_xy", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto es útil para observar
-            # los cambios visuales que el clic en las coordenadas pueda haber provocado.
+            # Espera fija posterior para observar los cambios visuales que el clic haya provocado.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 18- Función para marcar un checkbox, con verificación y medición de rendimiento
+    @accion_instrumentada(envolver_en=AssertionError)
     def marcar_checkbox(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Marca un checkbox especificado por su selector y verifica que se haya marcado
@@ -1509,84 +980,30 @@ class Funciones_Globales:
         self.logger.info(f"\nIntentando marcar el checkbox con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la operación de marcado y verificación ---
-        # Registra el tiempo justo antes de iniciar la operación.
-        start_time_checkbox_action = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self._resaltar(locator)
             # Toma una captura de pantalla del estado de la página *antes* de marcar el checkbox.
             self.tomar_captura(f"{nombre_base}_antes_marcar_checkbox", directorio)
-            
-            # Marca el checkbox. Playwright esperará automáticamente a que sea interactuable.
-            locator.check()
-            # Verifica que el checkbox esté marcado. Esta aserción también espera.
-            expect(locator).to_be_checked() 
-            
-            # --- Medición de rendimiento: Fin de la operación ---
-            # Registra el tiempo una vez que el checkbox ha sido marcado y verificado con éxito.
-            end_time_checkbox_action = time.time()
-            # Calcula la duración total de la operación.
-            # Esta métrica es importante para evaluar la **capacidad de respuesta de los elementos
-            # de formulario** y la velocidad de actualización de su estado en la UI.
-            duration_checkbox_action = end_time_checkbox_action - start_time_checkbox_action
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en marcar y verificar el checkbox '{selector}': {duration_checkbox_action:.4f} segundos.")
 
-            self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' marcado y verificado exitosamente.")
-            # Toma una captura de pantalla del estado de la página *después* de marcar el checkbox.
-            self.tomar_captura(f"{nombre_base}_despues_marcar_checkbox", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para cuando la operación de marcar o la verificación fallan por tiempo.
-            # Registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_checkbox_action # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El checkbox con selector '{selector}' no pudo ser marcado "
-                f"o verificado como marcado dentro de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_marcar", directorio)
-            # Re-lanza la excepción como un AssertionError para que la prueba falle claramente.
-            raise AssertionError(f"\nCheckbox no marcado/verificado (Timeout): {selector}") from e
-
-        except Error as e: # Captura errores específicos de Playwright (ej., selector inválido)
-            error_msg = (
-                f"\n❌ FALLO (Playwright Error): Problema al interactuar con el checkbox '{selector}'.\n"
-                f"Posibles causas: Selector inválido, elemento no interactuable, DOM no estable.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_marcar", directorio)
-            raise AssertionError(f"\nError de Playwright con checkbox: {selector}") from e # Re-lanza.
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al intentar marcar el checkbox '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_marcar", directorio)
-            raise # Re-lanza la excepción.
+            # Esta métrica evalúa la **capacidad de respuesta de los elementos de formulario** y la velocidad
+            # de actualización de su estado en la UI. Un timeout o un error de Playwright se relanzan como
+            # AssertionError para que la prueba falle claramente.
+            with self._medir("marcar_checkbox.checkbox_action", f"marcar y verificar el checkbox '{selector}'"):
+                locator.check()
+                expect(locator).to_be_checked()
 
+            self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' marcado y verificado exitosamente.")
+            # Toma una captura de pantalla del estado de la página *después* de marcar el checkbox.
+            self.tomar_captura(f"{nombre_base}_despues_marcar_checkbox", directorio)
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto puede ser útil para
-            # observar cualquier cambio adicional en la UI provocado por el cambio de estado del checkbox.
+            # Espera fija posterior para observar cualquier cambio en la UI provocado por el cambio de estado.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 19- Función para desmarcar un checkbox, con verificación y medición de rendimiento
+    @accion_instrumentada(envolver_en=AssertionError)
     def desmarcar_checkbox(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Desmarca un checkbox especificado por su selector y verifica que se haya desmarcado
@@ -1614,84 +1031,30 @@ class Funciones_Globales:
         self.logger.info(f"\nIntentando desmarcar el checkbox con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la operación de desmarcado y verificación ---
-        # Registra el tiempo justo antes de iniciar la operación.
-        start_time_checkbox_action = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self._resaltar(locator)
             # Toma una captura de pantalla del estado de la página *antes* de desmarcar el checkbox.
             self.tomar_captura(f"{nombre_base}_antes_desmarcar_checkbox", directorio)
-            
-            # Desmarca el checkbox. Playwright esperará automáticamente a que sea interactuable.
-            locator.uncheck()
-            # Verifica que el checkbox no esté marcado. Esta aserción también espera.
-            expect(locator).not_to_be_checked() 
-            
-            # --- Medición de rendimiento: Fin de la operación ---
-            # Registra el tiempo una vez que el checkbox ha sido desmarcado y verificado con éxito.
-            end_time_checkbox_action = time.time()
-            # Calcula la duración total de la operación.
-            # Esta métrica es importante para evaluar la **capacidad de respuesta de los elementos
-            # de formulario** y la velocidad de actualización de su estado en la UI.
-            duration_checkbox_action = end_time_checkbox_action - start_time_checkbox_action
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en desmarcar y verificar el checkbox '{selector}': {duration_checkbox_action:.4f} segundos.")
+
+            # Esta métrica evalúa la **capacidad de respuesta de los elementos de formulario** y la velocidad
+            # de actualización de su estado en la UI. Un timeout o un error de Playwright se relanzan como
+            # AssertionError para que la prueba falle claramente.
+            with self._medir("desmarcar_checkbox.checkbox_action", f"desmarcar y verificar el checkbox '{selector}'"):
+                locator.uncheck()
+                expect(locator).not_to_be_checked()
 
             self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' desmarcado y verificado exitosamente.")
             # Toma una captura de pantalla del estado de la página *después* de desmarcar el checkbox.
             self.tomar_captura(f"{nombre_base}_despues_desmarcar_checkbox", directorio)
-
-        except TimeoutError as e:
-            # Captura específica para cuando la operación de desmarcar o la verificación fallan por tiempo.
-            # Registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_checkbox_action # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El checkbox con selector '{selector}' no pudo ser desmarcado "
-                f"o verificado como desmarcado dentro de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_desmarcar", directorio)
-            # Re-lanza la excepción como un AssertionError para que la prueba falle claramente.
-            raise AssertionError(f"\nCheckbox no desmarcado/verificado (Timeout): {selector}") from e
-
-        except Error as e: # Captura errores específicos de Playwright (ej., selector inválido)
-            error_msg = (
-                f"\n❌ FALLO (Playwright Error): Problema al interactuar con el checkbox '{selector}'.\n"
-                f"Posibles causas: Selector inválido, elemento no interactuable, DOM no estable.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_desmarcar", directorio)
-            raise AssertionError(f"\nError de Playwright con checkbox: {selector}") from e # Re-lanza.
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al intentar desmarcar el checkbox '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_desmarcar", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto puede ser útil para
-            # observar cualquier cambio adicional en la UI provocado por el cambio de estado del checkbox.
+            # Espera fija posterior para observar cualquier cambio en la UI provocado por el cambio de estado.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
                 
     # 20- Función para verificar el valor de un campo de texto con medición de rendimiento
+    @accion_instrumentada(en_timeout=False, en_verificacion=False)
     def verificar_valor_campo(self, selector: Union[str, Page.locator], valor_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que el **valor de un campo de texto** coincida con el `valor_esperado`.
@@ -1724,110 +1087,28 @@ class Funciones_Globales:
         self.logger.info(f"\nVerificando que el campo '{selector}' contiene el valor esperado: '{valor_esperado}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la verificación del valor del campo ---
-        # Registra el tiempo justo antes de iniciar la aserción del valor.
-        start_time_value_check = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self._resaltar(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
-            # Esto puede ser útil para ver el valor inicial si es diferente al esperado.
             self.tomar_captura(f"{nombre_base}_antes_verificar_valor_campo", directorio)
 
-            # Playwright espera a que el campo contenga el valor especificado.
-            # El `timeout` se especifica en milisegundos.
-            expect(locator).to_have_value(valor_esperado)
-            
-            # --- Medición de rendimiento: Fin de la verificación ---
-            # Registra el tiempo una vez que la aserción del valor ha sido exitosa.
-            end_time_value_check = time.time()
-            # Calcula la duración total de la verificación del valor.
-            # Esta métrica es importante para evaluar la **velocidad con la que los campos
-            # de texto se pueblan o actualizan** en la UI, lo cual puede depender de la carga
-            # de datos o de la lógica de la aplicación.
-            duration_value_check = end_time_value_check - start_time_value_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el campo '{selector}' contiene el valor '{valor_esperado}': {duration_value_check:.4f} segundos.")
+            # Esta métrica evalúa la **velocidad con la que los campos de texto se pueblan o actualizan** en la UI.
+            # Si el valor no coincide a tiempo, el decorador toma la captura del fallo y devuelve False
+            # (el mensaje de la aserción incluye el valor actual del campo).
+            with self._medir("verificar_valor_campo.value_check", f"verificación de que el campo '{selector}' contiene el valor '{valor_esperado}'"):
+                expect(locator).to_have_value(valor_esperado)
 
             self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor esperado: '{valor_esperado}'.")
-            # Toma una captura de pantalla al verificar que el campo tiene el valor esperado.
             self.tomar_captura(f"{nombre_base}_despues_verificar_valor_campo", directorio)
             return True
-
-        except TimeoutError as e:
-            # Captura específica para cuando el campo no contiene el valor esperado dentro del tiempo.
-            # Se intenta obtener el valor actual del campo para incluirlo en el mensaje de error.
-            actual_value = "No se pudo obtener el valor"
-            try:
-                actual_value = locator.input_value() # Intenta obtener el valor actual
-            except Exception:
-                pass # Ignora si no se puede obtener el valor (ej., elemento no existe o no es input)
-
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_value_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El campo '{selector}' no contiene el valor esperado '{valor_esperado}' "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). "
-                f"Valor actual: '{actual_value}'. Detalles: {e}"
-            )
-            self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_campo", directorio)
-            return False
-
-        except AssertionError as e:
-            # Captura si la aserción de valor falla por alguna otra razón, aunque TimeoutError es más común.
-            actual_value = "No se pudo obtener el valor"
-            try:
-                actual_value = locator.input_value()
-            except Exception:
-                pass
-
-            error_msg = (
-                f"\n❌ FALLO (Aserción): El campo '{selector}' NO contiene el valor esperado '{valor_esperado}'. "
-                f"Valor actual: '{actual_value}'. Detalles: {e}"
-            )
-            self.logger.warning(error_msg) # Usa 'warning' aquí también.
-            # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_verificar_valor_campo", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, elemento no es un campo de entrada).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar el valor del campo '{selector}'. "
-                f"Esto indica un problema fundamental con el selector o el tipo de elemento. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_campo", directorio)
-            raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar el valor del campo '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_campo", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
-            # el estado del elemento o esperar efectos secundarios en la UI.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 21- Función para verificar el valor de un campo numérico (entero) con medición de rendimiento
+    @accion_instrumentada(en_timeout=False, en_verificacion=False)
     def verificar_valor_campo_numerico_int(self, selector: Union[str, Page.locator], valor_numerico_esperado: int, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que el **valor de un campo de texto**, interpretado como un **número entero**,
@@ -1864,129 +1145,34 @@ class Funciones_Globales:
         self.logger.info(f"\nVerificando que el campo '{selector}' contiene el valor numérico entero esperado: '{valor_numerico_esperado}'. Tiempo máximo de espera: {tiempo}s.")
 
         # --- Validación de entrada: Asegura que el valor esperado es un entero ---
-        # Es crucial que el valor esperado sea un entero para la lógica de la función.
         if not isinstance(valor_numerico_esperado, int):
-            error_msg = (
+            raise TypeError(
                 f"\n❌ ERROR de tipo: 'valor_numerico_esperado' debe ser un número entero (int), "
                 f"pero se recibió un tipo: {type(valor_numerico_esperado).__name__} con valor '{valor_numerico_esperado}'."
             )
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_valor_int", directorio)
-            raise TypeError(error_msg) # Se eleva un TypeError para un tipo de dato incorrecto.
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la verificación del valor numérico ---
-        # Registra el tiempo justo antes de iniciar la aserción del valor.
-        start_time_numeric_check = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self._resaltar(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
-            # Esto puede ser útil para ver el valor inicial si es diferente al esperado.
             self.tomar_captura(f"{nombre_base}_antes_verificar_valor_int", directorio)
 
-            # Playwright espera a que el campo contenga el valor especificado (convertido a cadena).
-            # El `timeout` se especifica en milisegundos.
-            # Se usa `str(valor_numerico_esperado)` porque el valor en un campo de texto HTML
-            # siempre se leerá como una cadena, incluso si representa un número.
-            expect(locator).to_have_value(str(valor_numerico_esperado))
-            
-            # --- Medición de rendimiento: Fin de la verificación ---
-            # Registra el tiempo una vez que la aserción del valor ha sido exitosa.
-            end_time_numeric_check = time.time()
-            # Calcula la duración total de la verificación del valor.
-            # Esta métrica es importante para evaluar la **velocidad con la que los campos
-            # numéricos se pueblan o actualizan** en la UI, lo cual puede depender de la carga
-            # de datos, cálculos en el frontend o lógica de la aplicación que establece los valores.
-            duration_numeric_check = end_time_numeric_check - start_time_numeric_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el campo '{selector}' contiene el valor numérico '{valor_numerico_esperado}': {duration_numeric_check:.4f} segundos.")
+            # El valor de un campo HTML siempre se lee como cadena, incluso si representa un número.
+            # Si no coincide a tiempo, el decorador toma la captura del fallo y devuelve False.
+            with self._medir("verificar_valor_campo_numerico_int.numeric_check", f"verificación de que el campo '{selector}' contiene el valor numérico '{valor_numerico_esperado}'"):
+                expect(locator).to_have_value(str(valor_numerico_esperado))
 
             self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor numérico entero esperado: '{valor_numerico_esperado}'.")
-            # Toma una captura de pantalla al verificar que el campo tiene el valor esperado.
             self.tomar_captura(f"{nombre_base}_despues_verificar_valor_int", directorio)
             return True
-
-        except TimeoutError as e:
-            # Captura específica para cuando el campo no contiene el valor esperado dentro del tiempo.
-            # Se intenta obtener el valor actual del campo para incluirlo en el mensaje de error.
-            actual_value_str = "No se pudo obtener el valor o no es un campo de entrada"
-            try:
-                # Intenta obtener el valor actual como cadena
-                actual_value_str = locator.input_value()
-            except Exception:
-                pass # Ignora si no se puede obtener el valor (ej., elemento no existe o no es input)
-
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_numeric_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El campo '{selector}' no contiene el valor entero esperado '{valor_numerico_esperado}' "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s). "
-                f"Valor actual en el campo: '{actual_value_str}'. Detalles: {e}"
-            )
-            self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_int", directorio)
-            return False
-
-        except AssertionError as e:
-            # Captura si la aserción de valor falla por alguna otra razón (menos común con to_have_value, pero posible).
-            actual_value_str = "No se pudo obtener el valor o no es un campo de entrada"
-            try:
-                actual_value_str = locator.input_value()
-                # Intenta convertir el valor actual a entero para una comparación más significativa en el log.
-                actual_value_int = int(actual_value_str)
-                comparison_msg = f"\n (Valor actual: {actual_value_int}, Esperado: {valor_numerico_esperado})"
-            except ValueError: # Si el valor actual no se puede convertir a int.
-                comparison_msg = f"\n (Valor actual no numérico: '{actual_value_str}', Esperado: {valor_numerico_esperado})"
-            except Exception: # Si no se puede obtener el valor en absoluto.
-                comparison_msg = f"\n (No se pudo obtener el valor actual, Esperado: {valor_numerico_esperado})"
-
-            error_msg = (
-                f"\n❌ FALLO (Aserción): El campo '{selector}' NO contiene el valor numérico entero esperado. "
-                f"{comparison_msg}. Detalles: {e}"
-            )
-            self.logger.warning(error_msg) # Usa 'warning' aquí también.
-            # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_verificar_valor_int", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, elemento no es un campo de entrada).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar el valor numérico entero del campo '{selector}'. "
-                f"Esto indica un problema fundamental con el selector o el tipo de elemento.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_int", directorio)
-            raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar el valor numérico entero del campo '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_int", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
-            # el estado del elemento o esperar efectos secundarios en la UI.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 22- Función para verificar el valor de un campo numérico (flotante) con medición de rendimiento
+    @accion_instrumentada(en_timeout=False)
     def verificar_valor_campo_numerico_float(self, selector: Union[str, Page.locator], valor_numerico_esperado: float, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, tolerancia: float = 1e-6) -> bool:
         """
         Verifica que el **valor de un campo de texto**, interpretado como un **número flotante**,
@@ -2027,134 +1213,58 @@ class Funciones_Globales:
 
         # --- Validación de entrada: Asegura que el valor esperado es un flotante y la tolerancia es un flotante ---
         if not isinstance(valor_numerico_esperado, float):
-            error_msg = (
+            raise TypeError(
                 f"\n❌ ERROR de tipo: 'valor_numerico_esperado' debe ser un número flotante (float), "
                 f"pero se recibió un tipo: {type(valor_numerico_esperado).__name__} con valor '{valor_numerico_esperado}'."
             )
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_valor_float", directorio)
-            raise TypeError(error_msg) # Se eleva un TypeError para un tipo de dato incorrecto.
-        
         if not isinstance(tolerancia, float) or tolerancia < 0:
-            error_msg = (
+            raise TypeError(
                 f"\n❌ ERROR de tipo: 'tolerancia' debe ser un número flotante (float) no negativo, "
                 f"pero se recibió un tipo: {type(tolerancia).__name__} con valor '{tolerancia}'."
             )
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_tolerancia_float", directorio)
-            raise TypeError(error_msg)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la verificación del valor flotante ---
-        # Registra el tiempo justo antes de iniciar la operación de verificación.
-        start_time_float_check = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self._resaltar(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
             self.tomar_captura(f"{nombre_base}_antes_verificar_valor_float", directorio)
 
-            # Primero, asegurar que el campo es visible y está presente en el DOM
-            # Esto es necesario porque `input_value()` no tiene un mecanismo de espera.
-            expect(locator).to_be_visible() 
-            
-            # Obtener el valor actual del campo como una cadena.
-            actual_value_str = locator.input_value()
+            with self._medir("verificar_valor_campo_numerico_float.float_check", f"verificación de que el campo '{selector}' contiene el valor flotante '{valor_numerico_esperado}'"):
+                # `input_value()` no espera: primero se asegura que el campo es visible y está en el DOM.
+                expect(locator).to_be_visible()
+                actual_value_str = locator.input_value()
+
+            try:
+                actual_value_float = float(actual_value_str)
+            except ValueError:
+                self.logger.warning(
+                    f"\n❌ FALLO (Valor no numérico): El valor actual del campo '{selector}' ('{actual_value_str}') "
+                    f"no pudo ser convertido a flotante para comparación. Se esperaba '{valor_numerico_esperado}'."
+                )
+                self.tomar_captura(f"{nombre_base}_fallo_valor_no_float", directorio)
+                return False
 
-            # Intentar convertir la cadena a un número flotante.
-            actual_value_float = float(actual_value_str)
-            
-            # Realizar la comparación de flotantes con la tolerancia.
             # `math.isclose` es la forma recomendada para comparar flotantes.
-            if math.isclose(actual_value_float, valor_numerico_esperado, rel_tol=tolerancia, abs_tol=tolerancia):
-                # --- Medición de rendimiento: Fin de la verificación (éxito) ---
-                end_time_float_check = time.time()
-                duration_float_check = end_time_float_check - start_time_float_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el campo '{selector}' contiene el valor flotante '{valor_numerico_esperado}': {duration_float_check:.4f} segundos.")
-
-                self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor numérico flotante esperado: '{valor_numerico_esperado}' (Actual: {actual_value_float}).")
-                # Toma una captura de pantalla al verificar que el campo tiene el valor esperado.
-                self.tomar_captura(f"{nombre_base}_despues_verificar_valor_float", directorio)
-                return True
-            else:
-                # Si la comparación con tolerancia falla
-                error_msg = (
+            if not math.isclose(actual_value_float, valor_numerico_esperado, rel_tol=tolerancia, abs_tol=tolerancia):
+                self.logger.warning(
                     f"\n❌ FALLO (Inexactitud): El campo '{selector}' NO contiene el valor numérico flotante esperado. "
                     f"Actual: {actual_value_float}, Esperado: {valor_numerico_esperado}, "
                     f"Diferencia: {abs(actual_value_float - valor_numerico_esperado):.10f} (Tolerancia: {tolerancia})."
                 )
-                self.logger.warning(error_msg)
                 self.tomar_captura(f"{nombre_base}_fallo_inexactitud_float", directorio)
                 return False
 
-        except TimeoutError as e:
-            # Captura si el campo no se hace visible o no se puede obtener su valor a tiempo.
-            # Se intenta obtener el valor actual del campo si es posible.
-            actual_value_str_on_timeout = "N/A"
-            try:
-                # Intenta obtener el valor actual como cadena justo antes de la excepción.
-                actual_value_str_on_timeout = locator.input_value()
-            except Exception:
-                pass # Ignora si no se puede obtener.
-
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_float_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El campo '{selector}' no se hizo visible o no se pudo obtener su valor "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s) para verificar el flotante '{valor_numerico_esperado}'. "
-                f"Valor actual (si disponible): '{actual_value_str_on_timeout}'. Detalles: {e}"
-            )
-            self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_float", directorio)
-            return False
-
-        except ValueError:
-            # Captura si el valor obtenido del campo no es una cadena que pueda convertirse a float.
-            error_msg = (
-                f"\n❌ FALLO (Valor no numérico): El valor actual del campo '{selector}' ('{actual_value_str}') "
-                f"no pudo ser convertido a flotante para comparación. Se esperaba '{valor_numerico_esperado}'."
-            )
-            self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_valor_no_float", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, elemento no es un campo de entrada).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar el valor numérico flotante del campo '{selector}'. "
-                f"Esto indica un problema fundamental con el selector o el tipo de elemento.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_float", directorio)
-            raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar el valor numérico flotante del campo '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_float", directorio)
-            raise # Re-lanza la excepción.
-
+            self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor numérico flotante esperado: '{valor_numerico_esperado}' (Actual: {actual_value_float}).")
+            self.tomar_captura(f"{nombre_base}_despues_verificar_valor_float", directorio)
+            return True
         finally:
-            # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
-            # el estado del elemento o esperar efectos secundarios en la UI.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
 
     # 23- Función para verificar el texto 'alt' de una imagen con medición de rendimiento
+    @accion_instrumentada(en_timeout=False)
     def verificar_alt_imagen(self, selector: Union[str, Page.locator], texto_alt_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que el **texto del atributo 'alt' de una imagen** coincida con el
@@ -2189,96 +1299,36 @@ class Funciones_Globales:
         self.logger.info(f"\nVerificando el texto 'alt' para la imagen con selector: '{selector}'. Valor esperado: '{texto_alt_esperado}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la verificación del texto 'alt' ---
-        # Registra el tiempo justo antes de iniciar la operación de verificación.
-        start_time_alt_check = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self._resaltar(locator)
             # Toma una captura de pantalla del estado de la imagen *antes* de la verificación.
             self.tomar_captura(f"{nombre_base}_antes_verificar_alt_imagen", directorio)
 
-            # Esperar a que la imagen sea visible y esté adjunta al DOM.
-            # Esto es crucial antes de intentar obtener atributos, ya que asegura que el elemento está cargado.
-            expect(locator).to_be_visible()
-            self.logger.debug(f"\nLa imagen con selector '{selector}' es visible.")
-
-            # Obtener el atributo 'alt' de la imagen.
-            # `get_attribute` también tiene un `timeout` que esperará hasta que el atributo esté presente.
-            alt_text_actual = locator.get_attribute("alt")
-
-            # Validar que el atributo 'alt' no sea None y coincida con el texto esperado.
-            # La comparación debe ser estricta para asegurar que el atributo existe y es correcto.
-            if alt_text_actual == texto_alt_esperado:
-                # --- Medición de rendimiento: Fin de la verificación (éxito) ---
-                end_time_alt_check = time.time()
-                duration_alt_check = end_time_alt_check - start_time_alt_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar el texto 'alt' de la imagen '{selector}': {duration_alt_check:.4f} segundos.")
-
-                self.logger.info(f"\n✔ ÉXITO: El texto 'alt' de la imagen es '{alt_text_actual}' y coincide con el esperado ('{texto_alt_esperado}').")
-                # Toma una captura de pantalla al verificar que el 'alt' de la imagen es el esperado.
-                self.tomar_captura(f"{nombre_base}_alt_ok", directorio)
-                return True
-            else:
-                # Si el texto 'alt' no coincide con el esperado
-                error_msg = (
+            with self._medir("verificar_alt_imagen.alt_check", f"verificación del texto 'alt' de la imagen '{selector}'"):
+                # La imagen debe estar visible y adjunta al DOM antes de leer sus atributos.
+                expect(locator).to_be_visible()
+                alt_text_actual = locator.get_attribute("alt")
+
+            # La comparación es estricta: el atributo debe existir y coincidir.
+            if alt_text_actual != texto_alt_esperado:
+                self.logger.warning(
                     f"\n❌ FALLO (No Coincide): El texto 'alt' actual de la imagen '{selector}' es '{alt_text_actual}', "
                     f"pero se esperaba '{texto_alt_esperado}'."
                 )
-                self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
-                # Toma una captura de pantalla si el texto 'alt' no coincide.
                 self.tomar_captura(f"{nombre_base}_alt_error", directorio)
                 return False
 
-        except TimeoutError as e:
-            # Captura si la imagen no se hace visible o no se puede obtener su atributo 'alt' a tiempo.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): La imagen con selector '{selector}' no se hizo visible "
-                f"o no se pudo obtener su atributo 'alt' después de {tiempo} segundos para verificar el texto '{texto_alt_esperado}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_alt_imagen", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, el elemento no es una imagen).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar el texto 'alt' de la imagen '{selector}'. "
-                f"Esto indica un problema fundamental con el selector o el tipo de elemento.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
-            # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_alt_imagen", directorio)
-            raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada que pueda ocurrir.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar el texto 'alt' de la imagen '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_alt_imagen", directorio)
-            raise # Re-lanza la excepción.
-
+            self.logger.info(f"\n✔ ÉXITO: El texto 'alt' de la imagen es '{alt_text_actual}' y coincide con el esperado ('{texto_alt_esperado}').")
+            self.tomar_captura(f"{nombre_base}_alt_ok", directorio)
+            return True
         finally:
-            # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
-            # el estado del elemento o esperar efectos secundarios en la UI.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
                 
     # 24- Función para verificar que una imagen se cargue exitosamente (sin enlaces rotos) con pruebas de rendimiento.
+    @accion_instrumentada(en_timeout=False, en_playwright=False)
     def verificar_carga_exitosa_imagen(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo_espera_red: Union[int, float] = 10.0, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que una **imagen especificada por su selector** se cargue exitosamente,
@@ -2307,109 +1357,52 @@ class Funciones_Globales:
                    (ej., selector inválido, no es un elemento de imagen válido).
             Exception: Para cualquier otro error inesperado.
         """
-        image_url = None
         self.logger.info(f"\nIniciando verificación de carga exitosa para la imagen con selector: '{selector}'. Tiempo de espera de red: {tiempo_espera_red}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la verificación de carga de imagen ---
-        # Registra el tiempo justo antes de iniciar la cadena de verificaciones (visibilidad, src, respuesta de red).
-        start_time_image_load_check = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # 1. Resaltar el elemento (útil para depuración visual en el navegador)
-            locator.highlight()
-            self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_verificar_carga_imagen", directorio) # Captura antes de iniciar la carga.
 
-            # 2. Esperar a que la imagen sea visible en el DOM
-            # Esto asegura que el elemento <img> está presente y renderizado.
-            self.logger.debug(f"\nEsperando visibilidad de la imagen con selector '{selector}' (timeout: {tiempo_espera_red}s).")
-            expect(locator).to_be_visible()
-            self.logger.info(f"\nLa imagen con selector '{selector}' es visible en el DOM.")
-
-            # 3. Obtener la URL de la imagen del atributo 'src'
-            # Playwright esperará implícitamente a que el atributo 'src' esté presente.
-            image_url = locator.get_attribute("src")
-            if not image_url:
-                error_msg = f"\n❌ FALLO: El atributo 'src' de la imagen con selector '{selector}' está vacío o no existe."
-                self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_src_vacio", directorio)
-                return False
-
-            self.logger.info(f"\nURL de la imagen a verificar: {image_url}")
-
-            # 4. Monitorear la carga de la imagen en la red
-            # Usamos page.wait_for_response para esperar la respuesta HTTP de la imagen específica.
-            # Esto es más robusto que solo verificar la visibilidad, ya que asegura que el recurso
-            # fue descargado correctamente de la red. Filtramos por la URL y el tipo de recurso 'image'.
-            self.logger.debug(f"\nEsperando respuesta de red para la imagen con URL: {image_url} (timeout: {tiempo_espera_red}s).")
-            response = self.page.wait_for_response(
-                lambda resp: resp.url == image_url and resp.request.resource_type == "image",
-                timeout=tiempo_espera_red * 1000 # Playwright espera milisegundos
-            )
-
-            # 5. Verificar el código de estado de la respuesta HTTP
-            if 200 <= response.status <= 299:
-                # --- Medición de rendimiento: Fin de la verificación (éxito) ---
-                end_time_image_load_check = time.time()
-                duration_image_load_check = end_time_image_load_check - start_time_image_load_check
-                self.logger.info(f"PERFORMANCE: Tiempo total para verificar la carga exitosa de la imagen '{selector}' (URL: {image_url}): {duration_image_load_check:.4f} segundos.")
+            # Si el elemento no aparece o la respuesta de red no llega a tiempo, o si falla Playwright (selector
+            # inválido, el elemento no es una imagen), el decorador toma la captura del fallo y devuelve False.
+            with self._medir("verificar_carga_exitosa_imagen.image_load_check", f"verificar la carga exitosa de la imagen '{selector}'"):
+                # 1. Esperar a que la imagen sea visible en el DOM
+                expect(locator).to_be_visible()
+                self.logger.info(f"\nLa imagen con selector '{selector}' es visible en el DOM.")
+
+                # 2. Obtener la URL de la imagen del atributo 'src'
+                image_url = locator.get_attribute("src")
+                if not image_url:
+                    self.logger.error(f"\n❌ FALLO: El atributo 'src' de la imagen con selector '{selector}' está vacío o no existe.")
+                    self.tomar_captura(f"{nombre_base}_src_vacio", directorio)
+                    return False
+                self.logger.info(f"\nURL de la imagen a verificar: {image_url}")
+
+                # 3. Esperar la respuesta HTTP de la imagen: asegura que el recurso se descargó de la red,
+                # no solo que el elemento es visible.
+                response = self.page.wait_for_response(
+                    lambda resp: resp.url == image_url and resp.request.resource_type == "image",
+                    timeout=tiempo_espera_red * 1000 # Playwright espera milisegundos
+                )
 
-                self.logger.info(f"\n✔ ÉXITO: La imagen con URL '{image_url}' cargó exitosamente con estado HTTP {response.status}.")
-                self.tomar_captura(f"{nombre_base}_carga_ok", directorio)
-                return True
-            else:
-                # Si el estado HTTP no es un 2xx (indica un problema de carga)
+            # 4. Verificar el código de estado de la respuesta HTTP
+            if not 200 <= response.status <= 299:
                 self.logger.error(f"\n❌ FALLO: La imagen con URL '{image_url}' cargó con un estado de error: {response.status}.")
                 self.tomar_captura(f"{nombre_base}_carga_fallida_status_{response.status}", directorio)
                 return False
 
-        except TimeoutError as e:
-            # Captura si el elemento no aparece o la respuesta de red no llega a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_image_load_check # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo verificar la carga de la imagen con selector '{selector}' "
-                f"y URL '{image_url if image_url else 'N/A'}' después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_red}s).\n"
-                f"Posibles causas: El elemento no apareció a tiempo o la respuesta de red no se completó.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que la función devuelve False.
-            self.tomar_captura(f"{nombre_base}_timeout_verificacion", directorio)
-            return False
-
-        except Error as e: # Captura errores específicos de Playwright (ej., selector inválido, no es un elemento de imagen)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al verificar la carga de la imagen con selector '{selector}'.\n"
-                f"Esto indica un problema fundamental con el selector o que el elemento no es una imagen válida.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            return False
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar la carga de la imagen con selector '{selector}' "
-                f"y URL '{image_url if image_url else 'N/A'}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise # Re-lanza la excepción.
-
+            self.logger.info(f"\n✔ ÉXITO: La imagen con URL '{image_url}' cargó exitosamente con estado HTTP {response.status}.")
+            self.tomar_captura(f"{nombre_base}_carga_ok", directorio)
+            return True
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
     
     # 25- Función para cargar archivo(s) con medición de rendimiento
+    @accion_instrumentada(en_timeout=False)
     def cargar_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, base_dir: str, file_names: Union[str, List[str]], tiempo: Union[int, float] = 0.5) -> bool:
         """
         Carga uno o varios archivos en un elemento de entrada de tipo 'file' en la página.
@@ -2448,109 +1441,40 @@ class Funciones_Globales:
         self.logger.info(f"\nIntentando cargar archivo(s) '{file_names_list}' en el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Construir las rutas completas de los archivos y verificar su existencia localmente
-        full_file_paths = []
-        for name in file_names_list:
-            full_path = os.path.join(base_dir, name)
-            full_file_paths.append(full_path)
-            self.logger.debug(f"\nConstruida ruta completa para archivo: '{full_path}'")
-
+        full_file_paths = [os.path.join(base_dir, name) for name in file_names_list]
+        for full_path in full_file_paths:
             if not os.path.exists(full_path):
-                error_msg = f"\n❌ Error: El archivo no existe en la ruta especificada: '{full_path}'."
-                self.logger.error(error_msg, exc_info=True)
-                self.tomar_captura(f"{nombre_base}_archivo_no_encontrado", directorio)
-                raise FileNotFoundError(error_msg) # Elevar un error específico si el archivo no se encuentra.
+                raise FileNotFoundError(f"\n❌ Error: El archivo no existe en la ruta especificada: '{full_path}'.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la operación de carga de archivos ---
-        # Registra el tiempo justo antes de iniciar la interacción con el elemento de entrada de archivo.
-        start_time_file_upload = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # 1. Esperar a que el elemento de entrada de archivo esté visible y habilitado
-            # Es fundamental asegurar que el elemento está listo para interactuar.
-            self.logger.debug(f"\nEsperando que el selector '{selector}' esté visible y habilitado (timeout: {tiempo}s).")
+            # 1. El elemento de entrada de archivo debe estar visible y habilitado antes de interactuar.
             expect(locator).to_be_visible()
-            expect(locator).to_be_enabled() # También se puede usar to_be_editable() si es un input
+            expect(locator).to_be_enabled()
             self.logger.info(f"\nEl selector '{selector}' está visible y habilitado.")
 
-            # 2. Opcional: Resaltar el elemento para depuración visual
-            locator.highlight()
-            self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_cargar_archivos", directorio) # Captura antes de adjuntar los archivos.
 
-            # 3. Usar set_input_files para adjuntar el archivo(s)
-            # Playwright maneja la interacción con el diálogo de carga de archivos.
-            # Se le pasa una lista de rutas completas de los archivos a adjuntar.
+            # 2. `set_input_files` adjunta los archivos sin abrir el diálogo de carga del sistema.
             self.logger.info(f"\nAdjuntando archivo(s) {file_names_list} al selector '{selector}'.")
-            locator.set_input_files(full_file_paths)
-
-            # --- Medición de rendimiento: Fin de la operación de carga de archivos ---
-            # Registra el tiempo una vez que Playwright ha adjuntado los archivos.
-            end_time_file_upload = time.time()
-            duration_file_upload = end_time_file_upload - start_time_file_upload
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en cargar el archivo(s) '{file_names_list}' en el selector '{selector}': {duration_file_upload:.4f} segundos.")
+            with self._medir("cargar_archivo.file_upload", f"cargar el archivo(s) '{file_names_list}' en el selector '{selector}'"):
+                locator.set_input_files(full_file_paths)
 
-            # Construir mensaje de éxito basado en si es uno o varios archivos
             if len(file_names_list) == 1:
-                success_msg = f"\n✅ Archivo '{file_names_list[0]}' cargado exitosamente desde '{base_dir}' en el selector '{selector}'."
+                self.logger.info(f"\n✅ Archivo '{file_names_list[0]}' cargado exitosamente desde '{base_dir}' en el selector '{selector}'.")
             else:
-                success_msg = f"\n✅ Archivos {file_names_list} cargados exitosamente desde '{base_dir}' en el selector '{selector}'."
-            self.logger.info(success_msg)
-            
+                self.logger.info(f"\n✅ Archivos {file_names_list} cargados exitosamente desde '{base_dir}' en el selector '{selector}'.")
             self.tomar_captura(f"{nombre_base}_archivos_cargados", directorio)
             return True
-
-        except TimeoutError as e:
-            # Captura si el elemento no se hace visible o habilitado a tiempo.
-            error_files_info = file_names_list[0] if len(file_names_list) == 1 else file_names_list
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_file_upload # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible o habilitado "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s) para cargar el archivo(s) '{error_files_info}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Usa 'error' porque un timeout al cargar archivos es un fallo crítico.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_cargar_archivo", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, el elemento no es un input[type="file"]).
-            error_files_info = file_names_list[0] if len(file_names_list) == 1 else file_names_list
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al cargar el archivo(s) '{error_files_info}' "
-                f"en el selector '{selector}'. Esto puede deberse a un selector incorrecto o que el elemento "
-                f"no es un input de tipo archivo válido.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_cargar_archivo", directorio)
-            raise # Re-lanza la excepción porque es un fallo de ejecución.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_files_info = file_names_list[0] if len(file_names_list) == 1 else file_names_list
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al cargar el archivo(s) '{error_files_info}' "
-                f"en el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
         
     # 26- Función para remover carga de archivo(s) con medición de rendimiento
+    @accion_instrumentada(en_timeout=False)
     def remover_carga_de_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Remueve la carga de archivo(s) de un elemento de entrada de tipo 'file'
@@ -2581,86 +1505,60 @@ class Funciones_Globales:
         self.logger.info(f"\nIntentando remover la carga de archivo para el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
-        if isinstance(selector, str):
-            locator = self.page.locator(selector)
-        else:
-            locator = selector
-
-        # --- Medición de rendimiento: Inicio de la operación de remoción de archivos ---
-        # Registra el tiempo justo antes de iniciar la interacción con el elemento.
-        start_time_file_removal = time.time()
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
 
         try:
-            # 1. Esperar a que el elemento de entrada de archivo esté visible y habilitado
-            # Es fundamental asegurar que el elemento está listo para interactuar y aceptar la limpieza.
-            self.logger.debug(f"\nEsperando que el selector '{selector}' esté visible y habilitado (timeout: {tiempo}s) para remover la carga.")
+            # 1. El elemento de entrada de archivo debe estar visible y habilitado para aceptar la limpieza.
             expect(locator).to_be_visible()
-            expect(locator).to_be_enabled() # O to_be_editable()
+            expect(locator).to_be_enabled()
             self.logger.info(f"\nEl selector '{selector}' está visible y habilitado.")
 
-            # 2. Resaltar el elemento para depuración visual
-            locator.highlight()
-            self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
+            self._resaltar(locator)
             self.tomar_captura(f"{nombre_base}_antes_remover_carga", directorio) # Captura antes de remover.
 
-            # 3. Usar set_input_files con una lista vacía para remover el archivo
-            # Esto simula el usuario cancelando o limpiando la selección de archivos.
+            # 2. `set_input_files` con una lista vacía simula que el usuario limpia la selección de archivos.
             self.logger.info(f"\nEstableciendo input files a vacío para el selector '{selector}'.")
-            locator.set_input_files([])
-
-            # --- Medición de rendimiento: Fin de la operación de remoción de archivos ---
-            # Registra el tiempo una vez que Playwright ha limpiado el input de archivos.
-            end_time_file_removal = time.time()
-            duration_file_removal = end_time_file_removal - start_time_file_removal
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en remover la carga de archivo para el selector '{selector}': {duration_file_removal:.4f} segundos.")
+            with self._medir("remover_carga_de_archivo.file_removal", f"remover la carga de archivo para el selector '{selector}'"):
+                locator.set_input_files([])
 
             self.logger.info(f"\n✅ Carga de archivo removida exitosamente para el selector '{selector}'.")
             self.tomar_captura(f"{nombre_base}_remocion_completa", directorio)
             return True
-
-        except TimeoutError as e:
-            # Captura si el elemento no se hace visible o habilitado a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_file_removal # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible o habilitado "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s) para remover la carga de archivo. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Usa 'error' porque un timeout es un fallo crítico.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_remocion_archivo", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, el elemento no es un input[type="file"]).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al intentar remover la carga de archivo "
-                f"para el selector '{selector}'. Esto puede deberse a un selector incorrecto o que el elemento "
-                f"no es un input de tipo archivo válido.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_remocion_archivo", directorio)
-            raise # Re-lanza la excepción porque es un fallo de ejecución.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al intentar remover la carga de archivo "
-                f"para el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_remocion_archivo", directorio)
-            raise # Re-lanza la excepción.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
         
+    # 26.1- Función para obtener una "foto" (snapshot) de una tabla en un solo viaje de ida y vuelta al navegador
+    @accion_instrumentada
+    def obtener_snapshot_tabla(self, tabla_selector: Locator) -> Dict[str, Any]:
+        """
+        Extrae en una sola llamada `evaluate` los encabezados, los textos de las filas, los textos
+        de las celdas y el estado de los checkboxes de una tabla HTML. Las funciones de tabla
+        buscan, validan y cuentan sobre esta estructura en Python en lugar de recorrer el DOM
+        con `filas.nth(i)` / `celdas.nth(j)` (un viaje de ida y vuelta por cada llamada).
+
+        Args:
+            tabla_selector (Locator): El **Locator de Playwright** del elemento `<table>`.
+
+        Returns:
+            Dict[str, Any]: Un diccionario con las claves:
+                - 'encabezados' (List[str]): Textos de `thead th` (o de todos los `th` si no hay `thead`).
+                - 'filas' (List[str]): Texto completo de cada fila de `tbody tr`.
+                - 'columnas' (List[List[Optional[str]]]): Textos de celda indexados por columna;
+                  `columnas[j][i]` es la celda `j` de la fila `i` (`None` si la fila no tiene esa celda).
+                - 'checkboxes' (List[List[Optional[bool]]]): Estado del checkbox de cada celda, con la misma
+                  forma que 'columnas' (`None` si la celda no contiene un checkbox).
+                - 'celdas_por_fila' (List[int]): Número de `td` de cada fila.
+                - 'num_filas' (int), 'num_columnas' (int): Dimensiones de la tabla.
+                - 'td_primera_fila' (int): Número de `td` de la primera fila (tablas sin encabezados).
+        """
+        with self._medir("obtener_snapshot_tabla.snapshot", "extracción del snapshot de la tabla"):
+            snapshot = tabla_selector.evaluate(_JS_SNAPSHOT_TABLA)
+        self.logger.debug(lambda: f"\nSnapshot de la tabla: {snapshot['num_filas']} filas x {snapshot['num_columnas']} columnas.")
+        return snapshot
+
     # 27- Función para contar filas y columnas de una tabla con pruebas de rendimiento
+    @accion_instrumentada(en_timeout=(-1, -1))
     def obtener_dimensiones_tabla(self, selector: Locator, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> Tuple[int, int]:
         """
         Obtiene las dimensiones (número de filas y columnas) de una tabla HTML
@@ -2704,101 +1602,43 @@ class Funciones_Globales:
 
         self.logger.info(f"\nObteniendo dimensiones de la tabla con selector: '{selector_info}'. Tiempo máximo de espera: {tiempo}s.")
 
-        # --- Medición de rendimiento: Inicio de la operación de obtener dimensiones ---
-        # Registra el tiempo justo antes de iniciar la interacción para obtener las dimensiones.
-        start_time_get_dimensions = time.time()
-
         try:
-            # 1. Asegurar que la tabla principal esté visible
-            # Es crucial que la tabla esté cargada y visible para poder contar sus elementos.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{selector_info}' esté visible (timeout: {tiempo}s).")
-            expect(selector).to_be_visible()
-            
-            # Resaltar el elemento de la tabla para depuración visual.
-            selector.highlight()
-            self.logger.debug(f"\nTabla con selector '{selector_info}' resaltada.")
-            self.tomar_captura(f"{nombre_base}_antes_obtener_dimensiones", directorio) # Captura antes de contar.
-
-            # 2. Contar el número de filas de datos
-            # Se buscan filas `<tr>` dentro de un `<tbody>` para contar solo las filas de datos,
-            # excluyendo potencialmente encabezados o pies de tabla.
-            filas_datos = selector.locator("tbody tr")
-            num_filas = filas_datos.count()
-            self.logger.debug(f"\nFilas de datos encontradas (tbody tr): {num_filas}.")
-
-            # 3. Contar el número de columnas
-            num_columnas = 0
-            # Intentar contar desde los encabezados de la tabla (th) primero.
-            headers = selector.locator("th")
-            if headers.count() > 0:
-                num_columnas = headers.count()
-                self.logger.debug(f"\nColumnas contadas desde encabezados (th): {num_columnas}.")
-            else:
-                # Si no hay thead/th, intentar contar td's de la primera fila de datos.
-                # Esto es útil para tablas que no usan thead o que son simples.
-                first_row_tds = selector.locator("tr").first.locator("td")
-                if first_row_tds.count() > 0:
-                    num_columnas = first_row_tds.count()
-                    self.logger.debug(f"\nColumnas contadas desde celdas de la primera fila (td): {num_columnas}.")
+            # Si la tabla no está disponible a tiempo, el decorador toma la captura del fallo y devuelve (-1, -1).
+            with self._medir("obtener_dimensiones_tabla.get_dimensions", f"obtener las dimensiones de la tabla '{selector_info}'"):
+                # 1. La tabla debe estar cargada y visible para poder contar sus elementos.
+                expect(selector).to_be_visible()
+
+                self._resaltar(selector)
+                self.tomar_captura(f"{nombre_base}_antes_obtener_dimensiones", directorio) # Captura antes de contar.
+
+                # 2. Filas de datos (`tbody tr`) a partir del snapshot de la tabla (un solo viaje al navegador).
+                snapshot = self.obtener_snapshot_tabla(selector)
+                num_filas = snapshot["num_filas"]
+                self.logger.debug(lambda: f"\nFilas de datos encontradas (tbody tr): {num_filas}.")
+
+                # 3. Columnas: desde los encabezados (th) o, si no hay, desde las celdas de la primera fila de datos.
+                num_columnas = 0
+                if snapshot["encabezados"]:
+                    num_columnas = len(snapshot["encabezados"])
+                    self.logger.debug(lambda: f"\nColumnas contadas desde encabezados (th): {num_columnas}.")
+                elif snapshot["td_primera_fila"] > 0:
+                    num_columnas = snapshot["td_primera_fila"]
+                    self.logger.debug(lambda: f"\nColumnas contadas desde celdas de la primera fila (td): {num_columnas}.")
                 else:
                     self.logger.warning(f"\nADVERTENCIA: No se pudieron encontrar encabezados (th) ni celdas (td) en la primera fila "
                                         f"para la tabla con selector '{selector_info}'. Asumiendo 0 columnas.")
-                    # En este caso, num_columnas seguirá siendo 0.
-
-            # --- Medición de rendimiento: Fin de la operación de obtener dimensiones ---
-            # Registra el tiempo una vez que se han contado las filas y columnas.
-            end_time_get_dimensions = time.time()
-            duration_get_dimensions = end_time_get_dimensions - start_time_get_dimensions
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en obtener las dimensiones de la tabla '{selector_info}': {duration_get_dimensions:.4f} segundos.")
 
             self.tomar_captura(f"{nombre_base}_dimensiones_obtenidas", directorio)
             self.logger.info(f"\n✅ ÉXITO: Dimensiones de la tabla '{selector_info}' obtenidas.")
             self.logger.info(f"--> Filas encontradas: {num_filas}")
             self.logger.info(f"--> Columnas encontradas: {num_columnas}")
             return (num_filas, num_columnas)
-
-        except TimeoutError as e:
-            # Captura si la tabla principal o sus elementos internos no se hacen visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_get_dimensions # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo obtener las dimensiones de la tabla con selector '{selector_info}' "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s).\n"
-                f"La tabla o sus elementos internos no estuvieron disponibles a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve un valor indicativo de fallo.
-            self.tomar_captura(f"{nombre_base}_dimensiones_timeout", directorio)
-            return (-1, -1) # Retorna valores indicativos de fallo.
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector de tabla inválido, problema al interactuar con el DOM).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al intentar obtener las dimensiones de la tabla con selector '{selector_info}'.\n"
-                f"Posibles causas: Selector de tabla inválido, estructura de tabla inesperada, elemento no es una tabla.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dimensiones_error_playwright", directorio)
-            raise # Relanzar porque es un error de ejecución de Playwright, no un fallo de aserción.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al obtener las dimensiones de la tabla con selector '{selector_info}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.tomar_captura(f"{nombre_base}_dimensiones_error_inesperado", directorio)
-            raise # Relanzar por ser un error inesperado.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
         
     # 28- Función para buscar datos parcial e imprimir la fila con pruebas de rendimiento
+    @accion_instrumentada(en_timeout=False)
     def busqueda_coincidencia_e_imprimir_fila(self, table_selector: Locator, texto_buscado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Busca una **coincidencia parcial de texto** dentro de las filas de una tabla
@@ -2832,99 +1672,43 @@ class Funciones_Globales:
         self.logger.info(f"\nIniciando búsqueda de coincidencia parcial para '{texto_buscado}' en la tabla con selector: '{table_selector}'. Tiempo máximo de espera: {tiempo}s.")
         encontrado = False
 
-        # --- Medición de rendimiento: Inicio de la búsqueda en la tabla ---
-        # Registra el tiempo justo antes de iniciar la interacción con la tabla para la búsqueda.
-        start_time_table_search = time.time()
-
         try:
-            # 1. Esperar a que la tabla esté visible
-            # Esto es fundamental antes de intentar iterar sobre sus filas.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{table_selector}' esté visible (timeout: {tiempo}s).")
-            expect(table_selector).to_be_visible()
-            self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
-            
-            # Resaltar la tabla completa para depuración visual.
-            table_selector.highlight()
-            self.tomar_captura(f"{nombre_base}_antes_busqueda_coincidencia", directorio) # Captura antes de buscar.
-
-            # 2. Obtener todas las filas de datos de la tabla
-            # Se buscan filas `<tr>` dentro de un `<tbody>` para enfocar la búsqueda en los datos.
-            filas = table_selector.locator("tbody tr")
-            num_filas = filas.count()
-            self.logger.debug(f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
-
-            # 3. Iterar sobre cada fila para buscar la coincidencia
-            for i in range(num_filas):
-                fila = filas.nth(i) # Obtiene el Locator para la fila actual.
-                fila_texto = fila.text_content() # Obtiene todo el texto visible de la fila.
-                self.logger.debug(f"\nAnalizando fila {i+1}: '{fila_texto}'.")
-
-                # Realizar la búsqueda de coincidencia parcial sin distinguir mayúsculas/minúsculas.
-                if texto_buscado.lower() in fila_texto.lower():
-                    self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia parcial) en la fila {i+1}.")
-                    self.logger.info(f"Contenido completo de la fila: '{fila_texto}'")
-                    fila.highlight() # Resalta la fila donde se encontró la coincidencia.
-                    self.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
-                    encontrado = True
-                    # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar el 'break'
-                    # break 
-            
-            if not encontrado:
-                self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia parcial) NO encontrado en ninguna fila de la tabla.")
-                self.tomar_captura(f"{nombre_base}_coincidencia_parcial_no_encontrada", directorio)
+            # Si la tabla no está disponible a tiempo, el decorador toma la captura del fallo y devuelve False.
+            with self._medir("busqueda_coincidencia_e_imprimir_fila.table_search", f"la búsqueda de '{texto_buscado}' en la tabla '{table_selector}'"):
+                # 1. La tabla debe estar visible antes de recorrer sus filas.
+                expect(table_selector).to_be_visible()
+                self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
+
+                self._resaltar(table_selector)
+                self.tomar_captura(f"{nombre_base}_antes_busqueda_coincidencia", directorio) # Captura antes de buscar.
+
+                # 2. Texto de todas las filas de datos (`tbody tr`) en un solo viaje al navegador.
+                filas = table_selector.locator("tbody tr")
+                textos_filas = self.obtener_snapshot_tabla(table_selector)["filas"]
+                self.logger.debug(lambda: f"\nNúmero de filas de datos encontradas en la tabla: {len(textos_filas)}.")
+
+                # 3. Coincidencia parcial sin distinguir mayúsculas/minúsculas en cada fila.
+                texto_buscado_min = texto_buscado.lower()
+                for i, fila_texto in enumerate(textos_filas):
+                    self.logger.debug(lambda: f"\nAnalizando fila {i+1}: '{fila_texto}'.")
+                    if texto_buscado_min in fila_texto.lower():
+                        self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia parcial) en la fila {i+1}.")
+                        self.logger.info(f"Contenido completo de la fila: '{fila_texto}'")
+                        self._resaltar(filas.nth(i)) # Resalta la fila donde se encontró la coincidencia.
+                        self.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
+                        encontrado = True
 
-            # --- Medición de rendimiento: Fin de la búsqueda en la tabla ---
-            # Registra el tiempo una vez que se ha completado la iteración sobre todas las filas (o hasta la primera coincidencia si se usa break).
-            end_time_table_search = time.time()
-            duration_table_search = end_time_table_search - start_time_table_search
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó la búsqueda de '{texto_buscado}' en la tabla '{table_selector}': {duration_table_search:.4f} segundos.")
+                if not encontrado:
+                    self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia parcial) NO encontrado en ninguna fila de la tabla.")
+                    self.tomar_captura(f"{nombre_base}_coincidencia_parcial_no_encontrada", directorio)
 
             return encontrado
-
-        except TimeoutError as e:
-            # Captura si la tabla principal o sus filas no se hacen visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_table_search # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla con selector '{table_selector}' "
-                f"o sus filas no estuvieron disponibles a tiempo ({duration_fail:.4f}s, timeout configurado: {tiempo}s) "
-                f"durante la búsqueda de '{texto_buscado}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve False.
-            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_timeout", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector de tabla inválido, problemas de interacción con el DOM).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al buscar coincidencia para '{texto_buscado}' "
-                f"en la tabla con selector '{table_selector}'.\n"
-                f"Posibles causas: Selector de tabla inválido, estructura de tabla inesperada, o problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_playwright", directorio)
-            raise # Relanzar porque es un error de ejecución de Playwright.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al buscar coincidencia para '{texto_buscado}' "
-                f"en la tabla con selector '{table_selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_inesperado", directorio)
-            raise # Relanzar por ser un error inesperado.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
         
     # 29- Función para buscar datos exacto e imprimir la fila con pruebas de rendimiento
+    @accion_instrumentada(en_timeout=False)
     def busqueda_estricta_imprimir_fila(self, table_selector: Locator, texto_buscado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Busca una **coincidencia exacta de texto** dentro de las celdas de una tabla
@@ -2960,111 +1744,50 @@ class Funciones_Globales:
         self.logger.info(f"\nIniciando búsqueda estricta para '{texto_buscado}' en la tabla con selector: '{table_selector}'. Tiempo máximo de espera: {tiempo}s.")
         encontrado = False
 
-        # --- Medición de rendimiento: Inicio de la búsqueda estricta en la tabla ---
-        # Registra el tiempo justo antes de iniciar la interacción con la tabla para la búsqueda.
-        start_time_strict_search = time.time()
-
         try:
-            # 1. Esperar a que la tabla esté visible
-            # Esto es fundamental antes de intentar iterar sobre sus filas y celdas.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{table_selector}' esté visible (timeout: {tiempo}s).")
-            expect(table_selector).to_be_visible()
-            self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
-            
-            # Resaltar la tabla completa para depuración visual.
-            table_selector.highlight()
-            self.tomar_captura(f"{nombre_base}_antes_busqueda_estricta", directorio) # Captura antes de buscar.
-
-            # 2. Obtener todas las filas de datos de la tabla
-            # Se buscan filas `<tr>` dentro de un `tbody` para enfocar la búsqueda en los datos.
-            filas = table_selector.locator("tbody tr")
-            num_filas = filas.count()
-            self.logger.debug(f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
-
-            # 3. Iterar sobre cada fila y cada celda para buscar la coincidencia exacta
-            for i in range(num_filas):
-                fila = filas.nth(i) # Obtiene el Locator para la fila actual.
-                celdas = fila.locator("td") # Asumiendo celdas de datos son 'td'.
-                num_celdas = celdas.count()
-                fila_texto_completo = "" # Para reconstruir y loggear el contenido completo de la fila.
-                self.logger.debug(f"\nAnalizando fila {i+1} para búsqueda estricta.")
-
-                for j in range(num_celdas):
-                    celda = celdas.nth(j) # Obtiene el Locator para la celda actual.
-                    celda_texto = celda.text_content().strip() # Obtiene el texto de la celda y elimina espacios en blanco alrededor.
-                    fila_texto_completo += celda_texto + " | " # Concatenar para imprimir la fila completa en el log.
-
-                    # Realizar la búsqueda de coincidencia estricta.
-                    if celda_texto == texto_buscado: # Coincidencia estricta
-                        self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia estricta) en la celda {j+1} de la fila {i+1}.")
-                        self.logger.info(f"Contenido completo de la fila: '{fila_texto_completo.strip(' | ')}'")
-                        celda.highlight() # Resaltar la celda donde se encontró la coincidencia.
-                        fila.highlight() # También resaltar la fila para mejor visibilidad.
-                        self.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
-                        encontrado = True
-                        # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar ambos 'break'.
-                        # break # Rompe el bucle de celdas.
-                
-                if encontrado:
-                    # break # Rompe el bucle de filas si se encontró una coincidencia y se desea parar.
-                    pass # Si se desea seguir buscando en otras filas, manteniendo el 'encontrado' en True.
-
-            if not encontrado:
-                self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia estricta) NO encontrado en ninguna celda de la tabla.")
-                self.tomar_captura(f"{nombre_base}_coincidencia_estricta_no_encontrada", directorio)
-
-            # --- Medición de rendimiento: Fin de la búsqueda estricta en la tabla ---
-            # Registra el tiempo una vez que se ha completado la iteración sobre todas las celdas/filas.
-            end_time_strict_search = time.time()
-            duration_strict_search = end_time_strict_search - start_time_strict_search
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó la búsqueda estricta de '{texto_buscado}' en la tabla '{table_selector}': {duration_strict_search:.4f} segundos.")
+            # Si la tabla no está disponible a tiempo, el decorador toma la captura del fallo y devuelve False.
+            with self._medir("busqueda_estricta_imprimir_fila.strict_search", f"la búsqueda estricta de '{texto_buscado}' en la tabla '{table_selector}'"):
+                # 1. La tabla debe estar visible antes de recorrer sus filas y celdas.
+                expect(table_selector).to_be_visible()
+                self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
+
+                self._resaltar(table_selector)
+                self.tomar_captura(f"{nombre_base}_antes_busqueda_estricta", directorio) # Captura antes de buscar.
+
+                # 2. Textos de todas las celdas de datos (`tbody tr`) en un solo viaje al navegador.
+                filas = table_selector.locator("tbody tr")
+                snapshot = self.obtener_snapshot_tabla(table_selector)
+                columnas = snapshot["columnas"]
+                num_filas = snapshot["num_filas"]
+                self.logger.debug(lambda: f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
+
+                # 3. Coincidencia exacta en cada celda (ya extraída) de cada fila.
+                for i in range(num_filas):
+                    fila_texto_completo = "" # Para reconstruir y loggear el contenido completo de la fila.
+                    self.logger.debug(lambda: f"\nAnalizando fila {i+1} para búsqueda estricta.")
+                    for j in range(snapshot["celdas_por_fila"][i]):
+                        celda_texto = columnas[j][i] # Texto de la celda, ya sin espacios en blanco alrededor.
+                        fila_texto_completo += celda_texto + " | "
+                        if celda_texto == texto_buscado:
+                            self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia estricta) en la celda {j+1} de la fila {i+1}.")
+                            self.logger.info(f"Contenido completo de la fila: '{fila_texto_completo.strip(' | ')}'")
+                            fila = filas.nth(i) # Los Locators solo se crean para las coincidencias.
+                            self._resaltar(fila.locator("td").nth(j))
+                            self._resaltar(fila)
+                            self.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
+                            encontrado = True
+
+                if not encontrado:
+                    self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia estricta) NO encontrado en ninguna celda de la tabla.")
+                    self.tomar_captura(f"{nombre_base}_coincidencia_estricta_no_encontrada", directorio)
 
             return encontrado
-
-        except TimeoutError as e:
-            # Captura si la tabla principal o sus elementos internos (filas/celdas) no se hacen visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_strict_search # Mide desde el inicio de la operación.
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla con selector '{table_selector}' "
-                f"o sus elementos internos no estuvieron disponibles a tiempo ({duration_fail:.4f}s, timeout configurado: {tiempo}s) "
-                f"durante la búsqueda estricta de '{texto_buscado}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve False.
-            self.tomar_captura(f"{nombre_base}_busqueda_estricta_timeout", directorio)
-            return False
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector de tabla inválido, problemas de interacción con el DOM).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al buscar estrictamente '{texto_buscado}' "
-                f"en la tabla con selector '{table_selector}'.\n"
-                f"Posibles causas: Selector de tabla inválido, estructura de tabla inesperada, o problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_busqueda_estricta_error_playwright", directorio)
-            raise # Relanzar porque es un error de ejecución de Playwright.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al buscar estrictamente '{texto_buscado}' "
-                f"en la tabla con selector '{table_selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.tomar_captura(f"{nombre_base}_busqueda_estricta_error_inesperado", directorio)
-            raise # Relanzar por ser un error inesperado.
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
             if tiempo > 0:
                 self.esperar_fijo(tiempo)
         
     # 30- Función para validar que todos los valores en una columna específica de una tabla sean numéricos, con pruebas de rendimiento
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_precios_son_numeros(self, tabla_selector: Locator, columna_nombre: str, nombre_base: str, directorio: str, tiempo_espera_celda: Union[int, float] = 0.5, tiempo_general_timeout: Union[int, float] = 15.0) -> bool:
         """
         Verifica que todos los valores en una **columna específica** de una tabla HTML
@@ -3100,144 +1823,79 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n⚙️ Verificando que todos los precios en la columna '{columna_nombre}' de la tabla '{tabla_selector}' son números.")
 
-        # --- Medición de rendimiento: Inicio de la validación de la tabla ---
-        # Registra el tiempo justo antes de iniciar cualquier interacción con la tabla.
-        start_time_validation = time.time()
-
         try:
-            # 1. Asegurar que la tabla principal esté visible
-            # Es el primer paso para garantizar que la tabla se ha cargado en el DOM.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_general_timeout}s).")
-            expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
-            self.logger.debug(f"\nTabla resaltada para verificación: {tabla_selector}")
-
-            # 2. Esperar a que el tbody exista y tenga contenido
-            # Es crucial esperar por la sección de cuerpo de la tabla y al menos una fila,
-            # ya que a menudo se cargan de forma asíncrona.
-            tbody_locator = tabla_selector.locator("tbody")
-            self.logger.debug(f"\nEsperando que el tbody de la tabla sea visible (timeout: {tiempo_general_timeout}s).")
-            expect(tbody_locator).to_be_visible()
-            self.logger.info("\n✅ El tbody de la tabla es visible.")
-            
-            self.logger.debug(f"\nEsperando que al menos la primera fila de datos sea visible (timeout: {tiempo_general_timeout}s).")
-            expect(tbody_locator.locator("tr").first).to_be_visible()
-            self.logger.info("\n✅ Al menos la primera fila de datos en la tabla es visible.")
-            self.tomar_captura(f"{nombre_base}_tabla_visible_para_verificacion", directorio) # Captura el estado inicial.
-
-            # 3. Encontrar el índice de la columna por su nombre
-            # Primero, asegurar que los encabezados existan y sean visibles.
-            headers = tabla_selector.locator("th")
-            self.logger.debug(f"\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: {tiempo_general_timeout}s).")
-            expect(headers.first).to_be_visible()
-
-            col_index = -1
-            header_texts = []
-            for i in range(headers.count()):
-                header_text = headers.nth(i).text_content().strip()
-                header_texts.append(header_text)
-                if header_text == columna_nombre:
-                    col_index = i
-            
-            self.logger.info(f"\n🔍 Cabeceras encontradas: {header_texts}")
-
-            if col_index == -1:
-                self.logger.error(f"\n❌ Error: No se encontró la columna '{columna_nombre}' en la tabla. Cabeceras disponibles: {header_texts}")
-                self.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio)
-                # No lanzamos una excepción aquí, ya que el retorno False es suficiente para indicar el fallo lógico.
-                return False
-
-            self.logger.info(f"\n🔍 Columna '{columna_nombre}' encontrada en el índice: {col_index}")
-
-            # 4. Obtener todas las filas de la tabla (solo las de datos dentro de tbody)
-            rows = tbody_locator.locator("tr")
-            num_rows = rows.count()
-            if num_rows == 0:
-                self.logger.warning("\n⚠️ Advertencia: La tabla no contiene filas de datos para verificar.")
-                self.tomar_captura(f"{nombre_base}_tabla_vacia_no_precios", directorio)
-                return True # Considera esto un éxito si no hay datos que validar.
-
-            self.logger.info(f"\n🔍 Se encontraron {num_rows} filas de datos para verificar precios.")
-
-            all_prices_are_numbers = True
-            for i in range(num_rows):
-                row_locator = rows.nth(i)
-                # Se busca la celda correspondiente al índice de la columna dentro de la fila actual.
-                price_cell = row_locator.locator(f"td").nth(col_index)
-                
-                # Es crucial esperar a que la celda de precio sea visible si las filas se renderizan dinámicamente
-                # o el contenido de las celdas aparece con un retardo.
-                self.logger.debug(f"\n Esperando que la celda de precio en la fila {i+1} esté visible (timeout: {tiempo_espera_celda}s).")
-                expect(price_cell).to_be_visible() # Convertir a milisegundos
-                
-                price_text = price_cell.text_content().strip() # Obtener texto y limpiar espacios.
-                price_cell.highlight() # Resaltar la celda actual para depuración visual.
-
-                self.logger.debug(f"\n Procesando fila {i+1}, texto de precio: '{price_text}'")
-
-                try:
-                    float(price_text) # Intentar convertir el texto a un número flotante.
-                    self.logger.debug(f"\n ✅ '{price_text}' es un número válido.")
-                except ValueError:
-                    self.logger.error(f"\n ❌ Error: El valor '{price_text}' en la fila {i+1} de la columna '{columna_nombre}' no es un número válido.")
-                    self.tomar_captura(f"{nombre_base}_precio_invalido_fila_{i+1}", directorio)
-                    all_prices_are_numbers = False
-                    # Continuamos el bucle para reportar todos los valores no numéricos, no solo el primero.
-
-            # --- Medición de rendimiento: Fin de la validación ---
-            end_time_validation = time.time()
-            duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo total de validación de precios en la columna '{columna_nombre}': {duration_validation:.4f} segundos.")
-
-            if all_prices_are_numbers:
-                self.logger.info(f"\n✅ Todos los precios en la columna '{columna_nombre}' son números válidos.")
-                self.tomar_captura(f"{nombre_base}_precios_ok", directorio)
-                return True
-            else:
+            # Si la tabla no está lista a tiempo o falla Playwright, el decorador toma la captura del fallo
+            # y lo relanza como AssertionError para que la prueba falle claramente.
+            with self._medir("verificar_precios_son_numeros.validation", f"validación de precios en la columna '{columna_nombre}'"):
+                # 1. La tabla, su tbody y al menos la primera fila de datos deben estar visibles
+                # (a menudo se cargan de forma asíncrona).
+                expect(tabla_selector).to_be_visible()
+                self._resaltar(tabla_selector)
+                tbody_locator = tabla_selector.locator("tbody")
+                expect(tbody_locator).to_be_visible()
+                self.logger.info("\n✅ El tbody de la tabla es visible.")
+                expect(tbody_locator.locator("tr").first).to_be_visible()
+                self.logger.info("\n✅ Al menos la primera fila de datos en la tabla es visible.")
+                self.tomar_captura(f"{nombre_base}_tabla_visible_para_verificacion", directorio) # Captura el estado inicial.
+
+                # 2. Índice de la columna por su nombre: encabezados y celdas se obtienen de una sola vez con el snapshot.
+                expect(tabla_selector.locator("th").first).to_be_visible()
+                snapshot = self.obtener_snapshot_tabla(tabla_selector)
+                header_texts = snapshot["encabezados"]
+                col_index = -1
+                for i, header_text in enumerate(header_texts):
+                    if header_text == columna_nombre:
+                        col_index = i
+                self.logger.info(f"\n🔍 Cabeceras encontradas: {header_texts}")
+
+                if col_index == -1:
+                    # El retorno False es suficiente para indicar el fallo lógico.
+                    self.logger.error(f"\n❌ Error: No se encontró la columna '{columna_nombre}' en la tabla. Cabeceras disponibles: {header_texts}")
+                    self.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio)
+                    return False
+                self.logger.info(f"\n🔍 Columna '{columna_nombre}' encontrada en el índice: {col_index}")
+
+                # 3. Filas de datos (solo las de tbody)
+                rows = tbody_locator.locator("tr")
+                num_rows = snapshot["num_filas"]
+                if num_rows == 0:
+                    self.logger.warning("\n⚠️ Advertencia: La tabla no contiene filas de datos para verificar.")
+                    self.tomar_captura(f"{nombre_base}_tabla_vacia_no_precios", directorio)
+                    return True # Considera esto un éxito si no hay datos que validar.
+                self.logger.info(f"\n🔍 Se encontraron {num_rows} filas de datos para verificar precios.")
+
+                # Los textos de la columna ya están en el snapshot (indexado por columna).
+                columna_precios = snapshot["columnas"][col_index] if col_index < snapshot["num_columnas"] else [None] * num_rows
+
+                all_prices_are_numbers = True
+                for i, price_text in enumerate(columna_precios):
+                    self.logger.debug(lambda: f"\n Procesando fila {i+1}, texto de precio: '{price_text}'")
+                    try:
+                        if price_text is None:
+                            raise ValueError("celda inexistente")
+                        float(price_text)
+                    except ValueError:
+                        self.logger.error(f"\n ❌ Error: El valor '{price_text}' en la fila {i+1} de la columna '{columna_nombre}' no es un número válido.")
+                        # Solo se crea el Locator de la celda cuando hay que resaltarla.
+                        self._resaltar(rows.nth(i).locator("td").nth(col_index))
+                        self.tomar_captura(f"{nombre_base}_precio_invalido_fila_{i+1}", directorio)
+                        all_prices_are_numbers = False
+                        # Se sigue recorriendo para reportar todos los valores no numéricos, no solo el primero.
+
+            if not all_prices_are_numbers:
                 self.logger.error(f"\n❌ Se encontraron precios no numéricos en la columna '{columna_nombre}'.")
                 return False
 
-        except TimeoutError as e:
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_validation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): La tabla o sus elementos (tbody, filas, celdas) no se volvieron visibles a tiempo "
-                f"después de {duration_fail:.4f} segundos (timeout general configurado: {tiempo_general_timeout}s, celda: {tiempo_espera_celda}s). "
-                f"Error: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_verificacion_precios", directorio)
-            # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
-            raise AssertionError(f"\nElementos de la tabla no disponibles a tiempo para verificación de precios: {tabla_selector}") from e
-        
-        except Error as e:
-            # Captura errores específicos de Playwright (ej., selector inválido, DOM mal formado).
-            error_msg = (
-                f"\n❌ FALLO (Error de Playwright): Ocurrió un error de Playwright al verificar los precios en la tabla '{tabla_selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Nivel crítico porque un error de Playwright es un problema fundamental.
-            self.tomar_captura(f"{nombre_base}_playwright_error_verificacion_precios", directorio)
-            raise AssertionError(f"\nError de Playwright al verificar precios en la tabla: {tabla_selector}") from e
-        
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al verificar los precios en la tabla '{tabla_selector}'. "
-                f"Error: {type(e).__name__}: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_excepcion_inesperada", directorio)
-            raise AssertionError(f"\nError inesperado al verificar precios en la tabla: {tabla_selector}") from e
-
+            self.logger.info(f"\n✅ Todos los precios en la columna '{columna_nombre}' son números válidos.")
+            self.tomar_captura(f"{nombre_base}_precios_ok", directorio)
+            return True
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Se puede eliminar la espera fija si la prueba se basa puramente en el retorno de la función.
-            # Sin embargo, se mantiene por si se desea una pausa visual al final de la ejecución.
-            if tiempo_general_timeout > 0: # Usamos el tiempo_general_timeout para la espera final
-                self.esperar_fijo(tiempo_general_timeout / 5.0) # Espera un tiempo más corto al final, por ejemplo.
+            # Pausa visual al final de la ejecución, más corta que el tiempo general.
+            if tiempo_general_timeout > 0:
+                self.esperar_fijo(tiempo_general_timeout / 5.0)
         
     # 31- Función para extraer y retornar el valor de un elemento dado su Playwright Locator, con pruebas de rendimiento
+    @accion_instrumentada(envolver_en=AssertionError)
     def obtener_valor_elemento(self, selector: Locator, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5) -> Optional[str]:
         """
         Extrae y retorna el valor de un elemento dado su Playwright Locator.
@@ -3269,104 +1927,52 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n⚙️ Extrayendo valor del elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo_espera_elemento}s.")
         valor_extraido = None
-        
-        # --- Medición de rendimiento: Inicio de la extracción del valor ---
-        # Registra el tiempo justo antes de iniciar la interacción con el elemento.
-        start_time_extraction = time.time()
 
         try:
-            # 1. Asegurar que el elemento esté visible y habilitado
-            # Estas aserciones son cruciales para garantizar que el elemento está listo para interactuar.
-            self.logger.debug(f"\nEsperando que el elemento '{selector}' sea visible (timeout: {tiempo_espera_elemento}s).")
-            expect(selector).to_be_visible()
-            
-            self.logger.debug(f"\nEsperando que el elemento '{selector}' esté habilitado (timeout: {tiempo_espera_elemento}s).")
-            expect(selector).to_be_enabled()
-
-            # Resaltar el elemento para depuración visual y tomar una captura.
-            selector.highlight()
-            self.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
-            self.logger.debug(f"\nElemento '{selector}' es visible y habilitado.")
-
-            # 2. Intentar extraer el valor usando diferentes métodos de Playwright
-            # Priorizamos `input_value` para campos de formulario (<input>, <textarea>, <select>).
-            try:
-                valor_extraido = selector.input_value() # Un timeout corto para input_value
-                self.logger.debug(f"\nValor extraído (input_value) de '{selector}': '{valor_extraido}'")
-            except Error as e_input: # Capturamos el error si input_value no es aplicable (ej. no es un elemento de entrada)
-                self.logger.debug(f"\ninput_value no aplicable o falló para '{selector}'. Intentando text_content/inner_text. Error: {e_input}")
-                
-                # Si input_value falla, intentamos con text_content o inner_text para otros elementos (p. ej. <div>, <span>, <p>)
+            # Si el elemento no está disponible a tiempo o falla Playwright, el decorador toma la captura del
+            # fallo y lo relanza como AssertionError.
+            with self._medir("obtener_valor_elemento.extraction", f"extracción del valor del elemento '{selector}'"):
+                # 1. El elemento debe estar visible y habilitado antes de interactuar.
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
+
+                # 2. Se prioriza `input_value` para campos de formulario (<input>, <textarea>, <select>).
                 try:
-                    valor_extraido = selector.text_content() # Un timeout corto para text_content
-                    # Si text_content devuelve solo espacios en blanco o es vacío,
-                    # intentamos inner_text, que a veces es más preciso para texto renderizado visiblemente.
-                    if valor_extraido is not None and valor_extraido.strip() == "":
-                        valor_extraido = selector.inner_text() # Un timeout corto para inner_text
-                        self.logger.debug(f"\nValor extraído (inner_text) de '{selector}': '{valor_extraido}' (después de text_content vacío).")
-                    else:
-                        self.logger.debug(f"\nValor extraído (text_content) de '{selector}': '{valor_extraido}'")
-                except Error as e_text_inner:
-                    self.logger.warning(f"\nNo se pudo extraer input_value, text_content ni inner_text de '{selector}'. Detalles: {e_text_inner}")
-                    valor_extraido = None # Asegurarse de que sea None si todos los intentos fallan
+                    valor_extraido = selector.input_value()
+                    self.logger.debug(lambda: f"\nValor extraído (input_value) de '{selector}': '{valor_extraido}'")
+                except Error as e_input:
+                    self.logger.debug(lambda: f"\ninput_value no aplicable o falló para '{selector}'. Intentando text_content/inner_text. Error: {e_input}")
+                    # Para otros elementos (<div>, <span>, <p>...) se usa text_content y, si solo tiene espacios,
+                    # inner_text, que a veces es más preciso para el texto renderizado.
+                    try:
+                        valor_extraido = selector.text_content()
+                        if valor_extraido is not None and valor_extraido.strip() == "":
+                            valor_extraido = selector.inner_text()
+                            self.logger.debug(lambda: f"\nValor extraído (inner_text) de '{selector}': '{valor_extraido}' (después de text_content vacío).")
+                        else:
+                            self.logger.debug(lambda: f"\nValor extraído (text_content) de '{selector}': '{valor_extraido}'")
+                    except Error as e_text_inner:
+                        self.logger.warning(f"\nNo se pudo extraer input_value, text_content ni inner_text de '{selector}'. Detalles: {e_text_inner}")
+                        valor_extraido = None
 
-            # 3. Procesar el valor extraído y registrar el rendimiento
+            # 3. Procesar el valor extraído
             valor_final = None
             if valor_extraido is not None:
-                # Eliminar espacios en blanco al inicio y al final si el valor es una cadena.
                 valor_final = valor_extraido.strip() if isinstance(valor_extraido, str) else valor_extraido
                 self.logger.info(f"\n✅ Valor final obtenido del elemento '{selector}': '{valor_final}'")
                 self.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio)
             else:
                 self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
                 self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
-            
-            # --- Medición de rendimiento: Fin de la extracción del valor ---
-            end_time_extraction = time.time()
-            duration_extraction = end_time_extraction - start_time_extraction
-            self.logger.info(f"PERFORMANCE: Tiempo total de extracción del valor del elemento '{selector}': {duration_extraction:.4f} segundos.")
-
             return valor_final
-
-        except TimeoutError as e:
-            # Captura si el elemento no se vuelve visible o habilitado a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_extraction
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout): El elemento '{selector}' no se volvió visible/habilitado a tiempo "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_elemento}s) "
-                f"para extraer su valor. Detalles: {e}"
-            )
-            self.logger.error(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio)
-            # Elevar AssertionError para indicar un fallo de prueba claro.
-            raise AssertionError(f"\nElemento no disponible para extracción de valor: {selector}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con el DOM.
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright): Ocurrió un error de Playwright al intentar extraer el valor de '{selector}'. Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True) # Nivel crítico para errores de Playwright.
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio)
-            raise AssertionError(f"\nError de Playwright al extraer valor: {selector}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al intentar extraer el valor de '{selector}'. Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio)
-            raise AssertionError(f"\nError inesperado al extraer valor: {selector}") from e
-
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Puedes eliminar esta espera si no es necesaria para la observación.
             if tiempo_espera_elemento > 0:
                 self.esperar_fijo(tiempo_espera_elemento / 5.0) # Una pequeña espera al final.
         
     # 32- Función para verificar que los encabezados de las columnas de una tabla sean correctos y estén presentes, con pruebas de rendimiento
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_encabezados_tabla(self, tabla_selector: Locator, encabezados_esperados: List[str], nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0) -> bool:
         """
         Verifica que los encabezados (<th>) de las columnas de una tabla HTML
@@ -3401,122 +2007,61 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n⚙️ Verificando encabezados de la tabla con selector '{tabla_selector}'...")
         self.logger.info(f"\nEncabezados esperados: {encabezados_esperados}. Tiempo máximo de espera: {tiempo_espera_tabla}s.")
-        
-        # --- Medición de rendimiento: Inicio de la verificación de encabezados ---
-        # Registra el tiempo justo antes de iniciar cualquier interacción con la tabla.
-        start_time_header_verification = time.time()
 
         try:
-            # 1. Verificar la presencia y visibilidad de la tabla misma
-            # Esto es crucial para asegurar que la tabla se ha cargado en el DOM.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
-            expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
-            self.logger.debug(f"\nTabla resaltada para verificación: {tabla_selector}")
-
-            # 2. Verificar la presencia y visibilidad del elemento thead (cabecera de la tabla)
-            thead_locator = tabla_selector.locator("thead")
-            self.logger.debug(f"\nEsperando que el thead de la tabla con selector '{tabla_selector} thead' esté visible (timeout: {tiempo_espera_tabla}s).")
-            expect(thead_locator).to_be_visible()
-            self.logger.info("\n✅ El elemento '<thead>' de la tabla es visible.")
-            
-            # 3. Obtener los locators de los encabezados (<th>) dentro del thead
-            encabezados_actuales_locators = thead_locator.locator("th")
-            self.logger.debug(f"\nEsperando que al menos un '<th>' dentro del '<thead>' sea visible (timeout: {tiempo_espera_tabla}s).")
-            expect(encabezados_actuales_locators.first).to_be_visible()
-            
-            # Resaltar todos los encabezados encontrados para depuración visual.
-            for i in range(encabezados_actuales_locators.count()):
-                encabezados_actuales_locators.nth(i).highlight()
-            self.tomar_captura(f"{nombre_base}_encabezados_encontrados_y_resaltados", directorio)
-
-            num_encabezados_actuales = encabezados_actuales_locators.count()
-            num_encabezados_esperados = len(encabezados_esperados)
-
-            # 4. Comparar la cantidad de encabezados
-            if num_encabezados_actuales != num_encabezados_esperados:
-                actual_texts = [h.text_content().strip() for h in encabezados_actuales_locators.all_js_handles()] # Obtener todos los textos para el log de error
-                self.logger.error(f"\n❌ --> FALLO: El número de encabezados '<th>' encontrados ({num_encabezados_actuales}) "
-                                  f"no coincide con el número de encabezados esperados ({num_encabezados_esperados}).\n"
-                                  f"Actuales: {actual_texts}\nEsperados: {encabezados_esperados}")
-                self.tomar_captura(f"{nombre_base}_cantidad_encabezados_incorrecta", directorio)
-                return False
-
-            # 5. Iterar y comparar el texto de cada encabezado
-            todos_correctos = True
-            for i in range(num_encabezados_esperados):
-                encabezado_locator = encabezados_actuales_locators.nth(i)
-                # Obtenemos el texto de la celda del encabezado y eliminamos espacios en blanco.
-                texto_encabezado_actual = encabezado_locator.text_content().strip()
-                encabezado_esperado = encabezados_esperados[i]
-
-                if texto_encabezado_actual == encabezado_esperado:
-                    self.logger.info(f"\n ✅ Encabezado {i+1}: '{texto_encabezado_actual}' coincide con el esperado '{encabezado_esperado}'.")
-                    # encabezado_locator.highlight() # Opcional: resaltar el encabezado individual si es necesario para cada uno.
-                else:
-                    self.logger.error(f"\n ❌ FALLO: Encabezado {i+1} esperado era '{encabezado_esperado}', pero se encontró '{texto_encabezado_actual}'.")
-                    encabezado_locator.highlight() # Resaltar el encabezado incorrecto.
-                    self.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio)
-                    todos_correctos = False
-                    # No es necesario un time.sleep() aquí si solo queremos el log y la captura.
-
-            # --- Medición de rendimiento: Fin de la verificación de encabezados ---
-            end_time_header_verification = time.time()
-            duration_header_verification = end_time_header_verification - start_time_header_verification
-            self.logger.info(f"PERFORMANCE: Tiempo total de verificación de encabezados de tabla '{tabla_selector}': {duration_header_verification:.4f} segundos.")
+            # Si la tabla no está lista a tiempo o falla Playwright, el decorador toma la captura del fallo
+            # y lo relanza como AssertionError para que la prueba falle claramente.
+            with self._medir("verificar_encabezados_tabla.header_verification", f"verificación de encabezados de tabla '{tabla_selector}'"):
+                # 1. La tabla, su <thead> y al menos un <th> deben estar visibles.
+                expect(tabla_selector).to_be_visible()
+                self._resaltar(tabla_selector)
+                thead_locator = tabla_selector.locator("thead")
+                expect(thead_locator).to_be_visible()
+                self.logger.info("\n✅ El elemento '<thead>' de la tabla es visible.")
+                encabezados_actuales_locators = thead_locator.locator("th")
+                expect(encabezados_actuales_locators.first).to_be_visible()
+
+                # Resaltar todos los encabezados encontrados (highlight marca todas las coincidencias).
+                self._resaltar(encabezados_actuales_locators)
+                self.tomar_captura(f"{nombre_base}_encabezados_encontrados_y_resaltados", directorio)
+
+                # 2. Textos de los encabezados obtenidos de una sola vez con el snapshot de la tabla.
+                actual_texts = self.obtener_snapshot_tabla(tabla_selector)["encabezados"]
+                num_encabezados_esperados = len(encabezados_esperados)
+
+                # 3. Comparar la cantidad de encabezados
+                if len(actual_texts) != num_encabezados_esperados:
+                    self.logger.error(f"\n❌ --> FALLO: El número de encabezados '<th>' encontrados ({len(actual_texts)}) "
+                                      f"no coincide con el número de encabezados esperados ({num_encabezados_esperados}).\n"
+                                      f"Actuales: {actual_texts}\nEsperados: {encabezados_esperados}")
+                    self.tomar_captura(f"{nombre_base}_cantidad_encabezados_incorrecta", directorio)
+                    return False
+
+                # 4. Comparar el texto de cada encabezado (ya sin espacios en blanco alrededor)
+                todos_correctos = True
+                for i, (texto_encabezado_actual, encabezado_esperado) in enumerate(zip(actual_texts, encabezados_esperados)):
+                    if texto_encabezado_actual == encabezado_esperado:
+                        self.logger.info(f"\n ✅ Encabezado {i+1}: '{texto_encabezado_actual}' coincide con el esperado '{encabezado_esperado}'.")
+                    else:
+                        self.logger.error(f"\n ❌ FALLO: Encabezado {i+1} esperado era '{encabezado_esperado}', pero se encontró '{texto_encabezado_actual}'.")
+                        self._resaltar(encabezados_actuales_locators.nth(i)) # Resaltar el encabezado incorrecto.
+                        self.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio)
+                        todos_correctos = False
 
-            if todos_correctos:
-                self.logger.info("\n✅ ÉXITO: Todos los encabezados de columna son correctos y están en el orden esperado.")
-                self.tomar_captura(f"{nombre_base}_encabezados_verificados_ok", directorio)
-                return True
-            else:
+            if not todos_correctos:
                 self.logger.error("\n❌ FALLO: Uno o más encabezados de columna son incorrectos o no están en el orden esperado.")
                 self.tomar_captura(f"{nombre_base}_encabezados_verificados_fallo", directorio)
                 return False
 
-        except TimeoutError as e:
-            # Captura si la tabla, el thead o los th no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_header_verification
-            error_msg = (
-                f"\n❌ FALLO (Timeout): La tabla o sus encabezados con el selector '{tabla_selector}' no se volvieron visibles a tiempo "
-                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_tabla}s).\n"
-                f"Posiblemente la tabla no estuvo disponible a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_encabezados_timeout", directorio)
-            # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
-            raise AssertionError(f"\nElementos de encabezado de tabla no disponibles a tiempo: {tabla_selector}") from e
-
-        except Error as e: # Catch Playwright-specific errors
-            # Captura errores de Playwright que impiden la interacción con el DOM.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al intentar verificar la tabla o sus encabezados con el selector '{tabla_selector}'.\n"
-                f"Posibles causas: Selector inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores de Playwright.
-            self.tomar_captura(f"{nombre_base}_verificar_encabezados_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al verificar encabezados de tabla: {tabla_selector}") from e # Relanzar.
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar los encabezados de la tabla con el selector '{tabla_selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_encabezados_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar encabezados de tabla: {tabla_selector}") from e # Relanzar.
-
+            self.logger.info("\n✅ ÉXITO: Todos los encabezados de columna son correctos y están en el orden esperado.")
+            self.tomar_captura(f"{nombre_base}_encabezados_verificados_ok", directorio)
+            return True
         finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Puedes eliminar esta espera si no es necesaria para la observación.
             if tiempo_espera_tabla > 0:
-                self.esperar_fijo(tiempo_espera_tabla / 5.0) # Una pequeña espera al final, por ejemplo.
+                self.esperar_fijo(tiempo_espera_tabla / 5.0) # Una pequeña espera al final.
         
     # 33- Función para verificar los datos de las filas de una tabla, con pruebas de rendimiento integradas.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_datos_filas_tabla(self, tabla_selector: Locator, datos_filas_esperados: List[Dict[str, Union[str, bool, int, float]]], nombre_base: str, directorio: str, tiempo_espera_general: Union[int, float] = 0.5) -> bool:
         """
         Verifica que los datos de las filas de una tabla HTML coincidan con los datos esperados.
@@ -3554,200 +2099,183 @@ class Funciones_Globales:
         self.logger.info(f"\nNúmero de filas esperadas: {len(datos_filas_esperados)}")
         self.tomar_captura(f"{nombre_base}_inicio_verificacion_datos_filas", directorio)
 
-        # --- Medición de rendimiento: Inicio de la verificación de datos de filas ---
-        # Registra el tiempo justo antes de iniciar cualquier interacción con la tabla.
-        start_time_row_data_verification = time.time()
-
         try:
-            # 1. Asegurarse de que la tabla esté visible y disponible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_general}s).")
-            expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
-            self.logger.info("\n✅ Tabla visible. Procediendo a verificar los datos.")
-
-            # 2. Obtener los encabezados para mapear los índices de las columnas
-            header_locators = tabla_selector.locator("thead th")
-            self.logger.debug(f"\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: {tiempo_espera_general}s).")
-            expect(header_locators.first).to_be_visible()
-            headers = [h.text_content().strip() for h in header_locators.all()]
-            
-            if not headers:
-                self.logger.error(f"\n❌ --> FALLO: No se encontraron encabezados en la tabla con locator '{tabla_selector}'. No se pueden verificar los datos de las filas.")
-                self.tomar_captura(f"{nombre_base}_no_headers_para_datos_filas", directorio)
-                return False
-            self.logger.info(f"\n🔍 Encabezados de la tabla encontrados: {headers}")
-
-            # 3. Obtener todas las filas del cuerpo de la tabla (excluyendo thead)
-            tbody_locator = tabla_selector.locator("tbody")
-            self.logger.debug(f"\nEsperando que el tbody de la tabla sea visible (timeout: {tiempo_espera_general}s).")
-            expect(tbody_locator).to_be_visible()
-
-            row_locators = tbody_locator.locator("tr")
-            # Esperar a que al menos la primera fila de datos sea visible si se esperan filas.
-            if len(datos_filas_esperados) > 0:
-                self.logger.debug(f"\nEsperando que al menos la primera fila de datos sea visible (timeout: {tiempo_espera_general}s).")
-                expect(row_locators.first).to_be_visible()
-
-            num_filas_actuales = row_locators.count()
-            num_filas_esperadas = len(datos_filas_esperados)
-
-            # 4. Comparar el número total de filas
-            if num_filas_actuales == 0 and num_filas_esperadas == 0:
-                self.logger.info("\n✅ ÉXITO: No se esperaban filas y no se encontraron filas en la tabla. Verificación completada.")
-                self.tomar_captura(f"{nombre_base}_no_rows_expected_and_found", directorio)
-                # No necesitamos detener el tiempo si no se hizo nada realmente.
-                return True
-            
-            if num_filas_actuales != num_filas_esperadas:
-                self.logger.error(f"\n❌ --> FALLO: El número de filas encontradas ({num_filas_actuales}) "
-                                  f"no coincide con el número de filas esperadas ({num_filas_esperadas}).")
-                self.tomar_captura(f"{nombre_base}_cantidad_filas_incorrecta", directorio)
+            # Si la tabla no está lista a tiempo o falla Playwright, el decorador toma la captura del fallo
+            # y lo relanza como AssertionError para que la prueba falle claramente.
+            with self._medir("verificar_datos_filas_tabla.row_data_verification", f"verificación de datos de filas en la tabla '{tabla_selector}'"):
+                # 1. La tabla y sus encabezados deben estar visibles
+                expect(tabla_selector).to_be_visible()
+                self._resaltar(tabla_selector)
+                self.logger.info("\n✅ Tabla visible. Procediendo a verificar los datos.")
+                expect(tabla_selector.locator("thead th").first).to_be_visible()
+
+                # 2. Encabezados, celdas y checkboxes se obtienen de una sola vez con el snapshot de la tabla.
+                snapshot = self.obtener_snapshot_tabla(tabla_selector)
+                headers = snapshot["encabezados"]
+                if not headers:
+                    self.logger.error(f"\n❌ --> FALLO: No se encontraron encabezados en la tabla con locator '{tabla_selector}'. No se pueden verificar los datos de las filas.")
+                    self.tomar_captura(f"{nombre_base}_no_headers_para_datos_filas", directorio)
+                    return False
+                self.logger.info(f"\n🔍 Encabezados de la tabla encontrados: {headers}")
+
+                # 3. Filas del cuerpo de la tabla (excluyendo thead)
+                tbody_locator = tabla_selector.locator("tbody")
+                expect(tbody_locator).to_be_visible()
+                row_locators = tbody_locator.locator("tr")
+                if len(datos_filas_esperados) > 0:
+                    # El snapshot se vuelve a tomar una vez que las filas están renderizadas.
+                    expect(row_locators.first).to_be_visible()
+                    snapshot = self.obtener_snapshot_tabla(tabla_selector)
+
+                num_filas_actuales = snapshot["num_filas"]
+                num_filas_esperadas = len(datos_filas_esperados)
+
+                # 4. Comparar el número total de filas
+                if num_filas_actuales == 0 and num_filas_esperadas == 0:
+                    self.logger.info("\n✅ ÉXITO: No se esperaban filas y no se encontraron filas en la tabla. Verificación completada.")
+                    self.tomar_captura(f"{nombre_base}_no_rows_expected_and_found", directorio)
+                    return True
+                if num_filas_actuales != num_filas_esperadas:
+                    self.logger.error(f"\n❌ --> FALLO: El número de filas encontradas ({num_filas_actuales}) "
+                                      f"no coincide con el número de filas esperadas ({num_filas_esperadas}).")
+                    self.tomar_captura(f"{nombre_base}_cantidad_filas_incorrecta", directorio)
+                    return False
+                self.logger.info(f"\n🔍 Número de filas actual y esperado coinciden: {num_filas_actuales} filas.")
+
+                todos_los_datos_correctos = True
+
+                # 5. Verificar los datos de cada fila esperada. Un fallo en una celda se registra y la
+                # verificación continúa con el resto de columnas y filas.
+                for i, datos_fila_esperada in enumerate(datos_filas_esperados):
+                    fila_actual_locator = row_locators.nth(i)
+                    self.logger.info(f"\n  Verificando Fila {i+1} (Datos esperados: {datos_fila_esperada})...")
+                    self._resaltar(fila_actual_locator)
+                    fila_actual_correcta = True
+
+                    for col_name, expected_value in datos_fila_esperada.items():
+                        try:
+                            if col_name not in headers:
+                                self.logger.error(f"\n  ❌ FALLO: Columna '{col_name}' esperada para la Fila {i+1} no encontrada en los encabezados de la tabla. Encabezados actuales: {headers}")
+                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_columna_{col_name}_no_encontrada", directorio)
+                                todos_los_datos_correctos = fila_actual_correcta = False
+                                continue
+
+                            col_index = headers.index(col_name)
+                            # Locator de la celda específica (td); solo se usa para resaltar en caso de fallo.
+                            celda_locator = fila_actual_locator.locator("td").nth(col_index)
+                            if col_index >= snapshot["celdas_por_fila"][i]:
+                                raise Error(f"La Fila {i+1} no tiene una celda en la columna '{col_name}' (índice {col_index}).")
+
+                            if col_name == "Select": # Lógica específica para el checkbox en la columna "Select"
+                                checkbox_locator = celda_locator.locator("input[type='checkbox']")
+                                checkbox_marcado = snapshot["checkboxes"][col_index][i]
+                                if checkbox_marcado is None:
+                                    self.logger.error(f"\n  ❌ FALLO: Checkbox no encontrado en la columna '{col_name}' de la Fila {i+1}.")
+                                    self._resaltar(celda_locator)
+                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_no_checkbox", directorio)
+                                    todos_los_datos_correctos = fila_actual_correcta = False
+                                elif isinstance(expected_value, bool):
+                                    if checkbox_marcado != expected_value:
+                                        self.logger.error(f"\n  ❌ FALLO: El checkbox de la Fila {i+1}, Columna '{col_name}' estaba "
+                                                          f"{'marcado' if checkbox_marcado else 'desmarcado'}, se esperaba {'marcado' if expected_value else 'desmarcado'}.")
+                                        self._resaltar(checkbox_locator)
+                                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_estado_incorrecto", directorio)
+                                        todos_los_datos_correctos = fila_actual_correcta = False
+                                    else:
+                                        self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente y estado correcto ({'marcado' if expected_value else 'desmarcado'}).")
+                                else: # Se espera que el checkbox exista, sin un estado booleano concreto
+                                    self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente (estado no verificado explícitamente).")
+                            else: # Columnas de texto: se compara con el valor esperado como cadena, sin espacios alrededor.
+                                actual_value = snapshot["columnas"][col_index][i]
+                                if actual_value != str(expected_value).strip():
+                                    self.logger.error(f"\n  ❌ FALLO: Fila {i+1}, Columna '{col_name}'. Se esperaba '{expected_value}', se encontró '{actual_value}'.")
+                                    self._resaltar(celda_locator)
+                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_incorrecta", directorio)
+                                    todos_los_datos_correctos = fila_actual_correcta = False
+                                else:
+                                    self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': '{actual_value}' coincide con lo esperado.")
+                        except Exception as col_e:
+                            self.logger.error(f"\n  ❌ FALLO al verificar la columna '{col_name}' de la Fila {i+1}: {col_e}", exc_info=not isinstance(col_e, Error))
+                            self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_error", directorio)
+                            todos_los_datos_correctos = fila_actual_correcta = False
+
+                    # Pausa solo si la fila actual tuvo algún fallo para que la captura sea más útil
+                    if not fila_actual_correcta:
+                        self.esperar_fijo(1)
+
+            if not todos_los_datos_correctos:
+                self.logger.error("\n❌ FALLO: Uno o más datos de las filas o checkboxes son incorrectos o faltan.")
+                self.tomar_captura(f"{nombre_base}_datos_filas_verificados_fallo", directorio)
                 return False
-            self.logger.info(f"\n🔍 Número de filas actual y esperado coinciden: {num_filas_actuales} filas.")
 
-            # --- Variable principal para el retorno ---
-            todos_los_datos_correctos = True 
+            self.logger.info("\n✅ ÉXITO: Todos los datos de las filas y checkboxes son correctos y están presentes.")
+            self.tomar_captura(f"{nombre_base}_datos_filas_verificados_ok", directorio)
+            return True
+        finally:
+            self.esperar_fijo(1) # Pequeña espera final para observación.
+    
+    # 33.1- Función para obtener el ID de producto (primera celda) de la fila de un checkbox de una tabla
+    def _id_producto_de_checkbox(self, checkbox: Locator, indice: int) -> str:
+        """
+        Devuelve el texto de la primera celda de la fila que contiene el checkbox, o "N/A" si no se puede
+        obtener (solo se registra una advertencia: el ID es informativo para el log).
+
+        Args:
+            checkbox (Locator): Checkbox dentro de un 'td' de un 'tr'.
+            indice (int): Índice del checkbox en la tabla, para el log.
+        """
+        try:
+            # Se asume que el checkbox está dentro de un 'td' y este 'td' dentro de un 'tr':
+            # se suben dos niveles para llegar al 'tr' y luego se busca el primer 'td'.
+            celdas = checkbox.locator("..").locator("..").locator("td")
+            if celdas.count() > 0:
+                return celdas.nth(0).text_content().strip()
+            self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {indice}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
+        except Exception as id_e:
+            self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {indice}: {id_e}")
+        return "N/A"
+
+    # 33.2- Función para dejar un checkbox de una tabla MARCADO como resultado de un clic
+    def _asegurar_checkbox_marcado(self, checkbox: Locator, product_id: str, prefijo_captura: str, sufijo_captura: str, directorio: str, pausa_interaccion: Union[int, float]) -> bool:
+        """
+        Si el checkbox ya está marcado lo desmarca primero, para que la acción verificada sea siempre la de
+        marcarlo; después lo marca y comprueba su estado. Los fallos se registran con captura
+        '{prefijo_captura}_<resultado>{sufijo_captura}'.
 
-            # 5. Iterar sobre cada fila esperada y verificar sus datos
-            for i in range(num_filas_esperadas):
-                fila_actual_locator = row_locators.nth(i)
-                datos_fila_esperada = datos_filas_esperados[i]
-                self.logger.info(f"\n  Verificando Fila {i+1} (Datos esperados: {datos_fila_esperada})...")
-                fila_actual_locator.highlight() # Resaltar la fila actual en la captura para debug.
+        Returns:
+            bool: True si el checkbox terminó MARCADO; False si no se pudo desmarcar o marcar.
+        """
+        initial_state = checkbox.is_checked()
+        self.logger.info(f"\n  Estado inicial del checkbox del Producto ID: {product_id}: {'MARCADO' if initial_state else 'DESMARCADO'}.")
 
-                # Bandera para saber si la fila actual tiene algún fallo
-                fila_actual_correcta = True 
+        if initial_state:
+            self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
+            checkbox.uncheck()
+            self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-                # Iterar sobre las columnas esperadas para esta fila
-                for col_name, expected_value in datos_fila_esperada.items():
-                    try:
-                        # Encontrar el índice de la columna por su nombre
-                        if col_name not in headers:
-                            self.logger.error(f"\n  ❌ FALLO: Columna '{col_name}' esperada para la Fila {i+1} no encontrada en los encabezados de la tabla. Encabezados actuales: {headers}")
-                            self.tomar_captura(f"{nombre_base}_fila_{i+1}_columna_{col_name}_no_encontrada", directorio)
-                            todos_los_datos_correctos = False # Falla general
-                            fila_actual_correcta = False # Falla en esta fila
-                            continue # Pasa a la siguiente columna esperada o fila
-
-                        col_index = headers.index(col_name)
-                        
-                        # Localizar la celda específica (td) dentro de la fila por su índice
-                        celda_locator = fila_actual_locator.locator("td").nth(col_index)
-                        
-                        # Asegurarse de que la celda esté visible antes de interactuar.
-                        expect(celda_locator).to_be_visible() # Timeout para celda individual
-
-                        if col_name == "Select": # Lógica específica para el checkbox en la columna "Select"
-                            checkbox_locator = celda_locator.locator("input[type='checkbox']")
-                            if checkbox_locator.count() == 0: # Si no se encuentra el checkbox dentro de la celda
-                                self.logger.error(f"\n  ❌ FALLO: Checkbox no encontrado en la columna '{col_name}' de la Fila {i+1}.")
-                                celda_locator.highlight() # Resaltar la celda donde se esperaba el checkbox
-                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_no_checkbox", directorio)
-                                todos_los_datos_correctos = False
-                                fila_actual_correcta = False
-                            elif isinstance(expected_value, bool): # Si se espera un estado específico (True/False)
-                                if checkbox_locator.is_checked() != expected_value:
-                                    self.logger.error(f"\n  ❌ FALLO: El checkbox de la Fila {i+1}, Columna '{col_name}' estaba "
-                                                      f"{'marcado' if checkbox_locator.is_checked() else 'desmarcado'}, se esperaba {'marcado' if expected_value else 'desmarcado'}.")
-                                    checkbox_locator.highlight() # Resaltar el checkbox incorrecto
-                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_estado_incorrecto", directorio)
-                                    todos_los_datos_correctos = False
-                                    fila_actual_correcta = False
-                                else:
-                                    self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente y estado correcto ({'marcado' if expected_value else 'desmarcado'}).")
-                            else: # Si se espera que el checkbox exista, pero no se especificó un estado booleano
-                                self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente (estado no verificado explícitamente).")
-                        else: # Para otras columnas de texto (no checkbox)
-                            actual_value = celda_locator.text_content().strip()
-                            # Aseguramos que expected_value también sea una cadena para la comparación, eliminando espacios.
-                            if actual_value != str(expected_value).strip(): 
-                                self.logger.error(f"\n  ❌ FALLO: Fila {i+1}, Columna '{col_name}'. Se esperaba '{expected_value}', se encontró '{actual_value}'.")
-                                celda_locator.highlight() # Resaltar la celda con el dato incorrecto
-                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_incorrecta", directorio)
-                                todos_los_datos_correctos = False
-                                fila_actual_correcta = False
-                            else:
-                                self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': '{actual_value}' coincide con lo esperado.")
-                        
-                    except TimeoutError as cell_timeout_e:
-                        self.logger.error(f"\n  ❌ FALLO (Timeout): La celda de la Fila {i+1}, Columna '{col_name}' no se volvió visible a tiempo. Detalles: {cell_timeout_e}")
-                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_timeout", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                    except Error as col_playwright_e:
-                        self.logger.error(f"\n  ❌ FALLO (Playwright): Error de Playwright al verificar la columna '{col_name}' de la Fila {i+1}. Detalles: {col_playwright_e}")
-                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_playwright_error", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                    except Exception as col_e:
-                        self.logger.error(f"\n  ❌ ERROR INESPERADO al verificar la columna '{col_name}' de la Fila {i+1}: {col_e}", exc_info=True)
-                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_error_inesperado", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                        # Podrías decidir si quieres continuar con el resto de las columnas/filas
-                        # o si este error debe detener la verificación.
-
-                # Pausa solo si la fila actual tuvo algún fallo para que la captura sea más útil
-                if not fila_actual_correcta:
-                    self.esperar_fijo(1) # Pausa de 1 segundo para visualización si hay un fallo en la fila.
-
-            # --- Medición de rendimiento: Fin de la verificación de datos de filas ---
-            end_time_row_data_verification = time.time()
-            duration_row_data_verification = end_time_row_data_verification - start_time_row_data_verification
-            self.logger.info(f"PERFORMANCE: Tiempo total de verificación de datos de filas en la tabla '{tabla_selector}': {duration_row_data_verification:.4f} segundos.")
-
-            # --- Retorno final basado en el estado acumulado ---
-            if todos_los_datos_correctos:
-                self.logger.info("\n✅ ÉXITO: Todos los datos de las filas y checkboxes son correctos y están presentes.")
-                self.tomar_captura(f"{nombre_base}_datos_filas_verificados_ok", directorio)
-                return True
-            else:
-                self.logger.error("\n❌ FALLO: Uno o más datos de las filas o checkboxes son incorrectos o faltan.")
-                self.tomar_captura(f"{nombre_base}_datos_filas_verificados_fallo", directorio)
+            if checkbox.is_checked(): # Si después de uncheck sigue marcado, es un fallo
+                self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
+                self._resaltar(checkbox)
+                self.tomar_captura(f"{prefijo_captura}_no_se_desmarco{sufijo_captura}", directorio)
                 return False
 
-        except TimeoutError as e:
-            # Captura si la tabla, el thead, el tbody o las filas no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_row_data_verification
-            error_msg = (
-                f"\n❌ FALLO (Timeout): La tabla, sus encabezados o sus filas con el locator '{tabla_selector}' no se volvieron visibles a tiempo "
-                f"después de {duration_fail:.4f} segundos (timeout general configurado: {tiempo_espera_general}s).\n"
-                f"Posiblemente la tabla no estuvo disponible a tiempo o tardó demasiado en cargar su contenido.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_timeout", directorio)
-            # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
-            raise AssertionError(f"\nElementos de tabla no disponibles a tiempo para verificación de datos de filas: {tabla_selector}") from e
+        # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo)
+        self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
+        checkbox.check()
+        self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con el DOM de la tabla.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al intentar verificar las filas con el locator '{tabla_selector}'.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al verificar datos de filas de tabla: {tabla_selector}") from e
+        if not checkbox.is_checked():
+            self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
+            self._resaltar(checkbox)
+            self.tomar_captura(f"{prefijo_captura}_no_se_marco{sufijo_captura}", directorio)
+            return False
 
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada durante la verificación.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error desconocido al verificar los datos de las filas con el locator '{tabla_selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar datos de filas de tabla: {tabla_selector}") from e
+        self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
+        self.tomar_captura(f"{prefijo_captura}_marcado_ok{sufijo_captura}", directorio)
+        return True
 
-        finally:
-            # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Puedes eliminar esta espera si no es necesaria para la observación al final de la ejecución de la función.
-            self.esperar_fijo(1) # Pequeña espera final para observación.
-    
     # 34- Función para seleccionar y verificar el estado de checkboxes de filas aleatorias, con pruebas de rendimiento.
+    @accion_instrumentada(envolver_en=AssertionError)
     def seleccionar_y_verificar_checkboxes_aleatorios(self, tabla_selector: Locator, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
         """
         Selecciona y verifica el estado de un número específico de checkboxes aleatorios
@@ -3780,39 +2308,31 @@ class Funciones_Globales:
         self.logger.info(f"\n--- Iniciando selección y verificación de {num_checkboxes_a_interactuar} checkbox(es) aleatorio(s) en la tabla con locator '{tabla_selector}' ---")
         self.tomar_captura(f"{nombre_base}_inicio_seleccion_checkbox", directorio)
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si la tabla o los checkboxes no están disponibles a tiempo o falla Playwright, el decorador toma
+            # la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que la tabla esté visible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug(lambda: f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self._resaltar(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
-            # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
-            start_time_discovery = time.time()
-
-            # 2. Obtener todos los locators de los checkboxes en las celdas del cuerpo de la tabla
-            all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
-            
-            # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar.
-            if num_checkboxes_a_interactuar > 0:
-                self.logger.debug(f"\nEsperando que al menos un checkbox en la tabla sea visible (timeout: {tiempo_espera_tabla}s).")
-                expect(all_checkbox_locators.first).to_be_visible()
+            with self._medir("seleccionar_y_verificar_checkboxes_aleatorios.discovery", "descubrimiento de checkboxes disponibles"):
+                # 2. Obtener todos los locators de los checkboxes en las celdas del cuerpo de la tabla
+                all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
 
-            num_checkboxes_disponibles = all_checkbox_locators.count()
+                # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar.
+                if num_checkboxes_a_interactuar > 0:
+                    self.logger.debug(lambda: f"\nEsperando que al menos un checkbox en la tabla sea visible (timeout: {tiempo_espera_tabla}s).")
+                    expect(all_checkbox_locators.first).to_be_visible()
 
-            # --- Medición de rendimiento: Fin del descubrimiento de checkboxes ---
-            end_time_discovery = time.time()
-            duration_discovery = end_time_discovery - start_time_discovery
-            self.logger.info(f"PERFORMANCE: Tiempo de descubrimiento de checkboxes disponibles: {duration_discovery:.4f} segundos. ({num_checkboxes_disponibles} encontrados)")
+                num_checkboxes_disponibles = all_checkbox_locators.count()
 
             if num_checkboxes_disponibles == 0:
-                self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
+                self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{all_checkbox_locators}'.")
                 self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados", directorio)
                 return False
-            
+
             if num_checkboxes_a_interactuar <= 0:
                 self.logger.warning("\n⚠️ ADVERTENCIA: El número de checkboxes a interactuar es 0 o negativo. No se realizará ninguna acción.")
                 return True
@@ -3826,87 +2346,23 @@ class Funciones_Globales:
 
             # 3. Seleccionar N índices de checkboxes aleatorios y únicos
             random_indices = random.sample(range(num_checkboxes_disponibles), num_checkboxes_a_interactuar)
-            
+
             todos_correctos = True
-            interaction_times = [] # Lista para almacenar tiempos de interacción individuales
 
             # 4. Iterar sobre los checkboxes seleccionados aleatoriamente e interactuar con ellos
             for i, idx in enumerate(random_indices):
                 checkbox_to_interact = all_checkbox_locators.nth(idx)
-                
-                # --- Medición de rendimiento: Inicio de interacción individual ---
-                start_time_interaction = time.time()
-
-                # Resaltar el checkbox actual para la captura/visualización
-                checkbox_to_interact.highlight()
-                self.tomar_captura(f"{nombre_base}_checkbox_{i+1}_aleatorio_idx_{idx}_resaltado", directorio)
-                self.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
-
-                # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
-                product_id = "N/A" # Default en caso de error
-                try:
-                    # Encontrar la fila que contiene este checkbox para obtener información de contexto.
-                    # Esto es un poco más complejo si el checkbox no está en la primera columna,
-                    # pero si asumimos que está dentro de un 'td' de un 'tr' que representa una fila:
-                    # Podemos buscar el ancestro 'tr' y luego el primer 'td' de ese 'tr'.
-                    # Podría ser más robusto si el product ID estuviera en un atributo de datos,
-                    # o si el checkbox tuviera un atributo id/name relacionado con el producto.
-                    row_locator_for_id = checkbox_to_interact.locator("..").locator("..") # Sube dos niveles para llegar al 'tr'
-                    # Asegurarse de que el 'td' existe en la primera posición.
-                    if row_locator_for_id.locator("td").count() > 0:
-                        product_id = row_locator_for_id.locator("td").nth(0).text_content().strip()
-                    else:
-                        self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {idx}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
-                except Exception as id_e:
-                    self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {idx}: {id_e}")
-                
-                initial_state = checkbox_to_interact.is_checked()
-                self.logger.info(f"\n  Checkbox del Producto ID: {product_id} (Fila índice: {idx}, Interacción {i+1}/{num_checkboxes_a_interactuar}): Estado inicial {'MARCADO' if initial_state else 'DESMARCADO'}.")
 
-                # --- Lógica para asegurar que el click lo deje en estado 'seleccionado' (marcado) ---
-                if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
-                    self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
-                    checkbox_to_interact.uncheck()
-                    self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                with self._medir("seleccionar_y_verificar_checkboxes_aleatorios.interaction", f"interacción con checkbox {i+1} (fila índice {idx})"):
+                    # Resaltar el checkbox actual para la captura/visualización
+                    self._resaltar(checkbox_to_interact)
+                    self.tomar_captura(f"{nombre_base}_checkbox_{i+1}_aleatorio_idx_{idx}_resaltado", directorio)
+                    self.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
 
-                    if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
-                        self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
-                        checkbox_to_interact.highlight()
-                        self.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_desmarco", directorio)
+                    product_id = self._id_producto_de_checkbox(checkbox_to_interact, idx)
+                    self.logger.info(f"\n  Checkbox del Producto ID: {product_id} (Fila índice: {idx}, Interacción {i+1}/{num_checkboxes_a_interactuar}).")
+                    if not self._asegurar_checkbox_marcado(checkbox_to_interact, product_id, f"{nombre_base}_fila_{idx+1}", "", directorio, pausa_interaccion):
                         todos_correctos = False
-                        # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
-                        # Continua al siguiente checkbox aleatorio.
-                        continue 
-                
-                # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
-                self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
-                checkbox_to_interact.check() # Marca el checkbox
-                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-
-                final_state = checkbox_to_interact.is_checked()
-                if not final_state: # Si no está marcado (seleccionado) después del clic
-                    self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
-                    checkbox_to_interact.highlight()
-                    self.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_marco", directorio)
-                    todos_correctos = False
-                else:
-                    self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
-                    self.tomar_captura(f"{nombre_base}_fila_{idx+1}_marcado_ok", directorio)
-                
-                # --- Medición de rendimiento: Fin de interacción individual ---
-                end_time_interaction = time.time()
-                duration_interaction = end_time_interaction - start_time_interaction
-                interaction_times.append(duration_interaction)
-                self.logger.info(f"PERFORMANCE: Tiempo de interacción para checkbox {i+1} (Producto ID: {product_id}): {duration_interaction:.4f} segundos.")
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes: {duration_total_operation:.4f} segundos.")
-
-            if interaction_times:
-                avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de interacción por checkbox: {avg_interaction_time:.4f} segundos.")
 
             if todos_correctos:
                 self.logger.info(f"\n✅ ÉXITO: Todos los {num_checkboxes_a_interactuar} checkbox(es) aleatorio(s) fueron seleccionados y verificados correctamente.")
@@ -3916,46 +2372,11 @@ class Funciones_Globales:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) aleatorio(s) no pudieron ser seleccionados o verificados.")
                 self.tomar_captura(f"{nombre_base}_fallo_general_seleccion", directorio)
                 return False
-
-        except TimeoutError as e:
-            # Captura si la tabla o los checkboxes no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
-                f"Posiblemente los elementos no estuvieron disponibles a tiempo después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_tabla}s).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_timeout", directorio)
-            raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con los checkboxes.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al seleccionar y verificar checkboxes en la tabla '{tabla_selector}'.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al seleccionar y verificar checkboxes aleatorios.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
-
         finally:
-            # Este bloque se ejecuta siempre.
             self.esperar_fijo(1) # Pequeña espera final para observación.
     
     # 35- Función para seleccionar y verificar el estado de checkboxes de filas CONSECUTIVAS, con pruebas de rendimiento.
+    @accion_instrumentada(envolver_en=AssertionError)
     def seleccionar_y_verificar_checkboxes_consecutivos(self, tabla_selector: Locator, start_index: int, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
         """
         Selecciona y verifica el estado de un número específico de checkboxes en filas consecutivas
@@ -3992,45 +2413,32 @@ class Funciones_Globales:
                          f"a partir del índice {start_index} en la tabla con locator '{tabla_selector}' ---")
         self.tomar_captura(f"{nombre_base}_inicio_seleccion_consecutiva_checkbox", directorio)
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si la tabla o los checkboxes no están disponibles a tiempo o falla Playwright, el decorador toma
+            # la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que la tabla esté visible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug(lambda: f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self._resaltar(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
-            # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
-            start_time_discovery = time.time()
+            with self._medir("seleccionar_y_verificar_checkboxes_consecutivos.discovery", "descubrimiento de checkboxes disponibles"):
+                # 2. Obtener todos los locators de los checkboxes en las celdas del cuerpo de la tabla
+                all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
 
-            # 2. Obtener todos los locators de los checkboxes en las celdas del cuerpo de la tabla
-            all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
-            
-            # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar.
-            if num_checkboxes_a_interactuar > 0:
-                self.logger.debug(f"\nEsperando que al menos el primer checkbox en el rango deseado sea visible (timeout: {tiempo_espera_tabla}s).")
-                # Intentamos esperar al primer checkbox de la secuencia.
+                # Esperar al primer checkbox de la secuencia; un 'start_index' inválido se valida más adelante.
                 if num_checkboxes_a_interactuar > 0 and start_index < all_checkbox_locators.count():
+                    self.logger.debug(lambda: f"\nEsperando que al menos el primer checkbox en el rango deseado sea visible (timeout: {tiempo_espera_tabla}s).")
                     expect(all_checkbox_locators.nth(start_index)).to_be_visible()
-                elif num_checkboxes_a_interactuar > 0: # Si el start_index es inválido, pero aún se esperan interacciones
-                    # Esto será capturado por las validaciones de rango más adelante.
-                    pass 
-
-            num_checkboxes_disponibles = all_checkbox_locators.count()
 
-            # --- Medición de rendimiento: Fin del descubrimiento de checkboxes ---
-            end_time_discovery = time.time()
-            duration_discovery = end_time_discovery - start_time_discovery
-            self.logger.info(f"PERFORMANCE: Tiempo de descubrimiento de checkboxes disponibles: {duration_discovery:.4f} segundos. ({num_checkboxes_disponibles} encontrados)")
+                num_checkboxes_disponibles = all_checkbox_locators.count()
 
             # 3. Validaciones de precondición
             if num_checkboxes_disponibles == 0:
-                self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
+                self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{all_checkbox_locators}'.")
                 self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_consec", directorio)
                 return False
-            
+
             if num_checkboxes_a_interactuar <= 0:
                 self.logger.warning("\n⚠️ ADVERTENCIA: El número de checkboxes a interactuar es 0 o negativo. No se realizará ninguna acción.")
                 return True # Consideramos éxito si no hay nada que hacer
@@ -4039,7 +2447,7 @@ class Funciones_Globales:
                 self.logger.error(f"\n❌ --> FALLO: El 'posición de inicio' ({start_index}) está fuera del rango válido de checkboxes disponibles (0 a {num_checkboxes_disponibles - 1}).")
                 self.tomar_captura(f"{nombre_base}_start_index_invalido_consec", directorio)
                 return False
-            
+
             if (start_index + num_checkboxes_a_interactuar) > num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: Se solicitaron {num_checkboxes_a_interactuar} checkboxes a partir del índice {start_index}, "
                                   f"pero solo hay {num_checkboxes_disponibles} disponibles. El rango excede los límites de la tabla.")
@@ -4048,82 +2456,24 @@ class Funciones_Globales:
 
             self.logger.info(f"\nInteractuando con {num_checkboxes_a_interactuar} checkbox(es) consecutivo(s) "
                              f"desde el índice {start_index} hasta el {start_index + num_checkboxes_a_interactuar - 1}...")
-            
+
             todos_correctos = True
-            interaction_times = [] # Lista para almacenar tiempos de interacción individuales
 
             # 4. Iterar sobre los checkboxes consecutivos e interactuar con ellos
             for i in range(num_checkboxes_a_interactuar):
                 current_idx = start_index + i
                 checkbox_to_interact = all_checkbox_locators.nth(current_idx)
-                
-                # --- Medición de rendimiento: Inicio de interacción individual ---
-                start_time_interaction = time.time()
-
-                # Resaltar el checkbox actual para la captura/visualización
-                checkbox_to_interact.highlight()
-                self.tomar_captura(f"{nombre_base}_checkbox_consecutivo_{i+1}_idx_{current_idx}_resaltado", directorio)
-                self.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
-
-                # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
-                product_id = "N/A" # Default en caso de error
-                try:
-                    # Se asume que el checkbox está dentro de un 'td' y este 'td' está dentro de un 'tr'.
-                    # Se suben dos niveles para llegar al 'tr' y luego se busca el primer 'td'.
-                    row_locator_for_id = checkbox_to_interact.locator("..").locator("..") 
-                    if row_locator_for_id.locator("td").count() > 0:
-                        product_id = row_locator_for_id.locator("td").nth(0).text_content().strip()
-                    else:
-                        self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {current_idx}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
-                except Exception as id_e:
-                    self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {current_idx}: {id_e}")
-                
-                initial_state = checkbox_to_interact.is_checked()
-                self.logger.info(f"\n  Checkbox del Producto ID: {product_id} (Fila índice: {current_idx}, Interacción {i+1}/{num_checkboxes_a_interactuar}): Estado inicial {'MARCADO' if initial_state else 'DESMARCADO'}.")
 
-                # --- Lógica para asegurar que el click lo deje en estado 'seleccionado' (marcado) ---
-                if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
-                    self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
-                    checkbox_to_interact.uncheck()
-                    self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                with self._medir("seleccionar_y_verificar_checkboxes_consecutivos.interaction", f"interacción con checkbox {i+1} (fila índice {current_idx})"):
+                    # Resaltar el checkbox actual para la captura/visualización
+                    self._resaltar(checkbox_to_interact)
+                    self.tomar_captura(f"{nombre_base}_checkbox_consecutivo_{i+1}_idx_{current_idx}_resaltado", directorio)
+                    self.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
 
-                    if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
-                        self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
-                        checkbox_to_interact.highlight()
-                        self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_desmarco_consec", directorio)
+                    product_id = self._id_producto_de_checkbox(checkbox_to_interact, current_idx)
+                    self.logger.info(f"\n  Checkbox del Producto ID: {product_id} (Fila índice: {current_idx}, Interacción {i+1}/{num_checkboxes_a_interactuar}).")
+                    if not self._asegurar_checkbox_marcado(checkbox_to_interact, product_id, f"{nombre_base}_fila_{current_idx+1}", "_consec", directorio, pausa_interaccion):
                         todos_correctos = False
-                        # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
-                        continue 
-                
-                # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
-                self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
-                checkbox_to_interact.check() # Marca el checkbox
-                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-
-                final_state = checkbox_to_interact.is_checked()
-                if not final_state: # Si no está marcado (seleccionado) después del clic
-                    self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
-                    checkbox_to_interact.highlight()
-                    self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_marco_consec", directorio)
-                    todos_correctos = False
-                else:
-                    self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
-                    self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_marcado_ok_consec", directorio)
-                
-                # --- Medición de rendimiento: Fin de interacción individual ---
-                end_time_interaction = time.time()
-                duration_interaction = end_time_interaction - start_time_interaction
-                interaction_times.append(duration_interaction)
-                self.logger.info(f"PERFORMANCE: Tiempo de interacción para checkbox {i+1} (Producto ID: {product_id}): {duration_interaction:.4f} segundos.")
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes consecutivos: {duration_total_operation:.4f} segundos.")
-
-            if interaction_times:
-                avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de interacción por checkbox: {avg_interaction_time:.4f} segundos.")
 
             if todos_correctos:
                 self.logger.info(f"\n✅ ÉXITO: Todos los {num_checkboxes_a_interactuar} checkbox(es) consecutivo(s) fueron seleccionados y verificados correctamente.")
@@ -4133,46 +2483,11 @@ class Funciones_Globales:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) consecutivo(s) no pudieron ser seleccionados o verificados.")
                 self.tomar_captura(f"{nombre_base}_fallo_general_seleccion_consec", directorio)
                 return False
-
-        except TimeoutError as e:
-            # Captura si la tabla o los checkboxes no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
-                f"Posiblemente los elementos no estuvieron disponibles a tiempo después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_tabla}s).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_timeout", directorio)
-            raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con los checkboxes.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al seleccionar y verificar checkboxes consecutivos en la tabla '{tabla_selector}'.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al seleccionar y verificar checkboxes consecutivos.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
-
         finally:
-            # Este bloque se ejecuta siempre.
             self.esperar_fijo(1) # Pequeña espera final para observación.
         
     # 36- Función para deseleccionar todos los checkboxes actualmente marcados y verificar su estado.
+    @accion_instrumentada(envolver_en=AssertionError)
     def deseleccionar_y_verificar_checkbox_marcado(self, tabla_selector: Locator, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
         """
         Deselecciona y verifica el estado de **todos** los checkboxes que se encuentren
@@ -4205,115 +2520,74 @@ class Funciones_Globales:
                          f"en la tabla con locator '{tabla_selector}' ---")
         self.tomar_captura(f"{nombre_base}_inicio_deseleccion_todos_marcados", directorio)
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si la tabla o los checkboxes no están disponibles a tiempo o falla Playwright, el decorador toma
+            # la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que la tabla esté visible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug(lambda: f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self._resaltar(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
-            # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
-            start_time_discovery = time.time()
+            with self._medir("deseleccionar_y_verificar_checkbox_marcado.discovery", "descubrimiento de checkboxes y filtrado de marcados"):
+                # 2. Obtener todos los locators de los checkboxes en las celdas de la tabla
+                all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
 
-            # 2. Obtener todos los locators de los checkboxes en las celdas de la tabla
-            all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
-            
-            # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar (si no hay ninguno, lo gestionamos)
-            if all_checkbox_locators.count() > 0:
-                self.logger.debug(f"\nEsperando que al menos un checkbox en la tabla sea visible (timeout: {tiempo_espera_tabla}s).")
-                expect(all_checkbox_locators.first).to_be_visible()
+                # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar (si no hay ninguno, lo gestionamos)
+                if all_checkbox_locators.count() > 0:
+                    self.logger.debug(lambda: f"\nEsperando que al menos un checkbox en la tabla sea visible (timeout: {tiempo_espera_tabla}s).")
+                    expect(all_checkbox_locators.first).to_be_visible()
 
-            num_checkboxes_disponibles = all_checkbox_locators.count()
+                num_checkboxes_disponibles = all_checkbox_locators.count()
+
+                # 3. Recolectar todos los checkboxes que están actualmente marcados para deseleccionar
+                checkboxes_to_deselect = []
+                for i in range(num_checkboxes_disponibles):
+                    checkbox = all_checkbox_locators.nth(i)
+                    if checkbox.is_checked():
+                        checkboxes_to_deselect.append({"locator": checkbox, "original_index": i})
 
             if num_checkboxes_disponibles == 0:
-                self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
+                self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{all_checkbox_locators}'.")
                 self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_todos", directorio)
                 return False
-            
-            # 3. Recolectar todos los checkboxes que están actualmente marcados para deseleccionar
-            checkboxes_to_deselect = []
-            for i in range(num_checkboxes_disponibles):
-                checkbox = all_checkbox_locators.nth(i)
-                if checkbox.is_checked():
-                    checkboxes_to_deselect.append({"locator": checkbox, "original_index": i})
-            
-            # --- Medición de rendimiento: Fin del descubrimiento de checkboxes ---
-            end_time_discovery = time.time()
-            duration_discovery = end_time_discovery - start_time_discovery
-            self.logger.info(f"PERFORMANCE: Tiempo de descubrimiento de checkboxes y filtrado de marcados: {duration_discovery:.4f} segundos. ({len(checkboxes_to_deselect)} marcados encontrados de {num_checkboxes_disponibles} disponibles)")
 
             if not checkboxes_to_deselect:
                 self.logger.warning("\n⚠️ ADVERTENCIA: No se encontró ningún checkbox actualmente MARCADO en la tabla para deseleccionar. La función finaliza sin acciones de deselección.")
                 self.tomar_captura(f"{nombre_base}_no_marcados_para_deseleccionar", directorio)
                 return True # Consideramos éxito si no hay nada que deseleccionar
 
-            self.logger.info(f"\nSe encontraron {len(checkboxes_to_deselect)} checkbox(es) marcado(s) para deseleccionar. Iniciando el proceso...")
+            self.logger.info(f"\nSe encontraron {len(checkboxes_to_deselect)} checkbox(es) marcado(s) de {num_checkboxes_disponibles} para deseleccionar. Iniciando el proceso...")
 
             todos_deseleccionados_correctamente = True
-            interaction_times = [] # Lista para almacenar tiempos de interacción individuales
 
             # 4. Iterar sobre los checkboxes marcados y deseleccionarlos
             for i, checkbox_info in enumerate(checkboxes_to_deselect):
                 checkbox_to_interact = checkbox_info["locator"]
                 original_idx = checkbox_info["original_index"]
-                
-                # --- Medición de rendimiento: Inicio de interacción individual ---
-                start_time_interaction = time.time()
 
-                # Resaltar el checkbox actual
-                checkbox_to_interact.highlight()
-                self.tomar_captura(f"{nombre_base}_deseleccion_actual_{i+1}_idx_{original_idx}_resaltado", directorio)
-                self.esperar_fijo(pausa_interaccion)
-
-                # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
-                product_id = "N/A" # Default en caso de error
-                try:
-                    # Se asume que el checkbox está dentro de un 'td' y este 'td' dentro de un 'tr'.
-                    # Se suben dos niveles para llegar al 'tr' y luego se busca el primer 'td'.
-                    row_locator_for_id = checkbox_to_interact.locator("..").locator("..")
-                    if row_locator_for_id.locator("td").count() > 0:
-                        product_id = row_locator_for_id.locator("td").nth(0).text_content().strip()
-                    else:
-                        self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {original_idx}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
-                except Exception as id_e:
-                    self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {original_idx}: {id_e}")
-                
-                self.logger.info(f"\n  Procesando checkbox del Producto ID: {product_id} (Fila índice: {original_idx}, Interacción {i+1}/{len(checkboxes_to_deselect)}). Estado inicial: MARCADO (esperado).")
-
-                # --- Interacción: Clic para deseleccionar ---
-                self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para DESMARCARLO...")
-                # Usar .uncheck() es más directo para desmarcar que .click() si ya sabes el estado esperado.
-                checkbox_to_interact.uncheck()
-                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-
-                final_state = checkbox_to_interact.is_checked()
-                if final_state: # Si sigue marcado después de .uncheck()
-                    self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a DESMARCADO después del clic. Sigue MARCADO.")
-                    checkbox_to_interact.highlight()
-                    self.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio)
-                    todos_deseleccionados_correctamente = False
-                else:
-                    self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está DESMARCADO (deseleccionado).")
-                    self.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_desmarcado_ok", directorio)
-                
-                # --- Medición de rendimiento: Fin de interacción individual ---
-                end_time_interaction = time.time()
-                duration_interaction = end_time_interaction - start_time_interaction
-                interaction_times.append(duration_interaction)
-                self.logger.info(f"PERFORMANCE: Tiempo de deselección para checkbox {i+1} (Producto ID: {product_id}): {duration_interaction:.4f} segundos.")
+                with self._medir("deseleccionar_y_verificar_checkbox_marcado.interaction", f"deselección de checkbox {i+1} (fila índice {original_idx})"):
+                    # Resaltar el checkbox actual
+                    self._resaltar(checkbox_to_interact)
+                    self.tomar_captura(f"{nombre_base}_deseleccion_actual_{i+1}_idx_{original_idx}_resaltado", directorio)
+                    self.esperar_fijo(pausa_interaccion)
 
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación de deselección y verificación de checkboxes: {duration_total_operation:.4f} segundos.")
+                    product_id = self._id_producto_de_checkbox(checkbox_to_interact, original_idx)
+                    self.logger.info(f"\n  Procesando checkbox del Producto ID: {product_id} (Fila índice: {original_idx}, Interacción {i+1}/{len(checkboxes_to_deselect)}). Estado inicial: MARCADO (esperado).")
 
-            if interaction_times:
-                avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de deselección por checkbox: {avg_interaction_time:.4f} segundos.")
+                    # --- Interacción: Clic para deseleccionar ---
+                    self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para DESMARCARLO...")
+                    checkbox_to_interact.uncheck()
+                    self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
+                    if checkbox_to_interact.is_checked(): # Si sigue marcado después de .uncheck()
+                        self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a DESMARCADO después del clic. Sigue MARCADO.")
+                        self._resaltar(checkbox_to_interact)
+                        self.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio)
+                        todos_deseleccionados_correctamente = False
+                    else:
+                        self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está DESMARCADO (deseleccionado).")
+                        self.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_desmarcado_ok", directorio)
 
             if todos_deseleccionados_correctamente:
                 self.logger.info(f"\n✅ ÉXITO: Todos los {len(checkboxes_to_deselect)} checkbox(es) marcados fueron deseleccionados y verificados correctamente.")
@@ -4323,47 +2597,12 @@ class Funciones_Globales:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) marcados no pudieron ser deseleccionados o verificados.")
                 self.tomar_captura(f"{nombre_base}_fallo_general_deseleccion_todos", directorio)
                 return False
-
-        except TimeoutError as e:
-            # Captura si la tabla o los checkboxes no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
-                f"Posiblemente los elementos no estuvieron disponibles a tiempo después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_tabla}s).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_deseleccion_todos_timeout", directorio)
-            raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con los checkboxes.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al deseleccionar y verificar todos los checkboxes marcados en la tabla '{tabla_selector}'.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_deseleccion_todos_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al deseleccionar y verificar todos los checkboxes marcados.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_deseleccion_todos_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
-
         finally:
-            # Este bloque se ejecuta siempre.
             self.esperar_fijo(1) # Pequeña espera final para observación.
     
     # 37- Función para buscar un 'texto_a_buscar' en las celdas de una tabla (tbody) y, si lo encuentra,
     # intenta marcar el checkbox asociado en la misma fila. Incluye pruebas de rendimiento.
+    @accion_instrumentada(envolver_en=AssertionError)
     def seleccionar_checkbox_por_contenido_celda(self, tabla_selector: Locator, texto_a_buscar: str, nombre_base: str, directorio: str, case_sensitive: bool = False, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
         """
         Busca un 'texto_a_buscar' en todas las celdas (<td>) del cuerpo de una tabla (<tbody>).
@@ -4397,171 +2636,107 @@ class Funciones_Globales:
         self.logger.info(f"\n--- Iniciando búsqueda de '{texto_a_buscar}' en la tabla '{tabla_selector}' para marcar checkboxes ---")
         self.tomar_captura(f"{nombre_base}_inicio_busqueda_celdas", directorio)
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si la tabla no está visible a tiempo o falla Playwright, el decorador toma la captura del fallo
+            # y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que la tabla está visible y cargada
-            self.logger.debug(f"Esperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
-            # Convertir timeout de segundos a milisegundos para expect()
-            expect(tabla_selector).to_be_visible() 
-            tabla_selector.highlight()
+            self.logger.debug(lambda: f"Esperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            expect(tabla_selector).to_be_visible()
+            self._resaltar(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Comenzando a iterar por filas y celdas.")
 
-            # --- Medición de rendimiento: Inicio del escaneo de la tabla ---
-            start_time_scan = time.time()
-
-            # Obtener todas las filas del cuerpo de la tabla
-            filas = tabla_selector.locator("tbody tr")
-            num_filas = filas.count()
-
-            if num_filas == 0:
-                self.logger.error(f"\n❌ --> FALLO: No se encontraron filas en el 'tbody' de la tabla con locator '{tabla_selector}'.")
-                self.tomar_captura(f"{nombre_base}_no_filas_encontradas", directorio)
-                return False
-
-            self.logger.info(f"\nSe encontraron {num_filas} filas en la tabla. Iniciando escaneo de celdas...")
-            
-            checkboxes_marcados_exitosamente = 0
-            
-            # Normalizar el texto de búsqueda si no es sensible a mayúsculas/minúsculas
-            search_text_normalized = texto_a_buscar if case_sensitive else texto_a_buscar.lower()
-            
-            found_any_match = False # Bandera para saber si se encontró al menos una coincidencia
-            interaction_times = [] # Para medir el tiempo de marcado de cada checkbox
-
-            for i in range(num_filas):
-                fila_actual = filas.nth(i)
-                # Obtener todas las celdas (td) de la fila actual
-                celdas = fila_actual.locator("td")
-                num_celdas = celdas.count()
-
-                if num_celdas == 0:
-                    self.logger.warning(f"\n  ADVERTENCIA: La fila {i+1} no contiene celdas (td). Saltando.")
-                    continue
-
-                celda_encontrada_en_fila = False
-                for j in range(num_celdas):
-                    celda_actual = celdas.nth(j)
-                    celda_texto = celda_actual.text_content().strip()
-                    
-                    # Normalizar el texto de la celda para la comparación
-                    celda_texto_normalized = celda_texto if case_sensitive else celda_texto.lower()
-
-                    if search_text_normalized in celda_texto_normalized:
-                        self.logger.info(f"\n  ✅ Coincidencia encontrada en Fila {i+1}, Celda {j+1}: '{celda_texto}' contiene '{texto_a_buscar}'.")
-                        celda_encontrada_en_fila = True
-                        found_any_match = True
-                        
-                        # Buscar el checkbox dentro de la misma fila
-                        checkbox_locator = fila_actual.locator("input[type='checkbox']")
-                        
-                        if checkbox_locator.count() > 0:
-                            checkbox = checkbox_locator.first
-                            checkbox.highlight()
-                            self.tomar_captura(f"{nombre_base}_fila_{i+1}_coincidencia_resaltada", directorio)
-                            self.esperar_fijo(pausa_interaccion)
-
-                            # --- Medición de rendimiento: Inicio de interacción de checkbox ---
-                            start_time_checkbox_interaction = time.time()
-
-                            if not checkbox.is_checked():
-                                self.logger.info(f"\n  --> Marcando checkbox en Fila {i+1} (texto '{celda_texto}')...")
-                                checkbox.check()
-                                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-                                
-                                if checkbox.is_checked():
-                                    self.logger.info(f"\n  ✅ Checkbox en Fila {i+1} marcado correctamente.")
-                                    checkboxes_marcados_exitosamente += 1
-                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_marcado", directorio)
-                                else:
-                                    self.logger.error(f"\n  ❌ FALLO: No se pudo marcar el checkbox en Fila {i+1} (texto '{celda_texto}').")
-                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_no_marcado", directorio)
+            with self._medir("seleccionar_checkbox_por_contenido_celda.scan", f"escaneo de las filas de la tabla '{tabla_selector}'"):
+                # Obtener todas las filas del cuerpo de la tabla
+                filas = tabla_selector.locator("tbody tr")
+                num_filas = filas.count()
+
+                if num_filas == 0:
+                    self.logger.error(f"\n❌ --> FALLO: No se encontraron filas en el 'tbody' de la tabla con locator '{tabla_selector}'.")
+                    self.tomar_captura(f"{nombre_base}_no_filas_encontradas", directorio)
+                    return False
+
+                self.logger.info(f"\nSe encontraron {num_filas} filas en la tabla. Iniciando escaneo de celdas...")
+
+                checkboxes_marcados_exitosamente = 0
+
+                # Normalizar el texto de búsqueda si no es sensible a mayúsculas/minúsculas
+                search_text_normalized = texto_a_buscar if case_sensitive else texto_a_buscar.lower()
+
+                found_any_match = False # Bandera para saber si se encontró al menos una coincidencia
+
+                for i in range(num_filas):
+                    fila_actual = filas.nth(i)
+                    # Obtener todas las celdas (td) de la fila actual
+                    celdas = fila_actual.locator("td")
+                    num_celdas = celdas.count()
+
+                    if num_celdas == 0:
+                        self.logger.warning(f"\n  ADVERTENCIA: La fila {i+1} no contiene celdas (td). Saltando.")
+                        continue
+
+                    celda_encontrada_en_fila = False
+                    for j in range(num_celdas):
+                        celda_actual = celdas.nth(j)
+                        celda_texto = celda_actual.text_content().strip()
+
+                        # Normalizar el texto de la celda para la comparación
+                        celda_texto_normalized = celda_texto if case_sensitive else celda_texto.lower()
+
+                        if search_text_normalized in celda_texto_normalized:
+                            self.logger.info(f"\n  ✅ Coincidencia encontrada en Fila {i+1}, Celda {j+1}: '{celda_texto}' contiene '{texto_a_buscar}'.")
+                            celda_encontrada_en_fila = True
+                            found_any_match = True
+
+                            # Buscar el checkbox dentro de la misma fila
+                            checkbox_locator = fila_actual.locator("input[type='checkbox']")
+
+                            if checkbox_locator.count() > 0:
+                                checkbox = checkbox_locator.first
+                                self._resaltar(checkbox)
+                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_coincidencia_resaltada", directorio)
+                                self.esperar_fijo(pausa_interaccion)
+
+                                with self._medir("seleccionar_checkbox_por_contenido_celda.checkbox_interaction", f"interacción con checkbox en Fila {i+1}"):
+                                    if not checkbox.is_checked():
+                                        self.logger.info(f"\n  --> Marcando checkbox en Fila {i+1} (texto '{celda_texto}')...")
+                                        checkbox.check()
+                                        self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+
+                                        if checkbox.is_checked():
+                                            self.logger.info(f"\n  ✅ Checkbox en Fila {i+1} marcado correctamente.")
+                                            checkboxes_marcados_exitosamente += 1
+                                            self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_marcado", directorio)
+                                        else:
+                                            self.logger.error(f"\n  ❌ FALLO: No se pudo marcar el checkbox en Fila {i+1} (texto '{celda_texto}').")
+                                            self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_no_marcado", directorio)
+                                    else:
+                                        self.logger.warning(f"\n  ⚠️ Checkbox en Fila {i+1} (texto '{celda_texto}') ya estaba marcado. No se requiere acción.")
+                                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_ya_marcado", directorio)
                             else:
-                                self.logger.warning(f"\n  ⚠️ Checkbox en Fila {i+1} (texto '{celda_texto}') ya estaba marcado. No se requiere acción.")
-                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_ya_marcado", directorio)
-                            
-                            # --- Medición de rendimiento: Fin de interacción de checkbox ---
-                            end_time_checkbox_interaction = time.time()
-                            duration_checkbox_interaction = end_time_checkbox_interaction - start_time_checkbox_interaction
-                            interaction_times.append(duration_checkbox_interaction)
-                            self.logger.info(f"PERFORMANCE: Tiempo de interacción con checkbox en Fila {i+1}: {duration_checkbox_interaction:.4f} segundos.")
-
-                        else:
-                            self.logger.warning(f"\n  ⚠️ ADVERTENCIA: No se encontró un checkbox en la Fila {i+1} a pesar de la coincidencia del texto.")
-                        break # Salir del bucle de celdas una vez encontrada la coincidencia en la fila
-
-                if not celda_encontrada_en_fila:
-                    self.logger.debug(f"\n  No se encontró '{texto_a_buscar}' en la Fila {i+1}. Continuando con la siguiente fila.")
-
-            # --- Medición de rendimiento: Fin del escaneo de la tabla ---
-            end_time_scan = time.time()
-            duration_scan = end_time_scan - start_time_scan
-            self.logger.info(f"PERFORMANCE: Tiempo total de escaneo de {num_filas} filas en la tabla: {duration_scan:.4f} segundos.")
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (búsqueda y marcado): {duration_total_operation:.4f} segundos.")
-
-            if interaction_times:
-                avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de marcado por checkbox: {avg_interaction_time:.4f} segundos.")
+                                self.logger.warning(f"\n  ⚠️ ADVERTENCIA: No se encontró un checkbox en la Fila {i+1} a pesar de la coincidencia del texto.")
+                            break # Salir del bucle de celdas una vez encontrada la coincidencia en la fila
 
+                    if not celda_encontrada_en_fila:
+                        self.logger.debug(lambda: f"\n  No se encontró '{texto_a_buscar}' en la Fila {i+1}. Continuando con la siguiente fila.")
 
             if checkboxes_marcados_exitosamente > 0:
                 self.logger.info(f"\n✅ ÉXITO: Se marcaron {checkboxes_marcados_exitosamente} checkbox(es) basados en la búsqueda de '{texto_a_buscar}'.")
                 self.tomar_captura(f"{nombre_base}_busqueda_finalizada_exito", directorio)
                 return True
-            elif found_any_match and checkboxes_marcados_exitosamente == 0:
-                 self.logger.warning(f"\n⚠️ ADVERTENCIA: Se encontraron coincidencias para '{texto_a_buscar}', pero no se pudo marcar ningún checkbox. Posiblemente ya estaban marcados o hubo un problema al interactuar.")
-                 self.tomar_captura(f"{nombre_base}_busqueda_finalizada_coincidencia_sin_marcados", directorio)
-                 return True # Consideramos éxito si se encontró la coincidencia, aunque no se marcaran nuevos.
+            elif found_any_match:
+                self.logger.warning(f"\n⚠️ ADVERTENCIA: Se encontraron coincidencias para '{texto_a_buscar}', pero no se pudo marcar ningún checkbox. Posiblemente ya estaban marcados o hubo un problema al interactuar.")
+                self.tomar_captura(f"{nombre_base}_busqueda_finalizada_coincidencia_sin_marcados", directorio)
+                return True # Consideramos éxito si se encontró la coincidencia, aunque no se marcaran nuevos.
             else:
                 self.logger.warning(f"\n⚠️ ADVERTENCIA: No se encontraron coincidencias para '{texto_a_buscar}' en ninguna celda de la tabla.")
                 self.tomar_captura(f"{nombre_base}_busqueda_finalizada_sin_coincidencias", directorio)
                 return False # Falla si no se encuentra ninguna coincidencia.
-
-        except TimeoutError as e:
-            # Captura si la tabla no se vuelve visible a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): La tabla con el locator '{tabla_selector}' no estuvo visible a tiempo (timeout configurado: {tiempo_espera_tabla}s).\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_tabla", directorio)
-            raise AssertionError(f"\nTabla no disponible a tiempo: {tabla_selector}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con la tabla o checkboxes.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error al interactuar con la tabla o los checkboxes.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright durante la búsqueda/marcado: {tabla_selector}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado durante la búsqueda y marcado de checkboxes.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado durante la búsqueda/marcado: {tabla_selector}") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(1) # Pequeña espera final para observación o para liberar recursos si es necesario.
         
     # 38- Función para verificar que la página inicial esperada esté seleccionada y resaltada en un componente de paginación.
     # Incluye pruebas de rendimiento.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_pagina_inicial_seleccionada(self, selector_paginado: Locator, texto_pagina_inicial: str, nombre_base: str, directorio: str, clase_resaltado: str = "active", tiempo_espera_componente: Union[int, float] = 1.0) -> bool:
         """
         Verifica que la página inicial esperada esté seleccionada y correctamente resaltada
@@ -4598,121 +2773,50 @@ class Funciones_Globales:
         self.logger.info(f"P\nágina inicial esperada: '{texto_pagina_inicial}'")
         self.tomar_captura(f"{nombre_base}_inicio_verificacion_paginacion", directorio)
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el contenedor o la página inicial no están visibles a tiempo o falla Playwright, el decorador
+            # toma la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que el contenedor de paginación esté visible
-            self.logger.debug(f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
-            # Convertir tiempo_espera_componente de segundos a milisegundos para expect()
+            self.logger.debug(lambda: f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
             expect(selector_paginado).to_be_visible()
-            selector_paginado.highlight()
+            self._resaltar(selector_paginado)
             self.logger.info("\n✅ Contenedor de paginación visible. Procediendo a verificar la página inicial.")
 
-            # --- Medición de rendimiento: Inicio de localización de la página inicial ---
-            start_time_locator_page = time.time()
-
-            # 2. Intentar encontrar el elemento de la página inicial por su texto dentro del contenedor
-            # Se usa text= para una coincidencia exacta del texto visible del número de página.
-            # Es crucial que el selector apunte al elemento que realmente tiene el texto de la página (ej. un <a> o <span> dentro de un <li>).
-            # Si el texto '1' aparece en otros lugares, puede ser necesario un selector más específico,
-            # como `selector_paginado.locator(f"li > a:has-text('{texto_pagina_inicial}')")` o similar.
-            pagina_inicial_locator = selector_paginado.locator(f"text='{texto_pagina_inicial}'").first
-
-            # Esperar a que el elemento de la página inicial esté visible y sea interactuable
-            self.logger.debug(f"\nEsperando que el elemento de la página inicial '{texto_pagina_inicial}' esté visible (timeout: {tiempo_espera_componente}s).")
-            expect(pagina_inicial_locator).to_be_visible()
-            self.logger.info(f"\n✅ Elemento para la página '{texto_pagina_inicial}' encontrado y visible.")
-
-            # --- Medición de rendimiento: Fin de localización de la página inicial ---
-            end_time_locator_page = time.time()
-            duration_locator_page = end_time_locator_page - start_time_locator_page
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento de la página inicial: {duration_locator_page:.4f} segundos.")
-
-            # --- Medición de rendimiento: Inicio de verificación de estado ---
-            start_time_verification = time.time()
-
-            # 3. Verificar que la página inicial esperada esté seleccionada (marcada con la clase de resaltado)
-            self.logger.info(f"\nVerificando si la página '{texto_pagina_inicial}' tiene la clase de resaltado esperada '{clase_resaltado}'...")
-            pagina_inicial_locator.highlight() # Resaltar el elemento para la captura visual
-            self.tomar_captura(f"{nombre_base}_pagina_inicial_encontrada_resaltada", directorio)
-
-            # Obtener todas las clases del elemento y verificar si la clase de resaltado está presente
-            current_classes_attribute = pagina_inicial_locator.get_attribute("class")
-            
-            # Un elemento puede no tener atributo 'class' o puede ser una cadena vacía
-            if current_classes_attribute is not None:
-                current_classes_list = current_classes_attribute.split()
-            else:
-                current_classes_list = [] # Si no hay atributo 'class', la lista está vacía
-
-            if clase_resaltado in current_classes_list:
-                self.logger.info(f"\n  ✅ ÉXITO: La página '{texto_pagina_inicial}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
-                self.tomar_captura(f"{nombre_base}_pagina_inicial_seleccionada_ok", directorio)
-                success = True
-            else:
-                self.logger.error(f"\n  ❌ FALLO: La página '{texto_pagina_inicial}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
-                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
+            with self._medir("verificar_pagina_inicial_seleccionada.locator_page", "localización del elemento de la página inicial"):
+                # 2. Intentar encontrar el elemento de la página inicial por su texto dentro del contenedor
+                # Se usa text= para una coincidencia exacta del texto visible del número de página.
+                # Es crucial que el selector apunte al elemento que realmente tiene el texto de la página (ej. un <a> o <span> dentro de un <li>).
+                # Si el texto '1' aparece en otros lugares, puede ser necesario un selector más específico,
+                # como `selector_paginado.locator(f"li > a:has-text('{texto_pagina_inicial}')")` o similar.
+                pagina_inicial_locator = selector_paginado.locator(f"text='{texto_pagina_inicial}'").first
+
+                # Esperar a que el elemento de la página inicial esté visible y sea interactuable
+                self.logger.debug(lambda: f"\nEsperando que el elemento de la página inicial '{texto_pagina_inicial}' esté visible (timeout: {tiempo_espera_componente}s).")
+                expect(pagina_inicial_locator).to_be_visible()
+                self.logger.info(f"\n✅ Elemento para la página '{texto_pagina_inicial}' encontrado y visible.")
+
+            with self._medir("verificar_pagina_inicial_seleccionada.verification", "verificación de la clase de resaltado"):
+                # 3. Verificar que la página inicial esperada esté seleccionada (marcada con la clase de resaltado)
+                self.logger.info(f"\nVerificando si la página '{texto_pagina_inicial}' tiene la clase de resaltado esperada '{clase_resaltado}'...")
+                self._resaltar(pagina_inicial_locator) # Resaltar el elemento para la captura visual
+                self.tomar_captura(f"{nombre_base}_pagina_inicial_encontrada_resaltada", directorio)
+
+                # Un elemento puede no tener atributo 'class' o puede ser una cadena vacía
+                current_classes_attribute = pagina_inicial_locator.get_attribute("class")
+                if clase_resaltado in (current_classes_attribute or "").split():
+                    self.logger.info(f"\n  ✅ ÉXITO: La página '{texto_pagina_inicial}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
+                    self.tomar_captura(f"{nombre_base}_pagina_inicial_seleccionada_ok", directorio)
+                    return True
+                self.logger.error(f"\n  ❌ FALLO: La página '{texto_pagina_inicial}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
+                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
                 self.tomar_captura(f"{nombre_base}_pagina_inicial_no_resaltada", directorio)
-                success = False
-            
-            # --- Medición de rendimiento: Fin de verificación de estado ---
-            end_time_verification = time.time()
-            duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la clase de resaltado: {duration_verification:.4f} segundos.")
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de paginación inicial): {duration_total_operation:.4f} segundos.")
-
-            return success
-
-        except TimeoutError as e:
-            # Captura si el contenedor de paginación o el elemento de la página inicial no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El contenedor de paginación '{selector_paginado}' "
-                f"o la página inicial '{texto_pagina_inicial}' no estuvieron visibles a tiempo "
-                f"(timeout configurado: {tiempo_espera_componente}s).\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_paginacion", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nComponente de paginación o página inicial no disponibles a tiempo: {selector_paginado}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con el DOM.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error al interactuar con el componente de paginación.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError de Playwright al verificar paginación: {selector_paginado}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar la paginación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError inesperado al verificar paginación: {selector_paginado}") from e
-
+                return False
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.5) # Pequeña espera final para observación o para liberar recursos si es necesario.
         
     # 39- Función para navegar a un número de página específico en un componente de paginación y verificar su estado.
     # Incluye pruebas de rendimiento.
+    @accion_instrumentada(envolver_en=AssertionError)
     def navegar_y_verificar_pagina(self, selector_paginado: Locator, numero_pagina_a_navegar: str, nombre_base: str, directorio: str, clase_resaltado: str = "active", tiempo_espera_componente: Union[int, float] = 1.0, pausa_post_clic: Union[int, float] = 0.5) -> bool:
         """
         Navega a un número de página específico en un componente de paginación haciendo clic en el enlace
@@ -4753,54 +2857,40 @@ class Funciones_Globales:
         self.logger.info(f"\nContenedor de paginación locator: '{selector_paginado}'")
         self.tomar_captura(f"{nombre_base}_inicio_navegacion_pagina_{numero_pagina_a_navegar}", directorio)
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el contenedor o la página de destino no están disponibles a tiempo o falla Playwright, el decorador
+            # toma la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que el contenedor de paginación está visible
-            self.logger.debug(f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
-            # Convertir tiempo_espera_componente de segundos a milisegundos para expect()
+            self.logger.debug(lambda: f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
             expect(selector_paginado).to_be_visible()
-            selector_paginado.highlight()
+            self._resaltar(selector_paginado)
             self.logger.info("\n✅ Contenedor de paginación visible. Procediendo.")
 
-            # --- Medición de rendimiento: Inicio detección de página actual y total ---
-            start_time_detection = time.time()
-
-            # Obtener la página actualmente seleccionada
-            # Este locator debería apuntar al elemento que realmente tiene la clase 'active'
-            # y cuyo texto es el número de página (ej. un <a> dentro de un <li>)
-            pagina_actual_locator = selector_paginado.locator(f"a.{clase_resaltado}").first
-            # O si el <li> es el que tiene la clase, y necesitas el texto del <a> dentro:
-            # pagina_actual_locator = selector_paginado.locator(f"li.{clase_resaltado} a").first
-
-            # Usar .is_visible() y .text_content() para obtener el texto de forma segura
-            pagina_actual_texto = "Desconocida"
-            if pagina_actual_locator.count() > 0 and pagina_actual_locator.is_visible():
-                pagina_actual_texto = pagina_actual_locator.text_content().strip()
-            self.logger.info(f"\n  Página actualmente seleccionada detectada: {pagina_actual_texto}")
-
-            # Calcular el número total de páginas disponibles
-            # Asumimos que los elementos de paginación son 'li' y que el último 'li' visible
-            # que contenga un número representa la última página.
-            todos_los_botones_pagina = selector_paginado.locator("li")
-            num_botones = todos_los_botones_pagina.count()
-            
-            total_paginas = 0
-            if num_botones > 0:
-                for i in range(num_botones - 1, -1, -1): # Iterar al revés para encontrar el último número
-                    btn = todos_los_botones_pagina.nth(i)
-                    btn_text = btn.text_content().strip()
+            with self._medir("navegar_y_verificar_pagina.detection", "detección de página actual y total"):
+                # Obtener la página actualmente seleccionada
+                # Este locator debería apuntar al elemento que realmente tiene la clase 'active'
+                # y cuyo texto es el número de página (ej. un <a> dentro de un <li>)
+                pagina_actual_locator = selector_paginado.locator(f"a.{clase_resaltado}").first
+                # O si el <li> es el que tiene la clase, y necesitas el texto del <a> dentro:
+                # pagina_actual_locator = selector_paginado.locator(f"li.{clase_resaltado} a").first
+
+                # Usar .is_visible() y .text_content() para obtener el texto de forma segura
+                pagina_actual_texto = "Desconocida"
+                if pagina_actual_locator.count() > 0 and pagina_actual_locator.is_visible():
+                    pagina_actual_texto = pagina_actual_locator.text_content().strip()
+                self.logger.info(f"\n  Página actualmente seleccionada detectada: {pagina_actual_texto}")
+
+                # Calcular el número total de páginas disponibles
+                # Asumimos que los elementos de paginación son 'li' y que el último 'li' visible
+                # que contenga un número representa la última página.
+                todos_los_botones_pagina = selector_paginado.locator("li")
+                total_paginas = 0
+                for i in range(todos_los_botones_pagina.count() - 1, -1, -1): # Iterar al revés para encontrar el último número
+                    btn_text = todos_los_botones_pagina.nth(i).text_content().strip()
                     if btn_text.isdigit(): # Si el texto es un número válido
                         total_paginas = int(btn_text)
                         break
-            
-            self.logger.info(f"\n  Número total de páginas detectadas: {total_paginas}")
-            
-            # --- Medición de rendimiento: Fin detección de página actual y total ---
-            end_time_detection = time.time()
-            duration_detection = end_time_detection - start_time_detection
-            self.logger.info(f"PERFORMANCE: Tiempo de detección de página actual y total: {duration_detection:.4f} segundos.")
+                self.logger.info(f"\n  Número total de páginas detectadas: {total_paginas}")
 
             # 2. Validaciones previas a la navegación
             try:
@@ -4821,7 +2911,6 @@ class Funciones_Globales:
             # Condicional 2: La página de destino es la misma que la página actual
             if num_pagina_int == pagina_actual_int:
                 self.logger.warning(f"\n⚠️ ADVERTENCIA: Ya estás en la página '{numero_pagina_a_navegar}'. No se requiere navegación.")
-                # Opcional: Podrías verificar de nuevo que siga resaltada, pero si ya estaba, no es una "navegación".
                 self.tomar_captura(f"{nombre_base}_pagina_destino_actual", directorio)
                 return True # Considerar esto un éxito, ya que el estado es el esperado.
 
@@ -4829,121 +2918,47 @@ class Funciones_Globales:
             # Este selector busca un 'a' dentro de un 'li' que contenga el texto del número de página.
             # Ajusta esto si tu estructura HTML es diferente (ej. si el número está directamente en el 'li').
             pagina_destino_locator = selector_paginado.locator(
-                f"li:has-text('{numero_pagina_a_navegar}') a" 
+                f"li:has-text('{numero_pagina_a_navegar}') a"
             ).first
-            
-            # --- Medición de rendimiento: Inicio de localización del botón de la página de destino ---
-            start_time_locator_button = time.time()
-            expect(pagina_destino_locator).to_be_visible()
-            expect(pagina_destino_locator).to_be_enabled()
+
+            with self._medir("navegar_y_verificar_pagina.locator_button", "localización del botón de la página de destino"):
+                expect(pagina_destino_locator).to_be_visible()
+                expect(pagina_destino_locator).to_be_enabled()
             self.logger.info(f"\n✅ Elemento de la página '{numero_pagina_a_navegar}' encontrado y habilitado para clic.")
-            
-            # --- Medición de rendimiento: Fin de localización del botón de la página de destino ---
-            end_time_locator_button = time.time()
-            duration_locator_button = end_time_locator_button - start_time_locator_button
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del botón de la página de destino: {duration_locator_button:.4f} segundos.")
 
-            pagina_destino_locator.highlight()
+            self._resaltar(pagina_destino_locator)
             self.tomar_captura(f"{nombre_base}_pagina_a_navegar_encontrada", directorio)
-            
-            self.logger.info(f"\n  Haciendo clic en la página '{numero_pagina_a_navegar}'...")
-            
-            # --- Medición de rendimiento: Inicio de click y espera de carga ---
-            start_time_click_and_wait = time.time()
-            pagina_destino_locator.click()
-            self.esperar_fijo(pausa_post_clic) # Pausa para permitir la carga de la página y la aplicación de estilos
-            
-            # --- Medición de rendimiento: Fin de click y espera de carga ---
-            end_time_click_and_wait = time.time()
-            duration_click_and_wait = end_time_click_and_wait - start_time_click_and_wait
-            self.logger.info(f"PERFORMANCE: Tiempo de click y espera de carga para la página '{numero_pagina_a_navegar}': {duration_click_and_wait:.4f} segundos.")
+
+            self.logger.info(f"\n  Haciendo clic en la página '{numero_pagina_a_navegar}'...")
+            with self._medir("navegar_y_verificar_pagina.click_and_wait", f"click y espera de carga para la página '{numero_pagina_a_navegar}'"):
+                pagina_destino_locator.click()
+                self.esperar_fijo(pausa_post_clic) # Pausa para permitir la carga de la página y la aplicación de estilos
 
             self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_clic", directorio)
 
             # 4. Verificar que la página de destino se resalte
             self.logger.info(f"\nVerificando si la página '{numero_pagina_a_navegar}' tiene la clase de resaltado '{clase_resaltado}'...")
-            
+
             # Asegurarse de que el elemento de destino aún esté visible y, opcionalmente, que sus atributos se hayan actualizado.
             expect(pagina_destino_locator).to_be_visible()
-            pagina_destino_locator.highlight() # Resaltar el elemento para la captura final
-
-            # --- Medición de rendimiento: Inicio de verificación de estado final ---
-            start_time_final_verification = time.time()
-
-            current_classes_attribute = pagina_destino_locator.get_attribute("class")
-            
-            if current_classes_attribute is not None:
-                current_classes_list = current_classes_attribute.split()
-            else:
-                current_classes_list = []
-
-            if clase_resaltado in current_classes_list:
-                self.logger.info(f"\n  ✅ ÉXITO: La página '{numero_pagina_a_navegar}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
-                self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_seleccionada_ok", directorio)
-                success = True
-            else:
-                self.logger.error(f"\n  ❌ FALLO: La página '{numero_pagina_a_navegar}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
-                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
+            self._resaltar(pagina_destino_locator) # Resaltar el elemento para la captura final
+
+            with self._medir("navegar_y_verificar_pagina.final_verification", "verificación de la clase de resaltado final"):
+                current_classes_attribute = pagina_destino_locator.get_attribute("class")
+                if clase_resaltado in (current_classes_attribute or "").split():
+                    self.logger.info(f"\n  ✅ ÉXITO: La página '{numero_pagina_a_navegar}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
+                    self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_seleccionada_ok", directorio)
+                    return True
+                self.logger.error(f"\n  ❌ FALLO: La página '{numero_pagina_a_navegar}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
+                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
                 self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_no_resaltada", directorio)
-                success = False
-
-            # --- Medición de rendimiento: Fin de verificación de estado final ---
-            end_time_final_verification = time.time()
-            duration_final_verification = end_time_final_verification - start_time_final_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la clase de resaltado final: {duration_final_verification:.4f} segundos.")
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (navegación y verificación de paginación): {duration_total_operation:.4f} segundos.")
-
-            return success
-
-        except TimeoutError as e:
-            # Captura si el contenedor de paginación o el elemento de la página de destino no se vuelven visibles/interactuables a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El contenedor de paginación '{selector_paginado}' "
-                f"o la página '{numero_pagina_a_navegar}' no estuvieron visibles/interactuables a tiempo "
-                f"(timeout configurado: {tiempo_espera_componente}s).\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_navegacion", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nComponente de paginación o página de destino no disponibles a tiempo: {selector_paginado} o página {numero_pagina_a_navegar}") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright durante la interacción con el DOM.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error al interactuar con el componente de paginación durante la navegación.\n"
-                f"Posibles causas: Locator inválido, problemas de interacción con el DOM, elemento no clickable.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError de Playwright al navegar/verificar paginación: {selector_paginado}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al navegar y verificar la paginación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError inesperado al navegar/verificar paginación: {selector_paginado}") from e
-
+                return False
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.5) # Pequeña espera final para observación o para liberar recursos si es necesario.
         
     # 40- Función para verificar una alerta simple utilizando page.expect_event().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la alerta.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_alerta_simple_con_expect_event(self, selector: Locator, mensaje_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_alerta: Union[int, float] = 0.5) -> bool:
         """
         Verifica una alerta de tipo 'alert' que aparece después de hacer clic en un selector dado.
@@ -4979,45 +2994,27 @@ class Funciones_Globales:
         self.logger.info(f"\nVerificando alerta al hacer clic en '{selector}'")
         self.logger.info(f"\n  --> Mensaje de alerta esperado: '{mensaje_esperado}'")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el elemento no está listo, la alerta no aparece a tiempo, falla Playwright o falla una
+            # verificación, el decorador registra el fallo, toma la captura y lo relanza como AssertionError.
             # 1. Validar visibilidad y habilitación del selector que disparará la alerta
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
-            expect(selector).to_be_visible()
-            expect(selector).to_be_enabled()
-            selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
-            # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
-            duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
-            
-            self.tomar_captura(f"{nombre_base}_elemento_listo_para_alerta", directorio)
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            with self._medir("verificar_alerta_simple_con_expect_event.element_ready", "preparación del elemento disparador"):
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
 
+            self.tomar_captura(f"{nombre_base}_elemento_listo_para_alerta", directorio)
 
-            self.logger.debug(f"\n  --> Preparando expect_event para la alerta y haciendo clic (timeout de alerta: {tiempo_espera_alerta}s)...")
-            
             # 2. Esperar el evento de diálogo (alerta) y hacer clic en el selector
-            # Se usa `timeout` en `expect_event` para el tiempo máximo de aparición de la alerta.
-            # Se usa `timeout` en `click` para el tiempo máximo de clic en el elemento.
-            # Se recomienda que el timeout del `expect_event` sea al menos tan grande como el del `click`
-            # para dar tiempo a que la alerta aparezca.
             # Playwright automáticamente acepta diálogos si no hay un handler. Aquí, lo manejamos explícitamente.
-            with self.page.expect_event("dialog") as info_dialogo:
-                # --- Medición de rendimiento: Inicio de click y espera de alerta ---
-                start_time_alert_detection = time.time()
-                self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}' para disparar la alerta...")
-                selector.click()
-            
-            dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog de la alerta
-            # --- Medición de rendimiento: Fin de click y espera de alerta ---
-            end_time_alert_detection = time.time()
-            duration_alert_detection = end_time_alert_detection - start_time_alert_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la alerta: {duration_alert_detection:.4f} segundos.")
+            self.logger.debug(lambda: f"\n  --> Preparando expect_event para la alerta y haciendo clic (timeout de alerta: {tiempo_espera_alerta}s)...")
+            with self._medir("verificar_alerta_simple_con_expect_event.alert_detection", "detección de la alerta desde el clic"):
+                with self.page.expect_event("dialog") as info_dialogo:
+                    self.logger.debug(lambda: f"\n  --> Haciendo clic en el botón '{selector}' para disparar la alerta...")
+                    selector.click()
+                dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog de la alerta
 
             self.logger.info(f"\n  --> Alerta detectada. Tipo: '{dialogo.type}', Mensaje: '{dialogo.message}'")
             self.tomar_captura(f"{nombre_base}_alerta_detectada", directorio)
@@ -5025,29 +3022,17 @@ class Funciones_Globales:
             # 3. Validar el tipo de diálogo
             if dialogo.type != "alert":
                 dialogo.accept() # Aceptar para no bloquear si es un tipo inesperado
-                self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{dialogo.type}'. Se esperaba 'alert'.")
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{dialogo.type}'. Se esperaba 'alert'.")
 
             # 4. Validar el mensaje de la alerta
-            # --- Medición de rendimiento: Inicio de verificación del mensaje ---
-            start_time_message_verification = time.time()
-            if mensaje_esperado not in dialogo.message:
-                self.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
-                    f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
-                    f"  --> Obtenido: '{dialogo.message}'"
-                )
-                self.logger.error(error_msg)
-                dialogo.accept() # Aceptar para no bloquear antes de fallar
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            # --- Medición de rendimiento: Fin de verificación del mensaje ---
-            end_time_message_verification = time.time()
-            duration_message_verification = end_time_message_verification - start_time_message_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del mensaje de la alerta: {duration_message_verification:.4f} segundos.")
-
+            with self._medir("verificar_alerta_simple_con_expect_event.message_verification", "verificación del mensaje de la alerta"):
+                if mensaje_esperado not in dialogo.message:
+                    dialogo.accept() # Aceptar para no bloquear antes de fallar
+                    raise AssertionError(
+                        f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
+                        f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
+                        f"  --> Obtenido: '{dialogo.message}'"
+                    )
 
             # 5. Aceptar la alerta
             dialogo.accept()
@@ -5061,63 +3046,13 @@ class Funciones_Globales:
 
             self.tomar_captura(f"{nombre_base}_alerta_exitosa", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de alerta): {duration_total_operation:.4f} segundos.")
-
             return True
-
-        except TimeoutError as e:
-            # Captura si el selector no está listo o si la alerta no aparece a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo "
-                f"o la alerta no apareció/fue detectada a tiempo ({tiempo_espera_elemento}s para elemento, {tiempo_espera_alerta}s para alerta).\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_alerta_NO_aparece_timeout", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nTimeout al verificar alerta para selector '{selector}'") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. click fallido, problemas con el diálogo).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o la alerta.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError de Playwright al verificar alerta para selector '{selector}'") from e
-
-        except AssertionError as e:
-            # Captura las AssertionError lanzadas internamente por la función (tipo de diálogo, mensaje incorrecto).
-            self.logger.critical(f"\n❌ FALLO (Validación de Alerta): {e}", exc_info=True)
-            # La captura ya se tomó en la lógica interna donde se lanzó el AssertionError
-            raise # Re-lanzar la excepción original para que el framework la maneje
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar la alerta.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError inesperado al verificar alerta para selector '{selector}'") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
     
     # 41- Función para verificar una alerta simple utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la alerta a través de un listener.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_alerta_simple_con_on(self, selector: Locator, mensaje_alerta_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_max_deteccion_alerta: Union[int, float] = 0.7) -> bool:
         """
         Verifica una alerta de tipo 'alert' que aparece después de hacer clic en un selector dado.
@@ -5160,23 +3095,17 @@ class Funciones_Globales:
         self._alerta_mensaje_capturado = ""
         self._alerta_tipo_capturado = ""
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el elemento no está listo, falla Playwright o falla una verificación, el decorador registra
+            # el fallo, toma la captura y lo relanza como AssertionError.
             # 1. Validar visibilidad y habilitación del selector que disparará la alerta
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
-            expect(selector).to_be_visible()
-            expect(selector).to_be_enabled()
-            selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
-            # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
-            duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            with self._medir("verificar_alerta_simple_con_on.element_ready", "preparación del elemento disparador"):
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+
             self.tomar_captura(f"{nombre_base}_elemento_listo_para_alerta", directorio)
 
             # 2. Registrar el listener ANTES de la acción que dispara la alerta
@@ -5185,59 +3114,34 @@ class Funciones_Globales:
             # El handler `_get_simple_alert_handler_for_on()` también acepta la alerta internamente.
             self.page.once("dialog", self._get_simple_alert_handler_for_on())
 
-            # 3. Hacer clic en el botón que dispara la alerta
-            self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}'...")
-            # --- Medición de rendimiento: Inicio de click y espera de detección de alerta ---
-            start_time_click_and_alert_detection = time.time()
-            selector.click() # Reutilizar tiempo_espera_elemento para el click
-
-            # 4. Esperar a que el listener haya detectado y manejado la alerta
-            self.logger.debug(f"\n  --> Esperando a que la alerta sea detectada y manejada por el listener (timeout: {tiempo_max_deteccion_alerta}s)...")
-            # Bucle de espera activa hasta que la bandera _alerta_detectada sea True
-            # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_alerta
-            wait_end_time = time.time() + tiempo_max_deteccion_alerta
-            while not self._alerta_detectada and time.time() < wait_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
-
-            # --- Medición de rendimiento: Fin de click y espera de detección de alerta ---
-            end_time_click_and_alert_detection = time.time()
-            duration_click_and_alert_detection = end_time_click_and_alert_detection - start_time_click_and_alert_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la alerta por el listener: {duration_click_and_alert_detection:.4f} segundos.")
+            # 3. Hacer clic y esperar el evento 'dialog' con la maquinaria de eventos de Playwright (sin sondeo)
+            self.logger.debug(lambda: f"\n  --> Haciendo clic en el botón '{selector}' y esperando a que el listener maneje la alerta (timeout: {tiempo_max_deteccion_alerta}s)...")
+            with self._medir("verificar_alerta_simple_con_on.click_and_alert_detection", "detección de la alerta por el listener desde el clic"):
+                # Un clic que falla (elemento cubierto, desconectado o deshabilitado) se propaga como tal;
+                # solo la ausencia del diálogo se informa como alerta no detectada.
+                dialogo = self._esperar_evento("dialog", selector.click, tiempo_max_deteccion_alerta, si_no_llega=None)
+                self._alerta_detectada = dialogo is not None
+                if dialogo is not None:
+                    self._alerta_mensaje_capturado = dialogo.message
+                    self._alerta_tipo_capturado = dialogo.type
 
             if not self._alerta_detectada:
-                error_msg = f"\n❌ FALLO: La alerta no fue detectada por el listener después de {tiempo_max_deteccion_alerta} segundos."
-                self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_alerta_NO_detectada_timeout", directorio)
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            
+                raise AssertionError(f"\n❌ FALLO: La alerta no fue detectada por el listener después de {tiempo_max_deteccion_alerta} segundos.")
+
             self.tomar_captura(f"{nombre_base}_alerta_detectada_por_listener", directorio)
             self.logger.info(f"\n  ✅  Alerta detectada con éxito por el listener.")
 
-            # 5. Validaciones después de que el listener ha actuado
-            # --- Medición de rendimiento: Inicio de verificación de contenido de alerta ---
-            start_time_alert_content_verification = time.time()
-            if self._alerta_tipo_capturado != "alert":
-                self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{self._alerta_tipo_capturado}'. Se esperaba 'alert'.")
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(f"\nTipo de diálogo inesperado: '{self._alerta_tipo_capturado}'. Se esperaba 'alert'.")
-
-            if mensaje_alerta_esperado not in self._alerta_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
-                    f"  --> Esperado (contiene): '{mensaje_alerta_esperado}'\n"
-                    f"  --> Obtenido: '{self._alerta_mensaje_capturado}'"
-                )
-                self.logger.error(error_msg)
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            
-            # --- Medición de rendimiento: Fin de verificación de contenido de alerta ---
-            end_time_alert_content_verification = time.time()
-            duration_alert_content_verification = end_time_alert_content_verification - start_time_alert_content_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de tipo y mensaje de la alerta: {duration_alert_content_verification:.4f} segundos.")
+            # 4. Validaciones después de que el listener ha actuado
+            with self._medir("verificar_alerta_simple_con_on.alert_content_verification", "verificación de tipo y mensaje de la alerta"):
+                if self._alerta_tipo_capturado != "alert":
+                    raise AssertionError(f"\nTipo de diálogo inesperado: '{self._alerta_tipo_capturado}'. Se esperaba 'alert'.")
 
+                if mensaje_alerta_esperado not in self._alerta_mensaje_capturado:
+                    raise AssertionError(
+                        f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
+                        f"  --> Esperado (contiene): '{mensaje_alerta_esperado}'\n"
+                        f"  --> Obtenido: '{self._alerta_mensaje_capturado}'"
+                    )
 
             # La alerta ya fue aceptada por el handler `_get_simple_alert_handler_for_on()`.
             self.logger.info("\n  ✅  --> Alerta ACEPTADA (por el listener).")
@@ -5250,60 +3154,13 @@ class Funciones_Globales:
 
             self.tomar_captura(f"{nombre_base}_alerta_exitosa", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de alerta por listener): {duration_total_operation:.4f} segundos.")
-
             return True
-
-        except TimeoutError as e:
-            # Captura si el selector no está listo. La detección de alerta por timeout se maneja en el bucle.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo "
-                f"antes de intentar hacer clic ({tiempo_espera_elemento}s).\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_elemento_NO_listo_timeout", directorio)
-            raise AssertionError(f"\nTimeout al preparar el elemento disparador para '{selector}'") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. click fallido, problemas con el diálogo).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o la alerta.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al verificar alerta para selector '{selector}'") from e
-
-        except AssertionError as e:
-            # Captura las AssertionError lanzadas internamente por la función (alerta no detectada, tipo incorrecto, mensaje incorrecto).
-            self.logger.critical(f"\n❌ FALLO (Validación de Alerta): {e}", exc_info=True)
-            # La captura ya se tomó en la lógica interna donde se lanzó el AssertionError
-            raise # Re-lanzar la excepción original para que el framework la maneje
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar la alerta.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar alerta para selector '{selector}'") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 42- Función para verificar una alerta de confirmación utilizando page.expect_event().
     # Este método maneja el diálogo exclusivamente con expect_event e integra pruebas de rendimiento.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_confirmacion_expect_event(self, selector: Locator, mensaje_esperado: str, accion_confirmacion: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_confirmacion: Union[int, float] = 0.7) -> bool:
         """
         Verifica una alerta de tipo 'confirm' que aparece después de hacer clic en un selector dado.
@@ -5344,179 +3201,71 @@ class Funciones_Globales:
 
         # Validar la acción de confirmación antes de iniciar la operación
         if accion_confirmacion not in ['accept', 'dismiss']:
-            error_msg = f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
-            raise AssertionError(error_msg)
-
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+            raise AssertionError(f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'.")
 
         try:
+            # Si el elemento no está listo, el diálogo no aparece a tiempo, falla Playwright o falla una
+            # verificación, el decorador registra el fallo, toma la captura y lo relanza como AssertionError.
             # 1. Validar visibilidad y habilitación del selector que disparará la confirmación
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
-            expect(selector).to_be_visible()
-            expect(selector).to_be_enabled()
-            selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
-            # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
-            duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            with self._medir("verificar_confirmacion_expect_event.element_ready", "preparación del elemento disparador"):
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+
             self.tomar_captura(f"{nombre_base}_elemento_listo_para_confirmacion", directorio)
 
             # 2. Esperar el evento de diálogo (confirmación) y hacer clic en el selector
-            self.logger.debug(f"\n  --> Preparando expect_event para la confirmación y haciendo clic (timeout de confirmación: {tiempo_espera_confirmacion}s)...")
-            
-            # Se usa `timeout` en `expect_event` para el tiempo máximo de aparición de la confirmación.
-            # Se usa `timeout` en `click` para el tiempo máximo de clic en el elemento.
-            # Es importante que el timeout de `expect_event` sea suficiente para que la confirmación aparezca.
-            with self.page.expect_event("dialog", timeout=int(tiempo_espera_confirmacion * 1000)) as info_dialogo:
-                # --- Medición de rendimiento: Inicio de click y espera de confirmación ---
-                start_time_confirm_detection = time.time()
-                self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}' para disparar la confirmación...")
-                selector.click(timeout=int(tiempo_espera_elemento * 1000)) # Reutilizar tiempo_espera_elemento para el click
-            
-            dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog de la confirmación
-            # --- Medición de rendimiento: Fin de click y espera de confirmación ---
-            end_time_confirm_detection = time.time()
-            duration_confirm_detection = end_time_confirm_detection - start_time_confirm_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la confirmación: {duration_confirm_detection:.4f} segundos.")
+            self.logger.debug(lambda: f"\n  --> Preparando expect_event para la confirmación y haciendo clic (timeout de confirmación: {tiempo_espera_confirmacion}s)...")
+            with self._medir("verificar_confirmacion_expect_event.confirm_detection", "detección de la confirmación desde el clic"):
+                with self.page.expect_event("dialog", timeout=int(tiempo_espera_confirmacion * 1000)) as info_dialogo:
+                    self.logger.debug(lambda: f"\n  --> Haciendo clic en el botón '{selector}' para disparar la confirmación...")
+                    selector.click(timeout=int(tiempo_espera_elemento * 1000)) # Reutilizar tiempo_espera_elemento para el click
+                dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog de la confirmación
 
             self.logger.info(f"\n  --> Confirmación detectada. Tipo: '{dialogo.type}', Mensaje: '{dialogo.message}'")
             self.tomar_captura(f"{nombre_base}_confirmacion_detectada", directorio)
+            # Acción solicitada sobre el diálogo; también se realiza antes de fallar, para no bloquear la página
+            resolver_dialogo = dialogo.accept if accion_confirmacion == 'accept' else dialogo.dismiss
 
             # 3. Validar el tipo de diálogo
             if dialogo.type != "confirm":
-                # Realizar la acción solicitada incluso si el tipo es incorrecto para no bloquear
-                if accion_confirmacion == 'accept':
-                    dialogo.accept()
-                else:
-                    dialogo.dismiss()
-                self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{dialogo.type}'. Se esperaba 'confirm'.")
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
+                resolver_dialogo()
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{dialogo.type}'. Se esperaba 'confirm'.")
 
             # 4. Validar el mensaje de la confirmación
-            # --- Medición de rendimiento: Inicio de verificación del mensaje ---
-            start_time_message_verification = time.time()
-            if mensaje_esperado not in dialogo.message:
-                self.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
-                    f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
-                    f"  --> Obtenido: '{dialogo.message}'"
-                )
-                self.logger.error(error_msg)
-                # Realizar la acción solicitada para no bloquear antes de fallar
-                if accion_confirmacion == 'accept':
-                    dialogo.accept()
-                else:
-                    dialogo.dismiss()
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            # --- Medición de rendimiento: Fin de verificación del mensaje ---
-            end_time_message_verification = time.time()
-            duration_message_verification = end_time_message_verification - start_time_message_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del mensaje de la confirmación: {duration_message_verification:.4f} segundos.")
+            with self._medir("verificar_confirmacion_expect_event.message_verification", "verificación del mensaje de la confirmación"):
+                if mensaje_esperado not in dialogo.message:
+                    resolver_dialogo()
+                    raise AssertionError(
+                        f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
+                        f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
+                        f"  --> Obtenido: '{dialogo.message}'"
+                    )
 
             # 5. Realizar la acción solicitada (Aceptar o Cancelar)
-            # --- Medición de rendimiento: Inicio de la acción sobre la confirmación ---
-            start_time_confirm_action = time.time()
-            if accion_confirmacion == 'accept':
-                dialogo.accept()
-                self.logger.info("\n  ✅  --> Confirmación ACEPTADA.")
-            elif accion_confirmacion == 'dismiss':
-                dialogo.dismiss()
-                self.logger.info("\n  ✅  --> Confirmación CANCELADA.")
-            # --- Medición de rendimiento: Fin de la acción sobre la confirmación ---
-            end_time_confirm_action = time.time()
-            duration_confirm_action = end_time_confirm_action - start_time_confirm_action
-            self.logger.info(f"PERFORMANCE: Tiempo de acción ('{accion_confirmacion}') sobre la confirmación: {duration_confirm_action:.4f} segundos.")
-
-
-            # 6. Opcional: Verificar el resultado en la página después de la interacción
+            with self._medir("verificar_confirmacion_expect_event.confirm_action", f"acción ('{accion_confirmacion}') sobre la confirmación"):
+                resolver_dialogo()
+            self.logger.info(f"\n  ✅  --> Confirmación {'ACEPTADA' if accion_confirmacion == 'accept' else 'CANCELADA'}.")
+
+            # 6. Verificar el resultado en la página después de la interacción
             # Es crucial para confirmar que la acción en el diálogo tuvo el efecto esperado en la UI.
             # Asumo un selector '#demo' y textos específicos, ajusta esto a tu aplicación real.
-            # --- Medición de rendimiento: Inicio de verificación del resultado en la página ---
-            start_time_post_action_verification = time.time()
-            if accion_confirmacion == 'accept':
-                # Esto es un ejemplo, ajusta el selector y el texto esperado
-                expect(self.page.locator("#demo")).to_have_text("You pressed OK!", timeout=5000)
-                self.logger.info("\n  ✅  --> Resultado en página: 'You pressed OK!' verificado.")
-            elif accion_confirmacion == 'dismiss':
-                # Esto es un ejemplo, ajusta el selector y el texto esperado
-                expect(self.page.locator("#demo")).to_have_text("You pressed Cancel!", timeout=5000)
-                self.logger.info("\n  ✅  --> Resultado en página: 'You pressed Cancel!' verificado.")
-            
-            # --- Medición de rendimiento: Fin de verificación del resultado en la página ---
-            end_time_post_action_verification = time.time()
-            duration_post_action_verification = end_time_post_action_verification - start_time_post_action_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del resultado en la página: {duration_post_action_verification:.4f} segundos.")
-
+            with self._medir("verificar_confirmacion_expect_event.post_action_verification", "verificación del resultado en la página"):
+                texto_resultado = "You pressed OK!" if accion_confirmacion == 'accept' else "You pressed Cancel!"
+                expect(self.page.locator("#demo")).to_have_text(texto_resultado, timeout=5000)
+                self.logger.info(f"\n  ✅  --> Resultado en página: '{texto_resultado}' verificado.")
 
             self.tomar_captura(f"{nombre_base}_confirmacion_exitosa_{accion_confirmacion}", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: La confirmación se mostró, mensaje verificado y '{accion_confirmacion}' correctamente.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de confirmación): {duration_total_operation:.4f} segundos.")
-
             return True
-
-        except TimeoutError as e:
-            # Captura si el selector no está listo o si la confirmación no aparece a tiempo, o la verificación post-acción falla.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo, "
-                f"la confirmación no apareció/fue detectada a tiempo ({tiempo_espera_elemento}s para elemento, {tiempo_espera_confirmacion}s para confirmación), "
-                f"o la verificación del resultado en la página falló.\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_confirmacion_NO_aparece_timeout", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nTimeout al verificar confirmación para selector '{selector}'") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. click fallido, problemas con el diálogo).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o la confirmación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError de Playwright al verificar confirmación para selector '{selector}'") from e
-
-        except AssertionError as e:
-            # Captura las AssertionError lanzadas internamente por la función (tipo de diálogo, mensaje incorrecto, acción inválida).
-            self.logger.critical(f"\n❌ FALLO (Validación de Confirmación): {e}", exc_info=True)
-            # La captura ya se tomó en la lógica interna donde se lanzó el AssertionError
-            raise # Re-lanzar la excepción original para que el framework la maneje
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar la confirmación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar confirmación para selector '{selector}'") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 43- Función para verificar una alerta de confirmación utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la confirmación a través de un listener.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_confirmacion_on_dialog(self, selector: Locator, mensaje_esperado: str, accion_confirmacion: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_max_deteccion_confirmacion: Union[int, float] = 0.7) -> bool:
         """
         Verifica una confirmación de tipo 'confirm' que aparece después de hacer clic en un selector dado.
@@ -5558,10 +3307,7 @@ class Funciones_Globales:
 
         # Validar la acción de confirmación antes de iniciar la operación
         if accion_confirmacion not in ['accept', 'dismiss']:
-            error_msg = f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
-            raise AssertionError(error_msg)
+            raise AssertionError(f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'.")
 
         # Resetear el estado de las banderas para cada ejecución del test
         # Esto es crucial para evitar que valores de una ejecución anterior afecten la actual.
@@ -5569,23 +3315,17 @@ class Funciones_Globales:
         self._dialogo_mensaje_capturado = ""
         self._dialogo_tipo_capturado = ""
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el elemento no está listo, el diálogo no aparece a tiempo, falla Playwright o falla una
+            # verificación, el decorador registra el fallo, toma la captura y lo relanza como AssertionError.
             # 1. Validar visibilidad y habilitación del selector que disparará la confirmación
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
-            expect(selector).to_be_visible()
-            expect(selector).to_be_enabled()
-            selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
-            # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
-            duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            with self._medir("verificar_confirmacion_on_dialog.element_ready", "preparación del elemento disparador"):
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+
             self.tomar_captura(f"{nombre_base}_elemento_listo_para_confirmacion", directorio)
 
             # 2. Registrar el listener ANTES de la acción que dispara la confirmación
@@ -5594,137 +3334,54 @@ class Funciones_Globales:
             # El handler `_get_confirmation_dialog_handler_for_on()` también acepta/cancela la confirmación internamente.
             self.page.once("dialog", self._get_confirmation_dialog_handler_for_on(accion_confirmacion))
 
-            # 3. Hacer clic en el botón que dispara la confirmación
-            self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}'...")
-            # --- Medición de rendimiento: Inicio de click y espera de detección de confirmación ---
-            start_time_click_and_confirm_detection = time.time()
-            selector.click()
-
-            # 4. Esperar a que el listener haya detectado y manejado la confirmación
-            self.logger.debug(f"\n  --> Esperando a que la confirmación sea detectada y manejada por el listener (timeout: {tiempo_max_deteccion_confirmacion}s)...")
-            # Bucle de espera activa hasta que la bandera _dialogo_detectado sea True
-            # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_confirmacion
-            wait_end_time = time.time() + tiempo_max_deteccion_confirmacion
-            while not self._dialogo_detectado and time.time() < wait_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
-
-            # --- Medición de rendimiento: Fin de click y espera de detección de confirmación ---
-            end_time_click_and_confirm_detection = time.time()
-            duration_click_and_confirm_detection = end_time_click_and_confirm_detection - start_time_click_and_confirm_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la confirmación por el listener: {duration_click_and_confirm_detection:.4f} segundos.")
+            # 3. Hacer clic y esperar el evento 'dialog' con la maquinaria de eventos de Playwright (sin sondeo)
+            self.logger.debug(lambda: f"\n  --> Haciendo clic en el botón '{selector}' y esperando a que el listener maneje la confirmación (timeout: {tiempo_max_deteccion_confirmacion}s)...")
+            with self._medir("verificar_confirmacion_on_dialog.click_and_confirm_detection", "detección de la confirmación por el listener desde el clic"):
+                # Un clic que falla se propaga como tal; solo la ausencia del diálogo se informa como no detectada.
+                dialogo = self._esperar_evento("dialog", selector.click, tiempo_max_deteccion_confirmacion, si_no_llega=None)
+                self._dialogo_detectado = dialogo is not None
+                if dialogo is not None:
+                    self._dialogo_mensaje_capturado = dialogo.message
+                    self._dialogo_tipo_capturado = dialogo.type
 
             if not self._dialogo_detectado:
-                error_msg = f"\n❌ FALLO: La confirmación no fue detectada por el listener después de {tiempo_max_deteccion_confirmacion} segundos."
-                self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_confirmacion_NO_detectada_timeout", directorio)
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            
+                raise AssertionError(f"\n❌ FALLO: La confirmación no fue detectada por el listener después de {tiempo_max_deteccion_confirmacion} segundos.")
+
             self.tomar_captura(f"{nombre_base}_confirmacion_detectada_por_listener", directorio)
             self.logger.info(f"\n  ✅  Confirmación detectada con éxito por el listener.")
 
-            # 5. Validaciones después de que el listener ha actuado
-            # --- Medición de rendimiento: Inicio de verificación de contenido de confirmación ---
-            start_time_dialog_content_verification = time.time()
-            if self._dialogo_tipo_capturado != "confirm":
-                self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'confirm'.")
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(f"\nTipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'confirm'.")
-
-            if mensaje_esperado not in self._dialogo_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
-                    f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
-                    f"  --> Obtenido: '{self._dialogo_mensaje_capturado}'"
-                )
-                self.logger.error(error_msg)
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            
-            # --- Medición de rendimiento: Fin de verificación de contenido de confirmación ---
-            end_time_dialog_content_verification = time.time()
-            duration_dialog_content_verification = end_time_dialog_content_verification - start_time_dialog_content_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de tipo y mensaje de la confirmación: {duration_dialog_content_verification:.4f} segundos.")
+            # 4. Validaciones después de que el listener ha actuado
+            with self._medir("verificar_confirmacion_on_dialog.dialog_content_verification", "verificación de tipo y mensaje de la confirmación"):
+                if self._dialogo_tipo_capturado != "confirm":
+                    raise AssertionError(f"\nTipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'confirm'.")
 
-            # La confirmación ya fue aceptada/cancelada por el handler `_get_confirmation_dialog_handler_for_on()`.
+                if mensaje_esperado not in self._dialogo_mensaje_capturado:
+                    raise AssertionError(
+                        f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
+                        f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
+                        f"  --> Obtenido: '{self._dialogo_mensaje_capturado}'"
+                    )
+
+            # 5. La confirmación ya fue aceptada/cancelada por el handler `_get_confirmation_dialog_handler_for_on()`.
             self.logger.info(f"\n  ✅  --> Confirmación manejada (acción '{accion_confirmacion}' por el listener).")
 
-            # 6. Opcional: Verificar el resultado en la página después de la interacción
+            # 6. Verificar el resultado en la página después de la interacción
             # Es crucial para confirmar que la acción en el diálogo tuvo el efecto esperado en la UI.
-            # --- Medición de rendimiento: Inicio de verificación del resultado en la página ---
-            start_time_post_action_verification = time.time()
-            if accion_confirmacion == 'accept':
-                # Asumo un selector '#demo' y texto "You pressed OK!", ajusta esto a tu aplicación real
-                expect(self.page.locator("#demo")).to_have_text("You pressed OK!")
-                self.logger.info("\n  ✅  --> Resultado en página: 'You pressed OK!' verificado.")
-            elif accion_confirmacion == 'dismiss':
-                # Asumo un selector '#demo' y texto "You pressed Cancel!", ajusta esto a tu aplicación real
-                expect(self.page.locator("#demo")).to_have_text("You pressed Cancel!")
-                self.logger.info("\n  ✅  --> Resultado en página: 'You pressed Cancel!' verificado.")
-            
-            # --- Medición de rendimiento: Fin de verificación del resultado en la página ---
-            end_time_post_action_verification = time.time()
-            duration_post_action_verification = end_time_post_action_verification - start_time_post_action_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del resultado en la página: {duration_post_action_verification:.4f} segundos.")
+            # Asumo un selector '#demo' y textos específicos, ajusta esto a tu aplicación real.
+            with self._medir("verificar_confirmacion_on_dialog.post_action_verification", "verificación del resultado en la página"):
+                texto_resultado = "You pressed OK!" if accion_confirmacion == 'accept' else "You pressed Cancel!"
+                expect(self.page.locator("#demo")).to_have_text(texto_resultado)
+                self.logger.info(f"\n  ✅  --> Resultado en página: '{texto_resultado}' verificado.")
 
             self.tomar_captura(f"{nombre_base}_confirmacion_exitosa_{accion_confirmacion}", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: La confirmación se mostró, mensaje verificado y '{accion_confirmacion}' correctamente.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de confirmación por listener): {duration_total_operation:.4f} segundos.")
-
             return True
-
-        except TimeoutError as e:
-            # Captura si el selector no está listo, si la confirmación no aparece a tiempo, o si la verificación post-acción falla.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo, "
-                f"la confirmación no fue detectada por el listener después de {tiempo_max_deteccion_confirmacion} segundos, "
-                f"o la verificación del resultado en la página falló.\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_confirmacion_NO_detectada_timeout", directorio)
-            raise AssertionError(f"\nTimeout al verificar confirmación para selector '{selector}'") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. click fallido, problemas con el diálogo).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o la confirmación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al verificar confirmación para selector '{selector}'") from e
-
-        except AssertionError as e:
-            # Captura las AssertionError lanzadas internamente por la función (acción inválida, tipo de diálogo, mensaje incorrecto).
-            self.logger.critical(f"\n❌ FALLO (Validación de Confirmación): {e}", exc_info=True)
-            # La captura ya se tomó en la lógica interna donde se lanzó el AssertionError
-            raise # Re-lanzar la excepción original para que el framework la maneje
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar la confirmación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar confirmación para selector '{selector}'") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
     
     # 44- Función para verificar_prompt_expect_event (Implementación para Prompt Alert con expect_event).
     # Integra pruebas de rendimiento para medir la aparición, interacción y manejo de un diálogo prompt.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_prompt_expect_event(self, selector: Locator, mensaje_prompt_esperado: str, input_text: Optional[str], accion_prompt: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_prompt: Union[int, float] = 0.7) -> bool:
         """
         Verifica un cuadro de diálogo 'prompt' que aparece después de hacer clic en un selector dado.
@@ -5771,186 +3428,84 @@ class Funciones_Globales:
 
         # Validar la acción y el input_text antes de iniciar la operación
         if accion_prompt not in ['accept', 'dismiss']:
-            error_msg = f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
-            raise AssertionError(error_msg)
+            raise AssertionError(f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'.")
         if accion_prompt == 'accept' and input_text is None:
-            error_msg = "\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_input_text_missing", directorio)
-            raise AssertionError(error_msg)
+            raise AssertionError("\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'.")
         if accion_prompt == 'dismiss' and input_text is not None:
             self.logger.warning("\n⚠️ ADVERTENCIA: 'input_text' se ignora cuando 'accion_prompt' es 'dismiss'.")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el elemento no está listo, el prompt no aparece a tiempo, falla Playwright o falla una
+            # verificación, el decorador registra el fallo, toma la captura y lo relanza como AssertionError.
             # 1. Validar visibilidad y habilitación del selector que disparará el prompt
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
-            expect(selector).to_be_visible()
-            expect(selector).to_be_enabled()
-            selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
-            # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
-            duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            with self._medir("verificar_prompt_expect_event.element_ready", "preparación del elemento disparador"):
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+
             self.tomar_captura(f"{nombre_base}_elemento_listo_para_prompt", directorio)
 
             # 2. Esperar el evento de diálogo (prompt) y hacer clic en el selector
-            self.logger.debug(f"\n  --> Preparando expect_event para el prompt y haciendo clic (timeout de prompt: {tiempo_espera_prompt}s)...")
-            
-            # Se usa `timeout` en `expect_event` para el tiempo máximo de aparición del prompt.
-            # Se usa `timeout` en `click` para el tiempo máximo de clic en el elemento.
-            with self.page.expect_event("dialog") as info_dialogo:
-                # --- Medición de rendimiento: Inicio de click y espera de prompt ---
-                start_time_prompt_detection = time.time()
-                self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}' para disparar el prompt...")
-                selector.click()
-            
-            dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog del prompt
-            # --- Medición de rendimiento: Fin de click y espera de prompt ---
-            end_time_prompt_detection = time.time()
-            duration_prompt_detection = end_time_prompt_detection - start_time_prompt_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección del prompt: {duration_prompt_detection:.4f} segundos.")
+            self.logger.debug(lambda: f"\n  --> Preparando expect_event para el prompt y haciendo clic (timeout de prompt: {tiempo_espera_prompt}s)...")
+            with self._medir("verificar_prompt_expect_event.prompt_detection", "detección del prompt desde el clic"):
+                with self.page.expect_event("dialog") as info_dialogo:
+                    self.logger.debug(lambda: f"\n  --> Haciendo clic en el botón '{selector}' para disparar el prompt...")
+                    selector.click()
+                dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog del prompt
 
             self.logger.info(f"\n  --> Prompt detectado. Tipo: '{dialogo.type}', Mensaje: '{dialogo.message}', Valor por defecto: '{dialogo.default_value}'")
             self.tomar_captura(f"{nombre_base}_prompt_detectado", directorio)
 
-            # 3. Validar el tipo de diálogo
-            if dialogo.type != "prompt":
-                # Si el tipo es inesperado, intenta cerrarlo para no bloquear el test antes de fallar.
+            def resolver_dialogo():
+                # Acción solicitada sobre el diálogo; también se realiza antes de fallar, para no bloquear la página.
+                # El método `accept()` para prompts puede tomar un argumento `promptText`.
                 if accion_prompt == 'accept':
-                    dialogo.accept(input_text if input_text is not None else "") # Aceptar con o sin texto
+                    dialogo.accept(input_text if input_text is not None else "")
                 else:
                     dialogo.dismiss()
-                self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{dialogo.type}'. Se esperaba 'prompt'.")
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
+
+            # 3. Validar el tipo de diálogo
+            if dialogo.type != "prompt":
+                resolver_dialogo()
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{dialogo.type}'. Se esperaba 'prompt'.")
 
             # 4. Validar el mensaje del prompt
-            # --- Medición de rendimiento: Inicio de verificación del mensaje ---
-            start_time_message_verification = time.time()
-            if mensaje_prompt_esperado not in dialogo.message:
-                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
-                    f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
-                    f"  --> Obtenido: '{dialogo.message}'"
-                )
-                self.logger.error(error_msg)
-                # Intenta cerrar el diálogo antes de fallar
-                if accion_prompt == 'accept':
-                    dialogo.accept(input_text if input_text is not None else "")
-                else:
-                    dialogo.dismiss()
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            # --- Medición de rendimiento: Fin de verificación del mensaje ---
-            end_time_message_verification = time.time()
-            duration_message_verification = end_time_message_verification - start_time_message_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del mensaje del prompt: {duration_message_verification:.4f} segundos.")
+            with self._medir("verificar_prompt_expect_event.message_verification", "verificación del mensaje del prompt"):
+                if mensaje_prompt_esperado not in dialogo.message:
+                    resolver_dialogo()
+                    raise AssertionError(
+                        f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
+                        f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
+                        f"  --> Obtenido: '{dialogo.message}'"
+                    )
 
             # 5. Realizar la acción solicitada (Introducir texto y Aceptar, o Cancelar)
-            # --- Medición de rendimiento: Inicio de la acción sobre el prompt ---
-            start_time_prompt_action = time.time()
+            with self._medir("verificar_prompt_expect_event.prompt_action", f"acción ('{accion_prompt}') sobre el prompt"):
+                resolver_dialogo()
             if accion_prompt == 'accept':
-                # El método `accept()` para prompts puede tomar un argumento `promptText`
-                dialogo.accept(input_text)
                 self.logger.info(f"\n  ✅  --> Texto '{input_text}' introducido en el prompt y ACEPTADO.")
-            elif accion_prompt == 'dismiss':
-                dialogo.dismiss()
+            else:
                 self.logger.info("\n  ✅  --> Prompt CANCELADO.")
-            # No se necesita 'else' aquí, ya se validó 'accion_prompt' al principio
-            # --- Medición de rendimiento: Fin de la acción sobre el prompt ---
-            end_time_prompt_action = time.time()
-            duration_prompt_action = end_time_prompt_action - start_time_prompt_action
-            self.logger.info(f"PERFORMANCE: Tiempo de acción ('{accion_prompt}') sobre el prompt: {duration_prompt_action:.4f} segundos.")
-
 
-            # 6. Opcional: Verificar el resultado en la página después de la interacción
+            # 6. Verificar el resultado en la página después de la interacción
             # Es crucial para confirmar que la acción en el diálogo tuvo el efecto esperado en la UI.
             # Asumo un selector '#demo' y textos específicos, ajusta esto a tu aplicación real.
-            # --- Medición de rendimiento: Inicio de verificación del resultado en la página ---
-            start_time_post_action_verification = time.time()
-            if accion_prompt == 'accept':
-                # Ejemplo: Si el texto introducido se muestra en un elemento de la página
-                expect(self.page.locator("#demo")).to_have_text(f"You entered: {input_text}")
-                self.logger.info(f"\n  ✅  --> Resultado en página: 'You entered: {input_text}' verificado.")
-            elif accion_prompt == 'dismiss':
-                # Ejemplo: Si se muestra un mensaje de cancelación
-                expect(self.page.locator("#demo")).to_have_text("You cancelled the prompt.")
-                self.logger.info("\n  ✅  --> Resultado en página: 'You cancelled the prompt.' verificado.")
-            
-            # --- Medición de rendimiento: Fin de verificación del resultado en la página ---
-            end_time_post_action_verification = time.time()
-            duration_post_action_verification = end_time_post_action_verification - start_time_post_action_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del resultado en la página: {duration_post_action_verification:.4f} segundos.")
+            with self._medir("verificar_prompt_expect_event.post_action_verification", "verificación del resultado en la página"):
+                texto_resultado = f"You entered: {input_text}" if accion_prompt == 'accept' else "You cancelled the prompt."
+                expect(self.page.locator("#demo")).to_have_text(texto_resultado)
+                self.logger.info(f"\n  ✅  --> Resultado en página: '{texto_resultado}' verificado.")
 
             self.tomar_captura(f"{nombre_base}_prompt_exitosa_{accion_prompt}", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: El prompt se mostró, mensaje verificado, texto introducido y '{accion_prompt}' correctamente.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de prompt): {duration_total_operation:.4f} segundos.")
-
             return True
-
-        except TimeoutError as e:
-            # Captura si el selector no está listo o si el prompt no aparece a tiempo, o la verificación post-acción falla.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo, "
-                f"el prompt no apareció/fue detectado a tiempo ({tiempo_espera_elemento}s para elemento, {tiempo_espera_prompt}s para prompt), "
-                f"o la verificación del resultado en la página falló.\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_prompt_NO_aparece_timeout", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nTimeout al verificar prompt para selector '{selector}'") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. click fallido, problemas con el diálogo).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o el prompt.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nError de Playwright al verificar prompt para selector '{selector}'") from e
-
-        except AssertionError as e:
-            # Captura las AssertionError lanzadas internamente por la función (acción inválida, tipo de diálogo, mensaje incorrecto).
-            self.logger.critical(f"\n❌ FALLO (Validación de Prompt): {e}", exc_info=True)
-            # La captura ya se tomó en la lógica interna donde se lanzó el AssertionError
-            raise # Re-lanzar la excepción original para que el framework la maneje
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar el prompt.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar prompt para selector '{selector}'") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 45- Función para verificar una alerta de tipo 'prompt' utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición, interacción y manejo de un diálogo prompt.
+    @accion_instrumentada(envolver_en=AssertionError)
     def verificar_prompt_on_dialog(self, selector: Locator, mensaje_prompt_esperado: str, input_text: Optional[str], accion_prompt: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_max_deteccion_prompt: Union[int, float] = 0.7) -> bool:
         """
         Verifica un cuadro de diálogo 'prompt' que aparece después de hacer clic en un selector dado.
@@ -5996,15 +3551,9 @@ class Funciones_Globales:
 
         # Validar la acción y el input_text antes de iniciar la operación
         if accion_prompt not in ['accept', 'dismiss']:
-            error_msg = f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
-            raise AssertionError(error_msg)
+            raise AssertionError(f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'.")
         if accion_prompt == 'accept' and input_text is None:
-            error_msg = "\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_input_text_missing", directorio)
-            raise AssertionError(error_msg)
+            raise AssertionError("\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'.")
         if accion_prompt == 'dismiss' and input_text is not None:
             self.logger.warning("\n⚠️ ADVERTENCIA: 'input_text' se ignora cuando 'accion_prompt' es 'dismiss'.")
 
@@ -6015,160 +3564,77 @@ class Funciones_Globales:
         self._dialogo_tipo_capturado = ""
         self._dialogo_input_capturado = "" # Resetear también el input capturado del handler
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el elemento no está listo, el prompt no aparece a tiempo, falla Playwright o falla una
+            # verificación, el decorador registra el fallo, toma la captura y lo relanza como AssertionError.
             # 1. Validar visibilidad y habilitación del selector que disparará el prompt
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
-            expect(selector).to_be_visible()
-            expect(selector).to_be_enabled()
-            selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
-            # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
-            duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            with self._medir("verificar_prompt_on_dialog.element_ready", "preparación del elemento disparador"):
+                expect(selector).to_be_visible()
+                expect(selector).to_be_enabled()
+                self._resaltar(selector)
+                self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+
             self.tomar_captura(f"{nombre_base}_elemento_listo_para_prompt", directorio)
 
             # 2. Registrar el listener ANTES de la acción que dispara el prompt
             self.logger.debug("\n  --> Registrando listener para el prompt con page.once('dialog')...")
             # Usa page.once para que el listener se desregistre automáticamente después de detectar el primer diálogo.
-            # El handler `_get_prompt_dialog_handler_for_on()` también acepta/cancela la confirmación internamente.
+            # El handler `_get_prompt_dialog_handler_for_on()` también acepta/cancela el prompt internamente.
             self.page.once("dialog", self._get_prompt_dialog_handler_for_on(input_text, accion_prompt))
 
-            # 3. Hacer clic en el botón que dispara el prompt
-            self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}'...")
-            # --- Medición de rendimiento: Inicio de click y espera de detección del prompt ---
-            start_time_click_and_prompt_detection = time.time()
-            selector.click()
-
-            # 4. Esperar a que el listener haya detectado y manejado el prompt
-            self.logger.debug(f"\n  --> Esperando a que el prompt sea detectado y manejado por el listener (timeout: {tiempo_max_deteccion_prompt}s)...")
-            # Bucle de espera activa hasta que la bandera _dialogo_detectado sea True
-            # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_prompt
-            wait_end_time = time.time() + tiempo_max_deteccion_prompt
-            while not self._dialogo_detectado and time.time() < wait_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
-
-            # --- Medición de rendimiento: Fin de click y espera de detección del prompt ---
-            end_time_click_and_prompt_detection = time.time()
-            duration_click_and_prompt_detection = end_time_click_and_prompt_detection - start_time_click_and_prompt_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección del prompt por el listener: {duration_click_and_prompt_detection:.4f} segundos.")
+            # 3. Hacer clic y esperar el evento 'dialog' con la maquinaria de eventos de Playwright (sin sondeo)
+            self.logger.debug(lambda: f"\n  --> Haciendo clic en el botón '{selector}' y esperando a que el listener maneje el prompt (timeout: {tiempo_max_deteccion_prompt}s)...")
+            with self._medir("verificar_prompt_on_dialog.click_and_prompt_detection", "detección del prompt por el listener desde el clic"):
+                # Un clic que falla se propaga como tal; solo la ausencia del diálogo se informa como no detectado.
+                dialogo = self._esperar_evento("dialog", selector.click, tiempo_max_deteccion_prompt, si_no_llega=None)
+                self._dialogo_detectado = dialogo is not None
+                if dialogo is not None:
+                    self._dialogo_mensaje_capturado = dialogo.message
+                    self._dialogo_tipo_capturado = dialogo.type
+                    # El texto introducido lo registra el handler del prompt al procesar el diálogo
+                    self._dialogo_input_capturado = self._alerta_input_capturado
 
             if not self._dialogo_detectado:
-                error_msg = f"\n❌ FALLO: El prompt no fue detectado por el listener después de {tiempo_max_deteccion_prompt} segundos."
-                self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_prompt_NO_detectada_timeout", directorio)
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            
+                raise AssertionError(f"\n❌ FALLO: El prompt no fue detectado por el listener después de {tiempo_max_deteccion_prompt} segundos.")
+
             self.tomar_captura(f"{nombre_base}_prompt_detectado_por_listener", directorio)
             self.logger.info(f"\n  ✅  Prompt detectado con éxito por el listener.")
 
-            # 5. Validaciones después de que el listener ha actuado
-            # --- Medición de rendimiento: Inicio de verificación de contenido del prompt ---
-            start_time_dialog_content_verification = time.time()
-            if self._dialogo_tipo_capturado != "prompt":
-                self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'prompt'.")
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(f"\nTipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'prompt'.")
-
-            if mensaje_prompt_esperado not in self._dialogo_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
-                    f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
-                    f"  --> Obtenido: '{self._dialogo_mensaje_capturado}'"
-                )
-                self.logger.error(error_msg)
-                # Re-lanzar como AssertionError para un fallo claro de la prueba
-                raise AssertionError(error_msg)
-            
-            # Verificar que el texto introducido (si es el caso) se ha guardado correctamente
-            if accion_prompt == 'accept' and self._dialogo_input_capturado != input_text:
-                self.tomar_captura(f"{nombre_base}_prompt_input_incorrecto", directorio)
-                error_msg = (
-                    f"\n❌ FALLO: Texto introducido en el prompt incorrecto.\n"
-                    f"  --> Esperado: '{input_text}'\n"
-                    f"  --> Obtenido (capturado): '{self._dialogo_input_capturado}'"
-                )
-                self.logger.error(error_msg)
-                raise AssertionError(error_msg)
-
-            # --- Medición de rendimiento: Fin de verificación de contenido del prompt ---
-            end_time_dialog_content_verification = time.time()
-            duration_dialog_content_verification = end_time_dialog_content_verification - start_time_dialog_content_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de tipo, mensaje y texto introducido del prompt: {duration_dialog_content_verification:.4f} segundos.")
+            # 4. Validaciones después de que el listener ha actuado
+            with self._medir("verificar_prompt_on_dialog.dialog_content_verification", "verificación de tipo, mensaje y texto introducido del prompt"):
+                if self._dialogo_tipo_capturado != "prompt":
+                    raise AssertionError(f"\nTipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'prompt'.")
+
+                if mensaje_prompt_esperado not in self._dialogo_mensaje_capturado:
+                    raise AssertionError(
+                        f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
+                        f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
+                        f"  --> Obtenido: '{self._dialogo_mensaje_capturado}'"
+                    )
+
+                # Verificar que el texto introducido (si es el caso) se ha guardado correctamente
+                if accion_prompt == 'accept' and self._dialogo_input_capturado != input_text:
+                    raise AssertionError(
+                        f"\n❌ FALLO: Texto introducido en el prompt incorrecto.\n"
+                        f"  --> Esperado: '{input_text}'\n"
+                        f"  --> Obtenido (capturado): '{self._dialogo_input_capturado}'"
+                    )
 
             # El prompt ya fue aceptado/cancelado por el handler `_get_prompt_dialog_handler_for_on()`.
+            # La verificación del resultado en la página se deja a la prueba, para desacoplar responsabilidades.
             self.logger.info(f"\n  ✅  --> Prompt manejado (acción '{accion_prompt}' por el listener).")
 
-            # Nota: La verificación del resultado en la página se considera una aserción separada
-            # que debe realizarse después de esta función para desacoplar responsabilidades.
-            # Sin embargo, a modo de ejemplo, se puede mantener aquí si la aplicación es simple.
-            # Aquí se eliminará para reflejar un mejor desacoplamiento de esta función.
-
             self.tomar_captura(f"{nombre_base}_prompt_exitosa_{accion_prompt}", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: El prompt se mostró, mensaje y texto verificado, y acción '{accion_prompt}' completada correctamente.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de prompt por listener): {duration_total_operation:.4f} segundos.")
-
             return True
-
-        except TimeoutError as e:
-            # Captura si el selector no está listo, si el prompt no aparece a tiempo, o si la verificación post-acción falla.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo, "
-                f"el prompt no apareció/fue detectado por el listener después de {tiempo_max_deteccion_prompt} segundos.\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_prompt_NO_detectada_timeout", directorio)
-            raise AssertionError(f"\nTimeout al verificar prompt para selector '{selector}'") from e
-
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. click fallido, problemas con el diálogo).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o el prompt.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
-            raise AssertionError(f"\nError de Playwright al verificar prompt para selector '{selector}'") from e
-
-        except AssertionError as e:
-            # Captura las AssertionError lanzadas internamente por la función (acción inválida, tipo de diálogo, mensaje incorrecto).
-            self.logger.critical(f"\n❌ FALLO (Validación de Prompt): {e}", exc_info=True)
-            # La captura ya se tomó en la lógica interna donde se lanzó el AssertionError
-            raise # Re-lanzar la excepción original para que el framework la maneje
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar el prompt.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado al verificar prompt para selector '{selector}'") from e
-
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 46- Función para esperar por una nueva pestaña/página (popup) que se haya abierto
     # y cambia el foco de la instancia 'page' actual a esa nueva pestaña.
     # Integra mediciones de rendimiento para la apertura y carga de la nueva página.
+    @accion_instrumentada(envolver_en=AssertionError)
     def abrir_y_cambiar_a_nueva_pestana(self, selector_boton_apertura: Locator, nombre_base: str, directorio: str, tiempo_espera_max_total: Union[int, float] = 1.5) -> Optional[Page]:
         """
         Espera por la apertura de una nueva pestaña/página (popup) después de hacer clic
@@ -6195,113 +3661,50 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n🔄 Preparando para hacer clic en '{selector_boton_apertura}' y esperar nueva pestaña/popup. Esperando hasta {tiempo_espera_max_total} segundos...")
 
-        nueva_pagina = None
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si la nueva pestaña no se abre o no carga a tiempo, o falla Playwright, el decorador toma la
+            # captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Validar que el botón es visible y habilitado antes de hacer clic
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector_boton_apertura}'...")
-            # Aquí puedes reutilizar un tiempo de espera más corto para la validación inicial del elemento si lo deseas,
-            # o usar el tiempo_espera_max_total. Para simplicidad, se usará el total aquí.
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del botón '{selector_boton_apertura}'...")
             expect(selector_boton_apertura).to_be_visible()
             expect(selector_boton_apertura).to_be_enabled()
-            selector_boton_apertura.highlight()
+            self._resaltar(selector_boton_apertura)
             self.esperar_fijo(0.2) # Pequeña pausa visual
 
             # 2. Usar page.context.expect_event("page") para esperar la nueva página
             # y realizar la acción de click DENTRO de este contexto.
             # Esto asegura que la página capturada es la que se abre DESPUÉS del click.
-            self.logger.debug(f"\n  --> Configurando listener para nueva página y haciendo clic en '{selector_boton_apertura}'...")
-            # El timeout de expect_event cubre el tiempo desde el clic hasta que Playwright detecta la nueva página.
-            with self.page.context.expect_event("page") as event_info:
-                # --- Medición de rendimiento: Inicio de click y detección de nueva página ---
-                start_time_click_and_new_page_detection = time.time()
-                # Realizar el clic en el botón que abre la nueva pestaña
-                self.hacer_click_en_elemento(selector_boton_apertura, f"{nombre_base}_click_para_nueva_pestana", directorio, tiempo_espera_max_total)
-            
-            # Obtener el objeto 'Page' de la nueva pestaña
-            nueva_pagina = event_info.value 
-            # --- Medición de rendimiento: Fin de click y detección de nueva página ---
-            end_time_click_and_new_page_detection = time.time()
-            duration_click_and_new_page_detection = end_time_click_and_new_page_detection - start_time_click_and_new_page_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la nueva página: {duration_click_and_new_page_detection:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Configurando listener para nueva página y haciendo clic en '{selector_boton_apertura}'...")
+            with self._medir("abrir_y_cambiar_a_nueva_pestana.click_and_new_page_detection", "detección de la nueva página desde el clic"):
+                with self.page.context.expect_event("page") as event_info:
+                    # Realizar el clic en el botón que abre la nueva pestaña
+                    self.hacer_click_en_elemento(selector_boton_apertura, f"{nombre_base}_click_para_nueva_pestana", directorio, tiempo_espera_max_total)
+                nueva_pagina = event_info.value # Obtener el objeto 'Page' de la nueva pestaña
+
             # 3. Esperar a que la nueva página cargue completamente el DOM y los recursos (load state)
-            self.logger.debug(f"\n  --> Esperando que la nueva página cargue completamente (Load state, timeout: {tiempo_espera_max_total}s)...")
-            # --- Medición de rendimiento: Inicio de carga de nueva página ---
-            start_time_new_page_load = time.time()
-            nueva_pagina.wait_for_load_state("load")
-            # --- Medición de rendimiento: Fin de carga de nueva página ---
-            end_time_new_page_load = time.time()
-            duration_new_page_load = end_time_new_page_load - start_time_new_page_load
-            self.logger.info(f"PERFORMANCE: Tiempo de carga (load state) de la nueva página: {duration_new_page_load:.4f} segundos.")
+            self.logger.debug(lambda: f"\n  --> Esperando que la nueva página cargue completamente (Load state, timeout: {tiempo_espera_max_total}s)...")
+            with self._medir("abrir_y_cambiar_a_nueva_pestana.new_page_load", "carga (load state) de la nueva página"):
+                nueva_pagina.wait_for_load_state("load")
 
             # 4. Esperar a que un elemento clave de la nueva página sea visible (ej. body o un elemento específico)
             # Esto es más relevante para el rendimiento percibido por el usuario.
-            self.logger.debug(f"\n  --> Esperando que el 'body' de la nueva página sea visible (timeout: {tiempo_espera_max_total}s)...")
-            # --- Medición de rendimiento: Inicio de visibilidad de contenido de nueva página ---
-            start_time_new_page_content_visible = time.time()
-            expect(nueva_pagina.locator("body")).to_be_visible()
-            # --- Medición de rendimiento: Fin de visibilidad de contenido de nueva página ---
-            end_time_new_page_content_visible = time.time()
-            duration_new_page_content_visible = end_time_new_page_content_visible - start_time_new_page_content_visible
-            self.logger.info(f"PERFORMANCE: Tiempo hasta que el 'body' de la nueva página fue visible: {duration_new_page_content_visible:.4f} segundos.")
+            self.logger.debug(lambda: f"\n  --> Esperando que el 'body' de la nueva página sea visible (timeout: {tiempo_espera_max_total}s)...")
+            with self._medir("abrir_y_cambiar_a_nueva_pestana.new_page_content_visible", "visibilidad del 'body' de la nueva página"):
+                expect(nueva_pagina.locator("body")).to_be_visible()
 
             self.logger.info(f"\n✅ Nueva pestaña abierta y detectada: URL = {nueva_pagina.url}, Título = {nueva_pagina.title}")
-            
+
             # 5. Actualizar self.page para que las subsiguientes operaciones usen la nueva página
-            self.page = nueva_pagina 
+            self.page = nueva_pagina
             self.tomar_captura(f"{nombre_base}_nueva_pestana_abierta_y_cargada", directorio)
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (apertura y cambio a nueva pestaña): {duration_total_operation:.4f} segundos.")
-
             return nueva_pagina
-
-        except TimeoutError as e:
-            # Captura si la nueva página no se abre o no carga a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_total_operation
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido): No se detectó ninguna nueva pestaña/página después de {tiempo_espera_max_total} segundos "
-                f"al intentar hacer clic en el botón de apertura ('{selector_boton_apertura}'), o la nueva página no cargó completamente/no mostró su contenido.\n"
-                f"La operación duró {duration_fail:.4f} segundos antes del fallo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_no_se_detecto_popup_timeout", directorio)
-            # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
-            raise AssertionError(f"\nTimeout al abrir o cargar nueva pestaña para selector '{selector_boton_apertura}'") from e
-            # Retornar None si prefieres manejar el error en el nivel superior y no lanzar.
-            # return None 
-        except Error as e:
-            # Captura errores específicos de Playwright (ej. clic fallido).
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar con el botón o la nueva pestaña.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_abrir_pestana", directorio)
-            raise AssertionError(f"\nError de Playwright al abrir y cambiar a nueva pestaña para selector '{selector_boton_apertura}'") from e
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al intentar abrir y cambiar a la nueva pestaña.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_abrir_pestana", directorio)
-            raise AssertionError(f"\nError inesperado al abrir y cambiar a nueva pestaña para selector '{selector_boton_apertura}'") from e
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
 
     # 47- Función que cierra la pestaña actual y, si hay otras pestañas abiertas en el mismo contexto,
     # cambia el foco de la instancia 'page' a la primera pestaña disponible.
     # Integra mediciones de rendimiento para el cierre y el cambio de foco.
+    @accion_instrumentada(envolver_en=AssertionError)
     def cerrar_pestana_actual(self, nombre_base: str, directorio: str, tiempo_post_cierre: Union[int, float] = 1.0) -> None:
         """
         Cierra la pestaña Playwright actualmente activa (`self.page`).
@@ -6321,9 +3724,6 @@ class Funciones_Globales:
             AssertionError: Si ocurre un error inesperado durante el cierre o el cambio de foco.
                             Se lanza para asegurar que el test falle si la operación no es exitosa.
         """
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         # Guardar la URL actual antes de cerrarla (para logging)
         current_page_url = "N/A (Página ya cerrada o no accesible)"
         try:
@@ -6332,77 +3732,39 @@ class Funciones_Globales:
         except Exception as e:
             self.logger.warning(f"\nNo se pudo obtener la URL de la página actual antes de intentar cerrarla: {e}")
 
-
         try:
+            # Si falla el cierre o el cambio de foco, el decorador registra el fallo y lo relanza como
+            # AssertionError (su captura de evidencia se omite si la página ya no está disponible).
             # ¡IMPORTANTE! Tomar la captura *antes* de cerrar la página.
-            self.tomar_captura(f"{nombre_base}_antes_de_cerrar", directorio) 
-            
-            self.logger.debug(f"\n  --> Iniciando cierre de la página: {current_page_url}")
-            # --- Medición de rendimiento: Inicio del cierre de la pestaña ---
-            start_time_close_page = time.time()
-            self.page.close()
-            # --- Medición de rendimiento: Fin del cierre de la pestaña ---
-            end_time_close_page = time.time()
-            duration_close_page = end_time_close_page - start_time_close_page
-            self.logger.info(f"PERFORMANCE: Tiempo de cierre de la pestaña: {duration_close_page:.4f} segundos.")
-            
+            self.tomar_captura(f"{nombre_base}_antes_de_cerrar", directorio)
+
+            self.logger.debug(lambda: f"\n  --> Iniciando cierre de la página: {current_page_url}")
+            with self._medir("cerrar_pestana_actual.close_page", "cierre de la pestaña"):
+                self.page.close()
             self.logger.info(f"\n✅ Pestaña con URL '{current_page_url}' cerrada exitosamente.")
-            
+
             # Pequeña espera después de cerrar la pestaña para asegurar que el DOM se libere
-            self.esperar_fijo(tiempo_post_cierre) 
+            self.esperar_fijo(tiempo_post_cierre)
 
             # Verificar si hay otras páginas abiertas en el contexto y cambiar el foco
             self.logger.debug("\n  --> Verificando otras pestañas en el contexto para cambiar el foco...")
-            # --- Medición de rendimiento: Inicio del cambio de foco ---
-            start_time_switch_focus = time.time()
             if self.page.context.pages:
                 # Playwright mantiene automáticamente la lista de páginas abiertas.
                 # Al cerrar una página, si era la única, la lista se vacía.
                 # Si hay más, la primera página en la lista es generalmente la que queda activa o la primera en crearse.
-                self.page = self.page.context.pages[0] # Cambia el foco a la primera página disponible
-                # --- Medición de rendimiento: Fin del cambio de foco ---
-                end_time_switch_focus = time.time()
-                duration_switch_focus = end_time_switch_focus - start_time_switch_focus
-                self.logger.info(f"PERFORMANCE: Tiempo de cambio de foco a la nueva pestaña activa: {duration_switch_focus:.4f} segundos.")
-
+                with self._medir("cerrar_pestana_actual.switch_focus", "cambio de foco a la nueva pestaña activa"):
+                    self.page = self.page.context.pages[0] # Cambia el foco a la primera página disponible
                 self.logger.info(f"\n🔄 Foco cambiado automáticamente a la primera pestaña disponible: URL = {self.page.url}")
-                # Opcional: Podrías tomar otra captura aquí si quieres mostrar el estado de la nueva pestaña activa.
-                # self.tomar_captura(f"{nombre_base}_foco_cambiado", directorio)
             else:
                 self.logger.warning("\n⚠️ No hay más pestañas abiertas en el contexto del navegador. La instancia 'self.page' ahora es None.")
                 self.page = None # No hay página activa en este contexto
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (cierre de pestaña y cambio de foco): {duration_total_operation:.4f} segundos.")
-
-        except Error as e:
-            # Captura errores específicos de Playwright, como si la página ya está cerrada o el contexto se cerró.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al intentar cerrar la pestaña o cambiar de foco.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            # No se toma captura aquí porque la página podría estar inactiva/cerrada.
-            raise AssertionError(f"\nError de Playwright al cerrar pestaña actual: {e}") from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al intentar cerrar la pestaña actual o cambiar el foco.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            # No se toma captura aquí porque la página podría estar inactiva/cerrada.
-            raise AssertionError(f"\nError inesperado al cerrar pestaña actual: {e}") from e
         finally:
-            # Este bloque se ejecuta siempre, independientemente del resultado.
             self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 48- Función para hacer clic en un selector y esperar que se abran nuevas ventanas/pestañas.
     # Retorna una lista de objetos Page para las nuevas ventanas.
     # Integra pruebas de rendimiento para la detección y carga de múltiples páginas.
+    @accion_instrumentada(envolver_en=AssertionError)
     def hacer_clic_y_abrir_nueva_ventana(self, selector: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", tiempo_espera_max_total: Union[int, float] = 3.0) -> List[Page]:
         """
         Hace clic en un selector y espera que se abran una o más nuevas ventanas/pestañas (popups).
@@ -6436,134 +3798,63 @@ class Funciones_Globales:
         # Esto es crucial para asegurar que solo se capturan las páginas de la ejecución actual.
         self._all_new_pages_opened_by_click = []
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el elemento no está listo, no se abre ninguna ventana a tiempo o falla Playwright, el decorador
+            # toma la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Validar que el elemento es visible y habilitado antes de hacer clic
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del elemento '{selector}'...")
+            self.logger.debug(lambda: f"\n  --> Validando visibilidad y habilitación del elemento '{selector}'...")
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self._resaltar(selector)
             self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
 
-            # 2. Hacer clic en el elemento que debería abrir la(s) nueva(s) ventana(s)
-            self.logger.debug(f"\n  --> Realizando clic en '{selector}'...")
-            # --- Medición de rendimiento: Inicio del clic ---
-            start_time_click = time.time()
-            selector.click()
-            # --- Medición de rendimiento: Fin del clic ---
-            end_time_click = time.time()
-            duration_click = end_time_click - start_time_click
-            self.logger.info(f"PERFORMANCE: Tiempo de la acción de clic: {duration_click:.4f} segundos.")
-            
-            # 3. Esperar a que al menos una nueva página sea detectada por el listener
-            # Usamos un bucle de espera activa con un timeout para dar tiempo a que los popups aparezcan
-            self.logger.debug(f"\n  --> Esperando detección de nueva(s) ventana(s) por el listener (timeout: {tiempo_espera_max_total}s)...")
-            # --- Medición de rendimiento: Inicio de la espera de detección de páginas ---
-            start_time_page_detection = time.time()
-            wait_for_detection_end_time = time.time() + tiempo_espera_max_total
-            while not self._all_new_pages_opened_by_click and time.time() < wait_for_detection_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
-
-            if not self._all_new_pages_opened_by_click:
+            # 2 y 3. Hacer clic en el elemento y esperar el evento 'page' del contexto con la maquinaria
+            # de eventos de Playwright (sin sondeo). La nueva página se captura aunque se abra durante el clic.
+            self.logger.debug(lambda: f"\n  --> Realizando clic en '{selector}' y esperando detección de nueva(s) ventana(s) (timeout: {tiempo_espera_max_total}s)...")
+            with self._medir("hacer_clic_y_abrir_nueva_ventana.page_detection", "detección de la primera nueva página desde el clic"):
+                # Un clic que falla se propaga como tal; solo la ausencia de la página se informa como no detectada.
+                primera_pagina = self._esperar_evento("page", selector.click, tiempo_espera_max_total, emisor=self.page.context, si_no_llega=None)
+            if primera_pagina is None:
                 raise TimeoutError(f"\nNo se detectó ninguna nueva ventana/pestaña después de hacer clic en '{selector}' dentro del tiempo de espera de {tiempo_espera_max_total} segundos.")
-            
-            # --- Medición de rendimiento: Fin de la espera de detección de páginas ---
-            end_time_page_detection = time.time()
-            duration_page_detection = end_time_page_detection - start_time_page_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la primera nueva página: {duration_page_detection:.4f} segundos.")
 
-            # 4. Esperar a que cada una de las nuevas páginas cargue completamente
-            self.logger.debug(f"\n  --> Esperando la carga completa de {len(self._all_new_pages_opened_by_click)} nueva(s) página(s)...")
+            # El listener global '_on_new_page' también registra la página; se asegura que esté en la lista
+            # aunque su handler todavía no haya terminado de procesarla.
+            if primera_pagina not in self._all_new_pages_opened_by_click:
+                self._all_new_pages_opened_by_click.append(primera_pagina)
+
+            # 4. Esperar a que cada una de las nuevas páginas cargue completamente. Una página que no carga se
+            # registra y se descarta; la acción solo falla si no carga ninguna.
+            self.logger.debug(lambda: f"\n  --> Esperando la carga completa de {len(self._all_new_pages_opened_by_click)} nueva(s) página(s)...")
             loaded_pages = []
             for i, new_page in enumerate(self._all_new_pages_opened_by_click):
                 try:
-                    self.logger.debug(f"\n    --> Cargando página {i+1}/{len(self._all_new_pages_opened_by_click)}: URL inicial = {new_page.url}")
-                    # --- Medición de rendimiento: Inicio de carga de página individual ---
-                    start_time_single_page_load = time.time()
-                    
-                    # Esperar los estados de carga con el timeout global
-                    new_page.wait_for_load_state("load", timeout=tiempo_espera_max_total * 1000)
-                    new_page.wait_for_load_state("domcontentloaded", timeout=tiempo_espera_max_total * 1000)
-                    new_page.wait_for_load_state("networkidle", timeout=tiempo_espera_max_total * 1000)
-                    
-                    # Opcional: Esperar a que el 'body' o un elemento clave sea visible para garantizar renderizado.
-                    # expect(new_page.locator("body")).to_be_visible(timeout=tiempo_espera_max_total * 1000)
-
-                    # --- Medición de rendimiento: Fin de carga de página individual ---
-                    end_time_single_page_load = time.time()
-                    duration_single_page_load = end_time_single_page_load - start_time_single_page_load
-                    self.logger.info(f"PERFORMANCE: Tiempo de carga completa para página {i+1} (URL: {new_page.url}): {duration_single_page_load:.4f} segundos.")
-                    
+                    self.logger.debug(lambda: f"\n    --> Cargando página {i+1}/{len(self._all_new_pages_opened_by_click)}: URL inicial = {new_page.url}")
+                    with self._medir("hacer_clic_y_abrir_nueva_ventana.single_page_load", f"carga completa de la página {i+1}"):
+                        # Esperar los estados de carga con el timeout global
+                        new_page.wait_for_load_state("load", timeout=tiempo_espera_max_total * 1000)
+                        new_page.wait_for_load_state("domcontentloaded", timeout=tiempo_espera_max_total * 1000)
+                        new_page.wait_for_load_state("networkidle", timeout=tiempo_espera_max_total * 1000)
+
                     self.logger.info(f"\n  ✅ Nueva página cargada exitosamente: URL = {new_page.url}, Título = {new_page.title}")
                     self.tomar_captura(f"{nombre_base}_pagina_abierta_{i+1}", directorio, page_to_capture=new_page)
                     loaded_pages.append(new_page)
-
-                except TimeoutError as te:
-                    self.logger.error(f"\n  ❌ FALLO: Tiempo de espera excedido al cargar la página {i+1} (URL: {new_page.url}). Detalles: {te}")
+                except Exception as carga_e:
+                    self.logger.error(f"\n  ❌ FALLO: No se pudo cargar la página {i+1} (URL: {new_page.url}). Detalles: {carga_e}")
                     self.tomar_captura(f"{nombre_base}_pagina_no_cargada_{i+1}", directorio, page_to_capture=new_page)
-                except Error as pe:
-                    self.logger.error(f"\n  ❌ FALLO: Error de Playwright al interactuar con la página {i+1} (URL: {new_page.url}). Detalles: {pe}")
-                    self.tomar_captura(f"{nombre_base}_pagina_error_playwright_{i+1}", directorio, page_to_capture=new_page)
-                except Exception as ex:
-                    self.logger.error(f"\n  ❌ FALLO: Error inesperado al cargar la página {i+1} (URL: {new_page.url}). Detalles: {ex}")
-                    self.tomar_captura(f"{nombre_base}_pagina_error_inesperado_{i+1}", directorio, page_to_capture=new_page)
 
             if not loaded_pages:
-                self.logger.error(f"\n ❌ FALLO: Ninguna de las nuevas ventanas/pestañas se cargó correctamente.")
-                self.tomar_captura(f"{nombre_base}_ninguna_ventana_cargada", directorio)
-                # Re-lanzar un AssertionError si no se pudo cargar ninguna página
                 raise AssertionError("\nNinguna de las nuevas ventanas/pestañas se cargó correctamente.")
 
             self.tomar_captura(f"{nombre_base}_despues_clic_nueva_ventana_final", directorio)
             self.logger.info(f"\n✅ Se han detectado y cargado {len(loaded_pages)} de {len(self._all_new_pages_opened_by_click)} nueva(s) ventana(s) con éxito.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer clic y abrir/cargar nuevas ventanas): {duration_total_operation:.4f} segundos.")
-
             return loaded_pages
-
-        except TimeoutError as e:
-            error_msg = (
-                f"\n❌ FALLO (Tiempo de espera excedido) - {nombre_paso}: No se detectó ninguna nueva ventana "
-                f"después de hacer clic en '{selector}' dentro del tiempo de espera de {tiempo_espera_max_total} segundos, "
-                f"o el elemento no estuvo visible/habilitado a tiempo.\nDetalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_no_nueva_ventana_timeout", directorio)
-            # Re-lanzar como AssertionError para que el test falle correctamente.
-            raise AssertionError(error_msg) from e
-
-        except Error as e:
-            error_msg = (
-                f"\n❌ FALLO (Playwright) - {nombre_paso}: Error de Playwright al hacer clic o al detectar/interactuar con las nuevas ventanas.\nDetalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_abrir_ventanas", directorio)
-            raise AssertionError(error_msg) from e
-
-        except AssertionError as e:
-            # Captura las aserciones lanzadas internamente (ej. ninguna página cargada correctamente)
-            self.logger.critical(f"\n❌ FALLO (Validación) - {nombre_paso}: {e}", exc_info=True)
-            raise # Re-lanzar la excepción original para que el test falle
-
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al intentar abrir nuevas ventanas.\nDetalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_abrir_nueva_ventana", directorio)
-            raise AssertionError(error_msg) from e
-
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
 
     # 49- Función para cambiar el foco del navegador a una ventana/pestaña específica,
     # ya sea por su índice (int) o por una parte de su URL o título (str).
     # Integra mediciones de rendimiento para la búsqueda y el cambio de foco.
+    @accion_instrumentada(envolver_en=AssertionError)
     def cambiar_foco_entre_ventanas(self, opcion_ventana: Union[int, str], nombre_base: str, directorio: str, nombre_paso: str = "") -> Page:
         """
         Cambia el foco de la instancia 'self.page' a una ventana/pestaña específica
@@ -6590,22 +3881,16 @@ class Funciones_Globales:
             AssertionError: Si ocurre un error inesperado durante el proceso de cambio de foco.
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando cambiar el foco a la ventana/pestaña: '{opcion_ventana}' ---")
-        
+
         target_page_to_focus: Optional[Page] = None
-        
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
 
         try:
+            # Los errores de la opción recibida (IndexError, ValueError, TypeError) se relanzan tal cual; los de
+            # Playwright, como AssertionError. En ambos casos el decorador registra el fallo y toma la captura.
             # 1. Obtener todas las páginas actuales en el contexto del navegador
             self.logger.debug("\n  --> Recuperando todas las páginas en el contexto del navegador...")
-            # --- Medición de rendimiento: Inicio de recuperación de páginas ---
-            start_time_get_pages = time.time()
-            all_pages_in_context = self.page.context.pages
-            # --- Medición de rendimiento: Fin de recuperación de páginas ---
-            end_time_get_pages = time.time()
-            duration_get_pages = end_time_get_pages - start_time_get_pages
-            self.logger.info(f"PERFORMANCE: Tiempo de recuperación de todas las páginas en el contexto: {duration_get_pages:.4f} segundos.")
+            with self._medir("cambiar_foco_entre_ventanas.get_pages", "recuperación de todas las páginas en el contexto"):
+                all_pages_in_context = self.page.context.pages
 
             self.logger.info(f"\n  Ventanas/pestañas abiertas actualmente: {len(all_pages_in_context)}")
             for i, p in enumerate(all_pages_in_context):
@@ -6615,101 +3900,44 @@ class Funciones_Globales:
                     self.logger.warning(f"\n    [{i}] No se pudo obtener URL/Título: {e}")
 
             # 2. Buscar la página objetivo basada en la opción_ventana
-            self.logger.debug(f"\n  --> Buscando la página objetivo '{opcion_ventana}'...")
-            # --- Medición de rendimiento: Inicio de búsqueda de página objetivo ---
-            start_time_find_target_page = time.time()
-
-            if isinstance(opcion_ventana, int):
-                if 0 <= opcion_ventana < len(all_pages_in_context):
+            self.logger.debug(lambda: f"\n  --> Buscando la página objetivo '{opcion_ventana}'...")
+            with self._medir("cambiar_foco_entre_ventanas.find_target_page", "búsqueda de la página objetivo"):
+                if isinstance(opcion_ventana, int):
+                    if not 0 <= opcion_ventana < len(all_pages_in_context):
+                        raise IndexError(f"\n❌ FALLO: El índice '{opcion_ventana}' está fuera del rango de pestañas abiertas (0-{len(all_pages_in_context)-1}).")
                     target_page_to_focus = all_pages_in_context[opcion_ventana]
                     self.logger.info(f"  --> Seleccionada por índice: {opcion_ventana}")
+                elif isinstance(opcion_ventana, str):
+                    # Intentar encontrar por URL o título
+                    for p in all_pages_in_context:
+                        try:
+                            if opcion_ventana in p.url or opcion_ventana in p.title():
+                                target_page_to_focus = p
+                                self.logger.info(f"\n  --> Seleccionada por coincidencia de URL/Título: '{opcion_ventana}' (URL: {p.url}, Título: {p.title()})")
+                                break
+                        except Error as e:
+                            # La página podría haberse cerrado justo en el momento de acceder a URL/title
+                            self.logger.warning(f"\n  --> Error de Playwright al acceder a URL/título de una página durante la búsqueda: {e}")
+
+                    if target_page_to_focus is None:
+                        raise ValueError(f"\n❌ FALLO: No se encontró ninguna pestaña con la URL o título que contenga '{opcion_ventana}'.")
                 else:
-                    error_msg = f"\n❌ FALLO: El índice '{opcion_ventana}' está fuera del rango de pestañas abiertas (0-{len(all_pages_in_context)-1})."
-                    self.logger.error(error_msg)
-                    self.tomar_captura(f"{nombre_base}_error_indice_invalido", directorio)
-                    raise IndexError(error_msg)
-            elif isinstance(opcion_ventana, str):
-                # Intentar encontrar por URL o título
-                found_match = False
-                for p in all_pages_in_context:
-                    try:
-                        if opcion_ventana in p.url or opcion_ventana in p.title():
-                            target_page_to_focus = p
-                            found_match = True
-                            self.logger.info(f"\n  --> Seleccionada por coincidencia de URL/Título: '{opcion_ventana}' (URL: {p.url}, Título: {p.title()})")
-                            break
-                    except Error as e:
-                        # La página podría haberse cerrado justo en el momento de acceder a URL/title
-                        self.logger.warning(f"\n  --> Error de Playwright al acceder a URL/título de una página durante la búsqueda: {e}")
-                
-                if not found_match:
-                    error_msg = f"\n❌ FALLO: No se encontró ninguna pestaña con la URL o título que contenga '{opcion_ventana}'."
-                    self.logger.error(error_msg)
-                    self.tomar_captura(f"{nombre_base}_error_no_coincidencia_foco", directorio)
-                    raise ValueError(error_msg)
-            else:
-                error_msg = f"\n❌ FALLO: El tipo de 'opcion_ventana' no es válido. Debe ser int o str (tipo recibido: {type(opcion_ventana).__name__})."
-                self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_error_tipo_opcion_foco", directorio)
-                raise TypeError(error_msg)
-            
-            # --- Medición de rendimiento: Fin de búsqueda de página objetivo ---
-            end_time_find_target_page = time.time()
-            duration_find_target_page = end_time_find_target_page - start_time_find_target_page
-            self.logger.info(f"PERFORMANCE: Tiempo de búsqueda de la página objetivo: {duration_find_target_page:.4f} segundos.")
+                    raise TypeError(f"\n❌ FALLO: El tipo de 'opcion_ventana' no es válido. Debe ser int o str (tipo recibido: {type(opcion_ventana).__name__}).")
 
             # 3. Cambiar el foco si la página objetivo no es la actual
             if target_page_to_focus == self.page:
                 self.logger.info(f"\n✅ El foco ya está en la ventana seleccionada (URL: {self.page.url}). No es necesario cambiar.")
             else:
-                self.logger.debug(f"\n  --> Cambiando el foco de '{self.page.url}' a '{target_page_to_focus.url}'...")
-                # --- Medición de rendimiento: Inicio del cambio de foco ---
-                start_time_switch_focus = time.time()
-                self.page = target_page_to_focus
-                # --- Medición de rendimiento: Fin del cambio de foco ---
-                end_time_switch_focus = time.time()
-                duration_switch_focus = end_time_switch_focus - start_time_switch_focus
-                self.logger.info(f"PERFORMANCE: Tiempo de asignación del foco (self.page = ...): {duration_switch_focus:.4f} segundos.")
-                
+                self.logger.debug(lambda: f"\n  --> Cambiando el foco de '{self.page.url}' a '{target_page_to_focus.url}'...")
+                with self._medir("cambiar_foco_entre_ventanas.switch_focus", "asignación del foco (self.page = ...)"):
+                    self.page = target_page_to_focus
                 self.logger.info(f"\n✅ Foco cambiado exitosamente a la ventana/pestaña seleccionada.")
-            
+
             # 4. Reportar el estado final y tomar captura
             self.logger.info(f"\n  URL de la pestaña actual: {self.page.url}")
             self.logger.info(f"\n  Título de la pestaña actual: {self.page.title()}")
             self.tomar_captura(f"{nombre_base}_foco_cambiado", directorio)
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (cambio de foco entre ventanas): {duration_total_operation:.4f} segundos.")
-            
             return self.page # Retorna la página a la que se cambió el foco
-
-        except (IndexError, ValueError, TypeError) as e:
-            # Captura errores de validación de entrada o de búsqueda de la página
-            self.logger.critical(f"\n❌ FALLO (Validación) - {nombre_paso}: {e}", exc_info=True)
-            # La captura ya se tomó en los bloques if/elif donde se lanzó el error
-            raise # Re-lanzar la excepción original para que el test falle
-
-        except Error as e:
-            # Captura errores específicos de Playwright
-            error_msg = (
-                f"\n❌ FALLO (Playwright) - {nombre_paso}: Ocurrió un error de Playwright al intentar cambiar el foco de ventana.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_cambiar_foco", directorio)
-            raise AssertionError(error_msg) from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada
-            error_msg = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al intentar cambiar el foco de ventana.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_cambiar_foco", directorio)
-            raise AssertionError(error_msg) from e
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
 
@@ -6717,6 +3945,7 @@ class Funciones_Globales:
     # Si la página cerrada era la página activa (self.page), intenta cambiar el foco
     # a la primera página disponible en el mismo contexto del navegador.
     # Integra mediciones de rendimiento para el cierre de la pestaña y el posible cambio de foco.
+    @accion_instrumentada(envolver_en=AssertionError)
     def cerrar_pestana_especifica(self, page_to_close: Page, nombre_base: str, directorio: str, nombre_paso: str = "") -> None:
         """
         Cierra un objeto `Page` específico proporcionado.
@@ -6735,114 +3964,68 @@ class Funciones_Globales:
             AssertionError: Si ocurre un error de Playwright o un error inesperado
                             durante el cierre de la pestaña o el cambio de foco.
         """
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
+        closed_url = "N/A (Página no válida o ya cerrada)"
         try:
-            closed_url = "N/A (Página no válida o ya cerrada)"
-            try:
-                # Intenta obtener la URL para el log, pero maneja el error si la página ya está cerrada
-                if page_to_close and not page_to_close.is_closed():
-                    closed_url = page_to_close.url
-                self.logger.info(f"\n--- {nombre_paso}: Intentando cerrar la pestaña con URL: {closed_url} ---")
-            except Error as e:
-                self.logger.warning(f"\nNo se pudo obtener la URL de la página a cerrar. Podría estar inactiva: {e}")
-
-            if not page_to_close or page_to_close.is_closed():
-                self.logger.info(f"\n ℹ️ La pestaña (URL: {closed_url}) ya estaba cerrada o no es un objeto Page válido. No se requiere acción.")
-                # --- Medición de rendimiento: Fin total de la función (sin acción real) ---
-                end_time_total_operation = time.time()
-                duration_total_operation = end_time_total_operation - start_time_total_operation
-                self.logger.info(f"PERFORMANCE: Tiempo total de la operación (pestaña ya cerrada): {duration_total_operation:.4f} segundos.")
-                return # Salir si la página ya está cerrada o no es válida
+            # Intenta obtener la URL para el log, pero maneja el error si la página ya está cerrada
+            if page_to_close and not page_to_close.is_closed():
+                closed_url = page_to_close.url
+            self.logger.info(f"\n--- {nombre_paso}: Intentando cerrar la pestaña con URL: {closed_url} ---")
+        except Error as e:
+            self.logger.warning(f"\nNo se pudo obtener la URL de la página a cerrar. Podría estar inactiva: {e}")
+
+        if not page_to_close or page_to_close.is_closed():
+            self.logger.info(f"\n ℹ️ La pestaña (URL: {closed_url}) ya estaba cerrada o no es un objeto Page válido. No se requiere acción.")
+            return # Salir si la página ya está cerrada o no es válida
 
+        try:
+            # Cualquier otro fallo lo registra el decorador, que toma la captura y lo relanza como AssertionError.
             # 1. Determinar si la página a cerrar es la página actual (self.page)
-            # --- Medición de rendimiento: Inicio de la detección de página actual ---
-            start_time_is_current_page_check = time.time()
             is_current_page = (self.page == page_to_close)
-            # --- Medición de rendimiento: Fin de la detección de página actual ---
-            end_time_is_current_page_check = time.time()
-            duration_is_current_page_check = end_time_is_current_page_check - start_time_is_current_page_check
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación si es la página actual: {duration_is_current_page_check:.4f} segundos.")
 
-            self.logger.debug(f"\n  --> Tomando captura antes de cerrar la pestaña: {closed_url}")
+            self.logger.debug(lambda: f"\n  --> Tomando captura antes de cerrar la pestaña: {closed_url}")
             self.tomar_captura(f"{nombre_base}_antes_de_cerrar_especifica", directorio, page_to_capture=page_to_close)
-            
+
             # 2. Cerrar la pestaña específica
-            self.logger.debug(f"\n  --> Procediendo a cerrar la pestaña: {closed_url}")
-            # --- Medición de rendimiento: Inicio del cierre de la pestaña ---
-            start_time_close_page = time.time()
-            page_to_close.close()
-            # --- Medición de rendimiento: Fin del cierre de la pestaña ---
-            end_time_close_page = time.time()
-            duration_close_page = end_time_close_page - start_time_close_page
-            self.logger.info(f"PERFORMANCE: Tiempo de cierre de la pestaña '{closed_url}': {duration_close_page:.4f} segundos.")
-            
+            self.logger.debug(lambda: f"\n  --> Procediendo a cerrar la pestaña: {closed_url}")
+            with self._medir("cerrar_pestana_especifica.close_page", f"cierre de la pestaña '{closed_url}'"):
+                page_to_close.close()
             self.logger.info(f"\n✅ Pestaña '{closed_url}' cerrada exitosamente.")
             # No se toma una captura después de cerrar la página porque ya no es accesible.
 
             # 3. Si la página cerrada era la página actual (self.page), cambiar el foco
             if is_current_page:
                 self.logger.info("\n  --> Detectado: La pestaña cerrada era la pestaña activa.")
-                # --- Medición de rendimiento: Inicio del cambio de foco ---
-                start_time_switch_focus = time.time()
-                # Buscar la primera página disponible en el contexto
                 if self.page.context.pages:
-                    self.page = self.page.context.pages[0]
-                    # --- Medición de rendimiento: Fin del cambio de foco ---
-                    end_time_switch_focus = time.time()
-                    duration_switch_focus = end_time_switch_focus - start_time_switch_focus
-                    self.logger.info(f"PERFORMANCE: Tiempo de cambio de foco a la nueva pestaña activa: {duration_switch_focus:.4f} segundos.")
-
+                    # Buscar la primera página disponible en el contexto
+                    with self._medir("cerrar_pestana_especifica.switch_focus", "cambio de foco a la nueva pestaña activa"):
+                        self.page = self.page.context.pages[0]
                     self.logger.info(f"\n🔄 Foco cambiado automáticamente a la primera pestaña disponible: URL = {self.page.url}")
                     self.tomar_captura(f"{nombre_base}_foco_cambiado_despues_cerrar", directorio, page_to_capture=self.page)
                 else:
                     self.logger.warning("\n⚠️ No hay más pestañas abiertas en el contexto del navegador. La instancia 'self.page' ahora es None.")
                     self.page = None # No hay página activa en este contexto
-                    self.logger.info("PERFORMANCE: No se realizó cambio de foco, no hay más páginas en el contexto.")
             else:
                 self.logger.info("\n  --> La pestaña cerrada no era la pestaña activa. El foco actual permanece sin cambios.")
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (cierre de pestaña específica y gestión de foco): {duration_total_operation:.4f} segundos.")
-
-        except Error as e: # Captura errores específicos de Playwright
-            # Esto puede ocurrir si la página ya se cerró por alguna razón externa, o si hubo un problema con el contexto.
-            if "Target page, context or browser has been closed" in str(e) or "Page closed" in str(e):
-                self.logger.warning(f"\n⚠️ Advertencia (Playwright): La pestaña ya estaba cerrada o el contexto ya no es válido durante la operación. Detalles: {e}")
-                # En este caso, no necesitamos relanzar una excepción, ya que el objetivo (cerrar la página)
-                # se cumple implícitamente o la página ya estaba en el estado deseado.
-                # Asegúrate de que el estado de self.page es consistente si se cerró la activa
-                if self.page and self.page.is_closed():
-                    self.logger.warning("\n  --> La página activa se ha cerrado. Intentando reasignar el foco.")
-                    if self.page.context.pages:
-                        self.page = self.page.context.pages[0]
-                        self.logger.info(f"\n  --> Foco reasignado a: {self.page.url}")
-                    else:
-                        self.page = None
-                        self.logger.warning("\n  --> No hay más páginas en el contexto. self.page es None.")
-            else:
-                error_msg = (
-                    f"\n❌ FALLO (Playwright Error) - {nombre_paso}: Ocurrió un error de Playwright al intentar cerrar la pestaña.\n"
-                    f"Detalles: {e}"
-                )
-                self.logger.critical(error_msg, exc_info=True)
-                self.tomar_captura(f"{nombre_base}_error_cerrar_pestana_playwright", directorio)
-                raise AssertionError(error_msg) from e
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error al intentar cerrar la pestaña.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_cerrar_pestana", directorio)
-            raise AssertionError(error_msg) from e
+
+        except Error as e:
+            # Si la página se cerró por una causa externa durante la operación, el objetivo ya se cumplió:
+            # solo se reasigna el foco si hace falta. Cualquier otro error de Playwright se relanza.
+            if "Target page, context or browser has been closed" not in str(e) and "Page closed" not in str(e):
+                raise
+            self.logger.warning(f"\n⚠️ Advertencia (Playwright): La pestaña ya estaba cerrada o el contexto ya no es válido durante la operación. Detalles: {e}")
+            if self.page and self.page.is_closed():
+                self.logger.warning("\n  --> La página activa se ha cerrado. Intentando reasignar el foco.")
+                if self.page.context.pages:
+                    self.page = self.page.context.pages[0]
+                    self.logger.info(f"\n  --> Foco reasignado a: {self.page.url}")
+                else:
+                    self.page = None
+                    self.logger.warning("\n  --> No hay más páginas en el contexto. self.page es None.")
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
             
     #51- Función para realizar una operación de "Drag and Drop" de un elemento a otro.
+    @accion_instrumentada(envolver_en=AssertionError)
     def realizar_drag_and_drop(self, elemento_origen: Locator, elemento_destino: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", tiempo_espera_manual: float = 0.5, timeout_ms: int = 15000) -> None:
         """
         Realiza una operación de "Drag and Drop" de un elemento de origen a un elemento de destino.
@@ -6868,88 +4051,85 @@ class Funciones_Globales:
                             o si los elementos no están listos para la interacción.
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando realizar 'Drag and Drop' de '{elemento_origen}' a '{elemento_destino}' ---")
-        
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
 
         try:
-            # 1. Pre-validación: Verificar que ambos elementos estén visibles y habilitados antes de interactuar.
+            # Si fallan la pre-validación o el método manual, el decorador toma la captura del fallo
+            # y lo relanza como AssertionError para que la prueba falle claramente.
+            # 1. Pre-validación: Verificar que ambos elementos estén habilitados antes de interactuar.
             self.logger.info(f"\n🔍 Validando que el elemento de origen '{elemento_origen}' esté habilitado y listo para interactuar...")
-            # --- Medición de rendimiento: Inicio pre-validación ---
-            start_time_pre_validation = time.time()
-            expect(elemento_origen).to_be_enabled()
-            expect(elemento_destino).to_be_enabled()
-            # --- Medición de rendimiento: Fin pre-validación ---
-            end_time_pre_validation = time.time()
-            duration_pre_validation = end_time_pre_validation - start_time_pre_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de pre-validación de elementos: {duration_pre_validation:.4f} segundos.")
-            
+            with self._medir("realizar_drag_and_drop.pre_validation", "pre-validación de elementos"):
+                expect(elemento_origen).to_be_enabled()
+                expect(elemento_destino).to_be_enabled()
+
             self.logger.info(f"\n✅ Ambos elementos están habilitados y listos para 'Drag and Drop'.")
             self.tomar_captura(f"{nombre_base}_antes_drag_and_drop", directorio)
 
-            # 2. Intento 1: Usar el método .drag_to() del Locator (recomendado por Playwright)
+            # 2. Intento 1: Usar el método .drag_to() del Locator (recomendado por Playwright).
+            # La métrica 'drag_to' registra también el tiempo que tarda en fallar.
             self.logger.info(f"\n🔄 Intentando 'Drag and Drop' con el método estándar de Playwright (locator.drag_to())...")
-            # --- Medición de rendimiento: Inicio drag_to ---
-            start_time_drag_to = time.time()
             try:
-                elemento_origen.drag_to(elemento_destino)
-                # --- Medición de rendimiento: Fin drag_to ---
-                end_time_drag_to = time.time()
-                duration_drag_to = end_time_drag_to - start_time_drag_to
-                self.logger.info(f"PERFORMANCE: Tiempo del método estándar 'drag_to': {duration_drag_to:.4f} segundos.")
-
+                with self._medir("realizar_drag_and_drop.drag_to", "el método estándar 'drag_to'"):
+                    elemento_origen.drag_to(elemento_destino)
                 self.logger.info(f"\n✅ 'Drag and Drop' realizado exitosamente con el método estándar.")
                 self.tomar_captura(f"{nombre_base}_drag_and_drop_exitoso_estandar", directorio)
-                
-                # --- Medición de rendimiento: Fin total de la función ---
-                end_time_total_operation = time.time()
-                duration_total_operation = end_time_total_operation - start_time_total_operation
-                self.logger.info(f"PERFORMANCE: Tiempo total de la operación (estándar D&D): {duration_total_operation:.4f} segundos.")
                 return # Si funciona, salimos de la función
-
             except (Error, TimeoutError) as e:
-                # Captura errores específicos de Playwright (incluyendo TimeoutError de drag_to)
                 self.logger.warning(f"\n⚠️ Advertencia: El método directo 'locator.drag_to()' falló con error de Playwright: {type(e).__name__}: {e}")
                 self.logger.info("\n🔄 Recurriendo a 'Drag and Drop' con método manual de Playwright (mouse.hover, mouse.down, mouse.up)...")
                 self.tomar_captura(f"{nombre_base}_fallo_directo_intentando_manual", directorio)
-                
-                # Registrar el rendimiento del intento fallido de drag_to
-                end_time_drag_to = time.time() # Registrar el tiempo que tomó fallar
-                duration_drag_to = end_time_drag_to - start_time_drag_to
-                self.logger.info(f"PERFORMANCE: Tiempo del método estándar 'drag_to' (fallido): {duration_drag_to:.4f} segundos.")
-
-                # 3. Intento 2 (Fallback): Usar el método manual
-                self._realizar_drag_and_drop_manual(elemento_origen, elemento_destino, nombre_base, directorio, nombre_paso, tiempo_pausa_mouse=tiempo_espera_manual, timeout_ms=timeout_ms)
-                self.logger.info(f"\n✅ 'Drag and Drop' realizado exitosamente con el método manual.")
-                self.tomar_captura(f"{nombre_base}_drag_and_drop_exitoso_manual", directorio)
-
-        except (Error, TimeoutError) as e: # Captura errores de Playwright que puedan ocurrir fuera del drag_to o en la pre-validación
-            error_msg = (
-                f"\n❌ FALLO (Playwright Error) - {nombre_paso}: Ocurrió un error de Playwright al realizar 'Drag and Drop'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_drag_and_drop", directorio)
-            raise AssertionError(error_msg) from e
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al intentar realizar 'Drag and Drop'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_drag_and_drop", directorio)
-            raise AssertionError(error_msg) from e
+
+            # 3. Intento 2 (Fallback): Usar el método manual
+            self._realizar_drag_and_drop_manual(elemento_origen, elemento_destino, nombre_base, directorio, nombre_paso, tiempo_pausa_ms=tiempo_espera_manual * 1000, timeout_locators_ms=timeout_ms)
+            self.logger.info(f"\n✅ 'Drag and Drop' realizado exitosamente con el método manual.")
+            self.tomar_captura(f"{nombre_base}_drag_and_drop_exitoso_manual", directorio)
         finally:
-            # --- Medición de rendimiento: Fin total de la función (si no se salió antes) ---
-            if 'start_time_total_operation' in locals() and 'end_time_total_operation' not in locals():
-                end_time_total_operation = time.time()
-                duration_total_operation = end_time_total_operation - start_time_total_operation
-                self.logger.info(f"PERFORMANCE: Tiempo total de la operación (fallback manual D&D): {duration_total_operation:.4f} segundos.")
-            
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
         
+    # 51.1- Función para arrastrar un pulgar de un slider de rango hasta un porcentaje de la barra
+    def _arrastrar_pulgar_slider(self, nombre_pulgar: str, pulgar_locator: Locator, caja_barra: Dict[str, float], porcentaje_destino: float, tolerancia_pixeles: int) -> None:
+        """
+        Arrastra el pulgar con las acciones de ratón de Playwright desde su centro hasta el porcentaje
+        'porcentaje_destino' de la barra, sobre la Y central de la barra. No se mueve si ya está a menos
+        de 'tolerancia_pixeles' del destino.
+
+        Raises:
+            RuntimeError: Si no se puede obtener el bounding box del pulgar.
+        """
+        self.logger.info(f"\n🔄 Moviendo pulgar {nombre_pulgar} a {porcentaje_destino*100:.0f}%...")
+        caja_pulgar = pulgar_locator.bounding_box()
+        if not caja_pulgar:
+            raise RuntimeError(f"\n❌ No se pudo obtener el bounding box del pulgar {nombre_pulgar} '{pulgar_locator}'.")
+
+        posicion_x_destino = caja_barra['x'] + (caja_barra['width'] * porcentaje_destino)
+        # Usar la Y central de la barra para movimientos, para mantener una línea recta si el pulgar no es perfectamente redondo
+        posicion_y_movimiento = caja_barra['y'] + (caja_barra['height'] / 2)
+        # Posición X central actual del pulgar para iniciar el arrastre
+        posicion_x_actual_centro = caja_pulgar['x'] + (caja_pulgar['width'] / 2)
+
+        if abs(posicion_x_actual_centro - posicion_x_destino) < tolerancia_pixeles:
+            self.logger.info(f"\n  > Pulgar {nombre_pulgar} ya se encuentra en la posición deseada ({porcentaje_destino*100:.0f}%). No se requiere movimiento.")
+            return
+
+        self.logger.info(f"\n  > Iniciando arrastre de pulgar {nombre_pulgar} de X={posicion_x_actual_centro:.0f} a X={posicion_x_destino:.0f}...")
+        self.logger.debug("\n    -> mouse.move al origen")
+        self.page.mouse.move(posicion_x_actual_centro, posicion_y_movimiento) # Mover al centro del pulgar actual
+        self.esperar_fijo(0.1) # Pequeña pausa
+
+        self.logger.debug("\n    -> mouse.down")
+        self.page.mouse.down() # Presionar el botón del ratón
+        self.esperar_fijo(0.2) # Pausa para simular la interacción humana
+
+        self.logger.debug("\n    -> mouse.move al destino (arrastrando)")
+        self.page.mouse.move(posicion_x_destino, posicion_y_movimiento, steps=10) # Arrastrar suavemente
+        self.esperar_fijo(0.2) # Pausa para simular la interacción humana
+
+        self.logger.debug("\n    -> mouse.up")
+        self.page.mouse.up() # Soltar el botón del ratón
+        self.logger.info(f"\n  > Pulgar {nombre_pulgar} movido a X={posicion_x_destino:.0f}.")
+
     # 52- Función para mover sliders de rango (con dos pulgares)
     # Integra pruebas de rendimiento para cada fase del movimiento de los pulgares.
+    @accion_instrumentada(envolver_en=AssertionError)
     def mover_slider_rango(self, pulgar_izquierdo_locator: Locator, pulgar_derecho_locator: Locator, barra_slider_locator: Locator,
                             porcentaje_destino_izquierdo: float, porcentaje_destino_derecho: float,
                             nombre_base: str, directorio: str, nombre_paso: str = "",
@@ -6980,23 +4160,14 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando mover el slider de rango. Pulgar Izquierdo a {porcentaje_destino_izquierdo*100:.0f}%, Pulgar Derecho a {porcentaje_destino_derecho*100:.0f}% ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         # 1. Validaciones iniciales de porcentajes
         if not (0.0 <= porcentaje_destino_izquierdo <= 1.0) or not (0.0 <= porcentaje_destino_derecho <= 1.0):
-            error_msg = "\n❌ Los porcentajes de destino para ambos pulgares deben ser valores flotantes entre 0.0 (0%) y 1.0 (100%)."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_validacion_porcentajes", directorio)
-            raise ValueError(error_msg)
-        
+            raise ValueError("\n❌ Los porcentajes de destino para ambos pulgares deben ser valores flotantes entre 0.0 (0%) y 1.0 (100%).")
+
         # Validación de negocio: el porcentaje izquierdo no puede ser mayor que el derecho
         if porcentaje_destino_izquierdo > porcentaje_destino_derecho:
-            error_msg = "\n❌ El porcentaje del pulgar izquierdo no puede ser mayor que el del pulgar derecho."
-            self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_validacion_orden_porcentajes", directorio)
-            raise ValueError(error_msg)
-        
+            raise ValueError("\n❌ El porcentaje del pulgar izquierdo no puede ser mayor que el del pulgar derecho.")
+
         elementos_a_validar: Dict[str, Locator] = {
             "pulgar izquierdo": pulgar_izquierdo_locator,
             "pulgar derecho": pulgar_derecho_locator,
@@ -7004,167 +4175,44 @@ class Funciones_Globales:
         }
 
         try:
+            # Si los elementos no están listos, falta un bounding box o falla Playwright, el decorador toma
+            # la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 2. Pre-validación: Verificar visibilidad y habilitación de todos los elementos
             self.logger.info("\n🔍 Validando visibilidad y habilitación de los elementos del slider...")
-            # --- Medición de rendimiento: Inicio pre-validación ---
-            start_time_pre_validation = time.time()
-            for nombre_elemento, localizador_elemento in elementos_a_validar.items():
-                expect(localizador_elemento).to_be_visible()
-                expect(localizador_elemento).to_be_enabled()
-                localizador_elemento.highlight() # Para visualización durante la ejecución
-                self.esperar_fijo(0.1) # Pequeña pausa para que se vea el highlight
-            
-            # --- Medición de rendimiento: Fin pre-validación ---
-            end_time_pre_validation = time.time()
-            duration_pre_validation = end_time_pre_validation - start_time_pre_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de pre-validación de elementos del slider: {duration_pre_validation:.4f} segundos.")
+            with self._medir("mover_slider_rango.pre_validation", "pre-validación de elementos del slider"):
+                for localizador_elemento in elementos_a_validar.values():
+                    expect(localizador_elemento).to_be_visible()
+                    expect(localizador_elemento).to_be_enabled()
+                    self._resaltar(localizador_elemento) # Para visualización durante la ejecución
+                    self.esperar_fijo(0.1) # Pequeña pausa para que se vea el highlight
             self.logger.info("\n✅ Todos los elementos del slider están visibles y habilitados.")
             self.tomar_captura(f"{nombre_base}_slider_elementos_listos", directorio)
 
             # 3. Obtener el bounding box de la barra del slider (esencial para el cálculo de posiciones)
             self.logger.debug("\n  --> Obteniendo bounding box de la barra del slider...")
-            # --- Medición de rendimiento: Inicio obtener bounding box ---
-            start_time_get_bounding_box = time.time()
-            caja_barra = barra_slider_locator.bounding_box()
+            with self._medir("mover_slider_rango.get_bounding_box", "obtención de bounding box de la barra"):
+                caja_barra = barra_slider_locator.bounding_box()
             if not caja_barra:
                 raise RuntimeError(f"\n❌ No se pudo obtener el bounding box de la barra del slider '{barra_slider_locator}'.")
-            # --- Medición de rendimiento: Fin obtener bounding box ---
-            end_time_get_bounding_box = time.time()
-            duration_get_bounding_box = end_time_get_bounding_box - start_time_get_bounding_box
-            self.logger.info(f"PERFORMANCE: Tiempo de obtención de bounding box de la barra: {duration_get_bounding_box:.4f} segundos.")
-
-            inicio_x_barra = caja_barra['x']
-            ancho_barra = caja_barra['width']
-            posicion_y_barra = caja_barra['y'] + (caja_barra['height'] / 2) # Y central de la barra para movimientos
 
             # --- 4. Mover Pulgar Izquierdo (Mínimo) ---
-            self.logger.info(f"\n🔄 Moviendo pulgar izquierdo a {porcentaje_destino_izquierdo*100:.0f}%...")
-            # --- Medición de rendimiento: Inicio movimiento pulgar izquierdo ---
-            start_time_move_left_thumb = time.time()
-
-            caja_pulgar_izquierdo = pulgar_izquierdo_locator.bounding_box()
-            if not caja_pulgar_izquierdo:
-                raise RuntimeError(f"\n❌ No se pudo obtener el bounding box del pulgar izquierdo '{pulgar_izquierdo_locator}'.")
-
-            posicion_x_destino_izquierdo = inicio_x_barra + (ancho_barra * porcentaje_destino_izquierdo)
-            # Usar la Y central de la barra para movimientos, para mantener una línea recta si el pulgar no es perfectamente redondo
-            posicion_y_movimiento_izquierdo = posicion_y_barra 
-
-            # Calcular la posición X central actual del pulgar izquierdo para iniciar el arrastre
-            posicion_x_actual_izquierdo_centro = caja_pulgar_izquierdo['x'] + (caja_pulgar_izquierdo['width'] / 2)
-
-            # Verificar si el pulgar izquierdo ya está en la posición deseada dentro de la tolerancia
-            if abs(posicion_x_actual_izquierdo_centro - posicion_x_destino_izquierdo) < tolerancia_pixeles:
-                self.logger.info(f"\n  > Pulgar izquierdo ya se encuentra en la posición deseada ({porcentaje_destino_izquierdo*100:.0f}%). No se requiere movimiento.")
-            else:
-                self.logger.info(f"\n  > Iniciando arrastre de pulgar izquierdo de X={posicion_x_actual_izquierdo_centro:.0f} a X={posicion_x_destino_izquierdo:.0f}...")
-                
-                # Acciones del ratón para el arrastre
-                self.logger.debug("\n    -> mouse.move al origen")
-                self.page.mouse.move(posicion_x_actual_izquierdo_centro, posicion_y_movimiento_izquierdo) # Mover al centro del pulgar actual
-                self.esperar_fijo(0.1) # Pequeña pausa
-                
-                self.logger.debug("\n    -> mouse.down")
-                self.page.mouse.down() # Presionar el botón del ratón
-                self.esperar_fijo(0.2) # Pausa para simular la interacción humana
-                
-                self.logger.debug("\n    -> mouse.move al destino (arrastrando)")
-                self.page.mouse.move(posicion_x_destino_izquierdo, posicion_y_movimiento_izquierdo, steps=10) # Arrastrar suavemente
-                self.esperar_fijo(0.2) # Pausa para simular la interacción humana
-                
-                self.logger.debug("\n    -> mouse.up")
-                self.page.mouse.up() # Soltar el botón del ratón
-                self.logger.info(f"\n  > Pulgar izquierdo movido a X={posicion_x_destino_izquierdo:.0f}.")
-            
-            # --- Medición de rendimiento: Fin movimiento pulgar izquierdo ---
-            end_time_move_left_thumb = time.time()
-            duration_move_left_thumb = end_time_move_left_thumb - start_time_move_left_thumb
-            self.logger.info(f"PERFORMANCE: Tiempo de movimiento de pulgar izquierdo: {duration_move_left_thumb:.4f} segundos.")
+            with self._medir("mover_slider_rango.move_left_thumb", "movimiento de pulgar izquierdo"):
+                self._arrastrar_pulgar_slider("izquierdo", pulgar_izquierdo_locator, caja_barra, porcentaje_destino_izquierdo, tolerancia_pixeles)
             self.tomar_captura(f"{nombre_base}_slider_izquierdo_movido", directorio)
             self.esperar_fijo(0.5) # Pausa adicional después de procesar el primer pulgar para estabilización
 
             # --- 5. Mover Pulgar Derecho (Máximo) ---
-            self.logger.info(f"\n🔄 Moviendo pulgar derecho a {porcentaje_destino_derecho*100:.0f}%...")
-            # --- Medición de rendimiento: Inicio movimiento pulgar derecho ---
-            start_time_move_right_thumb = time.time()
-
-            caja_pulgar_derecho = pulgar_derecho_locator.bounding_box()
-            if not caja_pulgar_derecho:
-                raise RuntimeError(f"\n❌ No se pudo obtener el bounding box del pulgar derecho '{pulgar_derecho_locator}'.")
-
-            posicion_x_destino_derecho = inicio_x_barra + (ancho_barra * porcentaje_destino_derecho)
-            # Usar la Y central de la barra para movimientos
-            posicion_y_movimiento_derecho = posicion_y_barra 
-
-            # Calcular la posición X central actual del pulgar derecho para iniciar el arrastre
-            posicion_x_actual_derecho_centro = caja_pulgar_derecho['x'] + (caja_pulgar_derecho['width'] / 2)
-
-            # Verificar si el pulgar derecho ya está en la posición deseada dentro de la tolerancia
-            if abs(posicion_x_actual_derecho_centro - posicion_x_destino_derecho) < tolerancia_pixeles:
-                self.logger.info(f"\n  > Pulgar derecho ya se encuentra en la posición deseada ({porcentaje_destino_derecho*100:.0f}%). No se requiere movimiento.")
-            else:
-                self.logger.info(f"\n  > Iniciando arrastre de pulgar derecho de X={posicion_x_actual_derecho_centro:.0f} a X={posicion_x_destino_derecho:.0f}...")
-                
-                # Acciones del ratón para el arrastre
-                self.logger.debug("\n    -> mouse.move al origen")
-                self.page.mouse.move(posicion_x_actual_derecho_centro, posicion_y_movimiento_derecho) # Mover al centro del pulgar actual
-                self.esperar_fijo(0.1) # Pequeña pausa
-                
-                self.logger.debug("\n    -> mouse.down")
-                self.page.mouse.down() # Presionar el botón del ratón
-                self.esperar_fijo(0.2) # Pausa para simular la interacción humana
-                
-                self.logger.debug("\n    -> mouse.move al destino (arrastrando)")
-                self.page.mouse.move(posicion_x_destino_derecho, posicion_y_movimiento_derecho, steps=10) # Arrastrar suavemente
-                self.esperar_fijo(0.2) # Pausa para simular la interacción humana
-                
-                self.logger.debug("    -> mouse.up")
-                self.page.mouse.up() # Soltar el botón del ratón
-                self.logger.info(f"\n  > Pulgar derecho movido a X={posicion_x_destino_derecho:.0f}.")
-            
-            # --- Medición de rendimiento: Fin movimiento pulgar derecho ---
-            end_time_move_right_thumb = time.time()
-            duration_move_right_thumb = end_time_move_right_thumb - start_time_move_right_thumb
-            self.logger.info(f"PERFORMANCE: Tiempo de movimiento de pulgar derecho: {duration_move_right_thumb:.4f} segundos.")
+            with self._medir("mover_slider_rango.move_right_thumb", "movimiento de pulgar derecho"):
+                self._arrastrar_pulgar_slider("derecho", pulgar_derecho_locator, caja_barra, porcentaje_destino_derecho, tolerancia_pixeles)
 
             self.logger.info(f"\n✅ Slider de rango procesado exitosamente. Izquierdo a {porcentaje_destino_izquierdo*100:.0f}%, Derecho a {porcentaje_destino_derecho*100:.0f}%.")
             self.tomar_captura(f"{nombre_base}_slider_rango_procesado_{int(porcentaje_destino_izquierdo*100)}_{int(porcentaje_destino_derecho*100)}pc_final", directorio)
-
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (mover slider de rango): {duration_total_operation:.4f} segundos.")
-
-        except (ValueError, RuntimeError) as e:
-            # Captura errores de validación de entrada o de obtención de bounding box
-            self.logger.critical(f"\n❌ FALLO (Validación/Configuración) - {nombre_paso}: {e}", exc_info=True)
-            # La captura ya se tomó en los bloques if/elif donde se lanzó el error de validación
-            raise AssertionError(f"\nError de validación/configuración en mover_slider_rango: {e}") from e
-
-        except (Error, TimeoutError) as e:
-            # Captura errores específicos de Playwright, incluyendo TimeoutError de expect()
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright) - {nombre_paso}: Ocurrió un error de Playwright al intentar mover el slider de rango.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_slider_rango", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada
-            mensaje_error = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al intentar mover el slider de rango.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_slider_rango", directorio)
-            raise AssertionError(mensaje_error) from e
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
     
     # 53- Función para seleccionar una opción en un ComboBox (elemento <select>) por su atributo 'value'.
     # Integra pruebas de rendimiento para las fases de validación, selección y verificación.
+    @accion_instrumentada(envolver_en=AssertionError)
     def seleccionar_opcion_por_valor(self, combobox_locator: Locator, valor_a_seleccionar: str, nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
         """
         Selecciona una opción dentro de un elemento ComboBox (`<select>`) utilizando su atributo 'value'.
@@ -7187,95 +4235,40 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Iniciando selección de '{valor_a_seleccionar}' en ComboBox por valor: '{combobox_locator}' ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el ComboBox no está listo, la opción no existe o la verificación falla, el decorador toma
+            # la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que el ComboBox esté visible y habilitado
             self.logger.info(f"\n🔍 Esperando que el ComboBox '{combobox_locator}' sea visible y habilitado...")
-            # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
-            expect(combobox_locator).to_be_visible()
-            combobox_locator.highlight() # Para visualización durante la ejecución
-            expect(combobox_locator).to_be_enabled()
-            # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
-            duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación: {duration_validation:.4f} segundos.")
-            
+            with self._medir("seleccionar_opcion_por_valor.validation", "validación de visibilidad y habilitación"):
+                expect(combobox_locator).to_be_visible()
+                self._resaltar(combobox_locator) # Para visualización durante la ejecución
+                expect(combobox_locator).to_be_enabled()
             self.logger.info(f"\n✅ ComboBox '{combobox_locator}' es visible y habilitado.")
-            
+
             # 2. Tomar captura antes de la selección
             self.tomar_captura(f"{nombre_base}_antes_de_seleccionar_combo", directorio)
 
             # 3. Seleccionar la opción por su valor
             self.logger.info(f"\n🔄 Seleccionando opción '{valor_a_seleccionar}' en '{combobox_locator}'...")
-            # --- Medición de rendimiento: Inicio selección ---
-            start_time_selection = time.time()
-            combobox_locator.select_option(value=valor_a_seleccionar, timeout=timeout_ms) # Asegúrate de pasar el 'value=' explícitamente si es necesario
-            # --- Medición de rendimiento: Fin selección ---
-            end_time_selection = time.time()
-            duration_selection = end_time_selection - start_time_selection
-            self.logger.info(f"PERFORMANCE: Tiempo de selección de la opción: {duration_selection:.4f} segundos.")
-            
+            with self._medir("seleccionar_opcion_por_valor.selection", "selección de la opción"):
+                combobox_locator.select_option(value=valor_a_seleccionar, timeout=timeout_ms) # Asegúrate de pasar el 'value=' explícitamente si es necesario
             self.logger.info(f"\n✅ Opción '{valor_a_seleccionar}' seleccionada exitosamente en '{combobox_locator}'.")
 
             # 4. Verificar que la opción fue seleccionada correctamente
             self.logger.info(f"\n🔍 Verificando que ComboBox '{combobox_locator}' tenga el valor '{valor_a_seleccionar}'...")
-            # --- Medición de rendimiento: Inicio verificación ---
-            start_time_verification = time.time()
-            expect(combobox_locator).to_have_value(valor_a_seleccionar, timeout=timeout_ms)
-            # --- Medición de rendimiento: Fin verificación ---
-            end_time_verification = time.time()
-            duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la selección: {duration_verification:.4f} segundos.")
-            
+            with self._medir("seleccionar_opcion_por_valor.verification", "verificación de la selección"):
+                expect(combobox_locator).to_have_value(valor_a_seleccionar, timeout=timeout_ms)
             self.logger.info(f"\n✅ ComboBox '{combobox_locator}' verificado con valor '{valor_a_seleccionar}'.")
 
             # 5. Tomar captura después de la selección exitosa
             self.tomar_captura(f"{nombre_base}_despues_de_seleccionar_combo_exito", directorio)
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox): {duration_total_operation:.4f} segundos.")
-
-        except TimeoutError as e:
-            # Captura TimeoutError específicamente para mensajes más claros
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout) - {nombre_paso}: El ComboBox '{combobox_locator}' "
-                f"no se volvió visible/habilitado o la opción '{valor_a_seleccionar}' no se pudo seleccionar/verificar a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_combo", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Error as e:
-            # Captura otros errores de Playwright
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright) - {nombre_paso}: Ocurrió un error de Playwright al intentar seleccionar la opción '{valor_a_seleccionar}' en '{combobox_locator}'.\n"
-                f"Posibles causas: Selector inválido, elemento no es un <select>, opción no existe, o ComboBox no interactuable.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Exception as e:
-            # Captura cualquier otra excepción inesperada
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado) - {nombre_paso}: Ocurrió un error desconocido al manejar el ComboBox '{combobox_locator}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_combo", directorio)
-            raise AssertionError(mensaje_error) from e
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
         
     # 54- Función para seleccionar una opción en un ComboBox (elemento <select>) por su texto visible (label).
     # Integra pruebas de rendimiento para las fases de validación, selección y verificación.
+    @accion_instrumentada(envolver_en=AssertionError)
     def seleccionar_opcion_por_label(self, combobox_locator: Locator, label_a_seleccionar: str, nombre_base: str, directorio: str, value_esperado: Optional[str] = None, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
         """
         Selecciona una opción dentro de un elemento ComboBox (`<select>`) utilizando su texto visible (label).
@@ -7302,39 +4295,26 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Iniciando selección de '{label_a_seleccionar}' en ComboBox por label: '{combobox_locator}' ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el ComboBox no está listo, la opción no existe o la verificación falla, el decorador toma
+            # la captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurarse de que el ComboBox esté visible y habilitado
             self.logger.info(f"\n🔍 Esperando que el ComboBox '{combobox_locator}' sea visible y habilitado...")
-            # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
-            expect(combobox_locator).to_be_visible()
-            combobox_locator.highlight() # Para visualización durante la ejecución
-            expect(combobox_locator).to_be_enabled()
-            # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
-            duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación: {duration_validation:.4f} segundos.")
-            
+            with self._medir("seleccionar_opcion_por_label.validation", "validación de visibilidad y habilitación"):
+                expect(combobox_locator).to_be_visible()
+                self._resaltar(combobox_locator) # Para visualización durante la ejecución
+                expect(combobox_locator).to_be_enabled()
             self.logger.info(f"\n✅ ComboBox '{combobox_locator}' es visible y habilitado.")
-            
+
             # 2. Tomar captura antes de la selección
             self.tomar_captura(f"{nombre_base}_antes_de_seleccionar_combo_label", directorio)
 
             # 3. Seleccionar la opción por su texto visible (label)
             self.logger.info(f"\n🔄 Seleccionando opción con texto '{label_a_seleccionar}' en '{combobox_locator}'...")
-            # --- Medición de rendimiento: Inicio selección ---
-            start_time_selection = time.time()
-            # El método select_option() espera automáticamente a que el elemento
-            # sea visible, habilitado y con la opción disponible.
-            combobox_locator.select_option(label=label_a_seleccionar) # Usa 'label=' para claridad
-            # --- Medición de rendimiento: Fin selección ---
-            end_time_selection = time.time()
-            duration_selection = end_time_selection - start_time_selection
-            self.logger.info(f"PERFORMANCE: Tiempo de selección de la opción por label: {duration_selection:.4f} segundos.")
-            
+            with self._medir("seleccionar_opcion_por_label.selection", "selección de la opción por label"):
+                # El método select_option() espera automáticamente a que el elemento
+                # sea visible, habilitado y con la opción disponible.
+                combobox_locator.select_option(label=label_a_seleccionar) # Usa 'label=' para claridad
             self.logger.info(f"\n✅ Opción '{label_a_seleccionar}' seleccionada exitosamente en '{combobox_locator}' por label.")
 
             # 4. Verificar que la opción fue seleccionada correctamente
@@ -7342,60 +4322,21 @@ class Funciones_Globales:
             # Esto es más robusto que to_have_text() para <select>, ya que el texto visible puede variar
             # o incluir espacios, mientras que el 'value' es el dato real subyacente.
             valor_para_comparar_verificacion = value_esperado if value_esperado is not None else label_a_seleccionar
-            
+
             self.logger.info(f"\n🔍 Verificando que ComboBox '{combobox_locator}' tenga el valor esperado '{valor_para_comparar_verificacion}'...")
-            # --- Medición de rendimiento: Inicio verificación ---
-            start_time_verification = time.time()
-            expect(combobox_locator).to_have_value(valor_para_comparar_verificacion)
-            # --- Medición de rendimiento: Fin verificación ---
-            end_time_verification = time.time()
-            duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la selección: {duration_verification:.4f} segundos.")
-            
+            with self._medir("seleccionar_opcion_por_label.verification", "verificación de la selección"):
+                expect(combobox_locator).to_have_value(valor_para_comparar_verificacion)
             self.logger.info(f"\n✅ ComboBox '{combobox_locator}' verificado con valor seleccionado '{valor_para_comparar_verificacion}'.")
 
             # 5. Tomar captura después de la selección exitosa
             # Asegura que la captura refleje el estado final y el valor seleccionado
             self.tomar_captura(f"{nombre_base}_despues_de_seleccionar_combo_label_exito", directorio)
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox por label): {duration_total_operation:.4f} segundos.")
-
-        except TimeoutError as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout) - {nombre_paso}: El ComboBox '{combobox_locator}' "
-                f"no se volvió visible/habilitado o la opción con label '{label_a_seleccionar}' no se pudo seleccionar/verificar a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_combo_label", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Error as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright) - {nombre_paso}: Ocurrió un error al intentar seleccionar la opción con label '{label_a_seleccionar}' en '{combobox_locator}'.\n"
-                f"Posibles causas: Selector inválido, elemento no es un <select>, opción con ese label no existe, o ComboBox no interactuable.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo_label", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Exception as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado) - {nombre_paso}: Ocurrió un error desconocido al manejar el ComboBox '{combobox_locator}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_combo_label", directorio)
-            raise AssertionError(mensaje_error) from e
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
     
     # 55- Función para presionar la tecla TAB en el teclado
     # Integra pruebas de rendimiento para medir el tiempo de ejecución de la acción.
+    @accion_instrumentada(envolver_en=AssertionError)
     def Tab_Press(self, tiempo_espera_post_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la tecla 'TAB' en el teclado.
@@ -7414,43 +4355,18 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Presionando la tecla TAB y esperando {tiempo_espera_post_tab} segundos ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
-        try:
-            # --- Medición de rendimiento: Inicio de la acción 'keyboard.press' ---
-            start_time_press_action = time.time()
+        with self._medir("Tab_Press.press_action", "la acción 'keyboard.press(\"Tab\")'"):
             self.page.keyboard.press("Tab")
-            # --- Medición de rendimiento: Fin de la acción 'keyboard.press' ---
-            end_time_press_action = time.time()
-            duration_press_action = end_time_press_action - start_time_press_action
-            self.logger.info(f"PERFORMANCE: Tiempo de la acción 'keyboard.press(\"Tab\")': {duration_press_action:.4f} segundos.")
-            
-            self.logger.info("\nTecla TAB presionada exitosamente.")
 
-            # Espera fija después de presionar TAB (configuracion por parametro)
-            if tiempo_espera_post_tab > 0:
-                self.esperar_fijo(tiempo_espera_post_tab)
+        self.logger.info("\nTecla TAB presionada exitosamente.")
+
+        # Espera fija después de presionar TAB (configuracion por parametro)
+        if tiempo_espera_post_tab > 0:
+            self.esperar_fijo(tiempo_espera_post_tab)
 
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al presionar la tecla TAB.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            # En este caso, una captura de pantalla podría no ser tan útil,
-            # ya que es una acción de teclado global, pero se podría añadir
-            # si el contexto lo amerita (e.g., para ver el estado del foco).
-            # self.tomar_captura(f"error_tab_press", "directorio_errores") # Descomentar si se desea una captura
-            raise AssertionError(f"\nError al presionar la tecla TAB: {e}") from e
-        finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (Tab_Press): {duration_total_operation:.4f} segundos.")
-        
     # 56- Función optimizada para seleccionar múltiples opciones en un ComboBox múltiple.
     # Integra pruebas de rendimiento utilizando mediciones de tiempo para cada fase clave.
+    @accion_instrumentada(envolver_en=AssertionError)
     def seleccionar_multiples_opciones_combo(self, combobox_multiple_locator: Locator, valores_a_seleccionar: List[str], nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
         """
         Selecciona múltiples opciones en un ComboBox (`<select multiple>`) por sus valores o labels.
@@ -7474,27 +4390,20 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Iniciando selección de múltiples opciones {valores_a_seleccionar} en ComboBox: '{combobox_multiple_locator}' ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
         try:
+            # Si el ComboBox no está listo, no es múltiple, alguna opción no existe o la verificación falla,
+            # el decorador toma la captura del fallo y lo relanza como AssertionError.
             # 1. Asegurarse de que el ComboBox esté visible y habilitado
             self.logger.info(f"\n🔍 Esperando que el ComboBox múltiple '{combobox_multiple_locator}' sea visible y habilitado...")
-            # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
-            expect(combobox_multiple_locator).to_be_visible()
-            combobox_multiple_locator.highlight() # Para visualización durante la ejecución
-            expect(combobox_multiple_locator).to_be_enabled()
-            # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
-            duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación: {duration_validation:.4f} segundos.")
-            
+            with self._medir("seleccionar_multiples_opciones_combo.validation", "validación de visibilidad y habilitación"):
+                expect(combobox_multiple_locator).to_be_visible()
+                self._resaltar(combobox_multiple_locator) # Para visualización durante la ejecución
+                expect(combobox_multiple_locator).to_be_enabled()
             self.logger.info(f"\n✅ ComboBox múltiple '{combobox_multiple_locator}' es visible y habilitado.")
-            
+
             # Opcional: Verificar que sea un select múltiple.
             # Esta aserción es útil para fallar temprano si el locator no apunta al tipo de elemento correcto.
-            self.logger.debug(f"\nVerificando que '{combobox_multiple_locator}' sea un <select multiple>...")
+            self.logger.debug(lambda: f"\nVerificando que '{combobox_multiple_locator}' sea un <select multiple>...")
             expect(combobox_multiple_locator).to_have_attribute("multiple") # El atributo 'multiple' existe
             self.logger.debug("\n  > ComboBox verificado como select múltiple.")
 
@@ -7503,72 +4412,27 @@ class Funciones_Globales:
 
             # 3. Seleccionar las opciones
             self.logger.info(f"\n🔄 Seleccionando opciones '{valores_a_seleccionar}' en '{combobox_multiple_locator}'...")
-            # --- Medición de rendimiento: Inicio selección de múltiples opciones ---
-            start_time_selection = time.time()
-            # Playwright's select_option() para listas maneja tanto valores como labels.
-            # Pasando una lista de strings seleccionará las opciones correspondientes.
-            combobox_multiple_locator.select_option(valores_a_seleccionar)
-            # --- Medición de rendimiento: Fin selección de múltiples opciones ---
-            end_time_selection = time.time()
-            duration_selection = end_time_selection - start_time_selection
-            self.logger.info(f"PERFORMANCE: Tiempo de selección de las múltiples opciones: {duration_selection:.4f} segundos.")
-            
+            with self._medir("seleccionar_multiples_opciones_combo.selection", "selección de las múltiples opciones"):
+                # Playwright's select_option() para listas maneja tanto valores como labels.
+                # Pasando una lista de strings seleccionará las opciones correspondientes.
+                combobox_multiple_locator.select_option(valores_a_seleccionar)
             self.logger.info(f"\n✅ Opciones '{valores_a_seleccionar}' seleccionadas exitosamente en '{combobox_multiple_locator}'.")
 
             # 4. Verificar que las opciones fueron seleccionadas correctamente
             self.logger.info(f"\n🔍 Verificando que ComboBox múltiple '{combobox_multiple_locator}' tenga los valores seleccionados: {valores_a_seleccionar}...")
-            # --- Medición de rendimiento: Inicio verificación de selecciones ---
-            start_time_verification = time.time()
-            # to_have_values() es la aserción correcta para verificar múltiples selecciones por su 'value'.
-            expect(combobox_multiple_locator).to_have_values(valores_a_seleccionar)
-            # --- Medición de rendimiento: Fin verificación de selecciones ---
-            end_time_verification = time.time()
-            duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de las selecciones: {duration_verification:.4f} segundos.")
-            
+            with self._medir("seleccionar_multiples_opciones_combo.verification", "verificación de las selecciones"):
+                # to_have_values() es la aserción correcta para verificar múltiples selecciones por su 'value'.
+                expect(combobox_multiple_locator).to_have_values(valores_a_seleccionar)
             self.logger.info(f"\n✅ ComboBox múltiple '{combobox_multiple_locator}' verificado con valores seleccionados: {valores_a_seleccionar}.")
 
             # 5. Tomar captura después de la selección exitosa
             self.tomar_captura(f"{nombre_base}_despues_de_seleccionar_multi_combo_exito", directorio)
-            
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox múltiple): {duration_total_operation:.4f} segundos.")
-
-        except TimeoutError as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout) - {nombre_paso}: El ComboBox múltiple '{combobox_multiple_locator}' "
-                f"no se volvió visible/habilitado o las opciones '{valores_a_seleccionar}' no se pudieron seleccionar/verificar a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_multi_combo", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Error as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright) - {nombre_paso}: Ocurrió un error al intentar seleccionar las opciones '{valores_a_seleccionar}' en '{combobox_multiple_locator}'.\n"
-                f"Posibles causas: Selector inválido, elemento no es un <select multiple>, alguna opción no existe o el ComboBox no es interactuable.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_multi_combo", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Exception as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado) - {nombre_paso}: Ocurrió un error desconocido al manejar el ComboBox múltiple '{combobox_multiple_locator}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_multi_combo", directorio)
-            raise AssertionError(mensaje_error) from e
         finally:
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
         
     # 57- Función que obtiene y imprime los valores y el texto de todas las opciones en un dropdown list.
     # Integra pruebas de rendimiento para medir el tiempo de extracción de datos del dropdown.
+    @accion_instrumentada(envolver_en=AssertionError)
     def obtener_valores_dropdown(self, selector_dropdown: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> Optional[List[Dict[str, str]]]:
         """
         Obtiene los atributos 'value' y el texto visible de todas las opciones (`<option>`)
@@ -7595,35 +4459,24 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Extrayendo valores del dropdown '{selector_dropdown}' ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
         valores_opciones: List[Dict[str, str]] = []
 
         try:
+            # Si el dropdown no está listo o falla Playwright, el decorador toma la captura del fallo
+            # y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurar que el dropdown es visible y habilitado
             self.logger.info(f"\n🔍 Esperando que el dropdown '{selector_dropdown}' sea visible y habilitado...")
-            # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
-            expect(selector_dropdown).to_be_visible()
-            selector_dropdown.highlight() # Para visualización durante la ejecución
-            expect(selector_dropdown).to_be_enabled()
-            # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
-            duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación del dropdown: {duration_validation:.4f} segundos.")
-            
+            with self._medir("obtener_valores_dropdown.validation", "validación de visibilidad y habilitación del dropdown"):
+                expect(selector_dropdown).to_be_visible()
+                self._resaltar(selector_dropdown) # Para visualización durante la ejecución
+                expect(selector_dropdown).to_be_enabled()
             self.logger.info(f"\n✅ Dropdown '{selector_dropdown}' es visible y habilitado.")
             self.tomar_captura(f"{nombre_base}_dropdown_antes_extraccion", directorio)
 
             # 2. Obtener todos los locators de las opciones dentro del dropdown
             self.logger.info(f"\n🔄 Obteniendo locators de todas las opciones dentro de '{selector_dropdown}'...")
-            # --- Medición de rendimiento: Inicio obtención de option locators ---
-            start_time_get_options = time.time()
-            option_locators = selector_dropdown.locator("option").all()
-            # --- Medición de rendimiento: Fin obtención de option locators ---
-            end_time_get_options = time.time()
-            duration_get_options = end_time_get_options - start_time_get_options
-            self.logger.info(f"PERFORMANCE: Tiempo de obtención de todos los option locators: {duration_get_options:.4f} segundos.")
+            with self._medir("obtener_valores_dropdown.get_options", "obtención de todos los option locators"):
+                option_locators = selector_dropdown.locator("option").all()
 
             if not option_locators:
                 self.logger.warning(f"\n⚠️ No se encontraron opciones dentro del dropdown '{selector_dropdown}'.")
@@ -7634,64 +4487,27 @@ class Funciones_Globales:
 
             # 3. Iterar sobre cada opción y extraer su 'value' y 'text_content'
             self.logger.info("\n📊 Extrayendo valores y textos de cada opción...")
-            # --- Medición de rendimiento: Inicio iteración y extracción ---
-            start_time_extract_loop = time.time()
-            for i, option_locator in enumerate(option_locators):
-                value = option_locator.get_attribute("value")
-                text = option_locator.text_content()
+            with self._medir("obtener_valores_dropdown.extract_loop", f"iteración y extracción de {len(option_locators)} opciones"):
+                for i, option_locator in enumerate(option_locators):
+                    value = option_locator.get_attribute("value")
+                    text = option_locator.text_content()
 
-                # Limpieza de espacios en blanco
-                clean_value = value.strip() if value is not None else "" # Manejo de None para get_attribute
-                clean_text = text.strip() if text is not None else "" # Manejo de None para text_content
-
-                valores_opciones.append({'value': clean_value, 'text': clean_text})
-                self.logger.info(f"  Opción {i+1}: Value='{clean_value}', Text='{clean_text}'")
-            # --- Medición de rendimiento: Fin iteración y extracción ---
-            end_time_extract_loop = time.time()
-            duration_extract_loop = end_time_extract_loop - start_time_extract_loop
-            self.logger.info(f"PERFORMANCE: Tiempo de iteración y extracción de {len(option_locators)} opciones: {duration_extract_loop:.4f} segundos.")
+                    # Limpieza de espacios en blanco
+                    clean_value = value.strip() if value is not None else "" # Manejo de None para get_attribute
+                    clean_text = text.strip() if text is not None else "" # Manejo de None para text_content
 
+                    valores_opciones.append({'value': clean_value, 'text': clean_text})
+                    self.logger.info(f"  Opción {i+1}: Value='{clean_value}', Text='{clean_text}'")
 
             self.logger.info(f"\n✅ Valores obtenidos exitosamente del dropdown '{selector_dropdown}'.")
             self.tomar_captura(f"{nombre_base}_dropdown_valores_extraidos", directorio)
             return valores_opciones
-
-        except TimeoutError as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout) - {nombre_paso}: El dropdown '{selector_dropdown}' "
-                f"no se volvió visible/habilitado o sus opciones no cargaron a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Error as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright) - {nombre_paso}: Ocurrió un error de Playwright al intentar obtener los valores del dropdown '{selector_dropdown}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Exception as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado) - {nombre_paso}: Ocurrió un error desconocido al intentar obtener los valores del dropdown '{selector_dropdown}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio)
-            raise AssertionError(mensaje_error) from e
         finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener valores dropdown): {duration_total_operation:.4f} segundos.")
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
         
     # 58- Función que obtiene y compara los valores y el texto de todas las opciones en un dropdown list.
     # Integra pruebas de rendimiento para medir el tiempo de extracción y comparación de datos.
+    @accion_instrumentada(envolver_en=AssertionError)
     def obtener_y_comparar_valores_dropdown(self, dropdown_locator: Locator, nombre_base: str, directorio: str, expected_options: Optional[List[Union[str, Dict[str, str]]]] = None, compare_by_text: bool = True, compare_by_value: bool = False, nombre_paso: str = "", timeout_ms: int = 15000) -> Optional[List[Dict[str, str]]]:
         """
         Obtiene los atributos 'value' y el texto visible de todas las opciones (`<option>`)
@@ -7730,35 +4546,24 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Extrayendo y comparando valores del dropdown '{dropdown_locator}' ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
         valores_opciones_reales: List[Dict[str, str]] = []
 
         try:
+            # Si el dropdown no está listo, faltan opciones o la comparación falla, el decorador toma la
+            # captura del fallo y lo relanza como AssertionError para que la prueba falle claramente.
             # 1. Asegurar que el dropdown es visible y habilitado
             self.logger.info(f"\n🔍 Esperando que el dropdown '{dropdown_locator}' sea visible y habilitado...")
-            # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
-            expect(dropdown_locator).to_be_visible()
-            dropdown_locator.highlight() # Para visualización durante la ejecución
-            expect(dropdown_locator).to_be_enabled()
-            # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
-            duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación del dropdown: {duration_validation:.4f} segundos.")
-            
+            with self._medir("obtener_y_comparar_valores_dropdown.validation", "validación de visibilidad y habilitación del dropdown"):
+                expect(dropdown_locator).to_be_visible()
+                self._resaltar(dropdown_locator) # Para visualización durante la ejecución
+                expect(dropdown_locator).to_be_enabled()
             self.logger.info(f"\n✅ Dropdown '{dropdown_locator}' es visible y habilitado.")
             self.tomar_captura(f"{nombre_base}_dropdown_antes_extraccion_y_comparacion", directorio)
 
             # 2. Obtener todos los locators de las opciones dentro del dropdown
             self.logger.info(f"\n🔄 Obteniendo locators de todas las opciones dentro de '{dropdown_locator}'...")
-            # --- Medición de rendimiento: Inicio obtención de option locators ---
-            start_time_get_options = time.time()
-            option_locators = dropdown_locator.locator("option").all()
-            # --- Medición de rendimiento: Fin obtención de option locators ---
-            end_time_get_options = time.time()
-            duration_get_options = end_time_get_options - start_time_get_options
-            self.logger.info(f"PERFORMANCE: Tiempo de obtención de todos los option locators: {duration_get_options:.4f} segundos.")
+            with self._medir("obtener_y_comparar_valores_dropdown.get_options", "obtención de todos los option locators"):
+                option_locators = dropdown_locator.locator("option").all()
 
             if not option_locators:
                 self.logger.warning(f"\n⚠️ No se encontraron opciones dentro del dropdown '{dropdown_locator}'.")
@@ -7772,23 +4577,18 @@ class Funciones_Globales:
 
             # 3. Iterar sobre cada opción y extraer su 'value' y 'text_content'
             self.logger.info("\n📊 Extrayendo valores y textos de cada opción...")
-            # --- Medición de rendimiento: Inicio iteración y extracción ---
-            start_time_extract_loop = time.time()
-            for i, option_locator in enumerate(option_locators):
-                value = option_locator.get_attribute("value")
-                text = option_locator.text_content()
-
-                # Limpieza de espacios en blanco
-                # Asegura que value y text no sean None antes de strip().
-                clean_value = value.strip() if value is not None else ""
-                clean_text = text.strip() if text is not None else ""
-
-                valores_opciones_reales.append({'value': clean_value, 'text': clean_text})
-                self.logger.info(f"\n  Opción Real {i+1}: Value='{clean_value}', Text='{clean_text}'")
-            # --- Medición de rendimiento: Fin iteración y extracción ---
-            end_time_extract_loop = time.time()
-            duration_extract_loop = end_time_extract_loop - start_time_extract_loop
-            self.logger.info(f"PERFORMANCE: Tiempo de iteración y extracción de {len(option_locators)} opciones: {duration_extract_loop:.4f} segundos.")
+            with self._medir("obtener_y_comparar_valores_dropdown.extract_loop", f"iteración y extracción de {len(option_locators)} opciones"):
+                for i, option_locator in enumerate(option_locators):
+                    value = option_locator.get_attribute("value")
+                    text = option_locator.text_content()
+
+                    # Limpieza de espacios en blanco
+                    # Asegura que value y text no sean None antes de strip().
+                    clean_value = value.strip() if value is not None else ""
+                    clean_text = text.strip() if text is not None else ""
+
+                    valores_opciones_reales.append({'value': clean_value, 'text': clean_text})
+                    self.logger.info(f"\n  Opción Real {i+1}: Value='{clean_value}', Text='{clean_text}'")
 
             self.logger.info(f"\n✅ Valores obtenidos exitosamente del dropdown '{dropdown_locator}'.")
             self.tomar_captura(f"{nombre_base}_dropdown_valores_extraidos", directorio)
@@ -7796,9 +4596,7 @@ class Funciones_Globales:
             # 4. Comparar con las opciones esperadas (si se proporcionan)
             if expected_options is not None:
                 self.logger.info("\n--- Realizando comparación de opciones ---")
-                # --- Medición de rendimiento: Inicio de la fase de comparación ---
-                start_time_comparison = time.time()
-                try:
+                with self._medir("obtener_y_comparar_valores_dropdown.comparison", "fase de comparación"):
                     expected_set = set()
                     real_set = set()
 
@@ -7826,75 +4624,36 @@ class Funciones_Globales:
                         if compare_by_value and 'value' in opt_real and opt_real['value'] is not None:
                             real_set.add(opt_real['value'].strip().lower())
 
-                    # Comprobar si los conjuntos son idénticos
-                    if expected_set == real_set:
-                        self.logger.info("\n✅ ÉXITO: Las opciones del dropdown coinciden con las opciones esperadas.")
-                        self.tomar_captura(f"{nombre_base}_dropdown_comparacion_exitosa", directorio)
-                    else:
-                        missing_in_real = list(expected_set - real_set)
-                        missing_in_expected = list(real_set - expected_set)
-                        error_msg = f"\n❌ FALLO: Las opciones del dropdown NO coinciden con las esperadas.\n"
-                        if missing_in_real:
-                            error_msg += f"  - Opciones esperadas no encontradas en el dropdown: {missing_in_real}\n"
-                        if missing_in_expected:
-                            error_msg += f"  - Opciones encontradas en el dropdown que no estaban esperadas: {missing_in_expected}\n"
-                        self.logger.error(error_msg)
-                        self.tomar_captura(f"{nombre_base}_dropdown_comparacion_fallida", directorio)
-                        raise AssertionError(f"\nComparación de opciones del dropdown fallida para '{dropdown_locator}'. {error_msg.strip()}")
+                # Comprobar si los conjuntos son idénticos
+                if expected_set != real_set:
+                    missing_in_real = list(expected_set - real_set)
+                    missing_in_expected = list(real_set - expected_set)
+                    error_msg = "Las opciones del dropdown NO coinciden con las esperadas."
+                    if missing_in_real:
+                        error_msg += f"\n  - Opciones esperadas no encontradas en el dropdown: {missing_in_real}"
+                    if missing_in_expected:
+                        error_msg += f"\n  - Opciones encontradas en el dropdown que no estaban esperadas: {missing_in_expected}"
+                    raise AssertionError(f"\nComparación de opciones del dropdown fallida para '{dropdown_locator}'. {error_msg}")
 
-                except Exception as e:
-                    self.logger.critical(f"\n❌ FALLO: Ocurrió un error durante la comparación de opciones: {e}", exc_info=True)
-                    self.tomar_captura(f"{nombre_base}_dropdown_error_comparacion", directorio)
-                    raise AssertionError(f"\nError al comparar opciones del dropdown '{dropdown_locator}': {e}") from e
-                # --- Medición de rendimiento: Fin de la fase de comparación ---
-                end_time_comparison = time.time()
-                duration_comparison = end_time_comparison - start_time_comparison
-                self.logger.info(f"PERFORMANCE: Tiempo de la fase de comparación: {duration_comparison:.4f} segundos.")
+                self.logger.info("\n✅ ÉXITO: Las opciones del dropdown coinciden con las opciones esperadas.")
+                self.tomar_captura(f"{nombre_base}_dropdown_comparacion_exitosa", directorio)
 
             return valores_opciones_reales
-
-        except TimeoutError as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout) - {nombre_paso}: El dropdown '{dropdown_locator}' "
-                f"no se volvió visible/habilitado o sus opciones no cargaron a tiempo.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Error as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright) - {nombre_paso}: Ocurrió un error de Playwright al intentar obtener los valores del dropdown '{dropdown_locator}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio)
-            raise AssertionError(mensaje_error) from e
-
-        except Exception as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado) - {nombre_paso}: Ocurrió un error desconocido al intentar obtener los valores del dropdown '{dropdown_locator}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio)
-            raise AssertionError(mensaje_error) from e
         finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener y comparar valores dropdown): {duration_total_operation:.4f} segundos.")
             self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
     
     # 59- Función que detecta y devuelve el número total de filas ocupadas en una hoja específica de un archivo Excel.
+    # La hoja se lee una sola vez y se sirve desde la caché de libros (utils/workbook_cache.py) mientras el archivo no cambie.
     # Integra pruebas de rendimiento para medir el tiempo de lectura del archivo Excel.
+    @accion_instrumentada(en_error=0)
     def num_Filas_excel(self, archivo_excel_path: str, hoja: str, has_header: bool = False, nombre_paso: str = "") -> int:
         """
         Detecta y devuelve el número total de filas ocupadas en una hoja específica de un archivo Excel.
         Opcionalmente, descuenta una fila para el encabezado si 'has_header' es True.
         Esta función mide el tiempo que tarda en cargar el archivo Excel y obtener el número de filas,
         lo cual es útil para pruebas de rendimiento en escenarios de procesamiento de datos.
+        La hoja se carga en la caché de libros del proceso la primera vez; las llamadas siguientes
+        (y las de 'dato_Columna_excel' sobre la misma hoja) no vuelven a leer el archivo mientras no cambie.
 
         Args:
             archivo_excel_path (str): La **ruta completa al archivo Excel** (`.xlsx` o `.xlsm`).
@@ -7910,63 +4669,34 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando obtener el número de filas para la hoja '{hoja}' en el archivo '{archivo_excel_path}' (tiene encabezado: {has_header}). ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
-        num_physical_rows = 0
-        num_data_rows = 0
-
-        try:
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
-            workbook = openpyxl.load_workbook(archivo_excel_path) # Carga el libro de trabajo Excel
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
-            sheet = workbook[hoja] # Selecciona la hoja específica del libro
-            
-            # Obtiene el número total de filas con contenido.
-            # openpyxl.worksheet.max_row devuelve el índice de la última fila no vacía.
-            num_physical_rows = sheet.max_row 
-
-            if has_header and num_physical_rows > 0:
-                # Si tiene encabezado y hay al menos una fila (el encabezado)
-                num_data_rows = num_physical_rows - 1 # Resta 1 para no contar el encabezado
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas de datos (descontando encabezado) en la hoja '{hoja}'.")
-                return num_data_rows
-            else:
-                # Para hojas sin encabezado, o si num_physical_rows es 0 (hoja vacía),
-                # el número de filas de datos es igual al número de filas físicas.
-                num_data_rows = num_physical_rows
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas ocupadas en la hoja '{hoja}'.")
-                return num_data_rows
-
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo Excel no se encontró en la ruta: '{archivo_excel_path}'."
-            self.logger.critical(error_msg)
-            return 0
-        except KeyError:
-            error_msg = f"\n❌ FALLO (Hoja no encontrada): La hoja '{hoja}' no se encontró en el archivo Excel: '{archivo_excel_path}'."
-            self.logger.critical(error_msg)
-            return 0
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al leer el número de filas del Excel.\n"
-                f"Archivo: '{archivo_excel_path}', Hoja: '{hoja}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace
-            return 0
-        finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_excel): {duration_total_operation:.4f} segundos.")
-            # Es importante cerrar el workbook si se ha abierto explícitamente y no con 'with open()'
-            # Sin embargo, openpyxl.load_workbook no requiere un cierre explícito en la mayoría de los casos
-            # ya que maneja el archivo internamente. Aun así, se puede añadir un log de depuración.
-            self.logger.debug("\nFinalizada la operación de lectura de Excel.")
+        # Si el archivo o la hoja no existen (FileNotFoundError, KeyError) o la lectura falla,
+        # el decorador registra el error y devuelve 0.
+        self.logger.info(f"\n⏳ Obteniendo la hoja '{hoja}' del libro de trabajo Excel: '{archivo_excel_path}'...")
+        tabla, desde_cache = obtener_cache_libros().obtener_hoja(archivo_excel_path, hoja) # Lee la hoja o la sirve desde la caché
+        self.metricas.incrementar("excel_cache.aciertos" if desde_cache else "excel_cache.fallos")
+        self.logger.info(f"\n✅ Hoja '{hoja}' {'servida desde la caché' if desde_cache else 'cargada'}.")
+        # La caché de libros cierra el libro tras leer la hoja, así que no queda ningún archivo abierto.
+
+        # Obtiene el número total de filas presentes en la hoja (índice de la última fila).
+        num_physical_rows = tabla.num_filas
+
+        if has_header and num_physical_rows > 0:
+            # Si tiene encabezado y hay al menos una fila (el encabezado)
+            num_data_rows = num_physical_rows - 1 # Resta 1 para no contar el encabezado
+            self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas de datos (descontando encabezado) en la hoja '{hoja}'.")
+            return num_data_rows
+        else:
+            # Para hojas sin encabezado, o si num_physical_rows es 0 (hoja vacía),
+            # el número de filas de datos es igual al número de filas físicas.
+            num_data_rows = num_physical_rows
+            self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas ocupadas en la hoja '{hoja}'.")
+            return num_data_rows
 
     # 60- Función que obtiene el valor de una celda específica de una hoja Excel,
     # ajustando la fila si se indica que hay un encabezado.
+    # La hoja se sirve desde la caché de libros por columnas, con un mapa encabezado -> índice (consultas O(1)).
     # Integra pruebas de rendimiento para medir el tiempo de lectura de la celda.
+    @accion_instrumentada(en_error=None)
     def dato_Columna_excel(self, archivo_excel_path: str, hoja: str, numero_fila_logica: int, nombre_o_indice_columna: Union[str, int], has_header_excel: bool = False, nombre_paso: str = "") -> Union[str, int, float, None]:
         """
         Obtiene el valor de una celda específica de una hoja de un archivo Excel.
@@ -7974,6 +4704,8 @@ class Funciones_Globales:
         Permite especificar la columna por su nombre (si hay encabezado) o por su índice numérico.
         Esta función mide el tiempo que tarda en cargar el archivo, ubicar la columna/fila,
         y extraer el dato, lo cual es útil para identificar cuellos de botella en la lectura de datos.
+        El archivo solo se lee la primera vez que se consulta la hoja (modo solo lectura y valores calculados
+        de las fórmulas); las consultas siguientes se sirven desde la caché de libros del proceso.
 
         Args:
             archivo_excel_path (str): La **ruta completa al archivo Excel** (`.xlsx` o `.xlsm`).
@@ -7996,107 +4728,66 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando obtener dato de la celda (Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna}) de la hoja '{hoja}' en el archivo '{archivo_excel_path}' (tiene encabezado: {has_header_excel}). ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-        cell_value: Any = None # Inicializamos el valor de la celda
-
-        try:
-            # --- Medición de rendimiento: Carga del Workbook y selección de hoja ---
-            start_time_load_workbook = time.time()
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
-            workbook = openpyxl.load_workbook(archivo_excel_path)
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
-            sheet = workbook[hoja]
-            end_time_load_workbook = time.time()
-            duration_load_workbook = end_time_load_workbook - start_time_load_workbook
-            self.logger.info(f"PERFORMANCE: Tiempo de carga del workbook y selección de hoja: {duration_load_workbook:.4f} segundos.")
-
-            # 1. Determinar el índice físico de la columna
-            col_index: int = -1
-            if isinstance(nombre_o_indice_columna, str):
-                # --- Medición de rendimiento: Búsqueda de columna por nombre ---
-                start_time_find_column = time.time()
-                self.logger.info(f"\n🔎 Buscando columna por nombre: '{nombre_o_indice_columna}' en el encabezado de la hoja '{hoja}'...")
-                header_found = False
-                # sheet[1] se refiere a la primera fila física del Excel
-                for col_idx, cell in enumerate(sheet[1], 1):
-                    if cell.value is not None and str(cell.value).strip().lower() == nombre_o_indice_columna.strip().lower():
-                        col_index = col_idx
-                        header_found = True
-                        break
-                end_time_find_column = time.time()
-                duration_find_column = end_time_find_column - start_time_find_column
-                self.logger.info(f"PERFORMANCE: Tiempo de búsqueda de columna por nombre: {duration_find_column:.4f} segundos.")
-
-                if not header_found:
-                    self.logger.error(f"\n❌ Error: La columna '{nombre_o_indice_columna}' no fue encontrada en el encabezado de la hoja '{hoja}'.")
-                    return None
-            elif isinstance(nombre_o_indice_columna, int):
-                col_index = nombre_o_indice_columna
-            else:
-                self.logger.error(f"\n❌ Error: El parámetro 'nombre_o_indice_columna' debe ser un string (nombre) o un entero (índice). Se recibió: '{nombre_o_indice_columna}' ({type(nombre_o_indice_columna).__name__}).")
-                return None
-
-            # Validar que el índice de columna sea válido
-            if not (1 <= col_index <= sheet.max_column):
-                self.logger.error(f"\n❌ Error: Índice de columna '{col_index}' fuera de rango para la hoja '{hoja}' (máximo: {sheet.max_column}).")
+        # Si el archivo o la hoja no existen (FileNotFoundError, KeyError) o la lectura falla,
+        # el decorador registra el error y devuelve None.
+        self.logger.info(f"\n⏳ Obteniendo la hoja '{hoja}' del libro de trabajo Excel: '{archivo_excel_path}'...")
+        with self._medir("dato_Columna_excel.load_workbook", "carga del workbook y selección de hoja"):
+            tabla, desde_cache = obtener_cache_libros().obtener_hoja(archivo_excel_path, hoja) # Lee la hoja o la sirve desde la caché
+        self.metricas.incrementar("excel_cache.aciertos" if desde_cache else "excel_cache.fallos")
+        self.logger.info(f"\n✅ Hoja '{hoja}' {'servida desde la caché' if desde_cache else 'cargada'}.")
+
+        # 1. Determinar el índice físico de la columna
+        col_index: int = -1
+        if isinstance(nombre_o_indice_columna, str):
+            self.logger.info(f"\n🔎 Buscando columna por nombre: '{nombre_o_indice_columna}' en el encabezado de la hoja '{hoja}'...")
+            with self._medir("dato_Columna_excel.find_column", "búsqueda de columna por nombre"):
+                # Mapa del encabezado (primera fila física del Excel) a su índice de columna
+                indice_encontrado = tabla.indice_columna(nombre_o_indice_columna)
+
+            if indice_encontrado is None:
+                self.logger.error(f"\n❌ Error: La columna '{nombre_o_indice_columna}' no fue encontrada en el encabezado de la hoja '{hoja}'.")
                 return None
+            col_index = indice_encontrado
+        elif isinstance(nombre_o_indice_columna, int):
+            col_index = nombre_o_indice_columna
+        else:
+            self.logger.error(f"\n❌ Error: El parámetro 'nombre_o_indice_columna' debe ser un string (nombre) o un entero (índice). Se recibió: '{nombre_o_indice_columna}' ({type(nombre_o_indice_columna).__name__}).")
+            return None
 
-            # 2. Determinar el índice físico de la fila
-            # 'numero_fila_logica' es la fila de datos que el usuario piensa (1 para la primera fila de datos).
-            # Si hay encabezado, la primera fila de datos (lógica 1) está en la fila física 2.
-            # Por lo tanto, sumamos 1 si hay encabezado.
-            actual_fila_fisica = numero_fila_logica + 1 if has_header_excel else numero_fila_logica
+        # Validar que el índice de columna sea válido
+        if not (1 <= col_index <= tabla.num_columnas):
+            self.logger.error(f"\n❌ Error: Índice de columna '{col_index}' fuera de rango para la hoja '{hoja}' (máximo: {tabla.num_columnas}).")
+            return None
 
-            # Validar que la fila física sea válida
-            if not (1 <= actual_fila_fisica <= sheet.max_row):
-                self.logger.warning(f"\n⚠️ Advertencia: La fila física {actual_fila_fisica} (lógica: {numero_fila_logica}) está fuera del rango de filas de la hoja '{hoja}' (máximo: {sheet.max_row}). Retornando None.")
-                return None
-            
-            self.logger.info(f"\n🔎 Intentando obtener el dato de la celda (Fila lógica: {numero_fila_logica}, Fila física: {actual_fila_fisica}, Columna: {nombre_o_indice_columna}) de la hoja '{hoja}'.")
-            
-            # --- Medición de rendimiento: Lectura de la celda ---
-            start_time_read_cell = time.time()
-            cell_value = sheet.cell(row=actual_fila_fisica, column=col_index).value
-            end_time_read_cell = time.time()
-            duration_read_cell = end_time_read_cell - start_time_read_cell
-            self.logger.info(f"PERFORMANCE: Tiempo de lectura de la celda: {duration_read_cell:.4f} segundos.")
-            
-            # Convertir a string para asegurar que 'rellenar_campo_de_texto' u otras funciones siempre reciban un str
-            if cell_value is not None:
-                valor_retorno = str(cell_value)
-                self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna}) en '{hoja}': '{valor_retorno}'.")
-                return valor_retorno
-            else:
-                self.logger.warning(f"\n⚠️ La celda en Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna} en '{hoja}' está vacía. Retornando None.")
-                return None
+        # 2. Determinar el índice físico de la fila
+        # 'numero_fila_logica' es la fila de datos que el usuario piensa (1 para la primera fila de datos).
+        # Si hay encabezado, la primera fila de datos (lógica 1) está en la fila física 2.
+        # Por lo tanto, sumamos 1 si hay encabezado.
+        actual_fila_fisica = numero_fila_logica + 1 if has_header_excel else numero_fila_logica
 
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo Excel no se encontró en la ruta: '{archivo_excel_path}'."
-            self.logger.critical(error_msg)
-            return None
-        except KeyError:
-            error_msg = f"\n❌ FALLO (Hoja no encontrada): La hoja '{hoja}' no se encontró en el archivo Excel: '{archivo_excel_path}'."
-            self.logger.critical(error_msg)
+        # Validar que la fila física sea válida
+        if not (1 <= actual_fila_fisica <= tabla.num_filas):
+            self.logger.warning(f"\n⚠️ Advertencia: La fila física {actual_fila_fisica} (lógica: {numero_fila_logica}) está fuera del rango de filas de la hoja '{hoja}' (máximo: {tabla.num_filas}). Retornando None.")
             return None
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al leer el dato del Excel.\n"
-                f"Archivo: '{archivo_excel_path}', Hoja: '{hoja}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace
+
+        self.logger.info(f"\n🔎 Intentando obtener el dato de la celda (Fila lógica: {numero_fila_logica}, Fila física: {actual_fila_fisica}, Columna: {nombre_o_indice_columna}) de la hoja '{hoja}'.")
+
+        with self._medir("dato_Columna_excel.read_cell", "lectura de la celda"):
+            cell_value = tabla.celda(actual_fila_fisica, col_index)
+
+        # Convertir a string para asegurar que 'rellenar_campo_de_texto' u otras funciones siempre reciban un str
+        if cell_value is not None:
+            valor_retorno = str(cell_value)
+            self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna}) en '{hoja}': '{valor_retorno}'.")
+            return valor_retorno
+        else:
+            self.logger.warning(f"\n⚠️ La celda en Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna} en '{hoja}' está vacía. Retornando None.")
             return None
-        finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (dato_Columna_excel): {duration_total_operation:.4f} segundos.")
-            # Aunque openpyxl maneja la liberación de recursos, un log final es útil.
-            self.logger.debug("\nFinalizada la operación de lectura de dato de Excel.")
     
     # 61- Función que detecta y devuelve el número total de filas ocupadas en una hoja específica de un archivo CSV.
+    # El conteo sale del índice de filas del CSV (utils/csv_index.py), que solo se construye la primera vez.
     # Integra pruebas de rendimiento para medir el tiempo de lectura del archivo CSV.
+    @accion_instrumentada(en_error=0)
     def num_Filas_csv(self, archivo_csv_path: str, delimiter: str = ',', has_header: bool = False, nombre_paso: str = "") -> int:
         """
         Detecta y devuelve el número total de filas de datos en un archivo CSV.
@@ -8104,6 +4795,8 @@ class Funciones_Globales:
         Esta función mide el tiempo que tarda en abrir el archivo CSV, leer todas sus filas
         y realizar el conteo, lo cual es útil para evaluar el rendimiento en escenarios
         de procesamiento de grandes volúmenes de datos CSV.
+        El archivo se recorre una sola vez para construir su índice de filas (persistido en disco
+        mientras no cambie); las llamadas siguientes devuelven el conteo del índice sin leer el CSV.
 
         Args:
             archivo_csv_path (str): La **ruta completa al archivo CSV**.
@@ -8121,68 +4814,41 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando obtener el número de filas para el archivo CSV '{archivo_csv_path}' con delimitador '{delimiter}' (tiene encabezado: {has_header}). ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-        
-        row_count = 0 # Inicializamos el contador de filas
-
-        try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{archivo_csv_path}'...")
-            with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                # Crea un objeto reader para iterar sobre las líneas del CSV, usando el delimitador especificado.
-                # 'newline=''' es crucial para evitar problemas con saltos de línea en diferentes SO.
-                # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
-                csv_reader = csv.reader(csvfile, delimiter=delimiter)
-                
-                # Cuenta todas las filas en el CSV. sum(1 for row in csv_reader) es una forma eficiente.
-                row_count = sum(1 for row in csv_reader)
-
-            self.logger.info(f"\n✅ Lectura de archivo CSV completada. Filas totales encontradas: {row_count}.")
-
-            if has_header and row_count > 0:
-                # Si tiene encabezado y el archivo no está vacío (es decir, hay al menos el encabezado)
-                num_data_rows = row_count - 1 # Resta 1 para no contar el encabezado, obteniendo solo las filas de datos
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas de datos (descontando encabezado) en el archivo CSV '{archivo_csv_path}'.")
-                return num_data_rows
-            else:
-                # Si no tiene encabezado o el archivo está vacío (row_count es 0 o 1 si solo es un encabezado sin datos)
-                num_data_rows = row_count
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas ocupadas en el archivo CSV '{archivo_csv_path}'.")
-                return num_data_rows
-
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo CSV no se encontró en la ruta: '{archivo_csv_path}'."
-            self.logger.critical(error_msg)
-            return 0
-        except csv.Error as e:
-            error_msg = f"\n❌ FALLO (Error de formato CSV): Ocurrió un error al procesar el archivo CSV '{archivo_csv_path}'.\nDetalles: {e}"
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace para errores de CSV
-            return 0
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al leer el número de filas del CSV.\n"
-                f"Archivo: '{archivo_csv_path}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace para errores inesperados
-            return 0
-        finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_csv): {duration_total_operation:.4f} segundos.")
-            self.logger.debug("\nFinalizada la operación de lectura de CSV.")
+        # Si el archivo no existe, su formato no es válido (csv.Error) o la lectura falla,
+        # el decorador registra el error y devuelve 0.
+        self.logger.info(f"\n⏳ Obteniendo el índice de filas del archivo CSV: '{archivo_csv_path}'...")
+        # El índice se construye con csv.reader (las filas con saltos de línea entre comillas cuentan una vez)
+        indice, abierto = obtener_cache_indices_csv().obtener(archivo_csv_path, delimiter)
+        self._registrar_indice_csv(indice, abierto)
+        row_count = indice.num_filas
+
+        self.logger.info(f"\n✅ Lectura de archivo CSV completada. Filas totales encontradas: {row_count}.")
+
+        if has_header and row_count > 0:
+            # Si tiene encabezado y el archivo no está vacío (es decir, hay al menos el encabezado)
+            num_data_rows = row_count - 1 # Resta 1 para no contar el encabezado, obteniendo solo las filas de datos
+            self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas de datos (descontando encabezado) en el archivo CSV '{archivo_csv_path}'.")
+            return num_data_rows
+        else:
+            # Si no tiene encabezado o el archivo está vacío (row_count es 0 o 1 si solo es un encabezado sin datos)
+            num_data_rows = row_count
+            self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas ocupadas en el archivo CSV '{archivo_csv_path}'.")
+            return num_data_rows
 
     # 62- Función que obtiene el valor de una "celda" específica de un archivo CSV,
     # ajustando la fila si se indica que hay un encabezado y recibiendo el delimitador.
+    # Solo se leen los bytes de la fila pedida, localizados con el índice de filas del CSV.
     # Integra pruebas de rendimiento para medir el tiempo de lectura de la celda.
+    @accion_instrumentada(en_error=None)
     def dato_Columna_csv(self, archivo_csv_path: str, fila_logica: int, columna_logica: int, delimiter: str = ',', has_header: bool = False, nombre_paso: str = "") -> Optional[str]:
         """
         Obtiene el valor de una "celda" específica de un archivo CSV, ajustando el índice de la fila
         si se indica que la primera fila es un encabezado. Permite especificar el delimitador del CSV.
-        Esta función mide el tiempo que tarda en cargar el archivo CSV, leer todas sus filas
+        Esta función mide el tiempo que tarda en localizar la fila en el archivo CSV
         y extraer el dato de la celda solicitada, lo cual es crucial para evaluar el rendimiento
         en escenarios de automatización basados en datos de archivos CSV.
+        El archivo no se carga en memoria: con el índice de filas (construido la primera vez y
+        persistido en disco) se leen con `mmap` solo los bytes de la fila pedida.
 
         Args:
             archivo_csv_path (str): La **ruta completa al archivo CSV**.
@@ -8203,87 +4869,57 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando obtener dato de la celda (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) del archivo CSV '{archivo_csv_path}' con delimitador '{delimiter}' (tiene encabezado: {has_header}). ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-        cell_value: Optional[str] = None # Inicializamos el valor de la celda
+        # Si el archivo no existe, su formato no es válido (csv.Error) o la lectura falla,
+        # el decorador registra el error y devuelve None.
+        # Convierte el número de fila lógica (1-basada) a un índice 0-basado para Python
+        # Si hay encabezado, la primera fila de datos (lógica 1) está en el índice físico 1 (0-basado).
+        # Por lo tanto, si has_header, fila_logica 1 -> índice 1. Sin has_header, fila_logica 1 -> índice 0.
+        actual_fila_0_indexed = fila_logica - 1
+        if has_header:
+            actual_fila_0_indexed += 1 # Ajusta si hay encabezado para saltar la fila 0
 
-        try:
-            # Convierte el número de fila lógica (1-basada) a un índice 0-basado para Python
-            # Si hay encabezado, la primera fila de datos (lógica 1) está en el índice físico 1 (0-basado).
-            # Por lo tanto, si has_header, fila_logica 1 -> índice 1. Sin has_header, fila_logica 1 -> índice 0.
-            actual_fila_0_indexed = fila_logica - 1
-            if has_header:
-                actual_fila_0_indexed += 1 # Ajusta si hay encabezado para saltar la fila 0
-
-            # Convierte el número de columna lógica (1-basada) a un índice 0-basado para Python
-            actual_col_0_indexed = columna_logica - 1
-
-            self.logger.info(f"\n🔎 Calculando índices físicos: Fila física (0-indexed): {actual_fila_0_indexed}, Columna física (0-indexed): {actual_col_0_indexed}.")
-
-            # --- Medición de rendimiento: Carga del archivo CSV y lectura de todas las filas ---
-            start_time_load_csv = time.time()
-            self.logger.info(f"\n⏳ Abriendo y leyendo todas las filas del archivo CSV: '{archivo_csv_path}'...")
-            with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                csv_reader = csv.reader(csvfile, delimiter=delimiter)
-                rows = list(csv_reader) # Lee todas las filas del CSV en una lista de listas (cada sublista es una fila)
-            end_time_load_csv = time.time()
-            duration_load_csv = end_time_load_csv - start_time_load_csv
-            self.logger.info(f"PERFORMANCE: Tiempo de carga del archivo CSV y lectura de todas las filas: {duration_load_csv:.4f} segundos.")
-            
-            self.logger.info(f"\n✅ Archivo CSV leído. Total de filas físicas encontradas: {len(rows)}.")
+        # Convierte el número de columna lógica (1-basada) a un índice 0-basado para Python
+        actual_col_0_indexed = columna_logica - 1
 
-            # Validación de límites para la fila
-            if actual_fila_0_indexed < 0 or actual_fila_0_indexed >= len(rows):
-                self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'. Total filas físicas: {len(rows)}.")
-                return None
+        self.logger.info(f"\n🔎 Calculando índices físicos: Fila física (0-indexed): {actual_fila_0_indexed}, Columna física (0-indexed): {actual_col_0_indexed}.")
 
-            # Validación de límites para la columna en la fila específica
-            if actual_col_0_indexed < 0 or actual_col_0_indexed >= len(rows[actual_fila_0_indexed]):
-                self.logger.error(f"\n❌ Error: La columna lógica {columna_logica} (física 0-indexed: {actual_col_0_indexed}) está fuera de los límites de la fila física {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}'. Total columnas en esa fila: {len(rows[actual_fila_0_indexed])}.")
-                return None
+        self.logger.info(f"\n⏳ Obteniendo el índice de filas del archivo CSV: '{archivo_csv_path}'...")
+        with self._medir("dato_Columna_csv.load_index", "obtención del índice de filas del CSV"):
+            indice, abierto = obtener_cache_indices_csv().obtener(archivo_csv_path, delimiter)
+        self._registrar_indice_csv(indice, abierto)
 
-            # Obtiene el valor de la celda especificada
-            cell_value = rows[actual_fila_0_indexed][actual_col_0_indexed]
-            
-            self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) en '{archivo_csv_path}': '{cell_value}'.")
-            return cell_value
-        
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo CSV no se encontró en la ruta: '{archivo_csv_path}'."
-            self.logger.critical(error_msg)
-            return None
-        except ValueError:
-            # Esto ocurriría si fila_logica o columna_logica no fueran enteros,
-            # pero los type hints ya lo previenen. Se mantiene por robustez.
-            error_msg = f"\n❌ FALLO (Valor inválido): Los parámetros 'fila_logica' y 'columna_logica' deben ser números enteros. Se recibieron: fila='{fila_logica}', columna='{columna_logica}'."
-            self.logger.critical(error_msg)
-            return None
-        except csv.Error as e:
-            error_msg = f"\n❌ FALLO (Error de formato CSV): Ocurrió un error al procesar el archivo CSV '{archivo_csv_path}'.\nDetalles: {e}"
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace
+        self.logger.info(f"\n✅ Índice del archivo CSV disponible. Total de filas físicas encontradas: {indice.num_filas}.")
+
+        # Validación de límites para la fila
+        if actual_fila_0_indexed < 0 or actual_fila_0_indexed >= indice.num_filas:
+            self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'. Total filas físicas: {indice.num_filas}.")
             return None
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al leer el dato de la columna del CSV.\n"
-                f"Archivo: '{archivo_csv_path}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace
+
+        # Lectura de la fila (solo sus bytes, con mmap)
+        with self._medir("dato_Columna_csv.read_row", "lectura de la fila"):
+            row = indice.fila(actual_fila_0_indexed)
+
+        # Validación de límites para la columna en la fila específica
+        if actual_col_0_indexed < 0 or actual_col_0_indexed >= len(row):
+            self.logger.error(f"\n❌ Error: La columna lógica {columna_logica} (física 0-indexed: {actual_col_0_indexed}) está fuera de los límites de la fila física {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}'. Total columnas en esa fila: {len(row)}.")
             return None
-        finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (dato_Columna_csv): {duration_total_operation:.4f} segundos.")
-            self.logger.debug("\nFinalizada la operación de lectura de dato de CSV.")
+
+        # Obtiene el valor de la celda especificada
+        cell_value = row[actual_col_0_indexed]
+
+        self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) en '{archivo_csv_path}': '{cell_value}'.")
+        return cell_value
     
     # 63- Función que lee y parsea un archivo JSON, devolviendo su contenido.
     # Integra pruebas de rendimiento para medir el tiempo que tarda en leer y parsear el JSON.
+    @accion_instrumentada(en_error=None)
     def leer_json(self, json_file_path: str, nombre_paso: str = "") -> Union[Dict, List, None]:
         """
         Lee y parsea un archivo JSON, devolviendo su contenido como un diccionario o lista de Python.
         Esta función mide el tiempo que tarda en abrir, leer y parsear el archivo JSON,
         lo cual es útil para evaluar el rendimiento en escenarios de automatización impulsados por datos.
+        Todo el contenido queda en memoria: para arrays grandes de registros, 'iterar_json' los recorre
+        uno a uno con memoria acotada y 'leer_json_columnar' los guarda en forma compacta para la sesión.
 
         Args:
             json_file_path (str): La **ruta completa al archivo JSON**.
@@ -8297,46 +4933,20 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo JSON: '{json_file_path}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        data_content: Union[Dict, List, None] = None # Inicializamos a None
-
-        try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo JSON: '{json_file_path}'...")
-            with open(json_file_path, 'r', encoding='utf-8') as file:
-                # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
-                data_content = json.load(file) # Carga (parsea) el contenido del archivo JSON
-            
-            self.logger.info(f"\n✅ Archivo JSON '{json_file_path}' leído y parseado exitosamente.")
-            return data_content
+        # Si el archivo no existe, no es un JSON válido (json.JSONDecodeError) o la lectura falla,
+        # el decorador registra el error y devuelve None.
+        self.logger.info(f"\n⏳ Abriendo y leyendo el archivo JSON: '{json_file_path}'...")
+        with open(json_file_path, 'r', encoding='utf-8') as file:
+            # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
+            data_content = json.load(file) # Carga (parsea) el contenido del archivo JSON
 
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo JSON no se encontró en la ruta: '{json_file_path}'."
-            self.logger.critical(error_msg)
-            return None
-        except json.JSONDecodeError as e:
-            error_msg = f"\n❌ FALLO (Error de formato JSON): Error al decodificar JSON desde '{json_file_path}'.\nDetalles: {e}"
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores de decodificación JSON
-            return None
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al leer el archivo JSON.\n"
-                f"Archivo: '{json_file_path}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores inesperados
-            return None
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_json): {duration_total_operation:.4f} segundos.")
-            self.logger.debug("\nOperación de lectura de archivo JSON finalizada.")
+        self.logger.info(f"\n✅ Archivo JSON '{json_file_path}' leído y parseado exitosamente.")
+        return data_content
         
     # 64- Función que lee el contenido completo de un archivo de texto plano.
     # Si se proporciona un delimitador, divide el contenido del archivo por el delimitador.
     # Integra pruebas de rendimiento para medir el tiempo de lectura y procesamiento del archivo.
+    @accion_instrumentada(en_error=None)
     def leer_texto(self, file_path: str, delimiter: Optional[str] = None, nombre_paso: str = "") -> Union[str, List[str], None]:
         """
         Lee el contenido completo de un archivo de texto plano.
@@ -8362,159 +4972,109 @@ class Funciones_Globales:
         delimiter_log_info = f"'{delimiter}'" if delimiter is not None else "Ninguno"
         self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo de texto: '{file_path}' (Delimitador: {delimiter_log_info}). ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        content: Optional[str] = None # Inicializamos content
+        # Si el archivo no existe o falla la lectura (IOError, UnicodeDecodeError...),
+        # el decorador registra el error y devuelve None.
+        self.logger.info(f"\n⏳ Abriendo y leyendo el archivo de texto: '{file_path}'...")
+        with open(file_path, 'r', encoding='utf-8') as file:
+            # 'encoding='utf-8'' es crucial para manejar correctamente una amplia gama de caracteres.
+            content = file.read() # Lee todo el contenido del archivo
 
-        try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo de texto: '{file_path}'...")
-            with open(file_path, 'r', encoding='utf-8') as file:
-                # 'encoding='utf-8'' es crucial para manejar correctamente una amplia gama de caracteres.
-                content = file.read() # Lee todo el contenido del archivo
-            
-            self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído exitosamente.")
+        self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído exitosamente.")
 
-            if delimiter is not None:
-                # --- Medición de rendimiento: División del contenido (si aplica) ---
-                start_time_split = time.time()
-                self.logger.info(f"\n🔎 Dividiendo el contenido por el delimitador: '{delimiter}'...")
+        if delimiter is not None:
+            self.logger.info(f"\n🔎 Dividiendo el contenido por el delimitador: '{delimiter}'...")
+            with self._medir("leer_texto.split", "división del contenido"):
                 result = content.split(delimiter) # Divide el contenido por el delimitador y lo retorna como lista
-                end_time_split = time.time()
-                duration_split = end_time_split - start_time_split
-                self.logger.info(f"PERFORMANCE: Tiempo de división del contenido: {duration_split:.4f} segundos.")
-                self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído y dividido exitosamente. Se encontraron {len(result)} segmentos.")
-                return result
-            else:
-                self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído completamente como una sola cadena.")
-                return content
-            
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo de texto no se encontró en la ruta: '{file_path}'."
-            self.logger.critical(error_msg)
-            return None
-        except IOError as e:
-            error_msg = f"\n❌ FALLO (Error de E/S): Ocurrió un error de entrada/salida al leer el archivo de texto '{file_path}'.\nDetalles: {e}"
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo
-            return None
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al leer el archivo de texto.\n"
-                f"Archivo: '{file_path}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo
-            return None
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_texto): {duration_total_operation:.4f} segundos.")
-            self.logger.debug("\nOperación de lectura de archivo de texto finalizada.")
+            self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído y dividido exitosamente. Se encontraron {len(result)} segmentos.")
+            return result
+        else:
+            self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído completamente como una sola cadena.")
+            return content
 
     # 65- Función que escribe contenido en un archivo de texto plano.
-    # Si el contenido es una lista de cadenas y se proporciona un delimitador,
-    # las cadenas se unirán con el delimitador antes de escribirlas.
-    # Integra pruebas de rendimiento para medir el tiempo de preparación y escritura del archivo.
-    def escribir_texto(self, file_path: str, content: Union[str, List[str]], append: bool = False, delimiter: Optional[str] = None, nombre_paso: str = "") -> bool:
-        """
-        Escribe contenido en un archivo de texto plano. Si el contenido es una lista de cadenas
-        y se proporciona un delimitador, las cadenas se unirán con el delimitador antes de escribirlas.
-        Esta función mide el tiempo de preparación del contenido y la escritura en el archivo,
+    # Si el contenido es una lista (o cualquier iterable/generador) de cadenas y se proporciona un delimitador,
+    # las cadenas se separan con el delimitador; se escriben por bloques, sin unir todo el contenido en memoria.
+    # Integra pruebas de rendimiento para medir el tiempo de escritura del archivo.
+    @accion_instrumentada(en_error=False)
+    def escribir_texto(self, file_path: str, content: Union[str, Iterable[str]], append: bool = False, delimiter: Optional[str] = None, nombre_paso: str = "", atomico: bool = False, comprimir: bool = False) -> bool:
+        """
+        Escribe contenido en un archivo de texto plano. Si el contenido es una lista, un iterable o un generador
+        de cadenas y se proporciona un delimitador, las cadenas se separan con el delimitador.
+        Las cadenas se acumulan y escriben en bloques de tamaño fijo (`config.ESCRITURA_TAMANO_BLOQUE`
+        caracteres) en lugar de unirse todas con `join` antes de una única escritura, así que un generador
+        de líneas se escribe con memoria acotada, sea cual sea el tamaño del archivo.
+        Esta función mide el tiempo de escritura en el archivo,
         lo cual es útil para evaluar el rendimiento de las operaciones de E/S.
 
         Args:
             file_path (str): La **ruta completa al archivo de texto**.
-            content (Union[str, List[str]]): La cadena o lista de cadenas a escribir.
+            content (Union[str, Iterable[str]]): La cadena, o la lista/iterable/generador de cadenas, a escribir.
             append (bool, opcional): Si es `True`, el contenido se añadirá al final del archivo.
                                      Si es `False` (por defecto), el archivo se sobrescribirá si existe.
-            delimiter (str, opcional): Si se proporciona y `content` es una lista de cadenas, las cadenas
-                                       se unirán con este delimitador antes de la escritura. Si es `None`,
-                                       las cadenas de una lista se escribirán directamente sin separación explícita.
+            delimiter (str, opcional): Si se proporciona y `content` es una lista o iterable de cadenas, las cadenas
+                                       se separarán con este delimitador (no se añade tras la última). Si es `None`,
+                                       las cadenas se escribirán directamente sin separación explícita.
                                        Por defecto es `None`.
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
                                          Por defecto es una cadena vacía "".
+            atomico (bool, opcional): Si es `True`, se escribe en un archivo temporal que reemplaza al destino solo
+                                      al terminar: nunca queda un archivo a medio escribir y, si falla, el destino
+                                      queda como estaba. Por defecto es `False`.
+            comprimir (bool, opcional): Si es `True`, el contenido se comprime con gzip (p. ej. para 'resultados.txt.gz').
+                                        Por defecto es `False`.
 
         Returns:
             bool: `True` si la escritura fue exitosa, `False` en caso de error.
         """
-        mode = 'a' if append else 'w' # Determina el modo de apertura: 'a' para añadir, 'w' para sobrescribir
         action = "añadir a" if append else "escribir en" # Descripción de la acción para el log
-        
-        delimiter_log_info = f"'{delimiter}'" if delimiter is not None else "Ninguno"
-        self.logger.info(f"\n--- {nombre_paso}: Intentando {action} el archivo de texto: '{file_path}' (Delimitador de escritura: {delimiter_log_info}). ---")
-
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        text_to_write: str = "" # Variable para almacenar el contenido final a escribir
-
-        try:
-            # Lógica para procesar el contenido antes de la escritura
-            if isinstance(content, list):
-                # --- Medición de rendimiento: Unión de la lista con el delimitador ---
-                start_time_join = time.time()
-                
-                if delimiter is not None:
-                    text_to_write = delimiter.join(content)
-                    self.logger.info(f"\n🔎 El contenido de la lista será unido con el delimitador '{delimiter}' antes de escribir.")
-                else:
-                    text_to_write = "".join(content)
-                    self.logger.warning("\n⚠️ Se proporcionó una lista para escribir_texto sin delimitador. Las cadenas se concatenarán sin separación explícita, lo que puede no ser el comportamiento deseado.")
-                
-                end_time_join = time.time()
-                duration_join = end_time_join - start_time_join
-                self.logger.info(f"PERFORMANCE: Tiempo de preparación del contenido (join): {duration_join:.4f} segundos.")
 
-            elif isinstance(content, str):
-                text_to_write = content # Si el contenido ya es una cadena, lo asigna tal cual
-                self.logger.info("\n🔎 El contenido es una cadena, se escribirá directamente.")
-            else:
-                error_msg = f"\n❌ FALLO (Tipo de dato inválido): El tipo de contenido proporcionado no es válido. Se esperaba str o List[str], se recibió: {type(content)}."
-                self.logger.critical(error_msg)
-                return False
-
-            # Asegurarse de que el directorio del archivo exista antes de intentar escribir
-            directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory, exist_ok=True) # `exist_ok=True` evita errores si el directorio ya existe
-                self.logger.info(f"\n☑️ Directorio creado para el archivo de texto: {directory}")
-
-            # --- Medición de rendimiento: Escritura en el archivo ---
-            self.logger.info(f"\n✍️ Escribiendo contenido en el archivo: '{file_path}'...")
-            with open(file_path, mode, encoding='utf-8') as file:
-                # `encoding='utf-8'` es crucial para manejar correctamente una amplia gama de caracteres
-                file.write(text_to_write)
-            
-            self.logger.info(f"\n✅ Contenido {action} exitosamente en '{file_path}'.")
-            return True
-        
-        except IOError as e:
-            error_msg = f"\n❌ FALLO (Error de E/S): Ocurrió un error de entrada/salida al {action} el archivo de texto '{file_path}'.\nDetalles: {e}"
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo
-            return False
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al {action} el archivo de texto.\n"
-                f"Archivo: '{file_path}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo
+        delimiter_log_info = f"'{delimiter}'" if delimiter is not None else "Ninguno"
+        opciones_log_info = ", ".join(opcion for opcion, activa in (("atómica", atomico), ("gzip", comprimir)) if activa) or "ninguna"
+        self.logger.info(f"\n--- {nombre_paso}: Intentando {action} el archivo de texto: '{file_path}' (Delimitador de escritura: {delimiter_log_info}; opciones: {opciones_log_info}). ---")
+
+        # Lógica para validar el contenido antes de la escritura
+        if isinstance(content, str):
+            partes: Iterable[str] = (content,) # Si el contenido ya es una cadena, se escribe tal cual
+            self.logger.info("\n🔎 El contenido es una cadena, se escribirá directamente.")
+        elif isinstance(content, (bytes, bytearray, dict)) or not hasattr(content, "__iter__"):
+            error_msg = f"\n❌ FALLO (Tipo de dato inválido): El tipo de contenido proporcionado no es válido. Se esperaba str o un iterable de str, se recibió: {type(content)}."
+            self.logger.critical(error_msg)
             return False
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (escribir_texto): {duration_total_operation:.4f} segundos.")
-            self.logger.debug("\nOperación de escritura de archivo de texto finalizada.")
+        else:
+            partes = content
+            if delimiter is not None:
+                self.logger.info(f"\n🔎 Las cadenas del contenido se separarán con el delimitador '{delimiter}' y se escribirán por bloques.")
+            else:
+                self.logger.warning("\n⚠️ Se proporcionó una lista (o iterable) para escribir_texto sin delimitador. Las cadenas se concatenarán sin separación explícita, lo que puede no ser el comportamiento deseado.")
+
+        # Si falla la creación del directorio o la escritura (IOError, una parte que no es str...),
+        # el decorador registra el error y devuelve False.
+        # Asegurarse de que el directorio del archivo exista antes de intentar escribir
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True) # `exist_ok=True` evita errores si el directorio ya existe
+            self.logger.info(f"\n☑️ Directorio creado para el archivo de texto: {directory}")
+
+        self.logger.info(f"\n✍️ Escribiendo contenido en el archivo: '{file_path}'...")
+        with self._medir("escribir_texto.write", "escritura en el archivo"):
+            # La codificación UTF-8 es crucial para manejar correctamente una amplia gama de caracteres
+            caracteres, bloques = escribir_por_bloques(file_path, partes, delimiter, append=append, atomico=atomico,
+                                                       comprimir=comprimir, tamano_bloque=config.ESCRITURA_TAMANO_BLOQUE)
+        self.metricas.incrementar("escribir_texto.bloques", bloques)
+
+        self.logger.info(f"\n✅ Contenido {action} exitosamente en '{file_path}' ({caracteres} caracteres en {bloques} bloques).")
+        return True
     
     # 66- Función para leer archivos XML.
     # Integra pruebas de rendimiento para medir el tiempo que tarda en leer y parsear el XML.
+    @accion_instrumentada(en_error=None)
     def leer_xml(self, xml_file_path: str, nombre_paso: str = "") -> Union[ET.Element, None]:
         """
         Lee y parsea un archivo XML, devolviendo su elemento raíz como un objeto Element.
         Esta función mide el tiempo que tarda en abrir, leer y parsear el archivo XML,
         lo cual es útil para evaluar el rendimiento en escenarios donde se procesan archivos XML.
+        El árbol completo queda en memoria: para archivos grandes con muchos registros repetidos,
+        'iterar_registros_xml' los recorre en streaming con memoria constante.
 
         Args:
             xml_file_path (str): La **ruta completa al archivo XML**.
@@ -8528,50 +5088,24 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo XML: '{xml_file_path}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        root_element: Optional[ET.Element] = None # Inicializamos el elemento raíz
+        # Si el archivo no existe, no es un XML válido (ET.ParseError) o la lectura falla,
+        # el decorador registra el error y devuelve None.
+        self.logger.info(f"\n⏳ Abriendo y parseando el archivo XML: '{xml_file_path}'...")
+        # ET.parse() se encarga de abrir y parsear el archivo.
+        # No es necesario especificar la codificación en la mayoría de los casos ya que
+        # ET lo detecta automáticamente si el XML tiene una declaración de codificación (e.g., <?xml version="1.0" encoding="UTF-8"?>).
+        tree = ET.parse(xml_file_path)
 
-        try:
-            self.logger.info(f"\n⏳ Abriendo y parseando el archivo XML: '{xml_file_path}'...")
-            # ET.parse() se encarga de abrir y parsear el archivo.
-            # No es necesario especificar la codificación en la mayoría de los casos ya que
-            # ET lo detecta automáticamente si el XML tiene una declaración de codificación (e.g., <?xml version="1.0" encoding="UTF-8"?>).
-            tree = ET.parse(xml_file_path)
-            
-            # Obtiene el elemento raíz del XML
-            root_element = tree.getroot()
-            
-            self.logger.info(f"\n✅ Archivo XML '{xml_file_path}' leído y parseado exitosamente. Elemento raíz: '{root_element.tag}'.")
-            return root_element
+        # Obtiene el elemento raíz del XML
+        root_element = tree.getroot()
 
-        except FileNotFoundError:
-            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo XML no se encontró en la ruta: '{xml_file_path}'."
-            self.logger.critical(error_msg)
-            return None
-        except ET.ParseError as e:
-            error_msg = f"\n❌ FALLO (Error de formato XML): Ocurrió un error al parsear el archivo XML '{xml_file_path}'.\nDetalles: {e}"
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores de parseo XML
-            return None
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al leer el archivo XML.\n"
-                f"Archivo: '{xml_file_path}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores inesperados
-            return None
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_xml): {duration_total_operation:.4f} segundos.")
-            self.logger.debug("\nOperación de lectura de archivo XML finalizada.")
+        self.logger.info(f"\n✅ Archivo XML '{xml_file_path}' leído y parseado exitosamente. Elemento raíz: '{root_element.tag}'.")
+        return root_element
     
     # 67- Función que realiza una acción de click derecho (context click) sobre un elemento.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
     # Esta versión asume que la clase base de errores de Playwright se importa como 'Error' sin alias.
+    @accion_instrumentada
     def hacer_click_derecho_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_click: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de click derecho (context click) sobre un elemento en la página.
@@ -8599,93 +5133,38 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando hacer click derecho sobre el elemento con selector: '{selector}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-
         try:
+            # Si falla la interacción, el decorador registra el error, toma la captura y lo relanza tal cual.
             # Asegurarse de que el directorio de capturas de pantalla exista
             if not os.path.exists(directorio):
                 os.makedirs(directorio, exist_ok=True)
                 self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                locator = self.page.locator(selector)
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
-
-            # Resaltar el elemento antes de la interacción (útil para la depuración visual)
-            # locator.highlight() 
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
             # Tomar captura de pantalla antes del click derecho
             self.tomar_captura(f"{nombre_base}_antes_click_derecho", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada antes del click derecho: '{nombre_base}_antes_click_derecho.png'")
 
-            # --- Medición de rendimiento: Tiempo de ejecución del click derecho ---
-            start_time_click = time.time()
-            # El atributo 'button="right"' es clave para el click derecho (context click)
-            # Playwright espera implícitamente que el elemento esté visible y habilitado.
-            locator.click(button="right") 
-            end_time_click = time.time()
-            duration_click = end_time_click - start_time_click
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución del click derecho en '{selector}': {duration_click:.4f} segundos.")
+            with self._medir("hacer_click_derecho_en_elemento.click", f"ejecución del click derecho en '{selector}'"):
+                # El atributo 'button="right"' es clave para el click derecho (context click)
+                # Playwright espera implícitamente que el elemento esté visible y habilitado.
+                locator.click(button="right")
 
             self.logger.info(f"\n✔ ÉXITO: Click derecho realizado exitosamente en el elemento con selector '{selector}'.")
-            
+
             # Tomar captura de pantalla después del click derecho
             self.tomar_captura(f"{nombre_base}_despues_click_derecho", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada después del click derecho: '{nombre_base}_despues_click_derecho.png'")
-
-        except TimeoutError as e:
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El tiempo de espera se agotó al hacer click derecho en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado a tiempo ({e.message if hasattr(e, 'message') else str(e)}).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_click_derecho", directorio)
-            # Re-lanzamos la excepción TimeoutError que ya es específica de Playwright
-            raise 
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Ocurrió un problema de Playwright al hacer click derecho en '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_click_derecho", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Se produjo un error desconocido al intentar hacer click derecho en '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_click_derecho", directorio)
-            raise # Re-lanza la excepción
-
         finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_click_derecho_en_elemento): {duration_total_operation:.4f} segundos.")
-            
             # Espera fija después de la interacción, si se especificó
-            # Nota: el parámetro de entrada 'tiempo' se ha renombrado a 'tiempo_espera_post_click' para mayor claridad.
             if tiempo_espera_post_click > 0:
                 self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_click} segundos después del click derecho.")
-                self.esperar_fijo(tiempo_espera_post_click) # Asegúrate de que esta función exista
+                self.esperar_fijo(tiempo_espera_post_click)
     
     # 68- Función que realiza una acción de 'mouse down' (presionar el botón del ratón) sobre un elemento.
     # Esta versión utiliza page.mouse.down() para una simulación más precisa de solo presionar.
+    @accion_instrumentada
     def hacer_mouse_down_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'mouse down' (presionar el botón izquierdo del ratón) sobre el centro de un elemento.
@@ -8714,104 +5193,48 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'mouse down' sobre el elemento con selector: '{selector}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-        element_bounding_box: Optional[Dict[str, Any]] = None # Para almacenar las coordenadas del elemento
-
         try:
+            # Si falla la interacción, el decorador registra el error, toma la captura y lo relanza tal cual.
             # Asegurarse de que el directorio de capturas de pantalla exista
             if not os.path.exists(directorio):
                 os.makedirs(directorio, exist_ok=True)
                 self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                locator = self.page.locator(selector)
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-
-            # Asegurarse de que el elemento esté visible y obtener su bounding box
-            # Playwright ya espera visibilidad/habilitación con locator.wait_for() o actionability checks.
-            # Pero para obtener el bounding_box, el elemento debe estar en el DOM y visible.
-            element_bounding_box = locator.bounding_box()
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
+            with self._medir("hacer_mouse_down_en_elemento.locator", f"localización y obtención de coordenadas para '{selector}'"):
+                # Para obtener el bounding_box, el elemento debe estar en el DOM y visible.
+                element_bounding_box = locator.bounding_box()
             if not element_bounding_box:
                 raise Error(f"\nNo se pudo obtener el bounding box del elemento '{selector}'. Es posible que no sea visible o no esté adjunto al DOM.")
-            
+
             # Calcular el centro del elemento
             center_x = element_bounding_box['x'] + element_bounding_box['width'] / 2
             center_y = element_bounding_box['y'] + element_bounding_box['height'] / 2
-
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización y obtención de coordenadas para '{selector}': {duration_locator:.4f} segundos. Coordenadas: ({center_x:.2f}, {center_y:.2f})")
-
-            # Resaltar el elemento antes de la interacción (útil para la depuración visual)
-            # locator.highlight() 
+            self.logger.debug(f"\n  > Coordenadas del centro de '{selector}': ({center_x:.2f}, {center_y:.2f})")
 
             # Tomar captura de pantalla antes de la acción
             self.tomar_captura(f"{nombre_base}_antes_mouse_down", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'mouse down': '{nombre_base}_antes_mouse_down.png'")
 
-            # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'mouse down' ---
-            start_time_action = time.time()
-            # Realiza la acción de 'mouse down' puro en las coordenadas del centro del elemento.
-            self.page.mouse.down(button="left", x=center_x, y=center_y) 
-            end_time_action = time.time()
-            duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'mouse down' en '{selector}': {duration_action:.4f} segundos.")
+            with self._medir("hacer_mouse_down_en_elemento.action", f"ejecución de la acción 'mouse down' en '{selector}'"):
+                # Realiza la acción de 'mouse down' puro en las coordenadas del centro del elemento.
+                self.page.mouse.down(button="left", x=center_x, y=center_y)
 
             self.logger.info(f"\n✔ ÉXITO: Acción de 'mouse down' realizada exitosamente en el elemento con selector '{selector}'.")
-            
+
             # Tomar captura de pantalla después de la acción
             self.tomar_captura(f"{nombre_base}_despues_mouse_down", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada después del 'mouse down': '{nombre_base}_despues_mouse_down.png'")
-
-        except TimeoutError as e:
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El tiempo de espera se agotó al hacer 'mouse down' en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado a tiempo para obtener coordenadas ({e.message if hasattr(e, 'message') else str(e)}).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_mouse_down", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Ocurrió un problema de Playwright al hacer 'mouse down' en '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_down", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Se produjo un error desconocido al intentar hacer 'mouse down' en '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_down", directorio)
-            raise # Re-lanza la excepción
-
         finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_mouse_down_en_elemento): {duration_total_operation:.4f} segundos.")
-            
             # Espera fija después de la interacción, si se especificó
             if tiempo_espera_post_accion > 0:
                 self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'mouse down'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.esperar_fijo(tiempo_espera_post_accion)
     
     # 69- Función que realiza una acción de 'mouse up' (soltar el botón del ratón) sobre un elemento.
     # Esta versión utiliza page.mouse.up() para una simulación precisa de solo soltar el botón.
+    @accion_instrumentada
     def hacer_mouse_up_de_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'mouse up' (soltar el botón izquierdo del ratón) sobre el centro de un elemento.
@@ -8841,103 +5264,48 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'mouse up' sobre el elemento con selector: '{selector}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-        element_bounding_box: Optional[Dict[str, Any]] = None # Para almacenar las coordenadas del elemento
-
         try:
+            # Si falla la interacción, el decorador registra el error, toma la captura y lo relanza tal cual.
             # Asegurarse de que el directorio de capturas de pantalla exista
             if not os.path.exists(directorio):
                 os.makedirs(directorio, exist_ok=True)
                 self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                locator = self.page.locator(selector)
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-
-            # Asegurarse de que el elemento esté visible y obtener su bounding box
-            # locator.bounding_box() puede esperar la visibilidad del elemento.
-            element_bounding_box = locator.bounding_box()
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
+            with self._medir("hacer_mouse_up_de_elemento.locator", f"localización y obtención de coordenadas para '{selector}'"):
+                # Para obtener el bounding_box, el elemento debe estar en el DOM y visible.
+                element_bounding_box = locator.bounding_box()
             if not element_bounding_box:
                 raise Error(f"\nNo se pudo obtener el bounding box del elemento '{selector}'. Es posible que no sea visible o no esté adjunto al DOM.")
-            
+
             # Calcular el centro del elemento
             center_x = element_bounding_box['x'] + element_bounding_box['width'] / 2
             center_y = element_bounding_box['y'] + element_bounding_box['height'] / 2
-
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización y obtención de coordenadas para '{selector}': {duration_locator:.4f} segundos. Coordenadas: ({center_x:.2f}, {center_y:.2f})")
-
-            # Resaltar el elemento antes de la interacción (útil para la depuración visual)
-            # locator.highlight() 
+            self.logger.debug(f"\n  > Coordenadas del centro de '{selector}': ({center_x:.2f}, {center_y:.2f})")
 
             # Tomar captura de pantalla antes de la acción
             self.tomar_captura(f"{nombre_base}_antes_mouse_up", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'mouse up': '{nombre_base}_antes_mouse_up.png'")
 
-            # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'mouse up' ---
-            start_time_action = time.time()
-            # Realiza la acción de 'mouse up' puro en las coordenadas del centro del elemento.
-            self.page.mouse.up(button="left", x=center_x, y=center_y) 
-            end_time_action = time.time()
-            duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'mouse up' en '{selector}': {duration_action:.4f} segundos.")
+            with self._medir("hacer_mouse_up_de_elemento.action", f"ejecución de la acción 'mouse up' en '{selector}'"):
+                # Realiza la acción de 'mouse up' puro en las coordenadas del centro del elemento.
+                self.page.mouse.up(button="left", x=center_x, y=center_y)
 
             self.logger.info(f"\n✔ ÉXITO: Acción de 'mouse up' realizada exitosamente en el elemento con selector '{selector}'.")
-            
+
             # Tomar captura de pantalla después de la acción
             self.tomar_captura(f"{nombre_base}_despues_mouse_up", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada después del 'mouse up': '{nombre_base}_despues_mouse_up.png'")
-
-        except TimeoutError as e:
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El tiempo de espera se agotó al hacer 'mouse up' en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado a tiempo para obtener coordenadas ({e.message if hasattr(e, 'message') else str(e)}).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_mouse_up", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Ocurrió un problema de Playwright al hacer 'mouse up' en '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_up", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Se produjo un error desconocido al intentar hacer 'mouse up' en '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_up", directorio)
-            raise # Re-lanza la excepción
-
         finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_mouse_up_de_elemento): {duration_total_operation:.4f} segundos.")
-            
             # Espera fija después de la interacción, si se especificó
             if tiempo_espera_post_accion > 0:
                 self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'mouse up'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.esperar_fijo(tiempo_espera_post_accion)
     
     # 70- Función que realiza una acción de 'focus' (enfocar) sobre un elemento.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
+    @accion_instrumentada
     def hacer_focus_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'focus' (establecer el foco) sobre un elemento especificado.
@@ -8968,93 +5336,38 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'focus' sobre el elemento con selector: '{selector}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-
         try:
+            # Si falla la interacción, el decorador registra el error, toma la captura y lo relanza tal cual.
             # Asegurarse de que el directorio de capturas de pantalla exista
             if not os.path.exists(directorio):
                 os.makedirs(directorio, exist_ok=True)
                 self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                locator = self.page.locator(selector)
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
-
-            # Resaltar el elemento antes de la interacción (útil para la depuración visual)
-            # locator.highlight() 
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
             # Tomar captura de pantalla antes de la acción
             self.tomar_captura(f"{nombre_base}_antes_focus", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'focus': '{nombre_base}_antes_focus.png'")
 
-            # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'focus' ---
-            start_time_action = time.time()
-            # El método focus() de Playwright establece el foco en el elemento.
-            # Playwright espera implícitamente que el elemento esté visible y habilitado antes de enfocarlo.
-            locator.focus() # Eliminado 'timeout' del focus() para usar el de Playwright por defecto o global.
-                            # Si se necesita un timeout específico para el focus, se puede volver a añadir: timeout=tiempo_espera_max_para_focus * 1000
-            end_time_action = time.time()
-            duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'focus' en '{selector}': {duration_action:.4f} segundos.")
+            with self._medir("hacer_focus_en_elemento.action", f"ejecución de la acción 'focus' en '{selector}'"):
+                # El método focus() de Playwright establece el foco en el elemento.
+                # Playwright espera implícitamente que el elemento esté visible y habilitado antes de enfocarlo.
+                locator.focus() # Usa el timeout de Playwright por defecto o global.
 
             self.logger.info(f"\n✔ ÉXITO: 'Focus' realizado exitosamente en el elemento con selector '{selector}'.")
-            
+
             # Tomar captura de pantalla después de la acción
             self.tomar_captura(f"{nombre_base}_despues_focus", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada después del 'focus': '{nombre_base}_despues_focus.png'")
-
-        except TimeoutError as e:
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El tiempo de espera se agotó al hacer 'focus' en '{selector}'.\n"
-                f"Posibles causas: El elemento no apareció, no fue visible/habilitado a tiempo ({e.message if hasattr(e, 'message') else str(e)}).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_focus", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Ocurrió un problema de Playwright al hacer 'focus' en '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_focus", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Se produjo un error desconocido al intentar hacer 'focus' en '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_focus", directorio)
-            raise # Re-lanza la excepción
-
         finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_focus_en_elemento): {duration_total_operation:.4f} segundos.")
-            
             # Espera fija después de la interacción, si se especificó
-            # Nota: el parámetro de entrada original 'tiempo' se ha renombrado a 'tiempo_espera_post_accion' para mayor claridad.
             if tiempo_espera_post_accion > 0:
                 self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'focus'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.esperar_fijo(tiempo_espera_post_accion)
     
     # 71- Función que realiza una acción de 'blur' (desenfocar) sobre un elemento.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
+    @accion_instrumentada
     def hacer_blur_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'blur' (quitar el foco) sobre un elemento que actualmente lo tiene.
@@ -9086,95 +5399,38 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'blur' sobre el elemento con selector: '{selector}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-
         try:
+            # Si falla la interacción, el decorador registra el error, toma la captura y lo relanza tal cual.
             # Asegurarse de que el directorio de capturas de pantalla exista
             if not os.path.exists(directorio):
                 os.makedirs(directorio, exist_ok=True)
                 self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                locator = self.page.locator(selector)
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-            
-            # Opcional: Podrías querer resaltar el elemento ANTES de desenfocarlo
-            # Es útil para ver cuál elemento se va a desenfocar.
-            # locator.highlight() 
-
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
             # Tomar captura de pantalla antes de la acción
             self.tomar_captura(f"{nombre_base}_antes_blur", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'blur': '{nombre_base}_antes_blur.png'")
 
-            # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'blur' ---
-            start_time_action = time.time()
-            # El método blur() de Playwright quita el foco del elemento.
-            # Playwright espera implícitamente que el elemento esté en el DOM y enfocado para poder desenfocarlo.
-            locator.blur() # Eliminado 'timeout' del blur() para usar el de Playwright por defecto o global.
-                           # Si se necesita un timeout específico para el blur, se puede volver a añadir: timeout=tiempo_espera_max_para_blur * 1000
-            end_time_action = time.time()
-            duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'blur' en '{selector}': {duration_action:.4f} segundos.")
+            with self._medir("hacer_blur_en_elemento.action", f"ejecución de la acción 'blur' en '{selector}'"):
+                # El método blur() de Playwright quita el foco del elemento.
+                # Playwright espera implícitamente que el elemento esté en el DOM y enfocado para poder desenfocarlo.
+                locator.blur() # Usa el timeout de Playwright por defecto o global.
 
             self.logger.info(f"\n✔ ÉXITO: 'Blur' realizado exitosamente en el elemento con selector '{selector}'.")
-            
+
             # Tomar captura de pantalla después de la acción
             self.tomar_captura(f"{nombre_base}_despues_blur", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada después del 'blur': '{nombre_base}_despues_blur.png'")
-
-        except TimeoutError as e:
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El tiempo de espera se agotó al hacer 'blur' en '{selector}'.\n"
-                f"Posibles causas: El elemento no estaba presente, visible o no era el elemento enfocado a tiempo ({e.message if hasattr(e, 'message') else str(e)}).\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_blur", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Ocurrió un problema de Playwright al hacer 'blur' en '{selector}'.\n"
-                f"Verifica la validez del selector y el estado del elemento en el DOM.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_blur", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Se produjo un error desconocido al intentar hacer 'blur' en '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_blur", directorio)
-            raise # Re-lanza la excepción
-
         finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_blur_en_elemento): {duration_total_operation:.4f} segundos.")
-            
             # Espera fija después de la interacción, si se especificó
-            # Nota: el parámetro de entrada original 'tiempo' se ha renombrado a 'tiempo_espera_post_accion' para mayor claridad.
             if tiempo_espera_post_accion > 0:
                 self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'blur'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.esperar_fijo(tiempo_espera_post_accion)
     
     # 72- Función que verifica el estado de un checkbox (marcado/desmarcado) o el valor de una opción seleccionada en un select.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
+    @accion_instrumentada(en_timeout=False, en_verificacion=False)
     def verificar_estado_checkbox_o_select(self, selector: Union[str, Locator], estado_esperado: Union[bool, str], nombre_base: str, directorio: str, tiempo_max_espera_verificacion: Union[int, float] = 0.5, nombre_paso: str = "") -> bool:
         """
         Verifica el estado de un checkbox (marcado/desmarcado) o el valor de una opción seleccionada en un select.
@@ -9207,148 +5463,41 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Verificando estado para el selector: '{selector}'. Estado esperado: '{estado_esperado}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-        tipo_elemento: str = "elemento" # Valor por defecto para los mensajes de error
-        valor_actual_str: str = "N/A" # Valor por defecto para los mensajes de error
-        mensaje_fallo_esperado: str = "" # Mensaje por defecto para fallos de aserción
-
-        try:
-            # Asegurarse de que el directorio de capturas de pantalla exista
-            if not os.path.exists(directorio):
-                os.makedirs(directorio, exist_ok=True)
-                self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
+        # Si el estado no es el esperado (AssertionError o timeout), el decorador lo registra, toma la captura
+        # y devuelve False; un 'estado_esperado' inválido (ValueError) y los errores de Playwright se relanzan.
+        # Asegurarse de que el directorio de capturas de pantalla exista
+        if not os.path.exists(directorio):
+            os.makedirs(directorio, exist_ok=True)
+            self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                # Usar locator().first para manejar casos donde el selector podría devolver múltiples elementos
-                # pero solo nos interesa el primero. Si el selector ya es preciso, no hay problema.
-                locator = self.page.locator(selector) 
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
-            
-            # Resaltar el elemento antes de la interacción (útil para la depuración visual)
-            # locator.highlight() 
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
-            # Tomar captura de pantalla antes de la verificación
-            self.tomar_captura(f"{nombre_base}_antes_verificar_estado", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes de verificar estado: '{nombre_base}_antes_verificar_estado.png'")
+        # Tomar captura de pantalla antes de la verificación
+        self.tomar_captura(f"{nombre_base}_antes_verificar_estado", directorio)
+        self.logger.info(f"\n📸 Captura de pantalla tomada antes de verificar estado: '{nombre_base}_antes_verificar_estado.png'")
 
-            # --- Lógica de Verificación y Medición de Aserción ---
-            start_time_assertion = time.time()
+        with self._medir("verificar_estado_checkbox_o_select.assertion", f"ejecución de la verificación (aserción) para '{selector}'"):
             if isinstance(estado_esperado, bool): # Verificación para Checkbox
                 tipo_elemento = "checkbox"
                 if estado_esperado:
                     expect(locator).to_be_checked()
                 else:
                     expect(locator).not_to_be_checked()
-                
-                valor_actual_str = str(locator.is_checked())
-                mensaje_fallo_esperado = f"se esperaba {'marcado' if estado_esperado else 'desmarcado'} pero está '{valor_actual_str}'."
-            
             elif isinstance(estado_esperado, str): # Verificación para Select (option)
                 tipo_elemento = "select/option"
                 expect(locator).to_have_value(estado_esperado)
-                
-                valor_actual_str = locator.input_value() # Obtiene el 'value' de la opción seleccionada
-                mensaje_fallo_esperado = f"se esperaba la opción con valor '{estado_esperado}' pero la actual es '{valor_actual_str}'."
-            
             else:
                 raise ValueError(f"\nEl 'estado_esperado' debe ser un booleano para checkbox o un string para select. Tipo proporcionado: {type(estado_esperado).__name__}")
 
-            end_time_assertion = time.time()
-            duration_assertion = end_time_assertion - start_time_assertion
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la verificación (aserción) para '{selector}': {duration_assertion:.4f} segundos.")
-
-            self.logger.info(f"\n✔ ÉXITO: El {tipo_elemento} '{selector}' tiene el estado esperado '{estado_esperado}'.")
-            self.tomar_captura(f"{nombre_base}_despues_verificar_estado", directorio)
-            return True
-
-        except TimeoutError as e:
-            # En caso de Timeout, intentamos obtener el valor actual para el mensaje de error.
-            # Se usa un try-except interno para evitar fallos si el locator ya no es válido después del timeout.
-            try:
-                if tipo_elemento == "checkbox":
-                    valor_actual_str = str(locator.is_checked())
-                elif tipo_elemento == "select/option":
-                    valor_actual_str = locator.input_value()
-            except Exception:
-                valor_actual_str = "No disponible (error al obtener el valor actual)"
-
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El {tipo_elemento} '{selector}' "
-                f"no cumplió el estado esperado '{estado_esperado}' después de {tiempo_max_espera_verificacion} segundos. "
-                f"Estado actual: '{valor_actual_str}'. Detalles: {e}"
-            )
-            self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_estado", directorio)
-            return False
-
-        except AssertionError as e:
-            # En caso de AssertionError (falla de expect sin timeout), el valor ya se obtiene arriba.
-            error_msg = (
-                f"\n❌ FALLO (Aserción): El {tipo_elemento} '{selector}' "
-                f"NO cumple el estado esperado. {mensaje_fallo_esperado} "
-                f"Detalles: {e}"
-            )
-            self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_verificar_estado", directorio)
-            return False
-
-        except ValueError as e:
-            error_msg = (
-                f"\n❌ ERROR (Valor Inválido): Se proporcionó un 'estado_esperado' no válido para el selector '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True) # Incluir exc_info para ValueError también
-            self.tomar_captura(f"{nombre_base}_error_valor_invalido_verificar_estado", directorio)
-            raise # Re-lanzamos el ValueError ya que es un error de uso de la función.
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Ocurrió un problema de Playwright al verificar el estado del elemento '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_estado", directorio)
-            raise # Re-lanza la excepción original de Playwright
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Se produjo un error desconocido al verificar el estado del elemento '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_estado", directorio)
-            raise # Re-lanza la excepción
-
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificar_estado_checkbox_o_select): {duration_total_operation:.4f} segundos.")
-            
-            # Espera fija después de la verificación, si se especificó.
-            # El parámetro original 'tiempo' se renombró a 'tiempo_max_espera_verificacion' para el timeout de expect.
-            # Si aún se desea una espera fija *adicional* al final, se usa el parámetro 'tiempo_espera_post_accion'
-            # que definí para otras funciones. Para esta función, la espera principal es el timeout de expect.
-            # Si el 'tiempo' original se refería a una espera fija *después* de todo, lo mantengo así.
-            # Asumiendo que el 'tiempo' original era el timeout para la verificación.
-            # Si necesitas una espera adicional después, se puede añadir un nuevo parámetro.
-            pass # No hay una espera fija aquí por defecto, ya que el timeout de expect() maneja la espera.
-                 # Si 'tiempo' original era para una pausa, el parámetro ha sido absorbido por el timeout de expect.
-                 # Si se desea una pausa *adicional* al final, se debería añadir un nuevo parámetro.
+        self.logger.info(f"\n✔ ÉXITO: El {tipo_elemento} '{selector}' tiene el estado esperado '{estado_esperado}'.")
+        self.tomar_captura(f"{nombre_base}_despues_verificar_estado", directorio)
+        return True
 
     # 73- Función para extrae y retorna el valor textual de un elemento dado su selector.
     # Esta función ahora prioriza la extracción de 'value' de campos de formulario (input_value),
     # y luego el contenido de texto visible (inner_text) o todo el texto (text_content).
     # Integra pruebas de rendimiento y captura métricas de tiempo.
+    @accion_instrumentada(envolver_en=AssertionError)
     def obtener_valor_de_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, 
                                  tiempo_max_espera_visibilidad: Union[int, float] = 5.0, nombre_paso: str = "") -> Optional[str]:
         """
@@ -9385,120 +5534,61 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Extrayendo valor del elemento con selector: '{selector}'. ---")
 
-        # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
-        
-        locator: Locator = None # Inicializamos el locator
-        valor_extraido: Optional[str] = None # Para almacenar el valor extraído
+        # Si el elemento no se vuelve visible o falla Playwright, el decorador toma la captura del fallo
+        # y lo relanza como AssertionError para que el flujo de la prueba se detenga.
+        # Asegurarse de que el directorio de capturas de pantalla exista
+        if not os.path.exists(directorio):
+            os.makedirs(directorio, exist_ok=True)
+            self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-        try:
-            # Asegurarse de que el directorio de capturas de pantalla exista
-            if not os.path.exists(directorio):
-                os.makedirs(directorio, exist_ok=True)
-                self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector # Si no es str, ya es un Locator
 
-            # --- Medición de rendimiento: Tiempo de localización del elemento y espera de visibilidad ---
-            start_time_locator = time.time()
-            if isinstance(selector, str):
-                locator = self.page.locator(selector)
-            else: # Asume que si no es str, ya es un Locator
-                locator = selector
-            
+        with self._medir("obtener_valor_de_elemento.locator", f"localización y espera de visibilidad para '{selector}'"):
             # Esperar a que el elemento sea visible antes de intentar extraer su valor
             expect(locator).to_be_visible()
-            end_time_locator = time.time()
-            duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización y espera de visibilidad para '{selector}': {duration_locator:.4f} segundos.")
-            
-            # Resaltar el elemento (útil para la depuración visual)
-            # locator.highlight() 
 
-            # Tomar captura de pantalla antes de la extracción
-            self.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes de la extracción de valor: '{nombre_base}_antes_extraccion_valor.png'")
+        # Tomar captura de pantalla antes de la extracción
+        self.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
+        self.logger.info(f"\n📸 Captura de pantalla tomada antes de la extracción de valor: '{nombre_base}_antes_extraccion_valor.png'")
 
-            # --- Medición de rendimiento: Tiempo de extracción del valor ---
-            start_time_extraction = time.time()
+        valor_extraido: Optional[str] = None # Para almacenar el valor extraído
+        with self._medir("obtener_valor_de_elemento.extraction", f"extracción del valor para '{selector}'"):
             # Priorizamos input_value() para campos de formulario (incluyendo <select>, <input>, <textarea>)
             # input_value() extrae el valor del atributo 'value' o el contenido de <textarea>.
             try:
                 valor_extraido = locator.input_value()
-                self.logger.debug(f"\nValor extraído (input_value) de '{selector}': '{valor_extraido}'")
+                self.logger.debug(lambda: f"\nValor extraído (input_value) de '{selector}': '{valor_extraido}'")
             except Error as e: # Captura si no es un elemento de entrada o si falla la operación
-                self.logger.debug(f"\ninput_value no aplicable o falló para '{selector}' (Detalles: {e.message if hasattr(e, 'message') else str(e)}). Intentando text_content/inner_text.")
-                
+                self.logger.debug(lambda: f"\ninput_value no aplicable o falló para '{selector}' (Detalles: {e.message if hasattr(e, 'message') else str(e)}). Intentando text_content/inner_text.")
+
                 # Si falla input_value, intentamos con inner_text o text_content para otros elementos
                 # inner_text() es a menudo preferible ya que devuelve el texto visible y renderizado.
                 try:
                     valor_extraido = locator.inner_text()
-                    self.logger.debug(f"\nValor extraído (inner_text) de '{selector}': '{valor_extraido}'")
+                    self.logger.debug(lambda: f"\nValor extraído (inner_text) de '{selector}': '{valor_extraido}'")
                 except Error as e_inner:
-                    self.logger.debug(f"\ninner_text falló para '{selector}' (Detalles: {e_inner.message if hasattr(e_inner, 'message') else str(e_inner)}). Intentando text_content.")
+                    self.logger.debug(lambda: f"\ninner_text falló para '{selector}' (Detalles: {e_inner.message if hasattr(e_inner, 'message') else str(e_inner)}). Intentando text_content.")
                     try:
                         valor_extraido = locator.text_content()
-                        self.logger.debug(f"\nValor extraído (text_content) de '{selector}': '{valor_extraido}'")
+                        self.logger.debug(lambda: f"\nValor extraído (text_content) de '{selector}': '{valor_extraido}'")
                     except Error as e_text:
                         self.logger.warning(f"\nNo se pudo extraer input_value, inner_text ni text_content de '{selector}' (Detalles: {e_text.message if hasattr(e_text, 'message') else str(e_text)}).")
                         valor_extraido = None # Asegurarse de que sea None si todo falla
 
-            end_time_extraction = time.time()
-            duration_extraction = end_time_extraction - start_time_extraction
-            self.logger.info(f"PERFORMANCE: Tiempo de extracción del valor para '{selector}': {duration_extraction:.4f} segundos.")
-
-            if valor_extraido is not None:
-                # Stripping whitespace for cleaner results if it's a string
-                valor_final = valor_extraido.strip() if isinstance(valor_extraido, str) else valor_extraido
-                self.logger.info(f"\n✅ Valor final obtenido del elemento '{selector}': '{valor_final}'")
-                self.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio)
-                return valor_final
-            else:
-                self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
-                self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
-                return None
-
-        except TimeoutError as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Timeout): El elemento '{selector}' "
-                f"no se volvió visible a tiempo ({tiempo_max_espera_visibilidad}s) para extraer su valor. Detalles: {e}"
-            )
-            self.logger.error(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio)
-            # Elevar una excepción clara para que el flujo de la prueba se detenga si el elemento no está disponible
-            raise AssertionError(f"\nElemento no disponible para extracción de valor: {selector}. Error: {e.message if hasattr(e, 'message') else str(e)}") from e
-
-        except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
-            mensaje_error = (
-                f"\n❌ FALLO (Error de Playwright): Ocurrió un error de Playwright al intentar extraer el valor de '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.error(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio)
-            raise AssertionError(f"\nError de Playwright al extraer valor: {selector}. Error: {e.message if hasattr(e, 'message') else str(e)}") from e
-
-        except Exception as e: # Captura cualquier otro error inesperado
-            mensaje_error = (
-                f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al intentar extraer el valor de '{selector}'. "
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio)
-            raise AssertionError(f"\nError inesperado al extraer valor: {selector}. Error: {e}") from e
-
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener_valor_de_elemento): {duration_total_operation:.4f} segundos.")
-            
-            # El parámetro 'tiempo' original en tu función no tenía un uso claro aquí,
-            # ya que las operaciones de extracción tienen sus propios timeouts o son sincrónicas.
-            # Lo he renombrado a 'tiempo_max_espera_visibilidad' y se usa en expect().to_be_visible().
-            # No se añade una espera fija aquí por defecto. Si se necesita una pausa
-            # adicional después de la extracción, se debería añadir un nuevo parámetro.
-            pass
+        if valor_extraido is not None:
+            # Stripping whitespace for cleaner results if it's a string
+            valor_final = valor_extraido.strip() if isinstance(valor_extraido, str) else valor_extraido
+            self.logger.info(f"\n✅ Valor final obtenido del elemento '{selector}': '{valor_final}'")
+            self.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio)
+            return valor_final
+        else:
+            self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
+            self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
+            return None
         
     # 74- Función para presionar la tecla TAB y verificar que el foco cambie al elemento esperado.
     # Combina la acción de TAB con una validación directa del foco, aceptando tanto selectores como objetos Locator.
+    @accion_instrumentada(envolver_en=AssertionError)
     def presionar_Tab_y_verificar_foco(self, selector_o_locator_esperado: Union[str, Locator], nombre_base: str, direccion: str, tiempo_espera_post_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la tecla 'TAB' y verifica que el foco del navegador
@@ -9531,34 +5621,18 @@ class Funciones_Globales:
         paso_descripcion = nombre_paso if nombre_paso else f"Verificando el cambio de foco a '{localizador}' después de presionar TAB."
         self.logger.info(f"\n--- {paso_descripcion} ---")
 
-        try:
-            # 2. Presionar la tecla TAB utilizando la función existente.
-            self.Tab_Press(tiempo_espera_post_tab=tiempo_espera_post_tab, nombre_paso="Presionando TAB para cambiar de foco")
+        # 2. Presionar TAB utilizando la función existente.
+        self.Tab_Press(tiempo_espera_post_tab=tiempo_espera_post_tab, nombre_paso="Presionando TAB para cambiar de foco")
 
-            self.logger.info(f"\nVerificando que el foco se haya movido al elemento: '{localizador}'...")
-            
-            # 3. La verificación clave con `expect`
-            #     Es fundamental usar `expect()` para que `to_be_focused()` funcione.
-            expect(localizador).to_be_focused()
-            
-            self.logger.info(f"\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '{localizador}'.")
+        # 3. La verificación clave con `expect`: `to_be_focused()` comprueba si el elemento tiene el foco.
+        #    Si falla, el decorador registra el fallo, toma la captura y relanza un AssertionError.
+        expect(localizador).to_be_focused()
+
+        self.logger.info(f"\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '{localizador}'.")
 
-        except AssertionError as ae:
-            mensaje_error = f"\n❌ FALLO de Verificación - {paso_descripcion}\n{ae}"
-            self.logger.error(mensaje_error)
-            self.tomar_captura(f"{nombre_base}_foco_fallido", direccion)
-            raise ae
-        except Exception as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Inesperado) - {paso_descripcion}: Ocurrió un error inesperado durante la verificación.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", direccion)
-            raise AssertionError(f"\nError inesperado al verificar el foco: {e}") from e
-                
     # 75- Función para presionar la combinación de teclas SHIFT + TAB en el teclado
     # Integra pruebas de rendimiento para medir el tiempo de ejecución de la acción.
+    @accion_instrumentada(envolver_en=AssertionError)
     def presionar_shift_tab(self, tiempo_espera_post_shift_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la combinación de teclas 'Shift + Tab' en el teclado.
@@ -9580,41 +5654,19 @@ class Funciones_Globales:
         """
         self.logger.info(f"\n--- {nombre_paso}: Presionando la combinación de teclas SHIFT + TAB y esperando {tiempo_espera_post_shift_tab} segundos ---")
 
-        # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
-
-        try:
-            # --- Medición de rendimiento: Inicio de la acción 'keyboard.press' ---
-            start_time_press_action = time.time()
+        with self._medir("presionar_shift_tab.press_action", "la acción 'keyboard.press(\"Shift+Tab\")'"):
             self.page.keyboard.press("Shift+Tab")
-            # --- Medición de rendimiento: Fin de la acción 'keyboard.press' ---
-            end_time_press_action = time.time()
-            duration_press_action = end_time_press_action - start_time_press_action
-            self.logger.info(f"\nPERFORMANCE: Tiempo de la acción 'keyboard.press(\"Shift+Tab\")': {duration_press_action:.4f} segundos.")
-            
-            self.logger.info("\nCombinación de teclas SHIFT + TAB presionada exitosamente.")
 
-            # Espera fija después de presionar SHIFT + TAB (configuracion por parametro)
-            if tiempo_espera_post_shift_tab > 0:
-                self.esperar_fijo(tiempo_espera_post_shift_tab)
+        self.logger.info("\nCombinación de teclas SHIFT + TAB presionada exitosamente.")
+
+        # Espera fija después de presionar SHIFT + TAB (configuracion por parametro)
+        if tiempo_espera_post_shift_tab > 0:
+            self.esperar_fijo(tiempo_espera_post_shift_tab)
 
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al presionar la combinación de teclas SHIFT + TAB.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            # Se lanza la excepción para que el framework de pruebas maneje el fallo.
-            raise AssertionError(f"\nError al presionar la combinación de teclas SHIFT + TAB: {e}") from e
-        finally:
-            # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
-            duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"\nPERFORMANCE: Tiempo total de la operación (Shift_Tab_Press): {duration_total_operation:.4f} segundos.")
-    
     # 76- Función para presionar la combinación de teclas SHIFT + TAB y verificar que el foco cambie al elemento esperado.
     # Combina la acción de SHIFT + TAB con una validación directa del foco, aceptando
     # selectores o objetos Locator.
+    @accion_instrumentada(envolver_en=AssertionError)
     def presionar_Shift_Tab_y_verificar_foco(self, selector_o_locator_esperado: Union[str, Locator], nombre_base: str, direccion: str, tiempo_espera_post_shift_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la combinación de teclas 'Shift + Tab' y verifica
@@ -9646,35 +5698,107 @@ class Funciones_Globales:
             localizador = selector_o_locator_esperado
 
         paso_descripcion = nombre_paso if nombre_paso else f"Verificando el cambio de foco a '{localizador}' después de presionar SHIFT + TAB."
-        # self.logger.info(f"\n--- {paso_descripcion} ---")
+        self.logger.info(f"\n--- {paso_descripcion} ---")
 
-        try:
-            # 2. Presionar la combinación de teclas SHIFT + TAB utilizando la función existente.
-            self.presionar_shift_tab(tiempo_espera_post_shift_tab=tiempo_espera_post_shift_tab, nombre_paso="Presionando SHIFT + TAB para cambiar de foco")
+        # 2. Presionar SHIFT + TAB utilizando la función existente.
+        self.presionar_shift_tab(tiempo_espera_post_shift_tab=tiempo_espera_post_shift_tab, nombre_paso="Presionando SHIFT + TAB para cambiar de foco")
 
-            # self.logger.info(f"\nVerificando que el foco se haya movido al elemento: '{localizador}'...")
-            
-            # 3. La verificación clave con `expect` de Playwright.
-            #    `to_be_focused()` verifica si el elemento actualmente tiene el foco.
-            expect(localizador).to_be_focused()
-            
-            self.logger.info(f"\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '{localizador}'.")
+        # 3. La verificación clave con `expect`: `to_be_focused()` comprueba si el elemento tiene el foco.
+        #    Si falla, el decorador registra el fallo, toma la captura y relanza un AssertionError.
+        expect(localizador).to_be_focused()
+
+        self.logger.info(f"\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '{localizador}'.")
+
+    # 76.1- Función para verificar la secuencia completa de tabulación (TAB o SHIFT + TAB) en un solo pase del navegador.
+    # A diferencia de 'presionar_Tab_y_verificar_foco', no hay una espera ni un 'expect' por campo:
+    # el foco se registra dentro de la página y se compara toda la secuencia de una sola vez.
+    @accion_instrumentada(envolver_en=AssertionError)
+    def verificar_secuencia_tabulacion(self, locators: List[Union[str, Locator]], nombre_base: str, direccion: str, sentido: str = "adelante", tiempo_max_elemento: Union[int, float] = 5.0, nombre_paso: str = "") -> bool:
+        """
+        Verifica que el foco recorra los elementos indicados en el orden esperado al presionar
+        'TAB' (sentido "adelante") o 'SHIFT + TAB' (sentido "atras").
+
+        El primer elemento de `locators` es el punto de partida: se enfoca y, a continuación,
+        se presiona la tecla `len(locators) - 1` veces sin esperas intermedias. Un listener dentro
+        de la página registra `document.activeElement` después de cada pulsación, y el registro
+        completo se lee con un único `evaluate` para compararlo con la secuencia esperada.
+        Si no coincide, el error incluye la diferencia paso a paso del orden del foco.
+
+        Args:
+            locators (List[str | Locator]): Elementos en el orden en que deben recibir el foco,
+                                            empezando por el elemento inicial.
+            nombre_base (str): Nombre base para las capturas de pantalla.
+            direccion (str): Directorio donde se guardarán las capturas de pantalla.
+            sentido (str, opcional): "adelante" para 'TAB' o "atras" para 'SHIFT + TAB'. Por defecto "adelante".
+            tiempo_max_elemento (Union[int, float], opcional): Tiempo máximo de espera (en segundos) para
+                                                               localizar cada elemento esperado. Por defecto `5.0` segundos.
+            nombre_paso (str, opcional): Descripción del paso para los logs. Por defecto "".
+
+        Returns:
+            bool: `True` si el foco siguió exactamente la secuencia esperada.
+
+        Raises:
+            ValueError: Si el sentido no es válido o se indican menos de dos elementos.
+            AssertionError: Si el orden del foco no coincide con el esperado (incluye la diferencia)
+                            o si ocurre un error de Playwright o inesperado.
+        """
+        teclas_por_sentido = {"adelante": "Tab", "atras": "Shift+Tab"}
+        if sentido not in teclas_por_sentido:
+            raise ValueError(f"\nEl sentido de tabulación '{sentido}' no es válido. Use 'adelante' o 'atras'.")
+        if len(locators) < 2:
+            raise ValueError("\nSe necesitan al menos dos elementos (el inicial y uno más) para verificar una secuencia de tabulación.")
+
+        tecla = teclas_por_sentido[sentido]
+        localizadores = [self.page.locator(loc) if isinstance(loc, str) else loc for loc in locators]
+        num_pulsaciones = len(localizadores) - 1
+        paso_descripcion = nombre_paso if nombre_paso else f"Verificando la secuencia de tabulación ({tecla}) de {len(localizadores)} elementos."
+        self.logger.info(f"\n--- {paso_descripcion} ---")
+
+        # 1. Guardar la identidad de cada elemento esperado dentro de la página.
+        for indice, localizador in enumerate(localizadores):
+            localizador.evaluate(_JS_MARCAR_ELEMENTO_TAB, indice, timeout=tiempo_max_elemento * 1000)
+
+        # 2. Enfocar el elemento inicial y empezar a registrar el foco tras cada pulsación.
+        localizadores[0].focus(timeout=tiempo_max_elemento * 1000)
+        self.page.evaluate(_JS_INICIAR_REGISTRO_TAB)
+
+        # 3. Presionar la tecla N veces sin esperas intermedias.
+        with self._medir("verificar_secuencia_tabulacion.press_action", f"{num_pulsaciones} pulsaciones de '{tecla}'"):
+            for _ in range(num_pulsaciones):
+                self.page.keyboard.press(tecla)
+
+        # 4. Leer el registro completo en un solo viaje de ida y vuelta.
+        resultado = self.page.evaluate(_JS_LEER_REGISTRO_TAB)
+        esperados = resultado["esperados"]
+        registro = resultado["registro"]
+
+        # 5. Comparar la secuencia registrada con la esperada y construir la diferencia.
+        secuencia_correcta = len(registro) == num_pulsaciones
+        lineas_diferencia = []
+        for paso in range(max(num_pulsaciones, len(registro))):
+            esperado = esperados[paso + 1] if paso < num_pulsaciones else "(ninguno)"
+            if paso < len(registro):
+                obtenido = registro[paso]["descripcion"]
+                coincide = registro[paso]["indice"] == paso + 1
+            else:
+                obtenido = "(el foco salió de la página)"
+                coincide = False
+            secuencia_correcta = secuencia_correcta and coincide
+            marca = "✅" if coincide else "❌"
+            lineas_diferencia.append(f"  {marca} {tecla} #{paso + 1}: esperado '{esperado}', obtenido '{obtenido}'")
+        diferencia = "\n".join(lineas_diferencia)
+
+        # Si no coincide, el decorador registra el fallo (con la diferencia) y toma la captura;
+        # los timeouts y errores de Playwright se relanzan también como AssertionError.
+        if not secuencia_correcta:
+            raise AssertionError(f"\n{paso_descripcion}\nOrden del foco (esperado vs. obtenido):\n{diferencia}")
+
+        self.logger.info(f"\n✅ ÉXITO - El foco siguió la secuencia esperada de {len(localizadores)} elementos:\n{diferencia}")
+        self.tomar_captura(f"{nombre_base}_secuencia_tabulacion_ok", direccion)
+        return True
 
-        except AssertionError as ae:
-            mensaje_error = f"\n❌ FALLO de Verificación - {paso_descripcion}\n{ae}"
-            # self.logger.error(mensaje_error)
-            # self.tomar_captura(f"{nombre_base}_foco_fallido", direccion)
-            raise ae
-        except Exception as e:
-            mensaje_error = (
-                f"\n❌ FALLO (Inesperado) - {paso_descripcion}: Ocurrió un error inesperado durante la verificación.\n"
-                f"Detalles: {e}"
-            )
-            # self.logger.critical(mensaje_error, exc_info=True)
-            # self.tomar_captura(f"{nombre_base}_error_inesperado", direccion)
-            raise AssertionError(f"\nError inesperado al verificar el foco: {e}") from e
-    
     # 77- Función para descargar un archivo al hacer clic en un selector específico.
+    @accion_instrumentada(en_timeout=None)
     def descargar_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio_capturas: str, directorio_descargas: str, tiempo: Union[int, float] = 30.0) -> str:
         """
         Descarga un archivo al hacer clic en un selector específico.
@@ -9705,77 +5829,185 @@ class Funciones_Globales:
         locator = self.page.locator(selector) if isinstance(selector, str) else selector
         self.logger.info(f"\nIntentando descargar archivo desde el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
 
-        # 2. Configurar la escucha de la descarga ANTES de la acción que la desencadena.
-        #    La declaración `with` asegura que la escucha se active antes de hacer clic.
-        start_time_download = time.time()
-        try:
+        # Si la descarga no se inicia o no se completa a tiempo, el decorador toma la captura
+        # del fallo y devuelve None; cualquier otro error se relanza para que la prueba falle.
+        with self._medir("descargar_archivo.download", f"descarga desde el selector '{selector}'"):
+            # 2. Configurar la escucha de la descarga ANTES de la acción que la desencadena.
             with self.page.expect_download() as download_info:
                 # 3. Realizar la acción que inicia la descarga (ej. hacer clic en un enlace).
                 self.logger.info(f"\nRealizando la acción de clic en el selector '{selector}' para iniciar la descarga.")
                 locator.click()
 
-            # 4. Obtener el objeto de descarga y la ruta temporal del archivo.
+            # 4. Obtener el objeto de descarga y el nombre sugerido del archivo.
             download = download_info.value
-            path_temp = download.path()
             file_name = download.suggested_filename
 
-            # 5. Definir la ruta de destino y mover el archivo descargado.
-            #    Es crucial mover el archivo desde su ruta temporal antes de que Playwright
-            #    limpie la sesión.
+            # 5. Guardar el archivo en el destino antes de que Playwright limpie la sesión.
             ruta_completa_del_archivo = os.path.join(directorio_descargas, file_name)
             os.makedirs(directorio_descargas, exist_ok=True) # Crea el directorio si no existe.
             download.save_as(ruta_completa_del_archivo)
             self.logger.info(f"\nArchivo guardado exitosamente: '{ruta_completa_del_archivo}'.")
 
-            # 6. Medición de rendimiento y registro de éxito.
-            end_time_download = time.time()
-            duration_download = end_time_download - start_time_download
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en descargar el archivo '{file_name}': {duration_download:.4f} segundos.")
-            self.logger.info(f"\n✅ Archivo descargado exitosamente y guardado en '{ruta_completa_del_archivo}'.")
-            self.tomar_captura(f"{nombre_base}_archivo_descargado", directorio_capturas)
-            return ruta_completa_del_archivo
-
-        except TimeoutError as e:
-            # Manejo de error: la descarga no se inició o no se completó a tiempo.
-            end_time_fail = time.time()
-            duration_fail = end_time_fail - start_time_download
-            error_msg = (
-                f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible/habilitado o "
-                f"la descarga no se inició/completó después de {duration_fail:.4f} segundos.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_descargar_archivo", directorio_capturas)
-            return None
+        self.logger.info(f"\n✅ Archivo descargado exitosamente y guardado en '{ruta_completa_del_archivo}'.")
+        self.tomar_captura(f"{nombre_base}_archivo_descargado", directorio_capturas)
+        return ruta_completa_del_archivo
 
-        except Error as e:
-            # Manejo de error: problemas con el selector o interacción de Playwright.
-            error_msg = (
-                f"\n❌ FALLO (Playwright): Error de Playwright al intentar descargar "
-                f"el archivo desde el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_descarga", directorio_capturas)
-            raise # Re-lanzar la excepción para que el test falle.
+    # 78- Función generadora que recorre en streaming las filas de datos de un archivo CSV.
+    # Pensada para pruebas guiadas por datos: nunca tiene más de una fila en memoria y, con 'fila_inicio'/'fila_fin',
+    # salta directamente al rango pedido gracias al índice de filas del CSV.
+    def iterar_filas_csv(self, archivo_csv_path: str, delimiter: str = ',', has_header: bool = False, fila_inicio: int = 1, fila_fin: Optional[int] = None, nombre_paso: str = "") -> Iterator[List[str]]:
+        """
+        Generador de las filas de datos de un archivo CSV, leídas en streaming.
+
+        A diferencia de leer todo el archivo con `list(csv.reader(...))`, solo se mantiene en memoria la fila
+        en curso. El índice de filas del CSV (el mismo que usan 'num_Filas_csv' y 'dato_Columna_csv') permite
+        empezar en 'fila_inicio' sin recorrer las filas anteriores.
+
+        Args:
+            archivo_csv_path (str): La **ruta completa al archivo CSV**.
+            delimiter (str, opcional): El **carácter utilizado como separador** de datos en el CSV. Por defecto es `,`.
+            has_header (bool, opcional): Si es `True`, la primera fila física (el encabezado) no se devuelve
+                                         y las filas lógicas empiezan en la segunda. Por defecto es `False`.
+            fila_inicio (int, opcional): Primera **fila lógica** (basada en 1) a devolver. Por defecto `1`.
+            fila_fin (Optional[int], opcional): Última **fila lógica** (incluida) a devolver. Por defecto, hasta el final.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Yields:
+            List[str]: Los campos de cada fila.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            csv.Error: Si el archivo no tiene un formato CSV válido.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Recorriendo las filas lógicas {fila_inicio}-{fila_fin if fila_fin is not None else 'fin'} del archivo CSV '{archivo_csv_path}' con delimitador '{delimiter}' (tiene encabezado: {has_header}). ---")
+        filas_leidas = 0
+        # El generador puede cerrarse antes de agotarse (break en la prueba): el bloque se mide igualmente
+        with self._medir("iterar_filas_csv", "la acción 'iterar_filas_csv'"):
+            try:
+                indice, abierto = obtener_cache_indices_csv().obtener(archivo_csv_path, delimiter)
+                self._registrar_indice_csv(indice, abierto)
+                desplazamiento = 1 if has_header else 0
+                inicio = max(fila_inicio, 1) - 1 + desplazamiento
+                fin = fila_fin + desplazamiento if fila_fin is not None else None
+                for fila in indice.iterar_filas(inicio, fin):
+                    filas_leidas += 1
+                    yield fila
+            finally:
+                self.logger.info(f"\n'iterar_filas_csv' entregó {filas_leidas} filas de '{archivo_csv_path}'.")
+
+    def _registrar_indice_csv(self, indice, abierto: bool) -> None:
+        """
+        Registra en el log y en las métricas de dónde salió el índice de filas de un CSV.
+        """
+        if abierto:
+            self.metricas.incrementar("csv_indice.aciertos")
+            origen = "abierto en el proceso"
+        else:
+            self.metricas.incrementar("csv_indice.fallos")
+            origen = "leído del disco" if indice.desde_disco else "construido recorriendo el archivo"
+        self.logger.debug(lambda: f"\nÍndice de filas de '{indice.ruta}' {origen} ({indice.num_filas} filas).")
+
+    # 79- Función generadora que recorre en streaming los registros de un archivo XML (modo streaming de 'leer_xml').
+    # Usa iterparse y libera cada registro procesado: la memoria no depende del tamaño del archivo.
+    def iterar_registros_xml(self, xml_file_path: str, etiqueta_registro: Optional[str] = None, campos: Optional[Sequence[str]] = None, nombre_paso: str = "") -> Iterator[Union[ET.Element, tuple]]:
+        """
+        Generador de los registros de un archivo XML, leídos en streaming con `ET.iterparse`.
+
+        A diferencia de 'leer_xml', que construye el árbol completo con `ET.parse`, cada registro se vacía y se
+        retira del árbol en cuanto se pide el siguiente, así que la memoria se mantiene plana aunque el archivo
+        ocupe cientos de MB.
+
+        Args:
+            xml_file_path (str): La **ruta completa al archivo XML**.
+            etiqueta_registro (Optional[str], opcional): Etiqueta ('record') o ruta ('dataset/record', './/record')
+                                                         de los registros. Por defecto, los hijos de la raíz.
+            campos (Optional[Sequence[str]], opcional): Campos a proyectar en una tupla con nombre por registro:
+                                                        el texto del hijo con esa etiqueta o, con '@', un atributo.
+                                                        Sin campos se devuelve el elemento del registro, válido
+                                                        solo hasta pedir el siguiente.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Yields:
+            Union[ET.Element, tuple]: Cada registro o su proyección.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ET.ParseError: Si el XML no está bien formado.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Recorriendo en streaming los registros '{etiqueta_registro or '<hijos de la raíz>'}' del archivo XML: '{xml_file_path}'{f' (campos: {list(campos)})' if campos else ''}. ---")
+        registros_leidos = 0
+        # El generador puede cerrarse antes de agotarse (break en la prueba): el bloque se mide igualmente
+        with self._medir("iterar_registros_xml", "la acción 'iterar_registros_xml'"):
+            try:
+                for registro in iterar_registros_xml(xml_file_path, etiqueta_registro, campos):
+                    registros_leidos += 1
+                    yield registro
+            finally:
+                self.logger.info(f"\n'iterar_registros_xml' entregó {registros_leidos} registros de '{xml_file_path}'.")
+
+    # 80- Función generadora que recorre uno a uno los elementos de un array JSON grande (modo streaming de 'leer_json').
+    # Lee el archivo por bloques: la memoria depende del tamaño de un elemento, no del archivo.
+    def iterar_json(self, json_file_path: str, clave: Optional[str] = None, campos: Optional[Sequence[str]] = None, nombre_paso: str = "") -> Iterator[Any]:
+        """
+        Generador de los elementos del array raíz de un archivo JSON (o del array en 'clave' del objeto raíz).
+
+        A diferencia de 'leer_json', que decodifica todo el archivo con `json.load` antes de devolver nada, cada
+        elemento se decodifica al pedirlo, así que la prueba puede usar el primer registro sin esperar al resto.
+
+        Args:
+            json_file_path (str): La **ruta completa al archivo JSON**.
+            clave (Optional[str], opcional): Clave del objeto raíz que contiene el array. Por defecto, la raíz es el array.
+            campos (Optional[Sequence[str]], opcional): Campos a proyectar en una tupla con nombre por elemento.
+                                                        Por defecto se devuelve cada elemento completo.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Yields:
+            Any: Cada elemento del array (o su proyección).
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si el JSON no es válido o no contiene un array (json.JSONDecodeError es un ValueError).
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Recorriendo en streaming el array{f' de la clave {clave!r}' if clave else ''} del archivo JSON: '{json_file_path}'{f' (campos: {list(campos)})' if campos else ''}. ---")
+        elementos_leidos = 0
+        # El generador puede cerrarse antes de agotarse (break en la prueba): el bloque se mide igualmente
+        with self._medir("iterar_json", "la acción 'iterar_json'"):
+            try:
+                for elemento in iterar_elementos_json(json_file_path, clave, campos):
+                    elementos_leidos += 1
+                    yield elemento
+            finally:
+                self.logger.info(f"\n'iterar_json' entregó {elementos_leidos} elementos de '{json_file_path}'.")
+
+    # 81- Función que devuelve un array JSON de registros en forma columnar, leído una sola vez por sesión.
+    # Integra pruebas de rendimiento para medir el tiempo de lectura (o de acceso a la caché).
+    @accion_instrumentada(en_error=None)
+    def leer_json_columnar(self, json_file_path: str, clave: Optional[str] = None, campos: Optional[Sequence[str]] = None, nombre_paso: str = "") -> Optional[TablaColumnarJson]:
+        """
+        Devuelve el array de registros de un archivo JSON como tabla columnar (una lista de valores por campo).
+
+        La primera llamada lee el array en streaming y construye la tabla; las siguientes de la sesión (mientras
+        el archivo no cambie) la sirven desde la caché columnar del proceso. Con 'campos' solo se guardan esos
+        campos, lo que reduce todavía más la memoria.
+
+        Args:
+            json_file_path (str): La **ruta completa al archivo JSON**.
+            clave (Optional[str], opcional): Clave del objeto raíz que contiene el array. Por defecto, la raíz es el array.
+            campos (Optional[Sequence[str]], opcional): Campos (columnas) a conservar. Por defecto, todos.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Returns:
+            Optional[TablaColumnarJson]: La tabla (`columna(campo)`, `fila(i)`, `len()`, iteración por registros),
+                                         o **None** si el archivo no se encuentra, el JSON no es válido o no contiene un array.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Obteniendo en forma columnar el array{f' de la clave {clave!r}' if clave else ''} del archivo JSON: '{json_file_path}'. ---")
+        # Si el archivo no existe o no es un JSON válido con un array de registros (ValueError),
+        # el decorador registra el error y devuelve None.
+        tabla, desde_cache = obtener_cache_columnar_json().obtener(json_file_path, clave, campos)
+        self.metricas.incrementar("json_cache.aciertos" if desde_cache else "json_cache.fallos")
+        self.logger.info(f"\n✅ Tabla columnar {'servida desde la caché' if desde_cache else 'construida'}: {len(tabla)} registros, campos {tabla.campos}.")
+        return tabla
 
-        except Exception as e:
-            # Manejo de cualquier otro error inesperado.
-            error_msg = (
-                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al intentar descargar "
-                f"el archivo desde el selector '{selector}'.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_descarga", directorio_capturas)
-            raise # Re-lanzar la excepción.
-        
-        """finally:
-            # Este bloque siempre se ejecuta, útil para limpiezas o esperas finales.
-            # Aquí se usa para una espera fija al final de la operación, si se configuró.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)"""
-    
     # --- Manejadores y funciones para Alertas y Confirmaciones ---
 
     # Handler para alertas simples (usado con page.once).
@@ -9807,32 +6039,26 @@ class Funciones_Globales:
             """
             Función callback interna que se ejecuta cuando Playwright detecta un diálogo (alerta, confirmación, etc.).
             """
-            # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-            start_time_handler_execution = time.time()
             self.logger.info(f"\n--- [LISTENER START] Procesando diálogo tipo: '{dialog.type}'. ---")
 
-            try:
-                self._alerta_detectada = True
-                self._alerta_mensaje_capturado = dialog.message
-                self._alerta_tipo_capturado = dialog.type
+            with self._medir("_get_simple_alert_handler_for_on.handler_execution", "ejecución del handler de alerta"):
+                try:
+                    self._alerta_detectada = True
+                    self._alerta_mensaje_capturado = dialog.message
+                    self._alerta_tipo_capturado = dialog.type
                 
-                self.logger.info(f"\n--> [LISTENER ON - Simple Alert] Alerta detectada: Tipo='{dialog.type}', Mensaje='{dialog.message}'")
+                    self.logger.info(f"\n--> [LISTENER ON - Simple Alert] Alerta detectada: Tipo='{dialog.type}', Mensaje='{dialog.message}'")
                 
-                # Aceptamos el diálogo. Esto simula hacer clic en "Aceptar" o "OK".
-                # Para un 'prompt', puedes pasar un texto: dialog.accept("texto de respuesta")
-                dialog.accept() 
-                self.logger.info("\n--> [LISTENER ON - Simple Alert] Alerta ACEPTADA.")
+                    # Aceptamos el diálogo. Esto simula hacer clic en "Aceptar" o "OK".
+                    # Para un 'prompt', puedes pasar un texto: dialog.accept("texto de respuesta")
+                    dialog.accept() 
+                    self.logger.info("\n--> [LISTENER ON - Simple Alert] Alerta ACEPTADA.")
 
-            except Exception as e:
-                # Captura cualquier error que ocurra dentro del handler.
-                # Es crucial aquí no re-lanzar, ya que podría romper el listener de Playwright.
-                self.logger.error(f"\n❌ ERROR en el handler de alerta para '{dialog.type}' (Mensaje: '{dialog.message}'). Detalles: {e}", exc_info=True)
-            finally:
-                # --- Medición de rendimiento: Fin de la ejecución del handler ---
-                end_time_handler_execution = time.time()
-                duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-                self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de alerta: {duration_handler_execution:.4f} segundos.")
-                self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
+                except Exception as e:
+                    # Captura cualquier error que ocurra dentro del handler.
+                    # Es crucial aquí no re-lanzar, ya que podría romper el listener de Playwright.
+                    self.logger.error(f"\n❌ ERROR en el handler de alerta para '{dialog.type}' (Mensaje: '{dialog.message}'). Detalles: {e}", exc_info=True)
+            self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
 
         return handler
 
@@ -9871,42 +6097,36 @@ class Funciones_Globales:
             Función callback interna que se ejecuta cuando Playwright detecta un diálogo
             (especialmente 'confirm' o 'prompt').
             """
-            # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-            start_time_handler_execution = time.time()
             self.logger.info(f"\n--- [LISTENER START] Procesando diálogo de confirmación tipo: '{dialog.type}'. ---")
 
-            try:
-                self._alerta_detectada = True
-                self._alerta_mensaje_capturado = dialog.message
-                self._alerta_tipo_capturado = dialog.type
+            with self._medir("_get_confirmation_dialog_handler_for_on.handler_execution", "ejecución del handler de diálogo de confirmación"):
+                try:
+                    self._alerta_detectada = True
+                    self._alerta_mensaje_capturado = dialog.message
+                    self._alerta_tipo_capturado = dialog.type
                 
-                self.logger.info(f"\n--> [LISTENER ON - Dinámico] Diálogo detectado: Tipo='{dialog.type}', Mensaje='{dialog.message}'")
+                    self.logger.info(f"\n--> [LISTENER ON - Dinámico] Diálogo detectado: Tipo='{dialog.type}', Mensaje='{dialog.message}'")
                 
-                if accion == 'accept':
-                    # Acepta el diálogo (equivalente a hacer clic en "OK" o "Aceptar").
-                    # Para un prompt, puedes pasar un valor: dialog.accept("mi respuesta")
-                    dialog.accept()
-                    self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo ACEPTADO.")
-                elif accion == 'dismiss':
-                    # Descarta/cancela el diálogo (equivalente a hacer clic en "Cancelar").
-                    dialog.dismiss()
-                    self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo CANCELADO/DESCARTADO.")
-                else:
-                    # En caso de acción no reconocida, se registra una advertencia y se acepta por defecto.
-                    self.logger.warning(f"\n--> [LISTENER ON - Dinámico] Acción desconocida '{accion}' para el diálogo '{dialog.type}'. Aceptando por defecto.")
-                    dialog.accept()
-                    self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo ACEPTADO por defecto debido a acción inválida.")
+                    if accion == 'accept':
+                        # Acepta el diálogo (equivalente a hacer clic en "OK" o "Aceptar").
+                        # Para un prompt, puedes pasar un valor: dialog.accept("mi respuesta")
+                        dialog.accept()
+                        self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo ACEPTADO.")
+                    elif accion == 'dismiss':
+                        # Descarta/cancela el diálogo (equivalente a hacer clic en "Cancelar").
+                        dialog.dismiss()
+                        self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo CANCELADO/DESCARTADO.")
+                    else:
+                        # En caso de acción no reconocida, se registra una advertencia y se acepta por defecto.
+                        self.logger.warning(f"\n--> [LISTENER ON - Dinámico] Acción desconocida '{accion}' para el diálogo '{dialog.type}'. Aceptando por defecto.")
+                        dialog.accept()
+                        self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo ACEPTADO por defecto debido a acción inválida.")
 
-            except Exception as e:
-                # Captura cualquier error que ocurra dentro del handler.
-                # Es crucial aquí no re-lanzar, ya que podría romper el listener de Playwright.
-                self.logger.error(f"\n❌ ERROR en el handler de diálogo para '{dialog.type}' (Mensaje: '{dialog.message}', Acción: '{accion}'). Detalles: {e}", exc_info=True)
-            finally:
-                # --- Medición de rendimiento: Fin de la ejecución del handler ---
-                end_time_handler_execution = time.time()
-                duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-                self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de diálogo de confirmación: {duration_handler_execution:.4f} segundos.")
-                self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
+                except Exception as e:
+                    # Captura cualquier error que ocurra dentro del handler.
+                    # Es crucial aquí no re-lanzar, ya que podría romper el listener de Playwright.
+                    self.logger.error(f"\n❌ ERROR en el handler de diálogo para '{dialog.type}' (Mensaje: '{dialog.message}', Acción: '{accion}'). Detalles: {e}", exc_info=True)
+            self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
 
         return handler
     
@@ -9949,50 +6169,44 @@ class Funciones_Globales:
             Función callback interna que se ejecuta cuando Playwright detecta un diálogo
             (especialmente de tipo 'prompt').
             """
-            # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-            start_time_handler_execution = time.time()
             self.logger.info(f"\n--- [LISTENER START] Procesando diálogo de prompt tipo: '{dialog.type}'. ---")
 
-            try:
-                self._alerta_detectada = True
-                self._alerta_mensaje_capturado = dialog.message
-                self._alerta_tipo_capturado = dialog.type
-                self._alerta_input_capturado = input_text # Almacena el texto que se intentó introducir
+            with self._medir("_get_prompt_dialog_handler_for_on.handler_execution", "ejecución del handler de diálogo de prompt"):
+                try:
+                    self._alerta_detectada = True
+                    self._alerta_mensaje_capturado = dialog.message
+                    self._alerta_tipo_capturado = dialog.type
+                    self._alerta_input_capturado = input_text # Almacena el texto que se intentó introducir
 
-                self.logger.info(f"\n--> [LISTENER ON - Prompt Dinámico] Diálogo detectado: Tipo='{dialog.type}', Mensaje='{dialog.message}'.")
+                    self.logger.info(f"\n--> [LISTENER ON - Prompt Dinámico] Diálogo detectado: Tipo='{dialog.type}', Mensaje='{dialog.message}'.")
                 
-                if accion == 'accept':
-                    if dialog.type == "prompt":
-                        # Acepta el prompt e introduce el texto proporcionado.
-                        dialog.accept(input_text)
-                        self.logger.info(f"\n--> [LISTENER ON - Prompt Dinámico] Texto '{input_text}' introducido y prompt ACEPTADO.")
+                    if accion == 'accept':
+                        if dialog.type == "prompt":
+                            # Acepta el prompt e introduce el texto proporcionado.
+                            dialog.accept(input_text)
+                            self.logger.info(f"\n--> [LISTENER ON - Prompt Dinámico] Texto '{input_text}' introducido y prompt ACEPTADO.")
+                        else:
+                            # Si no es un prompt pero se especificó 'accept', lo acepta sin texto.
+                            self.logger.warning(f"\n--> [LISTENER ON - Prompt Dinámico] Se solicitó 'accept' con texto para un diálogo no-prompt ('{dialog.type}'). Aceptando sin texto.")
+                            dialog.accept()
+                            self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo ACEPTADO (sin texto, no es prompt).")
+                    elif accion == 'dismiss':
+                        # Descarta/cancela el diálogo. El texto de input_text se ignora.
+                        dialog.dismiss()
+                        self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo CANCELADO/DESCARTADO.")
                     else:
-                        # Si no es un prompt pero se especificó 'accept', lo acepta sin texto.
-                        self.logger.warning(f"\n--> [LISTENER ON - Prompt Dinámico] Se solicitó 'accept' con texto para un diálogo no-prompt ('{dialog.type}'). Aceptando sin texto.")
-                        dialog.accept()
-                        self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo ACEPTADO (sin texto, no es prompt).")
-                elif accion == 'dismiss':
-                    # Descarta/cancela el diálogo. El texto de input_text se ignora.
-                    dialog.dismiss()
-                    self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo CANCELADO/DESCARTADO.")
-                else:
-                    # En caso de acción no reconocida, se registra una advertencia y se descarta por defecto.
-                    # Se elige 'dismiss' como valor por defecto más seguro para evitar que el prompt
-                    # se quede abierto y bloquee la ejecución si la acción es inválida.
-                    self.logger.warning(f"\n--> [LISTENER ON - Prompt Dinámico] Acción desconocida '{accion}' para el diálogo '{dialog.type}'. Descartando por defecto.")
-                    dialog.dismiss()
-                    self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo DESCARTADO por defecto debido a acción inválida.")
+                        # En caso de acción no reconocida, se registra una advertencia y se descarta por defecto.
+                        # Se elige 'dismiss' como valor por defecto más seguro para evitar que el prompt
+                        # se quede abierto y bloquee la ejecución si la acción es inválida.
+                        self.logger.warning(f"\n--> [LISTENER ON - Prompt Dinámico] Acción desconocida '{accion}' para el diálogo '{dialog.type}'. Descartando por defecto.")
+                        dialog.dismiss()
+                        self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo DESCARTADO por defecto debido a acción inválida.")
 
-            except Exception as e:
-                # Captura cualquier error que ocurra dentro del handler.
-                # Es crucial aquí no re-lanzar, ya que podría romper el listener de Playwright.
-                self.logger.error(f"\n❌ ERROR en el handler de prompt para '{dialog.type}' (Mensaje: '{dialog.message}', Acción: '{accion}', Texto: '{input_text}'). Detalles: {e}", exc_info=True)
-            finally:
-                # --- Medición de rendimiento: Fin de la ejecución del handler ---
-                end_time_handler_execution = time.time()
-                duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-                self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de diálogo de prompt: {duration_handler_execution:.4f} segundos.")
-                self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
+                except Exception as e:
+                    # Captura cualquier error que ocurra dentro del handler.
+                    # Es crucial aquí no re-lanzar, ya que podría romper el listener de Playwright.
+                    self.logger.error(f"\n❌ ERROR en el handler de prompt para '{dialog.type}' (Mensaje: '{dialog.message}', Acción: '{accion}', Texto: '{input_text}'). Detalles: {e}", exc_info=True)
+            self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
 
         return handler
 
@@ -10016,33 +6230,28 @@ class Funciones_Globales:
             page (Page): El objeto `Page` de Playwright que representa la nueva ventana/pestaña abierta.
                          Este es proporcionado automáticamente por Playwright cuando se dispara el evento.
         """
-        # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-        start_time_handler_execution = time.time()
         self.logger.info("\n--- [LISTENER START] Procesando evento de nueva página. ---")
 
-        try:
-            self._popup_detectado = True
-            self._popup_page = page
-            self._popup_url_capturado = page.url
-            # El title() puede requerir una pequeña espera si la página no ha cargado lo suficiente.
-            # Sin embargo, para un handler que debe ser rápido, se asume que estará disponible.
-            # Si el título no se obtiene inmediatamente, podría ser None o vacío.
-            self._popup_title_capturado = page.title() 
-            self._all_new_pages_opened_by_click.append(page) # Añadir la nueva página a la lista
-
-            self.logger.info(f"\n🌐 Nueva página (popup/pestaña) detectada. URL: '{page.url}', Título: '{page.title()}'")
-            # Opcional: Si solo te interesa la primera popup o una específica, podrías manejarlo aquí.
-            # Por ahora, solo la añadimos a la lista para seguimiento.
+        with self._medir("_on_new_page.handler_execution", "ejecución del handler de nueva página"):
+            try:
+                self._popup_detectado = True
+                self._popup_page = page
+                self._popup_url_capturado = page.url
+                # El title() puede requerir una pequeña espera si la página no ha cargado lo suficiente.
+                # Sin embargo, para un handler que debe ser rápido, se asume que estará disponible.
+                # Si el título no se obtiene inmediatamente, podría ser None o vacío.
+                if page not in self._all_new_pages_opened_by_click:
+                    self._all_new_pages_opened_by_click.append(page) # Añadir la nueva página a la lista
+                self._popup_title_capturado = page.title() 
+
+                self.logger.info(f"\n🌐 Nueva página (popup/pestaña) detectada. URL: '{page.url}', Título: '{page.title()}'")
+                # Opcional: Si solo te interesa la primera popup o una específica, podrías manejarlo aquí.
+                # Por ahora, solo la añadimos a la lista para seguimiento.
 
-        except Exception as e:
-            # Es crucial capturar excepciones en handlers para evitar que Playwright deshabilite el listener.
-            self.logger.error(f"\n❌ ERROR en el handler de nueva página. Detalles: {e}", exc_info=True)
-        finally:
-            # --- Medición de rendimiento: Fin de la ejecución del handler ---
-            end_time_handler_execution = time.time()
-            duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de nueva página: {duration_handler_execution:.4f} segundos.")
-            self.logger.info("\n--- [LISTENER END] Evento de nueva página procesado. ---")
+            except Exception as e:
+                # Es crucial capturar excepciones en handlers para evitar que Playwright deshabilite el listener.
+                self.logger.error(f"\n❌ ERROR en el handler de nueva página. Detalles: {e}", exc_info=True)
+        self.logger.info("\n--- [LISTENER END] Evento de nueva página procesado. ---")
         
     # 78 (Número consecutivo si es parte de una serie)- Función privada para realizar Drag and Drop manual.
     # Utiliza las acciones de ratón de bajo nivel de Playwright para simular arrastrar y soltar.
@@ -10085,79 +6294,42 @@ class Funciones_Globales:
             os.makedirs(directorio, exist_ok=True)
             self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
 
-        # --- Medición de rendimiento: Inicio de la operación total de Drag and Drop manual ---
-        start_time_total_drag_drop = time.time()
-        
-        try:
+        # Los errores se propagan a la acción que llama (realizar_drag_and_drop), cuyo decorador
+        # los registra y toma la captura del fallo.
+        with self._medir("_realizar_drag_and_drop_manual.total_drag_drop", "la operación 'Drag and Drop' manual"):
             self.tomar_captura(f"{nombre_base}_antes_drag_drop_manual", directorio)
             self.logger.info(f"\n📸 Captura de pantalla tomada antes del D&D manual: '{nombre_base}_antes_drag_drop_manual.png'")
 
             # 1. Mover el ratón sobre el elemento de origen
-            start_time_hover_origin = time.time()
             self.logger.info(f"\n🖱️ Moviendo ratón sobre elemento de origen: '{elemento_origen}'...")
-            elemento_origen.hover()
-            end_time_hover_origin = time.time()
-            duration_hover_origin = end_time_hover_origin - start_time_hover_origin
-            self.logger.info(f"PERFORMANCE: Tiempo de 'hover' en origen: {duration_hover_origin:.4f} segundos.")
+            with self._medir("_realizar_drag_and_drop_manual.hover_origin", "'hover' en origen"):
+                elemento_origen.hover()
 
             # 2. Presionar el botón izquierdo del ratón (iniciar arrastre)
-            start_time_mouse_down = time.time()
             self.logger.info("\n⬇️ Presionando botón izquierdo del ratón para iniciar arrastre...")
-            self.page.mouse.down()
-            end_time_mouse_down = time.time()
-            duration_mouse_down = end_time_mouse_down - start_time_mouse_down
-            self.logger.info(f"PERFORMANCE: Tiempo de 'mouse.down': {duration_mouse_down:.4f} segundos.")
+            with self._medir("_realizar_drag_and_drop_manual.mouse_down", "'mouse.down'"):
+                self.page.mouse.down()
 
             # Pausa para simular arrastre humano
             if tiempo_pausa_ms > 0:
                 self.logger.info(f"\n⏳ Pausa durante arrastre (simulación): {tiempo_pausa_ms} ms...")
-                self.page.wait_for_timeout()
+                self.esperar_fijo(tiempo_pausa_ms / 1000)
 
             # 3. Mover el ratón sobre el elemento de destino
-            start_time_hover_destination = time.time()
             self.logger.info(f"\n➡️ Moviendo ratón sobre elemento de destino: '{elemento_destino}'...")
-            elemento_destino.hover(timeout=timeout_locators_ms)
-            end_time_hover_destination = time.time()
-            duration_hover_destination = end_time_hover_destination - start_time_hover_destination
-            self.logger.info(f"PERFORMANCE: Tiempo de 'hover' en destino: {duration_hover_destination:.4f} segundos.")
+            with self._medir("_realizar_drag_and_drop_manual.hover_destination", "'hover' en destino"):
+                elemento_destino.hover(timeout=timeout_locators_ms)
 
             # Pausa adicional antes de soltar, si se desea un comportamiento más humano
             if tiempo_pausa_ms > 0:
                 self.logger.info(f"\n⏳ Pausa antes de soltar (simulación): {tiempo_pausa_ms} ms...")
-                self.page.wait_for_timeout()
+                self.esperar_fijo(tiempo_pausa_ms / 1000)
 
             # 4. Soltar el botón izquierdo del ratón (finalizar arrastre)
-            start_time_mouse_up = time.time()
             self.logger.info("\n⬆️ Soltando botón izquierdo del ratón para finalizar arrastre...")
-            self.page.mouse.up()
-            end_time_mouse_up = time.time()
-            duration_mouse_up = end_time_mouse_up - start_time_mouse_up
-            self.logger.info(f"PERFORMANCE: Tiempo de 'mouse.up': {duration_mouse_up:.4f} segundos.")
+            with self._medir("_realizar_drag_and_drop_manual.mouse_up", "'mouse.up'"):
+                self.page.mouse.up()
 
             self.logger.info(f"\n✔ ÉXITO: 'Drag and Drop' manual realizado exitosamente de '{elemento_origen}' a '{elemento_destino}'.")
             self.tomar_captura(f"{nombre_base}_despues_drag_drop_manual", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del D&D manual: '{nombre_base}_despues_drag_drop_manual.png'")
-
-        except Error as e:
-            error_msg = (
-                f"\n❌ FALLO (Playwright Error - Manual) - {nombre_paso}: Ocurrió un error de Playwright al intentar realizar 'Drag and Drop' manualmente.\n"
-                f"Asegúrate de que los elementos sean visibles e interactuables. Detalles: {e}"
-            )
-            self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_manual_drag_and_drop_playwright", directorio)
-            raise # Re-lanza la excepción original de Playwright.
-        
-        except Exception as e:
-            error_msg = (
-                f"\n❌ FALLO (Inesperado - Manual) - {nombre_paso}: Ocurrió un error inesperado al intentar realizar 'Drag and Drop' manualmente.\n"
-                f"Detalles: {e}"
-            )
-            self.logger.critical(error_msg, exc_info=True) # Uso critical para errores inesperados graves.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_manual_drag_and_drop", directorio)
-            raise # Re-lanza la excepción.
-        
-        finally:
-            # --- Medición de rendimiento: Fin de la operación total de Drag and Drop manual ---
-            end_time_total_drag_drop = time.time()
-            duration_total_drag_drop = end_time_total_drag_drop - start_time_total_drag_drop
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación 'Drag and Drop' manual: {duration_total_drag_drop:.4f} segundos.")
\ No newline at end of file
+            self.logger.info(f"\n📸 Captura de pantalla tomada después del D&D manual: '{nombre_base}_despues_drag_drop_manual.png'")
\ No newline at end of file
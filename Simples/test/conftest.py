@@ -6,12 +6,364 @@ import time
 from playwright.sync_api import Page, expect, Playwright, sync_playwright
 from datetime import datetime
 import os
-from typing import Generator
+from typing import Generator, Optional
 from Simples.utils import config
+from Simples.utils.config import establecer_perfil
+from Simples.utils.browser_pool import BrowserPool
+from Simples.utils.storage_state import CacheEstadoAlmacenamiento
+from Simples.utils.network_filter import FiltroRed
+from Simples.utils.har_replay import HAR_MODOS, MARCADOR_FLUJO, nombre_flujo, ruta_har, preparar_har
+from Simples.utils.local_site import ServidorSitioLocal
+from Simples.utils.data_provider import MARCADOR_DATOS, FIXTURE_FILA, aplicar_reparto_datos, id_fila, obtener_proveedor_datos
+from Simples.utils.screenshot_writer import obtener_escritor_capturas, vaciar_escritor_capturas, cerrar_escritor_capturas
+from Simples.utils.capture_policy import POLITICAS_CAPTURA, obtener_politica_capturas, establecer_politica_capturas
+from Simples.utils.metrics import obtener_registro_metricas
+from Simples.utils.parallel_matrix import ResultadosMatriz, aplicar_afinidad_navegador, combinar_metricas
 from Simples.pages.base_page import Funciones_Globales
-from Simples.locator.locator_barraNavegacion import BarraNavLocatorPage
-from Simples.locator.locator_formularioDescarga import FormularioDescaraLocatorPage
-from Simples.locator.locator_formularioTextBox import FormularioTextBoxLocatorPage
+
+def pytest_addoption(parser):
+    """
+    Registra las opciones de línea de comandos propias del framework.
+    """
+    parser.addoption(
+        "--perfil",
+        action="store",
+        default=None,
+        choices=sorted(config.PERFILES_EJECUCION),
+        help="Perfil de ejecución (slow_mo, pausas, resaltado y capturas). "
+             "Por defecto, el de la variable de entorno PERFIL_EJECUCION o 'demo'."
+    )
+    parser.addoption(
+        "--politica-capturas",
+        action="store",
+        default=None,
+        choices=POLITICAS_CAPTURA,
+        help="Política de captura de evidencias (always, on-failure, first-and-last, every-nth). "
+             "Por defecto, la de la variable de entorno CAPTURA_POLITICA o 'always'."
+    )
+    parser.addoption(
+        "--modo-traza",
+        action="store",
+        default=None,
+        choices=config.MODOS_EVIDENCIA,
+        help="Modo de rastreo (tracing) de Playwright. Por defecto, el de la variable de entorno TRAZA_MODO o 'on'."
+    )
+    parser.addoption(
+        "--modo-video",
+        action="store",
+        default=None,
+        choices=config.MODOS_EVIDENCIA,
+        help="Modo de grabación de video. Por defecto, el de la variable de entorno VIDEO_MODO o 'on'."
+    )
+    parser.addoption(
+        "--modo-har",
+        action="store",
+        default=None,
+        choices=HAR_MODOS,
+        help="Grabación ('record') o reproducción ('replay') de un HAR por flujo de prueba. "
+             "Por defecto, el de la variable de entorno HAR_MODO o 'off'."
+    )
+    parser.addoption(
+        "--sitio-local",
+        action="store_true",
+        default=False,
+        help="Ejecuta las pruebas contra el sitio local de pruebas (servidor HTTP en segundo plano) en lugar de BASE_URL. "
+             "Equivale a la variable de entorno SITIO_LOCAL=1."
+    )
+
+def _es_worker_xdist(pytest_config) -> bool:
+    """
+    Indica si el proceso actual es un worker de pytest-xdist (y no el proceso principal).
+    """
+    return hasattr(pytest_config, "workerinput")
+
+def pytest_configure(config):
+    """
+    Activa el perfil de ejecución indicado por línea de comandos (tiene prioridad sobre la variable de entorno).
+    Con pytest-xdist y afinidad por navegador (o reparto de datos), el reparto 'load' (el que usa '-n' por defecto)
+    pasa a ser 'loadgroup' para que las pruebas de un mismo motor de navegador (o bloque de datos) compartan worker.
+    """
+    config.addinivalue_line("markers", f"{MARCADOR_FLUJO}(nombre): nombre del flujo con el que se graba y reproduce el HAR de la prueba")
+    config.addinivalue_line("markers", f"{MARCADOR_DATOS}(archivo, filas=(inicio, fin), columna_id=None, **opciones): "
+                                       f"parametriza la prueba con una fila del archivo de datos por caso (fixture '{FIXTURE_FILA}')")
+    perfil = config.getoption("--perfil", default=None)
+    if perfil:
+        establecer_perfil(perfil)
+    politica = config.getoption("--politica-capturas", default=None)
+    if politica:
+        establecer_politica_capturas(politica)
+    if not (_afinidad_navegador(config) or _reparto_datos(config)):
+        return
+    if _es_worker_xdist(config):
+        # El worker vuelve a interpretar la línea de comandos (donde el reparto sigue siendo 'load'):
+        # el proceso principal le indica en 'workerinput' que añada el grupo a los nodeid.
+        if config.workerinput.get("reparto_por_navegador"):
+            config.option.loadgroup = True
+    elif getattr(config.option, "dist", "no") == "load":
+        config.option.dist = "loadgroup"
+
+def _afinidad_navegador(pytest_config) -> bool:
+    return config.XDIST_AFINIDAD_NAVEGADOR and pytest_config.pluginmanager.hasplugin("xdist")
+
+def _reparto_datos(pytest_config) -> bool:
+    return config.DATOS_FRAGMENTAR and pytest_config.pluginmanager.hasplugin("xdist")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Hook de pytest-xdist (solo en el proceso principal): indica a cada worker si el reparto es por navegador.
+    """
+    node.workerinput["reparto_por_navegador"] = node.config.getoption("dist") == "loadgroup"
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Agrupa las pruebas de la matriz de navegadores por motor y las guiadas por datos por bloque de filas
+    (marcador 'xdist_group') para el reparto 'loadgroup'.
+    Se ejecuta antes que el hook de pytest-xdist que añade el grupo al nodeid de cada prueba.
+    """
+    if _afinidad_navegador(config):
+        aplicar_afinidad_navegador(items, pytest.mark.xdist_group)
+    if _reparto_datos(config):
+        aplicar_reparto_datos(items, pytest.mark.xdist_group)
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametriza las pruebas con el marcador 'datos' con una fila de su archivo de datos por caso.
+
+    Cada caso recibe como parámetro la fuente, el índice de su fila y el total de filas sobre el que se calculan
+    los bloques; el fixture 'fila_datos' lee la fila al ejecutarse. Con 'filas' no se lee el archivo al recolectar
+    (si el rango excede el archivo, los casos sobrantes se omiten al ejecutarse); sin 'filas' solo se cuentan las
+    filas, y el conteo se comparte entre workers y sesiones (ver `FuenteDatos.num_filas`). Los ids
+    ('<archivo>-<fila>') son estables entre ejecuciones y entre workers de pytest-xdist. Con 'columna_id' el id
+    es el valor de esa columna, lo que obliga a leer las filas al recolectar.
+    """
+    marcador = metafunc.definition.get_closest_marker(MARCADOR_DATOS)
+    if marcador is None or FIXTURE_FILA not in metafunc.fixturenames:
+        return
+    opciones = dict(marcador.kwargs)
+    filas = opciones.pop("filas", None)
+    columna_id = opciones.pop("columna_id", None)
+    archivo = marcador.args[0]
+    proveedor = obtener_proveedor_datos()
+    clave = proveedor.clave_fuente(archivo, **opciones)
+    fuente = proveedor.fuente(clave)
+    # 'filas' es un rango de filas de datos basado en 1 con ambos extremos incluidos, como en 'iterar_filas_csv'
+    inicio, fin = (filas[0] - 1, filas[1]) if filas else (0, fuente.num_filas)
+    if columna_id is not None:
+        leidas = list(enumerate(fuente.filas(inicio, fin), inicio))
+        indices = [i for i, _ in leidas]
+        ids = [id_fila(archivo, i, fila, columna_id) for i, fila in leidas]
+    else:
+        indices = range(inicio, fin)
+        ids = [id_fila(archivo, i) for i in indices]
+    metafunc.parametrize(FIXTURE_FILA, [(clave, i, fin) for i in indices], ids=ids, indirect=True)
+
+def _modo_evidencia(request, opcion: str, valor_por_defecto: str) -> str:
+    """
+    Devuelve el modo de traza o video: la opción de línea de comandos tiene prioridad sobre config.py.
+    """
+    return request.config.getoption(opcion, default=None) or valor_por_defecto
+
+def _modo_har(pytest_config) -> str:
+    """
+    Devuelve el modo de HAR: la opción '--modo-har' tiene prioridad sobre config.py.
+    """
+    return pytest_config.getoption("--modo-har", default=None) or config.HAR_MODO
+
+def _debe_grabar(modo: str, request) -> bool:
+    """
+    Indica si la prueba actual debe grabar la evidencia según el modo.
+    En 'on-first-retry' solo se graba en la primera repetición (execution_count == 2 de pytest-rerunfailures).
+    """
+    if modo == "off":
+        return False
+    if modo == "on-first-retry":
+        return getattr(request.node, "execution_count", 1) == 2
+    return True
+
+def _prueba_fallida(request) -> bool:
+    """
+    Indica si falló el setup o el cuerpo de la prueba (los reportes los guarda 'pytest_runtest_makereport').
+    """
+    return any(getattr(request.node, f"rep_{fase}", None) is not None and getattr(request.node, f"rep_{fase}").failed
+               for fase in ("setup", "call"))
+
+def _debe_conservar(modo: str, request) -> bool:
+    """
+    Indica si la evidencia grabada se conserva: en 'retain-on-failure' solo si la prueba falló.
+    """
+    if modo == "retain-on-failure":
+        return _prueba_fallida(request)
+    return True
+
+def pytest_runtest_setup(item):
+    """
+    Marca el inicio de la prueba para la política de capturas (las capturas del setup cuentan como de la prueba).
+    """
+    obtener_politica_capturas().iniciar_prueba(item.nodeid)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Guarda el reporte de cada fase en el item ('item.rep_setup', 'item.rep_call', 'item.rep_teardown')
+    y, al terminar la prueba, escribe las capturas retenidas por la política de capturas si corresponde.
+    """
+    outcome = yield
+    reporte = outcome.get_result()
+    setattr(item, f"rep_{reporte.when}", reporte)
+
+    if reporte.when == "teardown":
+        fallida = any(getattr(item, f"rep_{fase}", None) is not None and getattr(item, f"rep_{fase}").failed
+                      for fase in ("setup", "call", "teardown"))
+        retenidas = obtener_politica_capturas().finalizar_prueba(fallida)
+        if retenidas:
+            escritor = obtener_escritor_capturas()
+            for ruta_sin_extension, datos in retenidas:
+                escritor.encolar(ruta_sin_extension, datos)
+
+# Rutas de las métricas exportadas en la sesión, mostradas en el resumen final de pytest
+_archivos_metricas = []
+
+# Resultados de todas las pruebas de la sesión (en el proceso principal incluyen los de todos los workers)
+_resultados_matriz = ResultadosMatriz()
+
+# Métricas en crudo y lanzamientos de navegador recibidos de cada worker de pytest-xdist
+_metricas_workers = []
+
+def pytest_runtest_logreport(report):
+    """
+    Registra el resultado de cada prueba. En el proceso principal de pytest-xdist llegan aquí los reportes de todos los workers.
+    """
+    _resultados_matriz.registrar(report)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Hook de pytest-xdist (solo en el proceso principal): recoge las métricas y estadísticas que envía cada worker al terminar.
+    """
+    salida = getattr(node, "workeroutput", {}) or {}
+    if "metricas" in salida:
+        _metricas_workers.append(salida["metricas"])
+    for tipo, num in salida.get("lanzamientos", {}).items():
+        _estadisticas_pool[tipo] = _estadisticas_pool.get(tipo, 0) + num
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Escribe en disco las capturas de pantalla que aún estén en la cola del escritor en segundo plano
+    y exporta las métricas de rendimiento de la sesión (JSON y CSV con p50/p95/p99 por acción).
+
+    Cada worker de pytest-xdist exporta sus métricas en su subdirectorio de evidencias y las envía al
+    proceso principal, que las combina con los resultados de todas las pruebas en 'reportes/metricas'.
+    """
+    cerrar_escritor_capturas()
+    registro = obtener_registro_metricas()
+    if _es_worker_xdist(session.config):
+        session.config.workeroutput["metricas"] = registro.a_datos()
+        session.config.workeroutput["lanzamientos"] = dict(_estadisticas_pool)
+        if registro.total_muestras:
+            registro.exportar(config.METRICAS_DIR)
+        return
+
+    if _metricas_workers:
+        registro = combinar_metricas([registro.a_datos()] + _metricas_workers)
+    if registro.total_muestras:
+        _archivos_metricas.extend(registro.exportar(config.METRICAS_COMBINADAS_DIR))
+    if _resultados_matriz.total:
+        _archivos_metricas.append(_resultados_matriz.exportar(config.METRICAS_COMBINADAS_DIR))
+
+# Estadísticas del pool de navegadores de la sesión, mostradas en el resumen final de pytest
+_estadisticas_pool = {}
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright: Playwright) -> Generator[BrowserPool, None, None]:
+    """
+    Fixture de sesión que mantiene un navegador abierto por tipo (chromium, firefox, webkit)
+    durante toda la sesión (o por worker de pytest-xdist). Las pruebas obtienen de él un
+    BrowserContext nuevo y aislado en lugar de lanzar un navegador propio.
+    """
+    perfil = config.obtener_perfil()
+    pool = BrowserPool(playwright, headless=True, slow_mo=perfil["slow_mo"], reutilizar=config.BROWSER_POOL_ENABLED)
+    yield pool
+    pool.cerrar_todos()
+    _estadisticas_pool.update(pool.lanzamientos)
+
+@pytest.fixture(scope="session")
+def filtro_red() -> Optional[FiltroRed]:
+    """
+    Fixture de sesión con el filtro de peticiones de red compilado a partir de las listas de bloqueo de config.py
+    (ver config.RED_FILTRO_HABILITADO). Devuelve None si está deshabilitado.
+    """
+    if not config.RED_FILTRO_HABILITADO:
+        return None
+    return FiltroRed(config.RED_DOMINIOS_BLOQUEADOS, config.RED_TIPOS_BLOQUEADOS, config.RED_PATRONES_BLOQUEADOS)
+
+@pytest.fixture
+def fila_datos(request) -> dict:
+    """
+    Fila de datos del caso actual de una prueba con el marcador 'datos', como diccionario {columna: valor}.
+    La primera prueba de cada bloque de filas lo lee del archivo; las demás lo reciben de memoria.
+    """
+    parametro = getattr(request, "param", None)
+    if parametro is None:
+        pytest.fail(f"La prueba usa el fixture '{FIXTURE_FILA}' sin el marcador '{MARCADOR_DATOS}(archivo)'.")
+    clave, indice, total = parametro
+    try:
+        return obtener_proveedor_datos().fila(clave, indice, total)
+    except IndexError as e:
+        pytest.skip(str(e))
+
+@pytest.fixture(scope="session")
+def sitio_local() -> Generator[str, None, None]:
+    """
+    Fixture de sesión que sirve las páginas de config.SITIO_LOCAL_DIR desde un servidor HTTP local en un hilo
+    en segundo plano (uno por worker de pytest-xdist) y devuelve su URL base. Se detiene al finalizar la sesión.
+    """
+    with ServidorSitioLocal(config.SITIO_LOCAL_DIR) as url:
+        yield url
+
+@pytest.fixture(scope="session")
+def url_base(request) -> str:
+    """
+    Fixture de sesión con la URL base de la aplicación bajo prueba: la del sitio local con '--sitio-local'
+    (o SITIO_LOCAL=1) y, si no, config.BASE_URL.
+    """
+    if _usa_sitio_local(request.config):
+        return request.getfixturevalue("sitio_local")
+    return config.BASE_URL
+
+def _usa_sitio_local(pytest_config) -> bool:
+    return pytest_config.getoption("--sitio-local", default=False) or config.SITIO_LOCAL_HABILITADO
+
+@pytest.fixture(scope="session")
+def estado_almacenamiento(browser_pool: BrowserPool, filtro_red: Optional[FiltroRed], url_base: str,
+                          request) -> Optional[CacheEstadoAlmacenamiento]:
+    """
+    Fixture de sesión con la caché de 'storage_state' precalentado por navegador (ver config.ESTADO_ALMACENAMIENTO_HABILITADO).
+    Devuelve None si está deshabilitada, si las pruebas se reproducen desde HAR (el precalentamiento necesita la red)
+    o con el sitio local: sus páginas estáticas no dejan estado que precalentar y cada worker lo sirve en otro puerto.
+    """
+    if (not config.ESTADO_ALMACENAMIENTO_HABILITADO or _modo_har(request.config) == "replay"
+            or _usa_sitio_local(request.config)):
+        return None
+    return CacheEstadoAlmacenamiento(config.ESTADO_ALMACENAMIENTO_DIR, url_base,
+                                     config.ESTADO_ALMACENAMIENTO_MAX_EDAD, browser_pool.obtener_navegador,
+                                     preparar_contexto=filtro_red.instalar if filtro_red else None)
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Muestra cuántas veces se lanzó cada navegador durante la sesión (sumando todos los workers),
+    el reparto de las pruebas por worker y dónde se exportaron las métricas y los resultados.
+    """
+    if _estadisticas_pool:
+        detalle = ", ".join(f"{tipo}={num}" for tipo, num in sorted(_estadisticas_pool.items()))
+        terminalreporter.write_line(f"Lanzamientos de navegador: {sum(_estadisticas_pool.values())} ({detalle})")
+    if _metricas_workers:
+        for worker, resultados in _resultados_matriz.resumen("worker").items():
+            detalle = ", ".join(f"{resultado}={num}" for resultado, num in sorted(resultados.items()))
+            terminalreporter.write_line(f"Pruebas del worker {worker}: {detalle}")
+    for ruta in _archivos_metricas:
+        terminalreporter.write_line(f"Métricas de rendimiento exportadas en: {ruta}")
 
 # Función para generar IDs legibles
 def generar_ids_browser(param):
@@ -40,43 +392,69 @@ def generar_ids_browser(param):
     ],
     ids=generar_ids_browser # <--- Usar la función para generar IDs
 )
-def playwright_page(playwright: Playwright, request) -> Generator[Page, None, None]:
+def playwright_page(playwright: Playwright, browser_pool: BrowserPool,
+                    estado_almacenamiento: Optional[CacheEstadoAlmacenamiento], filtro_red: Optional[FiltroRed],
+                    request) -> Generator[Page, None, None]:
     """
-    Fixture base para configurar el navegador, contexto y página de Playwright con configuraciones comunes.
-    Maneja el lanzamiento del navegador, la creación del contexto (con grabación de video y emulación de dispositivos),
-    el rastreo (tracing) y la navegación de la página a una URL específica. También renombra el archivo de video al finalizar.
+    Fixture base para configurar el contexto y la página de Playwright con configuraciones comunes.
+    El navegador se obtiene del pool de la sesión ('browser_pool'); para cada prueba se crea un contexto
+    nuevo y aislado (con grabación de video y emulación de dispositivos) y se activa el rastreo (tracing).
+    Si la caché 'estado_almacenamiento' está habilitada, el contexto parte del storage_state precalentado del navegador,
+    y si el filtro de red ('filtro_red') está habilitado, el contexto aborta las peticiones de publicidad y analítica.
+    Con '--modo-har record' / 'replay' el flujo de la prueba se graba en su HAR o se sirve desde él.
+    La grabación del video y del rastreo depende de sus modos ('--modo-video' / '--modo-traza'): en
+    'retain-on-failure' las pruebas que pasan detienen el rastreo sin escribir el zip y borran su video.
+    También renombra el archivo de video al finalizar.
     """
     param = request.param
     browser_type = param["browser"]
     resolution = param["resolution"]
     device_name = param["device"]
 
-    browser_instance = None
+    # Las métricas registradas durante la prueba se indexan por prueba, navegador y dispositivo
+    metricas = obtener_registro_metricas()
+    metricas.establecer_contexto(id_prueba=request.node.nodeid, navegador=browser_type,
+                                 dispositivo=device_name or f"{resolution['width']}x{resolution['height']}")
+
+    modo_traza = _modo_evidencia(request, "--modo-traza", config.TRAZA_MODO)
+    modo_video = _modo_evidencia(request, "--modo-video", config.VIDEO_MODO)
+    grabar_traza = _debe_grabar(modo_traza, request)
+    grabar_video = _debe_grabar(modo_video, request)
+
     context = None
     page = None
 
     try:
-        if browser_type == "chromium":
-            browser_instance = playwright.chromium.launch(headless=True, slow_mo=500)
-        elif browser_type == "firefox":
-            browser_instance = playwright.firefox.launch(headless=True, slow_mo=500)
-        elif browser_type == "webkit":
-            browser_instance = playwright.webkit.launch(headless=True, slow_mo=500)
-        else:
-            raise ValueError(f"\nEl tipo de navegador '{browser_type}' no es compatible.")
-
-        context_options = {
-            "record_video_dir": config.VIDEO_DIR,
-            "record_video_size": {"width": 1920, "height": 1080}
-        }
+        context_options = {}
+        if grabar_video:
+            context_options = {
+                "record_video_dir": config.VIDEO_DIR,
+                "record_video_size": {"width": 1920, "height": 1080}
+            }
+        if estado_almacenamiento is not None:
+            ruta_estado = estado_almacenamiento.obtener(browser_type)
+            if ruta_estado:
+                context_options["storage_state"] = ruta_estado
 
         if device_name:
             device = playwright.devices[device_name]
-            context = browser_instance.new_context(**device, **context_options)
+            context = browser_pool.nuevo_contexto(browser_type, **device, **context_options)
         elif resolution:
-            context = browser_instance.new_context(viewport=resolution, **context_options)
+            context = browser_pool.nuevo_contexto(browser_type, viewport=resolution, **context_options)
         else:
-            context = browser_instance.new_context(**context_options)
+            context = browser_pool.nuevo_contexto(browser_type, **context_options)
+
+        # El HAR se registra antes que el filtro de red: las peticiones bloqueadas nunca llegan a grabarse ni a buscarse en él
+        modo_har = _modo_har(request.config)
+        if modo_har != "off":
+            har = ruta_har(config.HAR_DIR, nombre_flujo(request.node), generar_ids_browser(param))
+            try:
+                preparar_har(context, modo_har, har, config.HAR_NO_ENCONTRADO)
+            except FileNotFoundError as e:
+                pytest.skip(str(e))
+
+        if filtro_red is not None:
+            filtro_red.instalar(context)
 
         page = context.new_page()
 
@@ -90,19 +468,34 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
         trace_file_name = f"traceview_{current_time}_{browser_type}_{trace_name_suffix}.zip"
         trace_path = os.path.join(config.TRACEVIEW_DIR, trace_file_name)
 
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        if grabar_traza:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
 
         yield page
 
     finally:
+        # Las capturas de la prueba deben estar en disco antes de cerrar su evidencia
+        vaciar_escritor_capturas()
+
         if context:
-            context.tracing.stop(path=trace_path)
+            if grabar_traza:
+                # Sin 'path' Playwright descarta la traza en lugar de escribir el zip
+                if _debe_conservar(modo_traza, request):
+                    context.tracing.stop(path=trace_path)
+                else:
+                    context.tracing.stop()
             context.close()
             
-        if browser_instance:
-            browser_instance.close()
+        # El navegador pertenece al pool de la sesión; solo se cierra aquí si el pool está deshabilitado
+        browser_pool.liberar_navegador(browser_type)
+        metricas.limpiar_contexto()
             
-        if page and page.video:
+        if page and page.video and not _debe_conservar(modo_video, request):
+            try:
+                page.video.delete()
+            except Exception as e:
+                print(f"\nError al eliminar el video: {e}")
+        elif page and page.video:
             video_path = page.video.path()
             new_video_name = datetime.now().strftime("%Y%m%d-%H%M%S") + ".webm"
             new_video_path = os.path.join(config.VIDEO_DIR, new_video_name)
@@ -112,68 +505,56 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
             except Exception as e:
                 print(f"\nError al renombrar el video: {e}")
 
+def abrir_ruta(page: Page, nombre_ruta: str, base_url: str = None) -> Page:
+    """
+    Navega directamente (deep link) a una ruta de la aplicación definida en 'config.RUTAS_APLICACION'
+    y valida la URL, sin pasar por la página de inicio ni por el menú.
+    """
+    ruta = config.obtener_ruta(nombre_ruta, base_url)
+    # Espera a que el DOM de la página se cargue antes de continuar
+    page.goto(ruta["url"], wait_until="domcontentloaded")
+    page.set_default_timeout(10000)
+
+    fg = Funciones_Globales(page)
+    fg.validar_url_actual(ruta["patron_url"])
+    return page
+
 @pytest.fixture(scope="function")
-def set_up_Descarga(playwright_page: Page) -> Generator[Page, None, None]:
+def set_up_Inicio(playwright_page: Page, url_base: str) -> Generator[Page, None, None]:
     """
-    Fixture para pruebas que interactúan con la funcionalidad "Descargar archivo"
+    Fixture para las pruebas de navegación por el menú: abre la página de inicio de la aplicación.
     """
     # Espera a que el DOM de la página se cargue antes de continuar
-    playwright_page.goto(config.BASE_URL, wait_until="domcontentloaded")
+    playwright_page.goto(url_base, wait_until="domcontentloaded")
     playwright_page.set_default_timeout(10000)
-    
-    fg = Funciones_Globales(playwright_page)
-    bnl = BarraNavLocatorPage(playwright_page)
-    fdl = FormularioDescaraLocatorPage(playwright_page)
-    
-    # Espera a que el selector del menú de formulario sea visible usando .wait_for()
-    bnl.opcionFormulario.wait_for()
-    
-    fg.hacer_click_en_elemento(bnl.opcionFormulario, "clic_menu_formulario", config.SCREENSHOT_DIR, None, 1)
-    
-    ancho_viewport = playwright_page.viewport_size['width']
-    if ancho_viewport <= 768:
-        fg.scroll_pagina(0, 20)
-    else:
-        fg.logger.info(f"Detectada resolución de escritorio ({ancho_viewport}px). No se hace clic en el menú hamburguesa.")
-        
-    # Espera a que el elemento del Text Box sea visible antes de hacer clic
-    fdl.opcionDescarga.wait_for()
-    fg.hacer_click_en_elemento(fdl.opcionDescarga, "hacer_click_en_elemento_menú_formulario_descarga", config.SCREENSHOT_DIR, None, 1)
-    
-    fg.validar_url_actual(".*/upload-download")
-    fg.validar_titulo_de_web("DEMOQA", "validar_titulo_de_web", config.SCREENSHOT_DIR)
-    
+
     yield playwright_page
-    
+
+@pytest.fixture(scope="function")
+def set_up_Descarga(playwright_page: Page, url_base: str) -> Generator[Page, None, None]:
+    """
+    Fixture para pruebas que interactúan con la funcionalidad "Descargar archivo".
+    Abre directamente la ruta 'upload-download' (el recorrido por el menú se prueba en test_navegacion.py).
+    """
+    yield abrir_ruta(playwright_page, "upload-download", url_base)
+
 @pytest.fixture(scope="function")
-def set_up_Tabulacion(playwright_page: Page) -> Generator[Page, None, None]:
+def set_up_Tabulacion(playwright_page: Page, url_base: str) -> Generator[Page, None, None]:
     """
-    Fixture para pruebas que interactúan con la funcionalidad "Text Box"
+    Fixture para pruebas que interactúan con la funcionalidad "Text Box".
+    Abre directamente la ruta 'text-box' (el recorrido por el menú se prueba en test_navegacion.py).
+    """
+    yield abrir_ruta(playwright_page, "text-box", url_base)
+
+@pytest.fixture(scope="function")
+def set_up_SitioLocal(playwright_page: Page, sitio_local: str) -> Generator[Page, None, None]:
+    """
+    Fixture para las pruebas de 'Funciones_Globales' contra el sitio local de pruebas (sin red).
+    Abre la página de inicio del sitio local; cada prueba navega después a la página que necesita
+    (la URL base la proporciona el fixture 'sitio_local').
     """
     # Espera a que el DOM de la página se cargue antes de continuar
-    playwright_page.goto(config.BASE_URL, wait_until="domcontentloaded")
+    playwright_page.goto(sitio_local, wait_until="domcontentloaded")
     playwright_page.set_default_timeout(10000)
-    
-    fg = Funciones_Globales(playwright_page)
-    bnl = BarraNavLocatorPage(playwright_page)
-    tbl = FormularioTextBoxLocatorPage(playwright_page)
-    
-    # Espera a que el selector del menú de formulario sea visible usando .wait_for()
-    bnl.opcionFormulario.wait_for()
-    
-    fg.hacer_click_en_elemento(bnl.opcionFormulario, "clic_menu_formulario", config.SCREENSHOT_DIR, None, 1)
-    
-    ancho_viewport = playwright_page.viewport_size['width']
-    if ancho_viewport <= 768:
-        fg.scroll_pagina(0, 20)
-    else:
-        fg.logger.info(f"Detectada resolución de escritorio ({ancho_viewport}px). No se hace clic en el menú hamburguesa.")
-    
-    # Espera a que el elemento del Text Box sea visible antes de hacer clic
-    tbl.opcionTextBox.wait_for()
-    fg.hacer_click_en_elemento(tbl.opcionTextBox, "hacer_click_en_elemento_menú_formulario_texBox", config.SCREENSHOT_DIR, None, 1)
-    
-    fg.validar_url_actual(".*/text-box")
-    fg.validar_titulo_de_web("DEMOQA", "validar_titulo_de_web", config.SCREENSHOT_DIR)
-    
+
     yield playwright_page
\ No newline at end of file
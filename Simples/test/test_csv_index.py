@@ -0,0 +1,72 @@
+import csv
+import json
+from Simples.utils.csv_index import IndiceCsv
+
+# Con ';' el campo '"b\nc"' va entre comillas y ocupa dos líneas; con ',' la comilla no abre un campo entre comillas
+CONTENIDO = 'h1;h2\na;"b\nc"\nz;y\n'
+
+def _filas_esperadas(ruta, delimitador):
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        return list(csv.reader(archivo, delimiter=delimitador))
+
+def test_IndiceCsvPorDelimitador(tmp_path):
+    """
+    Indexa el mismo CSV con dos delimitadores que dan límites de fila distintos y comprueba que cada índice
+    guardado en disco solo se reutiliza con su delimitador.
+
+    Args:
+        tmp_path (Path): Directorio temporal de pytest.
+    """
+    ruta = tmp_path / "datos.csv"
+    ruta.write_bytes(CONTENIDO.encode("utf-8"))
+    directorio_indices = str(tmp_path / "indices")
+
+    for delimitador in (",", ";"):
+        indice = IndiceCsv(str(ruta), delimitador, directorio_indices=directorio_indices)
+        try:
+            assert not indice.desde_disco
+            assert list(indice.iterar_filas()) == _filas_esperadas(ruta, delimitador)
+        finally:
+            indice.cerrar()
+
+    indice = IndiceCsv(str(ruta), ";", directorio_indices=directorio_indices)
+    try:
+        assert indice.desde_disco
+        assert indice.num_filas == 3
+        assert indice.fila(1) == ["a", "b\nc"]
+        assert list(indice.iterar_filas()) == [["h1", "h2"], ["a", "b\nc"], ["z", "y"]]
+    finally:
+        indice.cerrar()
+
+def test_IndiceCsvRechazaDelimitadorDistinto(tmp_path):
+    """
+    Un índice en disco cuyos metadatos indican otro delimitador (p. ej. el de otra ruta de índice renombrada)
+    no se carga: el índice se reconstruye.
+
+    Args:
+        tmp_path (Path): Directorio temporal de pytest.
+    """
+    ruta = tmp_path / "datos.csv"
+    ruta.write_bytes(CONTENIDO.encode("utf-8"))
+    directorio_indices = str(tmp_path / "indices")
+
+    indice = IndiceCsv(str(ruta), ",", directorio_indices=directorio_indices)
+    ruta_indice_coma = indice._ruta_indice()
+    indice.cerrar()
+    indice = IndiceCsv(str(ruta), ";", directorio_indices=directorio_indices)
+    ruta_indice_punto_y_coma = indice._ruta_indice()
+    indice.cerrar()
+    assert ruta_indice_coma != ruta_indice_punto_y_coma
+
+    # El índice de ',' colocado donde se busca el de ';'
+    with open(ruta_indice_coma, "rb") as origen, open(ruta_indice_punto_y_coma, "wb") as destino:
+        destino.write(origen.read())
+    with open(ruta_indice_punto_y_coma, "rb") as archivo:
+        assert json.loads(archivo.readline())["delimiter"] == ","
+
+    indice = IndiceCsv(str(ruta), ";", directorio_indices=directorio_indices)
+    try:
+        assert not indice.desde_disco
+        assert list(indice.iterar_filas()) == [["h1", "h2"], ["a", "b\nc"], ["z", "y"]]
+    finally:
+        indice.cerrar()
@@ -0,0 +1,66 @@
+import pytest
+from Simples.pages.base_page import Funciones_Globales
+from Simples.utils import config
+
+def _enviar_formulario(page, sitio_local: str, nombre_completo: str, direccion: str, nombre_base: str):
+    """
+    Rellena y envía el formulario 'Text Box' del sitio local con los datos de una fila y verifica la salida.
+    """
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/text-box", wait_until="domcontentloaded")
+    fg.rellenar_campo_de_texto("#userName", nombre_completo, f"{nombre_base}_nombre", config.SCREENSHOT_DIR)
+    fg.rellenar_campo_de_texto("#currentAddress", direccion, f"{nombre_base}_direccion", config.SCREENSHOT_DIR)
+    fg.hacer_click_en_elemento("#submit", f"{nombre_base}_submit", config.SCREENSHOT_DIR)
+    fg.verificar_texto_contenido("#name", f"Name:{nombre_completo}", f"{nombre_base}_verificar_nombre", config.SCREENSHOT_DIR)
+
+@pytest.mark.datos("MOCK_DATA.csv", filas=(1, 2))
+def test_FormularioDesdeCsv(set_up_SitioLocal, sitio_local, fila_datos):
+    """
+    Envía el formulario 'Text Box' con cada una de las dos primeras filas de MOCK_DATA.csv.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        fila_datos (dict): Fila de datos del caso ({'Nombre', 'Apellido', 'Teléfono'}).
+    """
+    _enviar_formulario(set_up_SitioLocal, sitio_local, f"{fila_datos['Nombre']} {fila_datos['Apellido']}",
+                       fila_datos["Teléfono"], "datos_csv")
+
+@pytest.mark.datos("MOCK_DATA.xlsx", hoja="data", filas=(1, 2))
+def test_FormularioDesdeExcel(set_up_SitioLocal, sitio_local, fila_datos):
+    """
+    Envía el formulario 'Text Box' con cada una de las dos primeras filas de la hoja 'data' de MOCK_DATA.xlsx.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        fila_datos (dict): Fila de datos del caso ({'Nombre', 'Apellidos', 'Teléfono'}).
+    """
+    _enviar_formulario(set_up_SitioLocal, sitio_local, f"{fila_datos['Nombre']} {fila_datos['Apellidos']}",
+                       str(fila_datos["Teléfono"]), "datos_excel")
+
+@pytest.mark.datos("MOCK_DATA.json", filas=(1, 2))
+def test_FormularioDesdeJson(set_up_SitioLocal, sitio_local, fila_datos):
+    """
+    Envía el formulario 'Text Box' con cada uno de los dos primeros registros de MOCK_DATA.json.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        fila_datos (dict): Registro del caso ({'Nombre', 'Apellido', 'Teléfono'}).
+    """
+    _enviar_formulario(set_up_SitioLocal, sitio_local, f"{fila_datos['Nombre']} {fila_datos['Apellido']}",
+                       fila_datos["Teléfono"], "datos_json")
+
+@pytest.mark.datos("dataset.xml", etiqueta="record", filas=(1, 2))
+def test_FormularioDesdeXml(set_up_SitioLocal, sitio_local, fila_datos):
+    """
+    Envía el formulario 'Text Box' con cada uno de los dos primeros elementos <record> de dataset.xml.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        fila_datos (dict): Registro del caso ({'Nombre', 'Apellido', 'Teléfono'}).
+    """
+    _enviar_formulario(set_up_SitioLocal, sitio_local, f"{fila_datos['Nombre']} {fila_datos['Apellido']}",
+                       fila_datos["Teléfono"], "datos_xml")
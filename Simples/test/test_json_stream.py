@@ -0,0 +1,33 @@
+import json
+import pytest
+from Simples.utils.json_stream import iterar_elementos_json
+
+# Números con parte decimal y exponente: con bloques pequeños el final del búfer cae dentro de ellos ('12.', '3e', '3e+')
+NUMEROS = [12.5, -0.001, 3e+20, 1.25e-7, 10, 0, -7, 123456.789, 2.0, 6.02e23]
+
+@pytest.mark.parametrize("tamano_bloque", [1, 2, 3, 5, 7, 11, 39])
+def test_IterarJsonNumerosConBloquesPequenos(tmp_path, tamano_bloque):
+    """
+    Recorre en streaming un array de números con bloques de pocos caracteres y comprueba que cada número
+    cortado por el final del búfer se decodifica completo (igual que con json.load).
+
+    Args:
+        tmp_path (Path): Directorio temporal de pytest.
+        tamano_bloque (int): Caracteres leídos en cada bloque.
+    """
+    ruta = tmp_path / "numeros.json"
+    ruta.write_text(json.dumps(NUMEROS * 5), encoding="utf-8")
+    assert list(iterar_elementos_json(str(ruta), tamano_bloque=tamano_bloque)) == NUMEROS * 5
+
+@pytest.mark.parametrize("tamano_bloque", [1, 4, 9])
+def test_IterarJsonNumerosEnClave(tmp_path, tamano_bloque):
+    """
+    Igual que el anterior, con el array en una clave del objeto raíz precedida de claves con valores numéricos.
+
+    Args:
+        tmp_path (Path): Directorio temporal de pytest.
+        tamano_bloque (int): Caracteres leídos en cada bloque.
+    """
+    ruta = tmp_path / "objeto.json"
+    ruta.write_text(json.dumps({"total": 1.5e3, "media": 12.75, "valores": NUMEROS}), encoding="utf-8")
+    assert list(iterar_elementos_json(str(ruta), clave="valores", tamano_bloque=tamano_bloque)) == NUMEROS
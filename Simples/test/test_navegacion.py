@@ -0,0 +1,77 @@
+from playwright.sync_api import Page
+from Simples.pages.base_page import Funciones_Globales
+from Simples.locator.locator_barraNavegacion import BarraNavLocatorPage
+from Simples.locator.locator_formularioDescarga import FormularioDescaraLocatorPage
+from Simples.locator.locator_formularioTextBox import FormularioTextBoxLocatorPage
+from Simples.utils import config
+
+def _abrir_formularios_desde_menu(page: Page, fg: Funciones_Globales) -> None:
+    """
+    Hace clic en la opción 'Forms' de la barra de navegación de la página de inicio y, en
+    resoluciones móviles, desplaza la página para que el menú lateral quede a la vista.
+    """
+    bnl = BarraNavLocatorPage(page)
+
+    # Espera a que el selector del menú de formulario sea visible usando .wait_for()
+    bnl.opcionFormulario.wait_for()
+    fg.hacer_click_en_elemento(bnl.opcionFormulario, "clic_menu_formulario", config.SCREENSHOT_DIR, None, 1)
+
+    ancho_viewport = page.viewport_size['width']
+    if ancho_viewport <= 768:
+        fg.scroll_pagina(0, 20)
+    else:
+        fg.logger.info(f"Detectada resolución de escritorio ({ancho_viewport}px). No se hace clic en el menú hamburguesa.")
+
+def test_NavegarMenuTextBox(set_up_Inicio):
+    """
+    Prueba el recorrido por el menú desde la página de inicio hasta el formulario 'Text Box'.
+
+    Las pruebas funcionales abren la ruta directamente (fixture 'set_up_Tabulacion'); esta prueba
+    cubre una sola vez por navegador el camino que sigue el usuario:
+    1. Abre la página de inicio (gestionado por el fixture 'set_up_Inicio').
+    2. Hace clic en la opción 'Forms' de la barra de navegación.
+    3. Hace clic en la opción 'Text Box' del menú lateral.
+    4. Valida la URL y el título de la página.
+
+    Args:
+        set_up_Inicio (Page): Objeto de página de Playwright en la página de inicio de la aplicación.
+    """
+    page = set_up_Inicio
+    fg = Funciones_Globales(page)
+    tbl = FormularioTextBoxLocatorPage(page)
+
+    _abrir_formularios_desde_menu(page, fg)
+
+    # Espera a que el elemento del Text Box sea visible antes de hacer clic
+    tbl.opcionTextBox.wait_for()
+    fg.hacer_click_en_elemento(tbl.opcionTextBox, "hacer_click_en_elemento_menú_formulario_texBox", config.SCREENSHOT_DIR, None, 1)
+
+    fg.validar_url_actual(config.obtener_ruta("text-box")["patron_url"])
+    fg.validar_titulo_de_web("DEMOQA", "validar_titulo_de_web", config.SCREENSHOT_DIR)
+
+def test_NavegarMenuDescarga(set_up_Inicio):
+    """
+    Prueba el recorrido por el menú desde la página de inicio hasta el formulario 'Upload and Download'.
+
+    Las pruebas funcionales abren la ruta directamente (fixture 'set_up_Descarga'); esta prueba
+    cubre una sola vez por navegador el camino que sigue el usuario:
+    1. Abre la página de inicio (gestionado por el fixture 'set_up_Inicio').
+    2. Hace clic en la opción 'Forms' de la barra de navegación.
+    3. Hace clic en la opción 'Upload and Download' del menú lateral.
+    4. Valida la URL y el título de la página.
+
+    Args:
+        set_up_Inicio (Page): Objeto de página de Playwright en la página de inicio de la aplicación.
+    """
+    page = set_up_Inicio
+    fg = Funciones_Globales(page)
+    fdl = FormularioDescaraLocatorPage(page)
+
+    _abrir_formularios_desde_menu(page, fg)
+
+    # Espera a que el elemento de descarga sea visible antes de hacer clic
+    fdl.opcionDescarga.wait_for()
+    fg.hacer_click_en_elemento(fdl.opcionDescarga, "hacer_click_en_elemento_menú_formulario_descarga", config.SCREENSHOT_DIR, None, 1)
+
+    fg.validar_url_actual(config.obtener_ruta("upload-download")["patron_url"])
+    fg.validar_titulo_de_web("DEMOQA", "validar_titulo_de_web", config.SCREENSHOT_DIR)
@@ -0,0 +1,385 @@
+import os
+import pytest
+from playwright.sync_api import expect
+from Simples.pages.base_page import Funciones_Globales
+from Simples.utils import config
+
+# Filas de la tabla grande del sitio local ('/tabla?filas=N')
+FILAS_TABLA_GRANDE = 10000
+# Opciones del desplegable grande del sitio local ('/desplegables?opciones=N')
+OPCIONES_DESPLEGABLE_GRANDE = 500
+# Archivo de ejemplo que sirve el sitio local en '/descargas/'
+DIRECTORIO_DESCARGAS_LOCAL = os.path.join(config.SITIO_LOCAL_DIR, "descargas")
+ARCHIVO_EJEMPLO = "sampleFile.txt"
+
+def test_FormularioTextBoxLocal(set_up_SitioLocal, sitio_local):
+    """
+    Rellena y envía el formulario 'Text Box' del sitio local y verifica el texto de salida.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/text-box", wait_until="domcontentloaded")
+
+    fg.rellenar_campo_de_texto("#userName", "Ana Pérez", "rellenar_nombre_local", config.SCREENSHOT_DIR)
+    fg.rellenar_campo_de_texto("#userEmail", "ana@example.com", "rellenar_email_local", config.SCREENSHOT_DIR)
+    fg.hacer_click_en_elemento("#submit", "click_submit_local", config.SCREENSHOT_DIR)
+    fg.verificar_texto_contenido("#name", "Name:Ana Pérez", "verificar_salida_nombre_local", config.SCREENSHOT_DIR)
+    fg.verificar_texto_contenido("#email", "Email:ana@example.com", "verificar_salida_email_local", config.SCREENSHOT_DIR)
+
+def test_TablaGrandeLocal(set_up_SitioLocal, sitio_local):
+    """
+    Obtiene las dimensiones y verifica los encabezados de una tabla de 10 000 filas generada en el navegador.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/tabla?filas={FILAS_TABLA_GRANDE}", wait_until="domcontentloaded")
+    tabla = page.locator("#tabla")
+
+    assert fg.obtener_dimensiones_tabla(tabla, "dimensiones_tabla_local", config.SCREENSHOT_DIR) == (FILAS_TABLA_GRANDE, 5)
+    assert fg.verificar_encabezados_tabla(tabla, ["ID", "Producto", "Precio", "Stock", "Seleccionar"],
+                                          "encabezados_tabla_local", config.SCREENSHOT_DIR)
+
+def test_PaginacionLocal(set_up_SitioLocal, sitio_local):
+    """
+    Verifica la página inicial del paginador del sitio local y navega a la página 3.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/paginacion", wait_until="domcontentloaded")
+    paginador = page.locator("#paginacion")
+
+    assert fg.verificar_pagina_inicial_seleccionada(paginador, "1", "paginacion_inicial_local", config.SCREENSHOT_DIR)
+    assert fg.navegar_y_verificar_pagina(paginador, "3", "paginacion_navegar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#contenidoPagina")).to_have_text("Contenido de la página 3")
+
+def test_DialogosLocal(set_up_SitioLocal, sitio_local):
+    """
+    Verifica una alerta simple y acepta un diálogo de confirmación en el sitio local.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/dialogos", wait_until="domcontentloaded")
+
+    assert fg.verificar_alerta_simple_con_expect_event(page.locator("#botonAlerta"), "I am an alert box!",
+                                                       "alerta_local", config.SCREENSHOT_DIR)
+    assert fg.verificar_confirmacion_expect_event(page.locator("#botonConfirmacion"), "Press a button!", "accept",
+                                                  "confirmacion_local", config.SCREENSHOT_DIR)
+
+def test_NuevaPestanaLocal(set_up_SitioLocal, sitio_local):
+    """
+    Abre una pestaña nueva desde el sitio local y cambia el foco a ella.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/ventanas", wait_until="domcontentloaded")
+
+    nueva_pagina = fg.abrir_y_cambiar_a_nueva_pestana(page.locator("#enlacePestana"), "nueva_pestana_local", config.SCREENSHOT_DIR)
+    assert nueva_pagina is not None
+    expect(nueva_pagina.locator("#tituloVentana")).to_have_text("This is a sample page")
+
+def test_DesplegablesLocal(set_up_SitioLocal, sitio_local):
+    """
+    Selecciona una opción de un desplegable simple y varias de uno múltiple en el sitio local.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/desplegables", wait_until="domcontentloaded")
+
+    fg.seleccionar_opcion_por_valor(page.locator("#desplegableColores"), "green", "desplegable_simple_local", config.SCREENSHOT_DIR)
+    fg.seleccionar_multiples_opciones_combo(page.locator("#desplegableMultiple"), ["volvo", "audi"],
+                                            "desplegable_multiple_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#desplegableColores")).to_have_value("green")
+
+def test_SliderLocal(set_up_SitioLocal, sitio_local):
+    """
+    Mueve los dos pulgares del slider de rango del sitio local al 20 % y al 80 %.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/slider", wait_until="domcontentloaded")
+
+    fg.mover_slider_rango(page.locator("#pulgarIzquierdo"), page.locator("#pulgarDerecho"), page.locator("#barraSlider"),
+                          0.2, 0.8, "slider_local", config.SCREENSHOT_DIR)
+
+def test_DescargaLocal(set_up_SitioLocal, sitio_local):
+    """
+    Descarga el archivo de ejemplo del sitio local.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/upload-download", wait_until="domcontentloaded")
+
+    fg.descargar_archivo(page.get_by_role("link", name="Download"), "descargar_archivo_local",
+                         config.SCREENSHOT_DIR, config.SOURCE_FILES_DIR_DOWNLOAD)
+
+@pytest.mark.parametrize("pagina, esperado", [("5", True), ("1", True), ("9", False), ("abc", False)])
+def test_PaginacionVariantesLocal(set_up_SitioLocal, sitio_local, pagina, esperado):
+    """
+    Navega por el paginador del sitio local a la última página, a la página actual, a una página fuera de rango
+    y a un número de página no válido, y verifica el resultado de la navegación.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        pagina (str): Texto de la página de destino.
+        esperado (bool): Resultado esperado de 'navegar_y_verificar_pagina'.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/paginacion", wait_until="domcontentloaded")
+    paginador = page.locator("#paginacion")
+
+    assert fg.navegar_y_verificar_pagina(paginador, pagina, f"paginacion_variante_{pagina}_local", config.SCREENSHOT_DIR) is esperado
+    # Si la navegación no procede, la página 1 sigue seleccionada
+    expect(page.locator("#contenidoPagina")).to_have_text(f"Contenido de la página {pagina if esperado else 1}")
+
+def test_DialogosOnDialogLocal(set_up_SitioLocal, sitio_local):
+    """
+    Verifica una alerta simple con 'page.once("dialog")' y cancela el diálogo de confirmación con las dos
+    variantes de manejo (on dialog y expect_event) en el sitio local.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/dialogos", wait_until="domcontentloaded")
+
+    assert fg.verificar_alerta_simple_con_on(page.locator("#botonAlerta"), "I am an alert box!",
+                                             "alerta_on_local", config.SCREENSHOT_DIR)
+    assert fg.verificar_confirmacion_on_dialog(page.locator("#botonConfirmacion"), "Press a button!", "dismiss",
+                                               "confirmacion_on_cancelar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#demo")).to_have_text("You pressed Cancel!")
+    assert fg.verificar_confirmacion_on_dialog(page.locator("#botonConfirmacion"), "Press a button!", "accept",
+                                               "confirmacion_on_aceptar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#demo")).to_have_text("You pressed OK!")
+    assert fg.verificar_confirmacion_expect_event(page.locator("#botonConfirmacion"), "Press a button!", "dismiss",
+                                                  "confirmacion_cancelar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#demo")).to_have_text("You pressed Cancel!")
+
+def test_PromptLocal(set_up_SitioLocal, sitio_local):
+    """
+    Acepta el prompt del sitio local con un texto (expect_event y on dialog) y lo cancela, y verifica la
+    respuesta que muestra la página.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/dialogos", wait_until="domcontentloaded")
+
+    assert fg.verificar_prompt_expect_event(page.locator("#botonPrompt"), "Please enter your name:", "Ana", "accept",
+                                            "prompt_aceptar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#demo")).to_have_text("You entered: Ana")
+    assert fg.verificar_prompt_on_dialog(page.locator("#botonPrompt"), "Please enter your name:", "Luis", "accept",
+                                         "prompt_on_aceptar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#demo")).to_have_text("You entered: Luis")
+    assert fg.verificar_prompt_on_dialog(page.locator("#botonPrompt"), "Please enter your name:", None, "dismiss",
+                                         "prompt_on_cancelar_local", config.SCREENSHOT_DIR)
+    expect(page.locator("#demo")).to_have_text("You cancelled the prompt.")
+
+def test_VentanaEmergenteLocal(set_up_SitioLocal, sitio_local):
+    """
+    Abre una ventana emergente ('window.open') desde el sitio local, cambia el foco entre ella y la ventana
+    original por URL y por índice, y la cierra.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/ventanas", wait_until="domcontentloaded")
+
+    nuevas_paginas = fg.hacer_clic_y_abrir_nueva_ventana(page.locator("#botonVentana"), "ventana_emergente_local", config.SCREENSHOT_DIR)
+    assert len(nuevas_paginas) == 1
+    emergente = nuevas_paginas[0]
+
+    assert fg.cambiar_foco_entre_ventanas("ventana-nueva", "foco_emergente_local", config.SCREENSHOT_DIR) is emergente
+    expect(fg.page.locator("#tituloVentana")).to_have_text("This is a sample page")
+    assert fg.cambiar_foco_entre_ventanas(0, "foco_original_local", config.SCREENSHOT_DIR) is page
+
+    fg.cerrar_pestana_especifica(emergente, "cerrar_emergente_local", config.SCREENSHOT_DIR)
+    assert emergente.is_closed()
+    assert page.context.pages == [page]
+
+def test_CerrarPestanaActualLocal(set_up_SitioLocal, sitio_local):
+    """
+    Abre una pestaña nueva desde el sitio local, la cierra estando activa y verifica que el foco vuelve a la
+    pestaña original.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/ventanas", wait_until="domcontentloaded")
+
+    nueva_pagina = fg.abrir_y_cambiar_a_nueva_pestana(page.locator("#enlacePestana"), "pestana_a_cerrar_local", config.SCREENSHOT_DIR)
+    assert fg.page is nueva_pagina
+
+    fg.cerrar_pestana_actual("cerrar_pestana_actual_local", config.SCREENSHOT_DIR, tiempo_post_cierre=0)
+    assert nueva_pagina.is_closed()
+    assert fg.page is page
+
+def test_DesplegablesPorLabelYOpcionesLocal(set_up_SitioLocal, sitio_local):
+    """
+    Selecciona una opción por su texto visible en el sitio local, obtiene las opciones de los desplegables y las
+    compara con las esperadas por texto y por valor.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/desplegables", wait_until="domcontentloaded")
+    colores = page.locator("#desplegableColores")
+
+    fg.seleccionar_opcion_por_label(colores, "Azul", "desplegable_label_local", config.SCREENSHOT_DIR, value_esperado="blue")
+    assert fg.verificar_estado_checkbox_o_select(colores, "blue", "desplegable_estado_local", config.SCREENSHOT_DIR)
+
+    assert fg.obtener_valores_dropdown(page.locator("#desplegableMultiple"), "desplegable_valores_local", config.SCREENSHOT_DIR) == [
+        {"value": "volvo", "text": "Volvo"}, {"value": "saab", "text": "Saab"},
+        {"value": "opel", "text": "Opel"}, {"value": "audi", "text": "Audi"}]
+    assert fg.obtener_y_comparar_valores_dropdown(colores, "desplegable_comparar_texto_local", config.SCREENSHOT_DIR,
+                                                  expected_options=["Selecciona un color", "Rojo", "Verde", "Azul"])
+    assert fg.obtener_y_comparar_valores_dropdown(page.locator("#desplegableMultiple"), "desplegable_comparar_valor_local",
+                                                  config.SCREENSHOT_DIR,
+                                                  expected_options=[{"value": v} for v in ("volvo", "saab", "opel", "audi")],
+                                                  compare_by_text=False, compare_by_value=True)
+    with pytest.raises(AssertionError):
+        fg.obtener_y_comparar_valores_dropdown(colores, "desplegable_comparar_fallo_local", config.SCREENSHOT_DIR,
+                                               expected_options=["Rojo", "Verde", "Amarillo"])
+
+def test_DesplegableGrandeLocal(set_up_SitioLocal, sitio_local):
+    """
+    Obtiene las 500 opciones de un desplegable generado en el navegador y selecciona la última por su texto.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/desplegables?opciones={OPCIONES_DESPLEGABLE_GRANDE}", wait_until="domcontentloaded")
+    desplegable = page.locator("#desplegableGrande")
+
+    opciones = fg.obtener_valores_dropdown(desplegable, "desplegable_grande_local", config.SCREENSHOT_DIR)
+    assert len(opciones) == OPCIONES_DESPLEGABLE_GRANDE
+    assert opciones[-1] == {"value": f"opcion-{OPCIONES_DESPLEGABLE_GRANDE}", "text": f"Opción {OPCIONES_DESPLEGABLE_GRANDE}"}
+    fg.seleccionar_opcion_por_label(desplegable, f"Opción {OPCIONES_DESPLEGABLE_GRANDE}", "desplegable_grande_label_local",
+                                    config.SCREENSHOT_DIR, value_esperado=f"opcion-{OPCIONES_DESPLEGABLE_GRANDE}")
+
+@pytest.mark.parametrize("izquierdo, derecho", [(0.0, 1.0), (0.5, 0.5), (0.1, 0.3), (0.7, 0.95)])
+def test_SliderVariantesLocal(set_up_SitioLocal, sitio_local, izquierdo, derecho):
+    """
+    Mueve los pulgares del slider de rango del sitio local a los extremos, a un mismo punto y a rangos estrechos
+    en cada mitad, y verifica los valores que muestra la página.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        izquierdo (float): Porcentaje de destino del pulgar izquierdo (0.0 a 1.0).
+        derecho (float): Porcentaje de destino del pulgar derecho (0.0 a 1.0).
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/slider", wait_until="domcontentloaded")
+
+    fg.mover_slider_rango(page.locator("#pulgarIzquierdo"), page.locator("#pulgarDerecho"), page.locator("#barraSlider"),
+                          izquierdo, derecho, f"slider_{izquierdo}_{derecho}_local", config.SCREENSHOT_DIR)
+    # La función admite unos píxeles de tolerancia: el valor redondeado puede diferir en un par de puntos
+    assert abs(int(page.locator("#valorMinimo").text_content()) - izquierdo * 100) <= 2
+    assert abs(int(page.locator("#valorMaximo").text_content()) - derecho * 100) <= 2
+
+def test_SliderPorcentajesNoValidosLocal(set_up_SitioLocal, sitio_local):
+    """
+    Verifica que el slider de rango del sitio local rechaza porcentajes fuera de rango o con el pulgar izquierdo
+    a la derecha del derecho.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/slider", wait_until="domcontentloaded")
+    pulgares = (page.locator("#pulgarIzquierdo"), page.locator("#pulgarDerecho"), page.locator("#barraSlider"))
+
+    with pytest.raises(ValueError):
+        fg.mover_slider_rango(*pulgares, -0.1, 0.5, "slider_fuera_rango_local", config.SCREENSHOT_DIR)
+    with pytest.raises(ValueError):
+        fg.mover_slider_rango(*pulgares, 0.8, 0.2, "slider_invertido_local", config.SCREENSHOT_DIR)
+
+def test_DescargaContenidoLocal(set_up_SitioLocal, sitio_local, tmp_path):
+    """
+    Descarga el archivo de ejemplo del sitio local en un directorio temporal y verifica su nombre y contenido.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+        tmp_path (Path): Directorio temporal de pytest.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/upload-download", wait_until="domcontentloaded")
+
+    ruta = fg.descargar_archivo("#downloadButton", "descargar_contenido_local", config.SCREENSHOT_DIR, str(tmp_path))
+    assert os.path.basename(ruta) == ARCHIVO_EJEMPLO
+    with open(ruta, "rb") as descargado, open(os.path.join(DIRECTORIO_DESCARGAS_LOCAL, ARCHIVO_EJEMPLO), "rb") as original:
+        assert descargado.read() == original.read()
+
+def test_CargaArchivoLocal(set_up_SitioLocal, sitio_local):
+    """
+    Carga el archivo de ejemplo en el campo de archivo del sitio local y después la remueve.
+
+    Args:
+        set_up_SitioLocal (Page): Página de Playwright en la página de inicio del sitio local.
+        sitio_local (str): URL base del servidor del sitio local.
+    """
+    page = set_up_SitioLocal
+    fg = Funciones_Globales(page)
+    page.goto(f"{sitio_local}/upload-download", wait_until="domcontentloaded")
+    campo = page.locator("#uploadFile")
+
+    assert fg.cargar_archivo(campo, "cargar_archivo_local", config.SCREENSHOT_DIR, DIRECTORIO_DESCARGAS_LOCAL, ARCHIVO_EJEMPLO)
+    expect(page.locator("#uploadedFilePath")).to_contain_text(ARCHIVO_EJEMPLO)
+    assert fg.remover_carga_de_archivo(campo, "remover_carga_local", config.SCREENSHOT_DIR)
+    expect(campo).to_have_value("")
@@ -81,4 +81,71 @@ def test_verificar_orden_inverso_tabulacion(set_up_Tabulacion):
     fg.presionar_Shift_Tab_y_verificar_foco(ftb.campoEmail, "presionar_Shift_Tab_y_verificar_foco_campo_email", config.SCREENSHOT_DIR)
     
     #    - Finalmente, se espera que el foco se mueva del campoEmail al campoNombre.
-    fg.presionar_Shift_Tab_y_verificar_foco(ftb.campoNombre, "presionar_Shift_Tab_y_verificar_foco_campo_nombre", config.SCREENSHOT_DIR)
\ No newline at end of file
+    fg.presionar_Shift_Tab_y_verificar_foco(ftb.campoNombre, "presionar_Shift_Tab_y_verificar_foco_campo_nombre", config.SCREENSHOT_DIR)
+
+def test_verificar_secuencia_tabulacion(set_up_Tabulacion):
+    """
+    Objetivo: Verificar en un solo pase del navegador que la tabulación (tecla Tab)
+    recorre los elementos del formulario de texto en el orden correcto.
+
+    Pasos de la prueba:
+    1. Obtener la instancia de la página de Playwright desde el fixture.
+    2. Inicializar los objetos de las clases de acciones y localizadores.
+    3. Verificar la secuencia completa de foco, empezando por el campo de nombre.
+    """
+    # 1. Inicializa el objeto 'page' de Playwright a partir del fixture.
+    page = set_up_Tabulacion
+
+    # 2. Instancia la clase de funciones globales y la clase de localizadores.
+    fg = Funciones_Globales(page)
+    ftb = FormularioTextBoxLocatorPage(page)
+
+    # 3. El primer elemento es el punto de partida; el resto debe recibir el foco en este orden.
+    fg.verificar_secuencia_tabulacion(
+        [ftb.campoNombre, ftb.campoEmail, ftb.campoDireccion, ftb.campoDireccionFija, ftb.botonSubmit],
+        "verificar_secuencia_tabulacion", config.SCREENSHOT_DIR)
+
+def test_verificar_secuencia_inversa_tabulacion(set_up_Tabulacion):
+    """
+    Objetivo: Verificar en un solo pase del navegador que la tabulación inversa
+    (teclas Shift + Tab) recorre los elementos del formulario en orden inverso.
+
+    Pasos de la prueba:
+    1. Obtener la instancia de la página de Playwright desde el fixture.
+    2. Inicializar los objetos de las clases de acciones y localizadores.
+    3. Verificar la secuencia completa de foco, empezando por el botón de envío.
+    """
+    # 1. Inicializa el objeto 'page' de Playwright a partir del fixture.
+    page = set_up_Tabulacion
+
+    # 2. Instancia la clase de funciones globales y la clase de localizadores.
+    fg = Funciones_Globales(page)
+    ftb = FormularioTextBoxLocatorPage(page)
+
+    # 3. El botón de envío es el punto de partida; Shift + Tab debe recorrer el formulario hacia atrás.
+    fg.verificar_secuencia_tabulacion(
+        [ftb.botonSubmit, ftb.campoDireccionFija, ftb.campoDireccion, ftb.campoEmail, ftb.campoNombre],
+        "verificar_secuencia_inversa_tabulacion", config.SCREENSHOT_DIR, sentido="atras")
+
+def test_verificar_secuencia_tabulacion_detecta_orden_incorrecto(set_up_Tabulacion):
+    """
+    Objetivo: Verificar que la verificación de la secuencia de tabulación falla y
+    reporta la diferencia cuando el orden esperado no es el real.
+
+    Pasos de la prueba:
+    1. Obtener la instancia de la página de Playwright desde el fixture.
+    2. Inicializar los objetos de las clases de acciones y localizadores.
+    3. Indicar un orden incorrecto (dirección antes que email) y esperar el fallo con la diferencia.
+    """
+    # 1. Inicializa el objeto 'page' de Playwright a partir del fixture.
+    page = set_up_Tabulacion
+
+    # 2. Instancia la clase de funciones globales y la clase de localizadores.
+    fg = Funciones_Globales(page)
+    ftb = FormularioTextBoxLocatorPage(page)
+
+    # 3. El orden indicado es incorrecto, por lo que la verificación debe fallar mostrando el paso erróneo.
+    with pytest.raises(AssertionError, match="Orden del foco"):
+        fg.verificar_secuencia_tabulacion(
+            [ftb.campoNombre, ftb.campoDireccion, ftb.campoEmail],
+            "verificar_secuencia_tabulacion_orden_incorrecto", config.SCREENSHOT_DIR)
@@ -0,0 +1,93 @@
+from typing import Dict, Optional
+from playwright.sync_api import Playwright, Browser, BrowserContext # Importa clases necesarias de Playwright
+
+# Tipos de navegador soportados por el pool
+NAVEGADORES_SOPORTADOS = ("chromium", "firefox", "webkit")
+
+class BrowserPool:
+    """
+    Pool de navegadores indexado por tipo de navegador ('chromium', 'firefox', 'webkit').
+
+    Cada tipo de navegador se lanza una única vez por sesión (o por worker de pytest-xdist)
+    y se reutiliza entre pruebas. Cada prueba recibe un `BrowserContext` nuevo y aislado
+    (cookies, almacenamiento, viewport, video y tracing propios), por lo que el aislamiento
+    entre pruebas se mantiene sin pagar el coste de lanzar un proceso de navegador por prueba.
+
+    Si `reutilizar` es `False`, el pool se comporta como el esquema anterior: el navegador
+    se cierra al liberarlo y se vuelve a lanzar en la siguiente prueba. Esto permite comparar
+    ambos modos en los benchmarks.
+    """
+
+    def __init__(self, playwright: Playwright, headless: bool = True, slow_mo: float = 0, reutilizar: bool = True):
+        self.playwright = playwright
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.reutilizar = reutilizar
+        self._navegadores: Dict[str, Browser] = {}
+        # Número de lanzamientos de navegador realizados por tipo (útil para benchmarks)
+        self.lanzamientos: Dict[str, int] = {}
+
+    def _lanzar(self, browser_type: str) -> Browser:
+        if browser_type not in NAVEGADORES_SOPORTADOS:
+            raise ValueError(f"\nEl tipo de navegador '{browser_type}' no es compatible.")
+        lanzador = getattr(self.playwright, browser_type)
+        navegador = lanzador.launch(headless=self.headless, slow_mo=self.slow_mo)
+        self.lanzamientos[browser_type] = self.lanzamientos.get(browser_type, 0) + 1
+        return navegador
+
+    def obtener_navegador(self, browser_type: str) -> Browser:
+        """
+        Devuelve el navegador del tipo indicado, lanzándolo solo si aún no existe
+        o si el proceso anterior se desconectó.
+
+        Args:
+            browser_type (str): 'chromium', 'firefox' o 'webkit'.
+
+        Returns:
+            Browser: La instancia de navegador reutilizable.
+        """
+        navegador: Optional[Browser] = self._navegadores.get(browser_type)
+        if navegador is None or not navegador.is_connected():
+            navegador = self._lanzar(browser_type)
+            self._navegadores[browser_type] = navegador
+        return navegador
+
+    def nuevo_contexto(self, browser_type: str, **opciones_contexto) -> BrowserContext:
+        """
+        Crea un `BrowserContext` nuevo y aislado sobre el navegador del pool.
+
+        Args:
+            browser_type (str): 'chromium', 'firefox' o 'webkit'.
+            **opciones_contexto: Opciones de `Browser.new_context` (viewport, dispositivo, video, etc.).
+
+        Returns:
+            BrowserContext: Un contexto nuevo para la prueba actual.
+        """
+        return self.obtener_navegador(browser_type).new_context(**opciones_contexto)
+
+    def liberar_navegador(self, browser_type: str) -> None:
+        """
+        Indica que la prueba terminó de usar el navegador. En modo reutilizable no hace nada;
+        en modo no reutilizable cierra el navegador para que la siguiente prueba lance uno nuevo.
+        """
+        if self.reutilizar:
+            return
+        navegador = self._navegadores.pop(browser_type, None)
+        if navegador:
+            navegador.close()
+
+    def cerrar_todos(self) -> None:
+        """
+        Cierra todos los navegadores del pool. Se llama al finalizar la sesión.
+        """
+        for navegador in self._navegadores.values():
+            try:
+                navegador.close()
+            except Exception:
+                # El navegador pudo haberse cerrado/desconectado previamente
+                pass
+        self._navegadores.clear()
+
+    @property
+    def total_lanzamientos(self) -> int:
+        return sum(self.lanzamientos.values())
@@ -0,0 +1,121 @@
+import threading
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+# Políticas de captura de evidencias soportadas:
+#   always:         Se guardan todas las capturas (comportamiento original).
+#   on-failure:     Las capturas se retienen en memoria (las últimas K) y solo se escriben si la prueba falla.
+#   first-and-last: Se guarda la primera captura de la prueba y la última se escribe al terminarla.
+#   every-nth:      Se guarda una de cada N capturas (la primera, la N+1, ...); el resto ni siquiera se toma.
+POLITICAS_CAPTURA = ("always", "on-failure", "first-and-last", "every-nth")
+
+# Decisiones que devuelve la política para cada llamada a 'tomar_captura'
+ESCRIBIR = "escribir"
+RETENER = "retener"
+DESCARTAR = "descartar"
+
+class PoliticaCapturas:
+    """
+    Decide, para cada llamada a `tomar_captura`, si la captura se escribe, se retiene en memoria
+    o se descarta, según la política configurada y el estado de la prueba en curso.
+
+    El ciclo de vida de cada prueba lo marcan los hooks de conftest.py con `iniciar_prueba` y
+    `finalizar_prueba`. Fuera de una prueba (p. ej. scripts) todas las capturas se escriben.
+    """
+
+    def __init__(self, politica: str = "always", cada_n: int = 5, max_retenidas: int = 10):
+        if politica not in POLITICAS_CAPTURA:
+            raise ValueError(f"\nLa política de capturas '{politica}' no existe. Políticas disponibles: {', '.join(POLITICAS_CAPTURA)}")
+        self.politica = politica
+        self.cada_n = max(1, cada_n)
+        self.max_retenidas = max(1, max_retenidas)
+        self._bloqueo = threading.Lock()
+        self._prueba_actual: Optional[str] = None
+        self._num_capturas = 0
+        # Buffer circular de (ruta_sin_extension, bytes) de las últimas capturas retenidas
+        self._retenidas: Deque[Tuple[str, bytes]] = deque(maxlen=self.max_retenidas)
+        # Estadísticas de la sesión
+        self.descartadas = 0
+        self.retenidas_sin_escribir = 0
+
+    def iniciar_prueba(self, id_prueba: str) -> None:
+        """
+        Reinicia el estado al comenzar una prueba (incluida su fase de setup).
+        """
+        with self._bloqueo:
+            self._prueba_actual = id_prueba
+            self._num_capturas = 0
+            self._retenidas = deque(maxlen=1 if self.politica == "first-and-last" else self.max_retenidas)
+
+    def decidir(self) -> str:
+        """
+        Registra una nueva llamada a `tomar_captura` y devuelve ESCRIBIR, RETENER o DESCARTAR.
+        """
+        with self._bloqueo:
+            indice = self._num_capturas
+            self._num_capturas += 1
+            if self.politica == "always" or self._prueba_actual is None:
+                return ESCRIBIR
+            if self.politica == "every-nth":
+                if indice % self.cada_n == 0:
+                    return ESCRIBIR
+                self.descartadas += 1
+                return DESCARTAR
+            if self.politica == "first-and-last" and indice == 0:
+                return ESCRIBIR
+            return RETENER
+
+    def retener(self, ruta_sin_extension: str, datos: bytes) -> None:
+        """
+        Guarda en memoria una captura; si el buffer está lleno se pierde la más antigua.
+        """
+        with self._bloqueo:
+            if len(self._retenidas) == self._retenidas.maxlen:
+                self.retenidas_sin_escribir += 1
+            self._retenidas.append((ruta_sin_extension, datos))
+
+    def finalizar_prueba(self, fallida: bool) -> list:
+        """
+        Cierra la prueba en curso y devuelve las capturas retenidas que deben escribirse en disco:
+        todas si la prueba falló, la última en 'first-and-last' y ninguna si 'on-failure' pasó.
+
+        Returns:
+            list: Lista de tuplas (ruta_sin_extension, bytes) a escribir.
+        """
+        with self._bloqueo:
+            retenidas = list(self._retenidas)
+            self._retenidas.clear()
+            self._prueba_actual = None
+            self._num_capturas = 0
+        if fallida or self.politica == "first-and-last":
+            return retenidas
+        self.retenidas_sin_escribir += len(retenidas)
+        return []
+
+
+# Política compartida por todo el proceso (o worker de pytest-xdist)
+_politica: Optional[PoliticaCapturas] = None
+
+def obtener_politica_capturas() -> PoliticaCapturas:
+    """
+    Devuelve la política de capturas del proceso, creándola con la configuración de config.py
+    la primera vez que se necesita.
+    """
+    global _politica
+    if _politica is None:
+        from Simples.utils import config
+        _politica = PoliticaCapturas(politica=config.CAPTURA_POLITICA,
+                                     cada_n=config.CAPTURA_CADA_N,
+                                     max_retenidas=config.CAPTURA_MAX_RETENIDAS)
+    return _politica
+
+def establecer_politica_capturas(politica: str) -> PoliticaCapturas:
+    """
+    Sustituye la política de capturas del proceso (p. ej. desde la opción de pytest '--politica-capturas').
+    """
+    global _politica
+    from Simples.utils import config
+    _politica = PoliticaCapturas(politica=politica,
+                                 cada_n=config.CAPTURA_CADA_N,
+                                 max_retenidas=config.CAPTURA_MAX_RETENIDAS)
+    return _politica
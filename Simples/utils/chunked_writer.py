@@ -0,0 +1,103 @@
+import gzip
+import os
+import shutil
+import uuid
+from typing import Callable, Iterable, Optional, Tuple
+
+# Caracteres que se acumulan antes de cada escritura en el archivo
+TAMANO_BLOQUE = 64 * 1024
+
+def escribir_por_bloques(ruta: str, partes: Iterable[str], delimitador: Optional[str] = None, append: bool = False,
+                         atomico: bool = False, comprimir: bool = False,
+                         tamano_bloque: int = TAMANO_BLOQUE) -> Tuple[int, int]:
+    """
+    Escribe en un archivo de texto (UTF-8) las cadenas de un iterable o generador, separadas por 'delimitador',
+    acumulándolas en bloques de unos 'tamano_bloque' caracteres: el contenido completo nunca se une en memoria,
+    así que la memoria depende del tamaño del bloque y no del archivo.
+
+    Args:
+        ruta (str): Ruta del archivo. El directorio debe existir.
+        partes (Iterable[str]): Cadenas a escribir (una lista, un generador...).
+        delimitador (Optional[str]): Separador entre cadenas consecutivas (no se añade tras la última).
+        append (bool): Si es `True` se añade al final del archivo; si no, se sobrescribe.
+        atomico (bool): Si es `True` se escribe en un archivo temporal del mismo directorio que sustituye al
+                        destino (`os.replace`) solo al terminar: un lector nunca ve el archivo a medio escribir
+                        y, si la escritura falla, el destino queda como estaba. Con 'append' se copia primero
+                        el contenido actual al temporal.
+        comprimir (bool): Si es `True` el contenido se escribe comprimido con gzip (con 'append', como un
+                          miembro gzip más del archivo, que los lectores de gzip leen a continuación).
+        tamano_bloque (int): Caracteres acumulados antes de cada escritura.
+
+    Returns:
+        Tuple[int, int]: Caracteres escritos y número de bloques escritos.
+
+    Raises:
+        OSError: Si falla la apertura o la escritura del archivo.
+        TypeError: Si alguna de las partes no es una cadena. Sin 'atomico', lo escrito hasta ese momento
+                   permanece en el archivo.
+    """
+    ruta_temporal = None
+    if atomico:
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        ruta_temporal = os.path.join(directorio, f".{os.path.basename(ruta)}.{uuid.uuid4().hex}.tmp")
+    try:
+        # O_EXCL para el temporal: nombre único; los permisos de un archivo nuevo respetan la umask como en open()
+        if ruta_temporal is not None:
+            crudo = os.fdopen(os.open(ruta_temporal, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666), "wb")
+        else:
+            crudo = open(ruta, "ab" if append else "wb")
+        with crudo:
+            if ruta_temporal is not None and os.path.exists(ruta):
+                shutil.copymode(ruta, ruta_temporal)
+                if append:
+                    with open(ruta, "rb") as original:
+                        shutil.copyfileobj(original, crudo)
+            if comprimir:
+                # Cerrar el GzipFile escribe el final del miembro gzip sin cerrar 'crudo'
+                with gzip.GzipFile(fileobj=crudo, mode="wb") as capa:
+                    caracteres, bloques = _volcar(capa.write, partes, delimitador, tamano_bloque)
+            else:
+                caracteres, bloques = _volcar(crudo.write, partes, delimitador, tamano_bloque)
+            if ruta_temporal is not None:
+                crudo.flush()
+                os.fsync(crudo.fileno())
+        if ruta_temporal is not None:
+            os.replace(ruta_temporal, ruta)
+            ruta_temporal = None
+        return caracteres, bloques
+    finally:
+        if ruta_temporal is not None and os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+
+def _codificar(texto: str) -> bytes:
+    # Mismo tratamiento de saltos de línea que open(ruta, 'w', encoding='utf-8')
+    if os.linesep != "\n":
+        texto = texto.replace("\n", os.linesep)
+    return texto.encode("utf-8")
+
+def _volcar(escribir: Callable[[bytes], object], partes: Iterable[str], delimitador: Optional[str],
+            tamano_bloque: int) -> Tuple[int, int]:
+    # Acumula las partes (y los delimitadores) y escribe cada vez que el búfer alcanza 'tamano_bloque' caracteres
+    bufer = []
+    acumulado = caracteres = bloques = 0
+    primera = True
+    for parte in partes:
+        if not isinstance(parte, str):
+            raise TypeError(f"Solo se pueden escribir cadenas; se recibió {type(parte).__name__}.")
+        if delimitador and not primera:
+            bufer.append(delimitador)
+            acumulado += len(delimitador)
+        primera = False
+        bufer.append(parte)
+        acumulado += len(parte)
+        if acumulado >= tamano_bloque:
+            escribir(_codificar("".join(bufer)))
+            caracteres += acumulado
+            bloques += 1
+            bufer.clear()
+            acumulado = 0
+    if bufer:
+        escribir(_codificar("".join(bufer)))
+        caracteres += acumulado
+        bloques += 1
+    return caracteres, bloques
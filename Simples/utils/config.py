@@ -13,27 +13,250 @@ PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
 BASE_URL = "https://demoqa.com"
 #FORM_URL = "https://validaciones.rodrigovillanueva.com.mx"
 
+# --- Rutas de la aplicación ---
+# Los fixtures de conftest.py navegan directamente a estas rutas (deep link) en lugar de recorrer el menú
+# desde la página de inicio; el recorrido por el menú solo se prueba en test_navegacion.py.
+# Cada ruta indica su ruta relativa a BASE_URL y el patrón (regex) con el que se valida la URL.
+RUTAS_APLICACION = {
+    "text-box": {"ruta": "/text-box", "patron_url": ".*/text-box"},
+    "upload-download": {"ruta": "/upload-download", "patron_url": ".*/upload-download"},
+}
+
+def obtener_ruta(nombre: str, base_url: str = None) -> dict:
+    """
+    Devuelve la ruta de la aplicación indicada con su URL completa ('url') sobre 'base_url'
+    (por defecto, BASE_URL; p. ej. la URL del sitio local de pruebas).
+    """
+    if nombre not in RUTAS_APLICACION:
+        raise ValueError(f"\nLa ruta '{nombre}' no existe. Rutas disponibles: {', '.join(RUTAS_APLICACION)}")
+    ruta = RUTAS_APLICACION[nombre]
+    return dict(ruta, url=(base_url or BASE_URL).rstrip("/") + ruta["ruta"])
+
+# --- Configuración del pool de navegadores ---
+# Si está habilitado, cada tipo de navegador se lanza una sola vez por sesión (o worker de xdist)
+# y cada prueba recibe un BrowserContext nuevo. Con BROWSER_POOL=0 se vuelve a lanzar
+# un navegador por prueba (útil para comparar en benchmarks).
+BROWSER_POOL_ENABLED = os.environ.get("BROWSER_POOL", "1") != "0"
+
+# --- Perfiles de ejecución ---
+# Cada perfil agrupa en un solo lugar los parámetros que controlan la "velocidad" de la ejecución:
+#   slow_mo:           Milisegundos que Playwright espera entre cada operación del navegador.
+#   pausa_post_accion: Pausa por defecto (segundos) de 'esperar_fijo' cuando no se indica un tiempo.
+#   escala_pausas:     Multiplicador aplicado a todas las pausas fijas de 'esperar_fijo' (0 las elimina).
+#   resaltar:          Si se resaltan visualmente los elementos antes de interactuar con ellos.
+#   capturas:          Si se toman capturas de pantalla en 'tomar_captura'.
+#   nivel_log_archivo: Nivel mínimo de los mensajes escritos en el archivo de log. Con 'INFO' los mensajes
+#                      DEBUG ni siquiera se construyen (ver logger.LoggerPerezoso).
+# Se selecciona con la opción de pytest '--perfil' o con la variable de entorno PERFIL_EJECUCION.
+PERFILES_EJECUCION = {
+    "demo": {"slow_mo": 500, "pausa_post_accion": 0.5, "escala_pausas": 1.0, "resaltar": True, "capturas": True, "nivel_log_archivo": "DEBUG"},
+    "debug": {"slow_mo": 1000, "pausa_post_accion": 1.0, "escala_pausas": 2.0, "resaltar": True, "capturas": True, "nivel_log_archivo": "DEBUG"},
+    "ci-fast": {"slow_mo": 0, "pausa_post_accion": 0.0, "escala_pausas": 0.0, "resaltar": False, "capturas": False, "nivel_log_archivo": "INFO"},
+}
+PERFIL_POR_DEFECTO = "demo"
+PERFIL_EJECUCION = os.environ.get("PERFIL_EJECUCION", PERFIL_POR_DEFECTO)
+
+def establecer_perfil(nombre: str):
+    """
+    Activa el perfil de ejecución indicado para el resto del proceso.
+    """
+    global PERFIL_EJECUCION
+    if nombre not in PERFILES_EJECUCION:
+        raise ValueError(f"\nEl perfil de ejecución '{nombre}' no existe. Perfiles disponibles: {', '.join(PERFILES_EJECUCION)}")
+    PERFIL_EJECUCION = nombre
+
+def obtener_perfil(nombre: str = None) -> dict:
+    """
+    Devuelve la configuración del perfil indicado o, si no se indica, la del perfil activo.
+    """
+    nombre = nombre or PERFIL_EJECUCION
+    if nombre not in PERFILES_EJECUCION:
+        raise ValueError(f"\nEl perfil de ejecución '{nombre}' no existe. Perfiles disponibles: {', '.join(PERFILES_EJECUCION)}")
+    return PERFILES_EJECUCION[nombre]
+
+# --- Configuración de capturas de pantalla ---
+# CAPTURAS_ASINCRONAS: si está habilitado, 'tomar_captura' solo obtiene los bytes de la imagen y un hilo
+#                      en segundo plano los escribe en disco (con CAPTURAS_ASINCRONAS=0 se escribe en el momento).
+# CAPTURA_FORMATO:     'png', 'jpeg' o 'webp' (WebP requiere Pillow; si no está instalado se usa PNG).
+# CAPTURA_CALIDAD:     Calidad (0-100) para JPEG y WebP.
+# CAPTURA_MAX_PENDIENTES: Capturas que pueden esperar en la cola antes de bloquear la prueba (backpressure).
+CAPTURAS_ASINCRONAS = os.environ.get("CAPTURAS_ASINCRONAS", "1") != "0"
+CAPTURA_FORMATO = os.environ.get("CAPTURA_FORMATO", "png").lower()
+CAPTURA_CALIDAD = int(os.environ.get("CAPTURA_CALIDAD", "80"))
+CAPTURA_MAX_PENDIENTES = int(os.environ.get("CAPTURA_MAX_PENDIENTES", "16"))
+
+# --- Política de captura de evidencias ---
+# CAPTURA_POLITICA:      'always' (todas), 'on-failure' (solo si la prueba falla), 'first-and-last'
+#                        (primera y última de cada prueba) o 'every-nth' (una de cada CAPTURA_CADA_N).
+# CAPTURA_CADA_N:        Intervalo de muestreo de la política 'every-nth'.
+# CAPTURA_MAX_RETENIDAS: Capturas que 'on-failure' mantiene en memoria (las últimas K) para escribirlas si la prueba falla.
+# También se puede indicar con la opción de pytest '--politica-capturas'.
+CAPTURA_POLITICA = os.environ.get("CAPTURA_POLITICA", "always")
+CAPTURA_CADA_N = int(os.environ.get("CAPTURA_CADA_N", "5"))
+CAPTURA_MAX_RETENIDAS = int(os.environ.get("CAPTURA_MAX_RETENIDAS", "10"))
+
+# --- Modos de rastreo (tracing) y video ---
+# 'on':                Se graban y conservan en todas las pruebas (comportamiento original).
+# 'off':               No se graban.
+# 'retain-on-failure': Se graban en todas las pruebas, pero solo se conservan las de pruebas fallidas.
+# 'on-first-retry':    Solo se graban en el primer reintento de una prueba (requiere pytest-rerunfailures).
+# Se configuran con las variables de entorno TRAZA_MODO / VIDEO_MODO o con '--modo-traza' / '--modo-video'.
+MODOS_EVIDENCIA = ("on", "off", "retain-on-failure", "on-first-retry")
+TRAZA_MODO = os.environ.get("TRAZA_MODO", "on")
+VIDEO_MODO = os.environ.get("VIDEO_MODO", "on")
+
+# --- Ejecución paralela de la matriz de navegadores (pytest-xdist) ---
+# Si está habilitada, cada prueba parametrizada por 'playwright_page' se marca con 'xdist_group' según su
+# motor de navegador (chromium, firefox, webkit) y el reparto 'load' de xdist pasa a 'loadgroup': todas las
+# pruebas de un motor se ejecutan en el mismo worker, que lanza ese navegador una sola vez (ver BrowserPool).
+# Con XDIST_AFINIDAD_NAVEGADOR=0 se respeta el modo de reparto indicado con '--dist'.
+XDIST_AFINIDAD_NAVEGADOR = os.environ.get("XDIST_AFINIDAD_NAVEGADOR", "1") != "0"
+
+# --- Instrumentación de acciones ---
+# Si está habilitada, el decorador 'accion_instrumentada' (utils/instrumentation.py) mide cada acción de
+# 'Funciones_Globales', la registra en el registro de métricas y cuenta sus errores por clase.
+# Con INSTRUMENTACION=0 solo se conserva el manejo de errores (sin mediciones ni líneas 'PERFORMANCE').
+INSTRUMENTACION_HABILITADA = os.environ.get("INSTRUMENTACION", "1") != "0"
+
+# --- Estado de almacenamiento precalentado (storage_state) ---
+# Si está habilitado, la primera prueba de cada navegador en la sesión visita BASE_URL una vez y guarda el
+# 'storage_state' resultante (cookies y localStorage) en ESTADO_ALMACENAMIENTO_DIR; los contextos de todas las
+# pruebas se crean a partir de él (ver utils/storage_state.py). La instantánea se regenera si cambia BASE_URL
+# o si tiene más de ESTADO_ALMACENAMIENTO_MAX_EDAD segundos. Con ESTADO_ALMACENAMIENTO=0 cada contexto empieza vacío.
+ESTADO_ALMACENAMIENTO_HABILITADO = os.environ.get("ESTADO_ALMACENAMIENTO", "1") != "0"
+ESTADO_ALMACENAMIENTO_MAX_EDAD = int(os.environ.get("ESTADO_ALMACENAMIENTO_MAX_EDAD", "3600"))
+
+# --- Filtro de peticiones de red ---
+# Si está habilitado, cada contexto de prueba aborta las peticiones que coinciden con alguna de estas listas
+# (ver utils/network_filter.py): publicidad y analítica de terceros que ralentizan 'goto' y hacen impredecible
+# 'networkidle'. Los dominios incluyen sus subdominios; los tipos de recurso son los de Playwright
+# ('document', 'script', 'image', 'media', 'font', ...); los patrones son expresiones regulares sobre la URL.
+# Las peticiones bloqueadas se cuentan en las métricas ('red.bloqueadas'). Con RED_FILTRO=0 no se bloquea nada.
+RED_FILTRO_HABILITADO = os.environ.get("RED_FILTRO", "1") != "0"
+RED_DOMINIOS_BLOQUEADOS = (
+    "googlesyndication.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "googletagservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "fundingchoicesmessages.google.com",
+    "amazon-adsystem.com",
+    "adsafeprotected.com",
+    "moatads.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "facebook.net",
+    "hotjar.com",
+)
+RED_TIPOS_BLOQUEADOS = ("media", "font")
+RED_PATRONES_BLOQUEADOS = (
+    r"/pagead/",
+    r"[/.]ads?[/.]",
+    r"\.(?:mp4|webm|ogg)(?:\?|$)",
+)
+
+# --- Grabación y reproducción de HAR ---
+# 'off':    las pruebas usan la red real (por defecto).
+# 'record': cada prueba graba el HAR de su flujo en HAR_DIR ('<módulo>/<función>__<navegador-dispositivo>.har').
+# 'replay': cada prueba se sirve desde el HAR de su flujo con 'route_from_har', sin depender de la red
+#           ni de su latencia. HAR_NO_ENCONTRADO indica qué hacer con las peticiones que no están en el HAR:
+#           'abort' (ejecución totalmente sin red) o 'fallback' (salen a la red).
+# Se configura con la variable de entorno HAR_MODO o con '--modo-har'.
+HAR_MODO = os.environ.get("HAR_MODO", "off")
+HAR_NO_ENCONTRADO = os.environ.get("HAR_NO_ENCONTRADO", "abort")
+
+# --- Sitio local de pruebas ---
+# Si está habilitado, la sesión levanta un servidor HTTP local (utils/local_site.py) que sirve las páginas de
+# SITIO_LOCAL_DIR y los fixtures navegan a él en lugar de a BASE_URL: las pruebas se ejecutan sin red.
+# Se activa con la variable de entorno SITIO_LOCAL=1 o con '--sitio-local'. Las pruebas que usan el fixture
+# 'sitio_local' directamente (test_sitio_local.py) siempre se ejecutan contra el servidor local.
+SITIO_LOCAL_HABILITADO = os.environ.get("SITIO_LOCAL", "0") == "1"
+
+# --- Caché de libros de Excel ---
+# 'num_Filas_excel' y 'dato_Columna_excel' leen cada hoja una sola vez (modo solo lectura, valores calculados)
+# y sirven las consultas siguientes desde memoria (ver utils/workbook_cache.py). Un libro se vuelve a leer si
+# cambia su fecha de modificación o su tamaño; al superar EXCEL_CACHE_MAX_LIBROS se descarta el menos usado.
+EXCEL_CACHE_MAX_LIBROS = int(os.environ.get("EXCEL_CACHE_MAX_LIBROS", "8"))
+
+# --- Índice de filas de CSV ---
+# 'num_Filas_csv', 'dato_Columna_csv' e 'iterar_filas_csv' no cargan el archivo en memoria: la primera vez recorren
+# el CSV y guardan el desplazamiento en bytes de cada fila en CSV_INDICE_DIR (válido mientras no cambien el tamaño ni
+# la fecha de modificación del archivo); después leen solo la fila pedida con mmap (ver utils/csv_index.py).
+# Se mantienen abiertos como máximo CSV_CACHE_MAX_ARCHIVOS archivos por proceso.
+CSV_CACHE_MAX_ARCHIVOS = int(os.environ.get("CSV_CACHE_MAX_ARCHIVOS", "8"))
+
+# --- Lectura de JSON en streaming y caché columnar ---
+# 'iterar_json' recorre los elementos del array de un JSON uno a uno, leyendo el archivo por bloques; 'leer_json_columnar'
+# guarda el array como una lista de valores por campo (ver utils/json_stream.py) para las lecturas repetidas de la sesión.
+# Se conservan como máximo JSON_CACHE_MAX_TABLAS tablas por proceso.
+JSON_CACHE_MAX_TABLAS = int(os.environ.get("JSON_CACHE_MAX_TABLAS", "8"))
+
+# --- Escritura de archivos de texto ---
+# 'escribir_texto' escribe listas, iterables y generadores de cadenas por bloques de ESCRITURA_TAMANO_BLOQUE caracteres
+# (ver utils/chunked_writer.py) en lugar de unir todo el contenido en memoria antes de escribirlo.
+ESCRITURA_TAMANO_BLOQUE = int(os.environ.get("ESCRITURA_TAMANO_BLOQUE", str(64 * 1024)))
+
+# --- Pruebas guiadas por datos ---
+# Las pruebas con el marcador 'datos' se parametrizan con una fila del archivo indicado (CSV, Excel, JSON o XML,
+# relativo a SOURCE_FILES_DIR_DATA_FUENTE) por caso; el fixture 'fila_datos' la recibe como diccionario (ver
+# utils/data_provider.py). Las filas se leen por bloques contiguos de como máximo DATOS_FILAS_POR_BLOQUE filas,
+# la primera vez que una prueba del bloque las necesita. Con pytest-xdist y DATOS_FRAGMENTAR, cada bloque se
+# asigna a un único worker ('xdist_group'), así que cada worker solo lee su parte del archivo.
+# El número de filas de cada fuente (solo necesario si la prueba no indica 'filas') se cuenta una vez y se guarda
+# en DATOS_CONTEOS_DIR para los demás workers y las sesiones siguientes.
+DATOS_FILAS_POR_BLOQUE = int(os.environ.get("DATOS_FILAS_POR_BLOQUE", "1000"))
+DATOS_FRAGMENTAR = os.environ.get("DATOS_FRAGMENTAR", "1") != "0"
+
 # --- Rutas de Almacenamiento de Evidencias ---
 
 # Directorio base donde se guardarán todas las evidencias.
 # Construye la ruta absoluta para que apunte a '.../PRACTICA-RV/PRV/test/reportes'
 EVIDENCE_BASE_DIR = os.path.join(PROJECT_ROOT, "test", "reportes")
 
+# Id del worker de pytest-xdist ('gw0', 'gw1', ...) o None si la ejecución no es paralela.
+# pytest-xdist define PYTEST_XDIST_WORKER antes de importar conftest.py (y con él este módulo).
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+# Directorio de evidencias del proceso: con pytest-xdist cada worker escribe en su propio
+# subdirectorio ('.../test/reportes/gw0', ...) para que sus archivos no se mezclen ni colisionen.
+EVIDENCE_DIR = os.path.join(EVIDENCE_BASE_DIR, XDIST_WORKER) if XDIST_WORKER else EVIDENCE_BASE_DIR
+
 # Ruta para videos.
-# Se creará '.../PRACTICA-RV/PRV/test/reportes/video'
-VIDEO_DIR = os.path.join(EVIDENCE_BASE_DIR, "video")
+# Se creará '.../PRACTICA-RV/PRV/test/reportes[/gwN]/video'
+VIDEO_DIR = os.path.join(EVIDENCE_DIR, "video")
 
 # Ruta para traceview.
-# Se creará '.../PRACTICA-RV/PRV/test/reportes/traceview'
-TRACEVIEW_DIR = os.path.join(EVIDENCE_BASE_DIR, "traceview")
+# Se creará '.../PRACTICA-RV/PRV/test/reportes[/gwN]/traceview'
+TRACEVIEW_DIR = os.path.join(EVIDENCE_DIR, "traceview")
 
 # Ruta para capturas de pantalla.
-# Se creará '.../PRACTICA-RV/PRV/test/reportes/imagen'
-SCREENSHOT_DIR = os.path.join(EVIDENCE_BASE_DIR, "imagen")
+# Se creará '.../PRACTICA-RV/PRV/test/reportes[/gwN]/imagen'
+SCREENSHOT_DIR = os.path.join(EVIDENCE_DIR, "imagen")
+
+# Ruta para las métricas de rendimiento exportadas al final de la sesión (JSON y CSV).
+# Se creará '.../PRACTICA-RV/PRV/test/reportes[/gwN]/metricas'
+METRICAS_DIR = os.path.join(EVIDENCE_DIR, "metricas")
+
+# Ruta para las métricas y resultados combinados de todos los workers de pytest-xdist.
+# Se creará '.../PRACTICA-RV/PRV/test/reportes/metricas'
+METRICAS_COMBINADAS_DIR = os.path.join(EVIDENCE_BASE_DIR, "metricas")
+
+# Ruta para las instantáneas de 'storage_state' por navegador (compartidas por todos los workers).
+# Se creará '.../PRACTICA-RV/PRV/test/reportes/estado_almacenamiento'
+ESTADO_ALMACENAMIENTO_DIR = os.path.join(EVIDENCE_BASE_DIR, "estado_almacenamiento")
+
+# Ruta de los índices de filas de los CSV (compartida por todos los workers, como la de estado_almacenamiento)
+CSV_INDICE_DIR = os.path.join(EVIDENCE_BASE_DIR, "indices_csv")
+
+# Ruta de los conteos de filas de las fuentes de datos (compartida por todos los workers)
+DATOS_CONTEOS_DIR = os.path.join(EVIDENCE_BASE_DIR, "conteos_datos")
 
 # Ruta para logger.
-# Se creará '.../PRACTICA-RV/PRV/test/reportes/log'
-LOGGER_DIR = os.path.join(EVIDENCE_BASE_DIR, "log")
+# Se creará '.../PRACTICA-RV/PRV/test/reportes[/gwN]/log'
+LOGGER_DIR = os.path.join(EVIDENCE_DIR, "log")
 
 # --- Nueva ruta para archivos fuente ---
 # Se creará '.../PRACTICA-RV/PRV/test/archivos_data_escritura'
@@ -48,6 +271,12 @@ SOURCE_FILES_DIR_UPLOAD = os.path.join(PROJECT_ROOT, "test", "archivos", "archiv
 # Se creará '.../PRACTICA-RV/PRV/test/archivos_download'
 SOURCE_FILES_DIR_DOWNLOAD = os.path.join(PROJECT_ROOT, "test", "archivos", "archivos_download")
 
+# Ruta para los HAR grabados de cada flujo (se versionan junto con las pruebas para poder reproducirlos sin red)
+HAR_DIR = os.path.join(PROJECT_ROOT, "test", "archivos", "har")
+
+# Ruta de las páginas del sitio local de pruebas (formularios, tabla grande, paginación, diálogos, etc.)
+SITIO_LOCAL_DIR = os.path.join(PROJECT_ROOT, "test", "archivos", "sitio_local")
+
 # Función para asegurar que los directorios existan
 def ensure_directories_exist():
     """
@@ -61,7 +290,12 @@ def ensure_directories_exist():
     os.makedirs(SOURCE_FILES_DIR_UPLOAD, exist_ok=True)
     os.makedirs(SOURCE_FILES_DIR_DOWNLOAD, exist_ok=True)
     os.makedirs(LOGGER_DIR, exist_ok=True)
-    print(f"Directorios verificados/creados: {EVIDENCE_BASE_DIR}, \
+    os.makedirs(METRICAS_DIR, exist_ok=True)
+    os.makedirs(METRICAS_COMBINADAS_DIR, exist_ok=True)
+    os.makedirs(ESTADO_ALMACENAMIENTO_DIR, exist_ok=True)
+    os.makedirs(CSV_INDICE_DIR, exist_ok=True)
+    os.makedirs(DATOS_CONTEOS_DIR, exist_ok=True)
+    print(f"Directorios verificados/creados: {EVIDENCE_DIR}, \
         {SOURCE_FILES_DIR_UPLOAD}, \
             {SOURCE_FILES_DIR_DOWNLOAD}, \
                 {LOGGER_DIR}, \
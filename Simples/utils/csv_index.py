@@ -0,0 +1,237 @@
+import csv
+import hashlib
+import io
+import json
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+
+# Versión del formato del índice en disco (si cambia, los índices guardados se regeneran)
+VERSION_INDICE = 2
+
+def _lineas_fisicas(archivo) -> Iterator[bytes]:
+    """
+    Líneas de un archivo binario terminadas en '\n', '\r\n' o '\r' (como las que entrega open(..., newline='')
+    a csv.reader), conservando el terminador para poder contar los bytes de cada una.
+    """
+    for linea in archivo:
+        if b"\r" not in linea or (linea.endswith(b"\r\n") and linea.count(b"\r") == 1):
+            # Caso habitual: sin '\r' o solo en el terminador '\r\n'
+            yield linea
+            continue
+        partes = linea.split(b"\r")
+        ultima = partes.pop()
+        for parte in partes[:-1]:
+            yield parte + b"\r"
+        # El '\n' que sigue a la última '\r' forma con ella un terminador '\r\n'
+        if ultima == b"\n":
+            yield partes[-1] + b"\r\n"
+        else:
+            yield partes[-1] + b"\r"
+            if ultima:
+                yield ultima
+
+class IndiceCsv:
+    """
+    Acceso aleatorio y secuencial a un archivo CSV sin cargarlo en memoria.
+
+    Al crearse recorre el archivo una vez y guarda el desplazamiento en bytes del inicio de cada fila lógica
+    (una fila con un campo entre comillas puede ocupar varias líneas físicas: los límites se toman del propio
+    `csv.reader`, así que coinciden con las filas que devolvería leyendo el archivo completo). El índice se
+    persiste en 'directorio_indices' junto con el tamaño y la fecha de modificación del CSV, y se reutiliza
+    mientras el archivo no cambie. Cada delimitador y codificación tiene su propio índice: una comilla solo abre
+    un campo entre comillas al inicio de un campo, así que los límites de las filas dependen del delimitador.
+
+    - `fila(i)` lee solo los bytes de la fila i desde un mapa de memoria (`mmap`) del archivo.
+    - `iterar_filas(inicio, fin)` es un generador que recorre un rango de filas leyendo en streaming.
+    """
+
+    def __init__(self, ruta: str, delimiter: str = ",", encoding: str = "utf-8",
+                 directorio_indices: Optional[str] = None):
+        self.ruta = os.path.abspath(ruta)
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.directorio_indices = directorio_indices
+        estado = os.stat(self.ruta) # Lanza FileNotFoundError si el archivo no existe
+        self.tamano = estado.st_size
+        self.mtime_ns = estado.st_mtime_ns
+        # Desplazamiento del inicio de cada fila más uno final (el fin de la última fila): la fila i ocupa
+        # los bytes [desplazamientos[i], desplazamientos[i + 1]).
+        self.desplazamientos = array("Q")
+        # Indica si el índice se leyó del disco en lugar de construirse recorriendo el archivo
+        self.desde_disco = self._cargar_indice()
+        if not self.desde_disco:
+            self._construir_indice()
+            self._guardar_indice()
+        self._archivo = open(self.ruta, "rb")
+        # mmap no admite archivos vacíos
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ) if self.tamano else None
+
+    # --- Índice ---
+
+    def _ruta_indice(self) -> Optional[str]:
+        if not self.directorio_indices:
+            return None
+        # El hash de la ruta evita colisiones entre CSV con el mismo nombre en directorios distintos; el del
+        # delimitador y la codificación, que los índices de un mismo CSV leído de formas distintas se pisen
+        clave = "\0".join((self.ruta, self.delimiter, self.encoding))
+        huella = hashlib.sha1(clave.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.directorio_indices, f"{os.path.basename(self.ruta)}.{huella}.idx")
+
+    def _construir_indice(self) -> None:
+        desplazamientos = array("Q", [0])
+        posicion = [0]
+
+        def lineas():
+            # Devuelve las líneas físicas decodificadas y lleva la cuenta de los bytes consumidos
+            with open(self.ruta, "rb") as archivo:
+                for linea in _lineas_fisicas(archivo):
+                    posicion[0] += len(linea)
+                    yield linea.decode(self.encoding)
+
+        # csv.reader pide exactamente las líneas que forman cada fila, así que tras cada fila la
+        # posición consumida es el inicio de la siguiente.
+        for _ in csv.reader(lineas(), delimiter=self.delimiter):
+            desplazamientos.append(posicion[0])
+        self.desplazamientos = desplazamientos
+
+    def _cargar_indice(self) -> bool:
+        ruta_indice = self._ruta_indice()
+        if ruta_indice is None or not os.path.exists(ruta_indice):
+            return False
+        try:
+            with open(ruta_indice, "rb") as archivo:
+                meta = json.loads(archivo.readline())
+                if (meta.get("version") != VERSION_INDICE or meta.get("tamano") != self.tamano
+                        or meta.get("mtime_ns") != self.mtime_ns or meta.get("encoding") != self.encoding
+                        or meta.get("delimiter") != self.delimiter):
+                    return False
+                desplazamientos = array("Q")
+                desplazamientos.frombytes(archivo.read())
+        except (OSError, ValueError):
+            return False
+        if len(desplazamientos) != meta.get("filas", -1) + 1:
+            return False
+        self.desplazamientos = desplazamientos
+        return True
+
+    def _guardar_indice(self) -> None:
+        ruta_indice = self._ruta_indice()
+        if ruta_indice is None:
+            return
+        meta = {"version": VERSION_INDICE, "ruta": self.ruta, "tamano": self.tamano, "mtime_ns": self.mtime_ns,
+                "encoding": self.encoding, "delimiter": self.delimiter, "filas": self.num_filas}
+        try:
+            os.makedirs(self.directorio_indices, exist_ok=True)
+            # Escritura atómica: varios workers de pytest-xdist pueden indexar el mismo CSV a la vez
+            temporal = f"{ruta_indice}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporal, "wb") as archivo:
+                archivo.write(json.dumps(meta).encode("utf-8") + b"\n")
+                archivo.write(self.desplazamientos.tobytes())
+            os.replace(temporal, ruta_indice)
+        except OSError:
+            # Sin índice en disco solo se pierde la reutilización entre sesiones
+            pass
+
+    # --- Consultas ---
+
+    @property
+    def num_filas(self) -> int:
+        """
+        Número de filas lógicas del archivo (incluido el encabezado, si lo tiene).
+        """
+        return len(self.desplazamientos) - 1
+
+    def fila(self, indice: int) -> List[str]:
+        """
+        Campos de la fila lógica 'indice' (basado en 0).
+
+        Raises:
+            IndexError: Si la fila no existe.
+        """
+        if not 0 <= indice < self.num_filas:
+            raise IndexError(f"La fila {indice} está fuera del rango del CSV (filas: {self.num_filas}).")
+        datos = self._mapa[self.desplazamientos[indice]:self.desplazamientos[indice + 1]]
+        return next(csv.reader(io.StringIO(datos.decode(self.encoding), newline=""), delimiter=self.delimiter), [])
+
+    def iterar_filas(self, inicio: int = 0, fin: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Generador de las filas lógicas [inicio, fin) leídas en streaming desde el inicio de 'inicio',
+        sin leer las filas anteriores.
+        """
+        fin = self.num_filas if fin is None else min(fin, self.num_filas)
+        if inicio >= fin:
+            return
+        with open(self.ruta, "rb") as archivo:
+            archivo.seek(self.desplazamientos[inicio])
+            texto = io.TextIOWrapper(archivo, encoding=self.encoding, newline="")
+            for _, fila in zip(range(fin - inicio), csv.reader(texto, delimiter=self.delimiter)):
+                yield fila
+
+    def cerrar(self) -> None:
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._archivo.close()
+
+
+class CacheIndicesCsv:
+    """
+    Índices de CSV abiertos en el proceso, identificados por ruta absoluta, delimitador, fecha de modificación
+    y tamaño. Si el archivo cambia se construye un índice nuevo; al superar 'max_archivos' se cierra el menos usado.
+    """
+
+    def __init__(self, directorio_indices: Optional[str], max_archivos: int = 8):
+        self.directorio_indices = directorio_indices
+        self.max_archivos = max(1, max_archivos)
+        self._indices: "OrderedDict[Tuple[str, str, str, int, int], IndiceCsv]" = OrderedDict()
+        self._bloqueo = threading.Lock()
+
+    def obtener(self, ruta: str, delimiter: str = ",", encoding: str = "utf-8") -> Tuple[IndiceCsv, bool]:
+        """
+        Devuelve el índice del CSV y si ya estaba abierto en el proceso.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+        """
+        estado = os.stat(ruta)
+        clave = (os.path.abspath(ruta), delimiter, encoding, estado.st_mtime_ns, estado.st_size)
+        with self._bloqueo:
+            indice = self._indices.get(clave)
+            if indice is not None:
+                self._indices.move_to_end(clave)
+                return indice, True
+            indice = IndiceCsv(ruta, delimiter, encoding, self.directorio_indices)
+            # Se cierran las versiones anteriores del mismo archivo
+            for clave_antigua in [c for c in self._indices if c[:3] == clave[:3]]:
+                self._indices.pop(clave_antigua).cerrar()
+            self._indices[clave] = indice
+            while len(self._indices) > self.max_archivos:
+                self._indices.popitem(last=False)[1].cerrar()
+            return indice, False
+
+    def cerrar(self) -> None:
+        with self._bloqueo:
+            for indice in self._indices.values():
+                indice.cerrar()
+            self._indices.clear()
+
+
+# Caché compartida por todo el proceso (o worker de pytest-xdist)
+_cache: Optional[CacheIndicesCsv] = None
+_bloqueo_cache = threading.Lock()
+
+def obtener_cache_indices_csv() -> CacheIndicesCsv:
+    """
+    Devuelve la caché de índices de CSV del proceso, creándola con la configuración de config.py
+    la primera vez que se necesita.
+    """
+    global _cache
+    with _bloqueo_cache:
+        if _cache is None:
+            from Simples.utils import config
+            _cache = CacheIndicesCsv(config.CSV_INDICE_DIR, max_archivos=config.CSV_CACHE_MAX_ARCHIVOS)
+        return _cache
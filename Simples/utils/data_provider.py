@@ -0,0 +1,342 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from Simples.utils.csv_index import obtener_cache_indices_csv
+from Simples.utils.json_stream import iterar_elementos_json
+from Simples.utils.workbook_cache import obtener_cache_libros
+from Simples.utils.xml_stream import iterar_registros_xml
+
+# Marcador con el que una prueba declara su fuente de datos (ver conftest.py)
+MARCADOR_DATOS = "datos"
+
+# Fixture que recibe cada fila de la fuente como diccionario {columna: valor}
+FIXTURE_FILA = "fila_datos"
+
+# Formatos admitidos por extensión de archivo
+FORMATOS = {".csv": "csv", ".xlsx": "excel", ".xlsm": "excel", ".json": "json", ".xml": "xml"}
+
+# Segundos que un worker espera a que otro termine de contar las filas de una fuente; un bloqueo más antiguo
+# se considera abandonado (el proceso que contaba terminó sin liberarlo)
+ESPERA_CONTEO = 300
+
+Fila = Dict[Any, Any]
+
+class FuenteDatos:
+    """
+    Lector de filas de un archivo de datos (CSV, Excel, JSON o XML) para pruebas guiadas por datos.
+
+    Cada fila se devuelve como diccionario: con encabezado, {nombre de columna: valor}; sin encabezado (CSV y
+    Excel), {índice de columna basado en 1: valor}. En JSON cada fila es un elemento del array raíz (o del
+    array en 'clave') y en XML cada elemento 'etiqueta' (por defecto, cada hijo de la raíz) con sus atributos
+    y el texto de sus hijos.
+
+    `num_filas` y `filas(inicio, fin)` no cargan el archivo completo en CSV (índice de filas con mmap), JSON
+    (lectura del array elemento a elemento) ni XML (iterparse, liberando cada registro procesado); Excel se lee
+    una vez por sesión. Con 'directorio_conteos', el número de filas se guarda en disco (válido mientras no
+    cambien el tamaño ni la fecha de modificación del archivo): solo el primer proceso que lo necesita recorre
+    el archivo para contarlas, y los demás workers (y las sesiones siguientes) lo leen.
+
+    Args:
+        ruta (str): Ruta del archivo.
+        has_header (bool): CSV y Excel: si la primera fila es el encabezado. Por defecto `True`.
+        delimiter (str): CSV: separador de campos. Por defecto `,`.
+        hoja (Optional[str]): Excel: nombre de la hoja. Por defecto, la primera.
+        clave (Optional[str]): JSON: clave del objeto raíz que contiene el array de registros.
+        etiqueta (Optional[str]): XML: etiqueta o ruta de los registros (ver `iterar_registros_xml`).
+                                  Por defecto, los hijos directos de la raíz.
+        directorio_conteos (Optional[str]): Directorio donde se comparte el número de filas entre procesos.
+    """
+
+    def __init__(self, ruta: str, has_header: bool = True, delimiter: str = ",", hoja: Optional[str] = None,
+                 clave: Optional[str] = None, etiqueta: Optional[str] = None, directorio_conteos: Optional[str] = None):
+        extension = os.path.splitext(ruta)[1].lower()
+        if extension not in FORMATOS:
+            raise ValueError(f"\nFormato de datos no admitido: '{ruta}'. Extensiones admitidas: {', '.join(FORMATOS)}")
+        if not os.path.exists(ruta):
+            raise FileNotFoundError(f"\nNo existe el archivo de datos: '{ruta}'.")
+        self.ruta = ruta
+        self.formato = FORMATOS[extension]
+        self.has_header = has_header
+        self.delimiter = delimiter
+        self.hoja = hoja
+        self.clave = clave
+        self.etiqueta = etiqueta
+        self.directorio_conteos = directorio_conteos
+        self._num_filas: Optional[int] = None
+        self._bloqueo = threading.Lock()
+
+    # --- Conteo ---
+
+    @property
+    def num_filas(self) -> int:
+        """
+        Número de filas de datos (sin el encabezado). Se calcula una vez por sesión (o se lee del conteo
+        compartido en 'directorio_conteos').
+        """
+        with self._bloqueo:
+            if self._num_filas is None:
+                self._num_filas = self._contar_compartido() if self.directorio_conteos else self._contar()
+            return self._num_filas
+
+    def _ruta_conteo(self) -> str:
+        # El conteo depende de las opciones de lectura (hoja, clave, etiqueta, encabezado), no solo del archivo
+        opciones = (os.path.abspath(self.ruta), self.has_header, self.delimiter, self.hoja, self.clave, self.etiqueta)
+        huella = hashlib.sha1(repr(opciones).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.directorio_conteos, f"{os.path.basename(self.ruta)}.{huella}.filas")
+
+    def _leer_conteo(self, ruta_conteo: str, firma: Dict[str, int]) -> Optional[int]:
+        try:
+            with open(ruta_conteo, encoding="utf-8") as archivo:
+                conteo = json.load(archivo)
+        except (OSError, ValueError):
+            return None
+        if conteo.get("tamano") != firma["tamano"] or conteo.get("mtime_ns") != firma["mtime_ns"]:
+            return None
+        return conteo.get("filas")
+
+    def _contar_compartido(self) -> int:
+        """
+        Número de filas leído del conteo en disco o, si no hay uno válido, contado por este proceso y guardado.
+        Un archivo de bloqueo ('.lock', creado con O_EXCL) garantiza que un solo worker recorre el archivo
+        mientras los demás esperan su resultado.
+        """
+        estado = os.stat(self.ruta)
+        firma = {"tamano": estado.st_size, "mtime_ns": estado.st_mtime_ns}
+        ruta_conteo = self._ruta_conteo()
+        ruta_bloqueo = f"{ruta_conteo}.lock"
+        os.makedirs(self.directorio_conteos, exist_ok=True)
+        while True:
+            filas = self._leer_conteo(ruta_conteo, firma)
+            if filas is not None:
+                return filas
+            try:
+                os.close(os.open(ruta_bloqueo, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(ruta_bloqueo) > ESPERA_CONTEO:
+                        os.remove(ruta_bloqueo)
+                except OSError:
+                    pass # Otro proceso lo liberó (o lo retiró) mientras tanto
+                time.sleep(0.05)
+                continue
+            except OSError:
+                return self._contar() # Directorio no escribible: cada proceso cuenta por su cuenta
+            try:
+                filas = self._leer_conteo(ruta_conteo, firma)
+                if filas is None:
+                    filas = self._contar()
+                    temporal = f"{ruta_conteo}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with open(temporal, "w", encoding="utf-8") as archivo:
+                        json.dump(dict(firma, filas=filas), archivo)
+                    os.replace(temporal, ruta_conteo)
+                return filas
+            finally:
+                try:
+                    os.remove(ruta_bloqueo)
+                except OSError:
+                    pass
+
+    def _contar(self) -> int:
+        encabezado = 1 if self.has_header else 0
+        if self.formato == "csv":
+            indice, _ = obtener_cache_indices_csv().obtener(self.ruta, self.delimiter)
+            return max(indice.num_filas - encabezado, 0)
+        if self.formato == "excel":
+            return max(self._tabla_excel().num_filas - encabezado, 0)
+        if self.formato == "json":
+            return sum(1 for _ in iterar_elementos_json(self.ruta, self.clave))
+        return sum(1 for _ in iterar_registros_xml(self.ruta, self.etiqueta))
+
+    # --- Lectura ---
+
+    def filas(self, inicio: int = 0, fin: Optional[int] = None) -> Iterator[Fila]:
+        """
+        Generador de las filas de datos [inicio, fin) (índices basados en 0, sin contar el encabezado). Si el
+        archivo tiene menos filas, termina en la última: con 'fin' indicado no se cuentan las filas antes de leer.
+        """
+        if fin is None:
+            fin = self.num_filas
+        if inicio >= fin:
+            return iter(())
+        return getattr(self, f"_filas_{self.formato}")(inicio, fin)
+
+    def _filas_csv(self, inicio: int, fin: int) -> Iterator[Fila]:
+        indice, _ = obtener_cache_indices_csv().obtener(self.ruta, self.delimiter)
+        if not self.has_header:
+            for fila in indice.iterar_filas(inicio, fin):
+                yield {columna: valor for columna, valor in enumerate(fila, 1)}
+            return
+        encabezado = indice.fila(0)
+        for fila in indice.iterar_filas(inicio + 1, fin + 1):
+            yield dict(zip(encabezado, fila))
+
+    def _tabla_excel(self):
+        if self.hoja is None:
+            import openpyxl
+            libro = openpyxl.load_workbook(self.ruta, read_only=True)
+            self.hoja = libro.sheetnames[0]
+            libro.close()
+        tabla, _ = obtener_cache_libros().obtener_hoja(self.ruta, self.hoja)
+        return tabla
+
+    def _filas_excel(self, inicio: int, fin: int) -> Iterator[Fila]:
+        tabla = self._tabla_excel()
+        desplazamiento = 2 if self.has_header else 1 # Filas físicas basadas en 1
+        fin = min(fin, tabla.num_filas - desplazamiento + 1)
+        if self.has_header:
+            claves = [tabla.celda(1, c) if tabla.celda(1, c) is not None else c for c in range(1, tabla.num_columnas + 1)]
+        else:
+            claves = list(range(1, tabla.num_columnas + 1))
+        for fila in range(inicio + desplazamiento, fin + desplazamiento):
+            yield {clave: tabla.celda(fila, c) for c, clave in enumerate(claves, 1)}
+
+    def _filas_json(self, inicio: int, fin: int) -> Iterator[Fila]:
+        for posicion, registro in enumerate(iterar_elementos_json(self.ruta, self.clave)):
+            if posicion >= fin:
+                break
+            if posicion >= inicio:
+                yield registro if isinstance(registro, dict) else {1: registro}
+
+    def _filas_xml(self, inicio: int, fin: int) -> Iterator[Fila]:
+        for posicion, registro in enumerate(iterar_registros_xml(self.ruta, self.etiqueta)):
+            if posicion >= fin:
+                break
+            if posicion >= inicio:
+                fila = dict(registro.attrib)
+                fila.update((hijo.tag, (hijo.text or "").strip()) for hijo in registro)
+                yield fila
+
+
+class ProveedorDatos:
+    """
+    Proveedor de filas para la parametrización guiada por datos (un proceso o worker de pytest-xdist).
+
+    Mantiene un lector por archivo y configuración durante toda la sesión. Las filas se reparten en bloques
+    contiguos de como máximo 'filas_por_bloque' filas y, con pytest-xdist, en al menos tantos bloques como
+    workers: conftest.py agrupa cada bloque con 'xdist_group', así que cada worker solo lee (y guarda en
+    memoria) las filas de los bloques que ejecuta, en lugar de que todos recorran el archivo completo.
+
+    Los bloques se calculan sobre 'total': el número de filas de la fuente o, si la prueba indica un rango
+    de filas, el final de ese rango (así no hace falta contar las filas del archivo al recolectar).
+    """
+
+    def __init__(self, directorio_base: str, filas_por_bloque: int = 1000, num_workers: int = 1,
+                 directorio_conteos: Optional[str] = None):
+        self.directorio_base = directorio_base
+        self.filas_por_bloque = max(1, filas_por_bloque)
+        self.num_workers = max(1, num_workers)
+        self.directorio_conteos = directorio_conteos
+        self._fuentes: Dict[Tuple, FuenteDatos] = {}
+        self._bloques: Dict[Tuple, List[Fila]] = {}
+        self._bloqueo = threading.Lock()
+        # Bloques leídos en este proceso (para comprobar el reparto entre workers)
+        self.bloques_leidos = 0
+
+    def clave_fuente(self, archivo: str, **opciones) -> Tuple:
+        ruta = archivo if os.path.isabs(archivo) else os.path.join(self.directorio_base, archivo)
+        return (os.path.abspath(ruta),) + tuple(sorted(opciones.items()))
+
+    def fuente(self, clave: Tuple) -> FuenteDatos:
+        """
+        Devuelve el lector de la fuente, creándolo la primera vez que se pide en la sesión.
+        """
+        with self._bloqueo:
+            fuente = self._fuentes.get(clave)
+            if fuente is None:
+                fuente = FuenteDatos(clave[0], directorio_conteos=self.directorio_conteos, **dict(clave[1:]))
+                self._fuentes[clave] = fuente
+            return fuente
+
+    def tamano_bloque(self, total: int) -> int:
+        """
+        Filas por bloque para 'total' filas: se reparten entre los workers y se limitan a 'filas_por_bloque'.
+        """
+        return max(1, min(self.filas_por_bloque, math.ceil(total / self.num_workers)))
+
+    def bloque(self, total: int, indice: int) -> int:
+        return indice // self.tamano_bloque(total)
+
+    def fila(self, clave: Tuple, indice: int, total: int) -> Fila:
+        """
+        Devuelve la fila de datos 'indice' (basado en 0), leyendo la primera vez solo el bloque que la contiene.
+
+        Raises:
+            IndexError: Si la fuente no tiene esa fila (el rango indicado en la prueba excede el archivo).
+        """
+        tamano = self.tamano_bloque(total)
+        numero_bloque = indice // tamano
+        clave_bloque = clave + (tamano, numero_bloque)
+        with self._bloqueo:
+            filas = self._bloques.get(clave_bloque)
+        if filas is None:
+            inicio = numero_bloque * tamano
+            filas = list(self.fuente(clave).filas(inicio, inicio + tamano))
+            with self._bloqueo:
+                self._bloques[clave_bloque] = filas
+                self.bloques_leidos += 1
+        posicion = indice - numero_bloque * tamano
+        if posicion >= len(filas):
+            raise IndexError(f"La fila {indice + 1} no existe en '{os.path.basename(clave[0])}': "
+                             f"el rango de filas de la prueba excede las filas de datos del archivo.")
+        return filas[posicion]
+
+
+def aplicar_reparto_datos(items: list, marcador) -> int:
+    """
+    Marca cada prueba guiada por datos con `xdist_group(datos-<archivo>.<extensión>-<bloque>)` para que el reparto
+    'loadgroup' de pytest-xdist envíe todas las filas de un bloque al mismo worker (que solo leerá ese bloque).
+    Si la prueba también pertenece a la matriz de navegadores, pytest-xdist combina ambos grupos.
+
+    Args:
+        items (list): Pruebas recolectadas por pytest.
+        marcador: `pytest.mark.xdist_group`.
+
+    Returns:
+        int: Número de pruebas marcadas.
+    """
+    proveedor = obtener_proveedor_datos()
+    marcadas = 0
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        parametro = callspec.params.get(FIXTURE_FILA) if callspec is not None else None
+        if not isinstance(parametro, tuple):
+            continue
+        clave, indice, total = parametro
+        nombre = os.path.basename(clave[0])
+        item.add_marker(marcador(name=f"datos-{nombre}-{proveedor.bloque(total, indice)}"))
+        marcadas += 1
+    return marcadas
+
+def id_fila(archivo: str, indice: int, fila: Optional[Fila] = None, columna_id: Optional[str] = None) -> str:
+    """
+    Id estable de la prueba para una fila: '<archivo sin extensión>-<número de fila basado en 1>' o, con
+    'columna_id', el valor de esa columna (debe ser único en la fuente).
+    """
+    if columna_id is not None and fila is not None:
+        return f"{os.path.splitext(os.path.basename(archivo))[0]}-{fila.get(columna_id)}"
+    return f"{os.path.splitext(os.path.basename(archivo))[0]}-{indice + 1}"
+
+
+# Proveedor compartido por todo el proceso (o worker de pytest-xdist)
+_proveedor: Optional[ProveedorDatos] = None
+_bloqueo_proveedor = threading.Lock()
+
+def obtener_proveedor_datos() -> ProveedorDatos:
+    """
+    Devuelve el proveedor de datos del proceso, creándolo con la configuración de config.py
+    la primera vez que se necesita.
+    """
+    global _proveedor
+    with _bloqueo_proveedor:
+        if _proveedor is None:
+            from Simples.utils import config
+            _proveedor = ProveedorDatos(config.SOURCE_FILES_DIR_DATA_FUENTE,
+                                        filas_por_bloque=config.DATOS_FILAS_POR_BLOQUE,
+                                        num_workers=int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1")),
+                                        directorio_conteos=config.DATOS_CONTEOS_DIR)
+        return _proveedor
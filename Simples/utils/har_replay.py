@@ -0,0 +1,62 @@
+import os
+from typing import Optional
+
+from playwright.sync_api import BrowserContext # Importa clases necesarias de Playwright
+
+# Modos de HAR: 'off' (red real), 'record' (graba un HAR por flujo) y 'replay' (sirve el flujo desde su HAR)
+HAR_MODOS = ("off", "record", "replay")
+
+# Marcador con el que una prueba puede fijar el nombre de su flujo (por defecto, '<módulo>/<función>')
+MARCADOR_FLUJO = "flujo_har"
+
+def nombre_flujo(item) -> str:
+    """
+    Devuelve el nombre del flujo de una prueba: el del marcador 'flujo_har' o '<módulo>/<función>'
+    (sin el id de parametrización, que se añade como variante en 'ruta_har').
+    """
+    marcador = item.get_closest_marker(MARCADOR_FLUJO)
+    if marcador and marcador.args:
+        return str(marcador.args[0])
+    modulo = os.path.splitext(os.path.basename(str(item.path)))[0]
+    return f"{modulo}/{getattr(item, 'originalname', item.name)}"
+
+def ruta_har(directorio: str, flujo: str, variante: str = "") -> str:
+    """
+    Ruta del HAR de un flujo. La variante (navegador y dispositivo de la matriz) forma parte del nombre
+    porque cada motor y viewport puede pedir recursos distintos, y así los workers de pytest-xdist
+    nunca escriben el mismo archivo.
+    """
+    nombre = f"{flujo}__{variante}" if variante else flujo
+    return os.path.join(directorio, *nombre.split("/")) + ".har"
+
+def preparar_har(contexto: BrowserContext, modo: str, ruta: str, no_encontrado: str = "abort") -> Optional[str]:
+    """
+    Registra el HAR en el contexto con `route_from_har`.
+
+    - 'record': las peticiones salen a la red y Playwright escribe el HAR (con los cuerpos incrustados)
+      al cerrar el contexto.
+    - 'replay': las peticiones se responden desde el HAR; las que no estén en él se abortan
+      (`no_encontrado='abort'`, ejecución totalmente sin red) o salen a la red ('fallback').
+
+    Debe llamarse antes de instalar otras rutas del contexto (p. ej. el filtro de red): Playwright consulta
+    primero la última ruta registrada, así que las peticiones bloqueadas nunca llegan al HAR.
+
+    Returns:
+        Optional[str]: La ruta del HAR o None si el modo es 'off'.
+
+    Raises:
+        ValueError: Si el modo no es válido.
+        FileNotFoundError: Si el modo es 'replay' y el flujo no tiene HAR grabado.
+    """
+    if modo not in HAR_MODOS:
+        raise ValueError(f"\nEl modo de HAR '{modo}' no es válido. Modos disponibles: {', '.join(HAR_MODOS)}")
+    if modo == "off":
+        return None
+    if modo == "record":
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        contexto.route_from_har(ruta, update=True, update_content="embed")
+    else:
+        if not os.path.exists(ruta):
+            raise FileNotFoundError(f"\nNo existe el HAR '{ruta}'. Grábalo primero con '--modo-har record'.")
+        contexto.route_from_har(ruta, not_found=no_encontrado)
+    return ruta
@@ -0,0 +1,185 @@
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from playwright.sync_api import Error, TimeoutError # Excepciones de Playwright para clasificar los errores
+from Simples.utils import config
+from Simples.utils.metrics import obtener_registro_metricas
+
+# Clases de error con las que se clasifican los fallos de una acción
+ERROR_TIMEOUT = "timeout"
+ERROR_PLAYWRIGHT = "playwright"
+ERROR_VERIFICACION = "verificacion"
+ERROR_INESPERADO = "inesperado"
+
+# Por cada clase de error: título del mensaje, nivel de log y sufijo de la captura de evidencia
+_DETALLE_ERRORES = {
+    ERROR_TIMEOUT: ("Tiempo de espera excedido", logging.ERROR, "timeout"),
+    ERROR_PLAYWRIGHT: ("Error de Playwright", logging.ERROR, "error_playwright"),
+    ERROR_VERIFICACION: ("Verificación", logging.ERROR, "fallo_verificacion"),
+    ERROR_INESPERADO: ("Inesperado", logging.CRITICAL, "error_inesperado"),
+}
+
+# Valor centinela: la excepción se vuelve a lanzar tal cual
+RELANZAR = object()
+# Valor centinela: los errores de Playwright se resuelven igual que los demás errores ('en_error')
+_COMO_EN_ERROR = object()
+
+# Nombres de parámetro con los que los métodos de Funciones_Globales reciben el directorio de capturas
+_PARAMETROS_DIRECTORIO = ("directorio", "direccion", "directorio_capturas")
+
+def clasificar_error(error: BaseException) -> str:
+    """
+    Clasifica una excepción en 'timeout', 'playwright', 'verificacion' o 'inesperado'.
+    """
+    if isinstance(error, TimeoutError):
+        return ERROR_TIMEOUT
+    if isinstance(error, Error):
+        return ERROR_PLAYWRIGHT
+    if isinstance(error, AssertionError):
+        return ERROR_VERIFICACION
+    return ERROR_INESPERADO
+
+def _marcar(error: BaseException, marca: str) -> None:
+    try:
+        setattr(error, marca, True)
+    except AttributeError:
+        pass
+
+def accion_instrumentada(accion: Optional[str] = None, *, manejar_errores: bool = True,
+                         en_timeout: Any = RELANZAR, en_verificacion: Any = RELANZAR,
+                         en_error: Any = RELANZAR, en_playwright: Any = _COMO_EN_ERROR,
+                         envolver_en: Optional[type] = None) -> Callable:
+    """
+    Decorador para las acciones de página de `Funciones_Globales`. Se puede usar sin argumentos
+    (`@accion_instrumentada`) o con ellos (`@accion_instrumentada(en_timeout=False)`).
+
+    Con la instrumentación habilitada (config.INSTRUMENTACION_HABILITADA) mide la duración total de la
+    acción con `time.perf_counter_ns`, la registra en el registro de métricas con el nombre de la acción
+    y la escribe en el log como línea 'PERFORMANCE'. La bandera se consulta en cada llamada: con la
+    instrumentación deshabilitada solo queda el manejo de errores (un marco de llamada adicional).
+
+    Si `manejar_errores` es `True`, el decorador sustituye los bloques try/except repetidos de cada método:
+    clasifica el error (timeout, Playwright, verificación o inesperado), lo registra en el log y como
+    contador '<accion>.errores.<clase>', toma la captura de evidencia '<nombre_base>_<sufijo>' en el
+    directorio recibido por el método y, según la configuración, devuelve un valor o vuelve a lanzar
+    la excepción. Si la acción llama a otras acciones instrumentadas, el error se registra y se captura una sola vez.
+    Con `manejar_errores=False` (métodos que ya manejan sus errores) solo se cuentan los errores.
+
+    Args:
+        accion (str, opcional): Nombre de la acción en métricas y logs. Por defecto, el nombre del método.
+        manejar_errores (bool, opcional): Si el decorador registra, captura y resuelve los errores. Por defecto `True`.
+        en_timeout (Any, opcional): Valor a devolver si la acción falla por timeout. Por defecto, se relanza.
+        en_verificacion (Any, opcional): Valor a devolver si falla una aserción (`AssertionError`). Por defecto, se relanza.
+        en_error (Any, opcional): Valor a devolver para cualquier otro error. Por defecto, se relanza.
+        en_playwright (Any, opcional): Valor a devolver si falla Playwright (`Error` que no es timeout).
+                                       Por defecto, el mismo que 'en_error'.
+        envolver_en (type, opcional): Tipo de excepción con el que se relanzan los demás errores (p. ej. `AssertionError`).
+                                      Los errores de argumentos (`ValueError`, `TypeError`, `IndexError`) se relanzan siempre tal cual.
+                                      Por defecto, se relanzan tal cual.
+    """
+    def decorador(metodo: Callable) -> Callable:
+        nombre_accion = accion or metodo.__name__
+        firma = inspect.signature(metodo)
+        parametro_directorio = next((p for p in _PARAMETROS_DIRECTORIO if p in firma.parameters), None)
+        tiene_nombre_base = "nombre_base" in firma.parameters
+        tiene_selector = "selector" in firma.parameters
+
+        def _argumento(nombre: str, args, kwargs) -> Any:
+            try:
+                return firma.bind_partial(None, *args, **kwargs).arguments.get(nombre)
+            except TypeError:
+                return None
+
+        def _manejar(self, error: BaseException, args, kwargs) -> Any:
+            clase = clasificar_error(error)
+            titulo, nivel, sufijo = _DETALLE_ERRORES[clase]
+            # Un error que atraviesa varias acciones anidadas se registra una sola vez y su captura
+            # la toma la acción más interna que recibe 'nombre_base' y un directorio.
+            if not getattr(error, "_error_registrado", False):
+                contexto = f" sobre '{_argumento('selector', args, kwargs)}'" if tiene_selector else ""
+                self.logger.log(nivel, f"\n❌ FALLO ({titulo}) - {nombre_accion}{contexto}: {error}",
+                                exc_info=clase in (ERROR_PLAYWRIGHT, ERROR_INESPERADO))
+                _marcar(error, "_error_registrado")
+            if not getattr(error, "_captura_tomada", False) and tiene_nombre_base and parametro_directorio:
+                nombre_base = _argumento("nombre_base", args, kwargs)
+                directorio = _argumento(parametro_directorio, args, kwargs)
+                if nombre_base and directorio:
+                    self.tomar_captura(f"{nombre_base}_{sufijo}", directorio)
+                    _marcar(error, "_captura_tomada")
+            valor = {ERROR_TIMEOUT: en_timeout, ERROR_VERIFICACION: en_verificacion,
+                     ERROR_PLAYWRIGHT: en_error if en_playwright is _COMO_EN_ERROR else en_playwright}.get(clase, en_error)
+            if valor is not RELANZAR:
+                return valor
+            if envolver_en is not None and not isinstance(error, (envolver_en, ValueError, TypeError, IndexError)):
+                envuelto = envolver_en(f"\n{nombre_accion}: {error}")
+                for marca in ("_error_registrado", "_captura_tomada"):
+                    if getattr(error, marca, False):
+                        _marcar(envuelto, marca)
+                raise envuelto from error
+            raise error
+
+        @functools.wraps(metodo)
+        def envoltura(self, *args, **kwargs):
+            if not config.INSTRUMENTACION_HABILITADA:
+                if not manejar_errores:
+                    return metodo(self, *args, **kwargs)
+                try:
+                    return metodo(self, *args, **kwargs)
+                except Exception as e:
+                    return _manejar(self, e, args, kwargs)
+
+            registro = obtener_registro_metricas()
+            inicio = time.perf_counter_ns()
+            try:
+                return metodo(self, *args, **kwargs)
+            except Exception as e:
+                registro.incrementar(f"{nombre_accion}.errores.{clasificar_error(e)}")
+                if not manejar_errores:
+                    raise
+                return _manejar(self, e, args, kwargs)
+            finally:
+                duracion_ns = time.perf_counter_ns() - inicio
+                registro.registrar_duracion_ns(nombre_accion, duracion_ns)
+                self.logger.info("PERFORMANCE: Tiempo total de la acción '%s': %.4f segundos.", nombre_accion, duracion_ns / 1e9)
+
+        envoltura.accion_instrumentada = nombre_accion
+        return envoltura
+
+    # Uso sin argumentos: '@accion_instrumentada'
+    if callable(accion):
+        metodo, accion = accion, None
+        return decorador(metodo)
+    return decorador
+
+class MedicionBloque:
+    """
+    Context manager para medir un bloque dentro de una acción: registra su duración en el registro
+    de métricas y la escribe en el log como línea 'PERFORMANCE'. No hace nada si la instrumentación
+    está deshabilitada.
+
+    Ejemplo (desde `Funciones_Globales._medir`):
+        with self._medir("hacer_click_en_elemento.click", "el clic en el elemento"):
+            locator.click()
+    """
+    __slots__ = ("_pagina", "_accion", "_descripcion", "_inicio")
+
+    def __init__(self, pagina: Any, accion: str, descripcion: str = ""):
+        self._pagina = pagina
+        self._accion = accion
+        self._descripcion = descripcion
+        self._inicio = 0
+
+    def __enter__(self):
+        if config.INSTRUMENTACION_HABILITADA:
+            self._inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if self._inicio:
+            duracion_ns = time.perf_counter_ns() - self._inicio
+            obtener_registro_metricas().registrar_duracion_ns(self._accion, duracion_ns)
+            self._pagina.logger.info("PERFORMANCE: Tiempo de %s: %.4f segundos.", self._descripcion or self._accion, duracion_ns / 1e9)
+        return False
@@ -0,0 +1,246 @@
+import json
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Caracteres que se leen del archivo en cada bloque
+TAMANO_BLOQUE = 64 * 1024
+
+_ESPACIOS = " \t\n\r"
+
+# Caracteres que pueden seguir a un número completo, y cuántos caracteres puede ocupar un número cortado tras
+# la parte ya decodificable ('.', 'e', 'e+')
+_FIN_NUMERO = ",]}:"
+_MAX_CORTE_NUMERO = 2
+
+class _LectorIncremental:
+    """
+    Búfer de texto que se rellena por bloques y descarta lo ya consumido, para decodificar valores
+    JSON uno a uno con `JSONDecoder.raw_decode` sin cargar el archivo completo.
+    """
+
+    def __init__(self, archivo, tamano_bloque: int):
+        self._archivo = archivo
+        self._tamano_bloque = tamano_bloque
+        self._decodificador = json.JSONDecoder()
+        self.bufer = ""
+        self.pos = 0
+        self.fin_archivo = False
+
+    def _leer(self, minimo: int) -> bool:
+        # Descarta lo consumido y añade al menos 'minimo' caracteres; devuelve False al final del archivo
+        if self.fin_archivo:
+            return False
+        bloque = self._archivo.read(max(self._tamano_bloque, minimo))
+        if not bloque:
+            self.fin_archivo = True
+            return False
+        self.bufer = self.bufer[self.pos:] + bloque
+        self.pos = 0
+        return True
+
+    def siguiente_caracter(self) -> Optional[str]:
+        """
+        Salta los espacios y devuelve el siguiente carácter sin consumirlo (None al final del archivo).
+        """
+        while True:
+            while self.pos < len(self.bufer) and self.bufer[self.pos] in _ESPACIOS:
+                self.pos += 1
+            if self.pos < len(self.bufer):
+                return self.bufer[self.pos]
+            if not self._leer(0):
+                return None
+
+    def esperar(self, caracter: str) -> None:
+        encontrado = self.siguiente_caracter()
+        if encontrado != caracter:
+            raise json.JSONDecodeError(f"Se esperaba '{caracter}'", self.bufer, self.pos)
+        self.pos += 1
+
+    def valor(self) -> Any:
+        """
+        Decodifica el siguiente valor JSON. Si el valor no está completo en el búfer se leen más bloques.
+        Un número cortado por el final del búfer se decodifica sin error ('12.' da 12), así que un número
+        solo se acepta cuando ya está en el búfer el carácter que lo cierra (ver `_numero_completo`) o se
+        llegó al final del archivo.
+        """
+        self.siguiente_caracter()
+        ampliacion = self._tamano_bloque
+        while True:
+            try:
+                valor, fin = self._decodificador.raw_decode(self.bufer, self.pos)
+                if self.fin_archivo or self._numero_completo(valor, fin):
+                    self.pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self.fin_archivo:
+                    raise
+            if not self._leer(ampliacion):
+                continue
+            # Los valores muy grandes duplican la lectura en cada intento para no redecodificar demasiadas veces
+            ampliacion *= 2
+
+    def _numero_completo(self, valor: Any, fin: int) -> bool:
+        # Cadenas, objetos, arrays y literales solo se decodifican si están cerrados en el búfer
+        if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+            return True
+        siguiente = fin
+        while siguiente < len(self.bufer) and self.bufer[siguiente] in _ESPACIOS:
+            siguiente += 1
+        if siguiente < len(self.bufer) and self.bufer[siguiente] in _FIN_NUMERO:
+            return True
+        # Otro carácter (p. ej. '.', 'e' o 'e+' de un número cortado): el número puede continuar en el siguiente
+        # bloque, salvo que haya más de los dos caracteres que puede ocupar un corte (JSON no válido)
+        return siguiente + _MAX_CORTE_NUMERO < len(self.bufer)
+
+def iterar_elementos_json(ruta: str, clave: Optional[str] = None, campos: Optional[Sequence[str]] = None,
+                          tamano_bloque: int = TAMANO_BLOQUE) -> Iterator[Any]:
+    """
+    Recorre uno a uno los elementos del array raíz de un archivo JSON (o del array en la clave 'clave'
+    del objeto raíz), leyendo el archivo por bloques: la memoria depende del tamaño de un elemento, no
+    del archivo.
+
+    Args:
+        ruta (str): Ruta del archivo JSON (UTF-8).
+        clave (Optional[str]): Clave del objeto raíz que contiene el array. Por defecto, el array es la raíz.
+        campos (Optional[Sequence[str]]): Si se indican, cada elemento (objeto) se proyecta en una tupla con
+                                          nombre con esos campos (None si el elemento no tiene el campo).
+        tamano_bloque (int): Caracteres leídos en cada bloque.
+
+    Yields:
+        Any: Cada elemento del array (o su proyección).
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        json.JSONDecodeError: Si el JSON no es válido.
+        ValueError: Si la raíz (o la clave) no es un array, o la clave no existe.
+    """
+    tipo_tupla = namedtuple("RegistroJson", campos, rename=True) if campos else None
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        lector = _LectorIncremental(archivo, tamano_bloque)
+        if clave is not None:
+            _buscar_clave(lector, clave, ruta)
+        elif lector.siguiente_caracter() != "[":
+            raise ValueError(f"\nLa raíz del JSON '{ruta}' no es un array.")
+        lector.esperar("[")
+        if lector.siguiente_caracter() == "]":
+            return
+        while True:
+            elemento = lector.valor()
+            if tipo_tupla is not None:
+                yield tipo_tupla(*(elemento.get(campo) if isinstance(elemento, dict) else None for campo in campos))
+            else:
+                yield elemento
+            separador = lector.siguiente_caracter()
+            if separador == "]":
+                return
+            lector.esperar(",")
+
+def _buscar_clave(lector: _LectorIncremental, clave: str, ruta: str) -> None:
+    # Avanza por el objeto raíz hasta el valor de 'clave', que debe ser un array
+    lector.esperar("{")
+    while lector.siguiente_caracter() != "}":
+        nombre = lector.valor()
+        lector.esperar(":")
+        if nombre == clave:
+            if lector.siguiente_caracter() != "[":
+                raise ValueError(f"\nLa clave '{clave}' del JSON '{ruta}' no contiene un array.")
+            return
+        lector.valor() # Valor de otra clave: se decodifica y se descarta
+        if lector.siguiente_caracter() == ",":
+            lector.esperar(",")
+    raise ValueError(f"\nLa clave '{clave}' no existe en el objeto raíz del JSON '{ruta}'.")
+
+
+class TablaColumnarJson:
+    """
+    Forma compacta de un array de objetos JSON: una lista de valores por campo en lugar de un diccionario
+    por registro (las claves no se repiten en cada fila). Las columnas son los campos indicados o, si no se
+    indicaron, la unión de las claves de todos los registros en orden de aparición; los campos que faltan
+    en un registro valen None.
+    """
+
+    def __init__(self, registros: Iterator[Any], campos: Optional[Sequence[str]] = None):
+        self.columnas: Dict[str, List[Any]] = {campo: [] for campo in campos} if campos else {}
+        self.num_filas = 0
+        for registro in registros:
+            if not isinstance(registro, dict):
+                registro = {"valor": registro}
+            if not campos:
+                for campo in registro:
+                    if campo not in self.columnas:
+                        self.columnas[campo] = [None] * self.num_filas
+            for campo, valores in self.columnas.items():
+                valores.append(registro.get(campo))
+            self.num_filas += 1
+
+    @property
+    def campos(self) -> List[str]:
+        return list(self.columnas)
+
+    def columna(self, campo: str) -> List[Any]:
+        return self.columnas[campo]
+
+    def fila(self, indice: int) -> Dict[str, Any]:
+        """
+        Registro 'indice' (basado en 0) como diccionario.
+        """
+        return {campo: valores[indice] for campo, valores in self.columnas.items()}
+
+    def __len__(self) -> int:
+        return self.num_filas
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for indice in range(self.num_filas):
+            yield self.fila(indice)
+
+
+class CacheColumnarJson:
+    """
+    Caché LRU de tablas columnares de JSON para lecturas repetidas durante la sesión. Cada entrada se identifica
+    por ruta absoluta, fecha de modificación, tamaño, clave y campos: si el archivo cambia se vuelve a leer.
+    """
+
+    def __init__(self, max_tablas: int = 8):
+        self.max_tablas = max(1, max_tablas)
+        self._tablas: "OrderedDict[Tuple, TablaColumnarJson]" = OrderedDict()
+        self._bloqueo = threading.Lock()
+
+    def obtener(self, ruta: str, clave: Optional[str] = None,
+                campos: Optional[Sequence[str]] = None) -> Tuple[TablaColumnarJson, bool]:
+        """
+        Devuelve la tabla columnar del array y si se sirvió desde la caché.
+        """
+        estado = os.stat(ruta)
+        clave_cache = (os.path.abspath(ruta), estado.st_mtime_ns, estado.st_size, clave, tuple(campos) if campos else None)
+        with self._bloqueo:
+            tabla = self._tablas.get(clave_cache)
+            if tabla is not None:
+                self._tablas.move_to_end(clave_cache)
+                return tabla, True
+        tabla = TablaColumnarJson(iterar_elementos_json(ruta, clave), campos)
+        with self._bloqueo:
+            for clave_antigua in [c for c in self._tablas if c[0] == clave_cache[0] and c[1:3] != clave_cache[1:3]]:
+                del self._tablas[clave_antigua]
+            self._tablas[clave_cache] = tabla
+            while len(self._tablas) > self.max_tablas:
+                self._tablas.popitem(last=False)
+        return tabla, False
+
+
+# Caché compartida por todo el proceso (o worker de pytest-xdist)
+_cache: Optional[CacheColumnarJson] = None
+_bloqueo_cache = threading.Lock()
+
+def obtener_cache_columnar_json() -> CacheColumnarJson:
+    """
+    Devuelve la caché columnar de JSON del proceso, creándola con la configuración de config.py
+    la primera vez que se necesita.
+    """
+    global _cache
+    with _bloqueo_cache:
+        if _cache is None:
+            from Simples.utils import config
+            _cache = CacheColumnarJson(max_tablas=config.JSON_CACHE_MAX_TABLAS)
+        return _cache
@@ -0,0 +1,93 @@
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+# Prefijo de las rutas que se sirven como descarga (cabecera Content-Disposition: attachment)
+PREFIJO_DESCARGAS = "/descargas/"
+
+class _ManejadorSitioLocal(SimpleHTTPRequestHandler):
+    """
+    Sirve los archivos del sitio local. Las rutas sin extensión se resuelven a '<ruta>.html'
+    ('/text-box' -> 'text-box.html'), igual que las rutas de la aplicación real en config.RUTAS_APLICACION.
+    """
+
+    def translate_path(self, path: str) -> str:
+        ruta = super().translate_path(path)
+        if not os.path.splitext(ruta)[1] and not os.path.isdir(ruta) and os.path.isfile(ruta + ".html"):
+            return ruta + ".html"
+        return ruta
+
+    def end_headers(self) -> None:
+        if self.path.startswith(PREFIJO_DESCARGAS):
+            nombre = os.path.basename(self.path.split("?", 1)[0])
+            self.send_header("Content-Disposition", f'attachment; filename="{nombre}"')
+        super().end_headers()
+
+    def log_message(self, format, *args) -> None:
+        # Sin salida por consola: el servidor atiende cientos de peticiones por sesión
+        pass
+
+class ServidorSitioLocal:
+    """
+    Servidor HTTP estático (ThreadingHTTPServer) que sirve las páginas del sitio local de pruebas
+    desde un hilo en segundo plano. Permite ejecutar las pruebas y benchmarks de `Funciones_Globales`
+    sin red: formulario de texto, tabla grande, paginación, diálogos, ventanas emergentes, slider,
+    desplegables, carga y descarga de archivos.
+
+    Por defecto escucha en 127.0.0.1 con un puerto libre asignado por el sistema, así que cada worker
+    de pytest-xdist puede levantar el suyo sin colisiones.
+
+    Ejemplo:
+        with ServidorSitioLocal(config.SITIO_LOCAL_DIR) as url:
+            page.goto(f"{url}/text-box")
+    """
+
+    def __init__(self, directorio: str, host: str = "127.0.0.1", puerto: int = 0):
+        self.directorio = directorio
+        self.host = host
+        self.puerto = puerto
+        self._servidor: Optional[ThreadingHTTPServer] = None
+        self._hilo: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._servidor is None:
+            raise RuntimeError("\nEl servidor del sitio local no está iniciado.")
+        host, puerto = self._servidor.server_address[:2]
+        return f"http://{host}:{puerto}"
+
+    def iniciar(self) -> str:
+        """
+        Inicia el servidor en un hilo daemon y devuelve su URL base (sin '/' final).
+        """
+        if self._servidor is None:
+            if not os.path.isdir(self.directorio):
+                raise FileNotFoundError(f"\nNo existe el directorio del sitio local: '{self.directorio}'.")
+            manejador = partial(_ManejadorSitioLocal, directory=self.directorio)
+            self._servidor = ThreadingHTTPServer((self.host, self.puerto), manejador)
+            self._servidor.daemon_threads = True
+            self._hilo = threading.Thread(target=self._servidor.serve_forever, name="sitio_local", daemon=True)
+            self._hilo.start()
+        return self.url
+
+    def detener(self) -> None:
+        """
+        Detiene el servidor y espera a que termine su hilo.
+        """
+        if self._servidor is None:
+            return
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        if self._hilo is not None:
+            self._hilo.join(timeout=5)
+        self._servidor = None
+        self._hilo = None
+
+    def __enter__(self) -> str:
+        return self.iniciar()
+
+    def __exit__(self, tipo, valor, traza) -> bool:
+        self.detener()
+        return False
@@ -1,13 +1,135 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from .config import LOGGER_DIR # Importa la ruta del directorio de logs desde config.py
 
+# Estado compartido por todo el proceso (o worker de pytest-xdist): una sola cola, un solo
+# QueueListener y un solo archivo de log, sin importar cuántas veces se llame a setup_logger.
+_cola_logs = None
+_listener = None
+_ruta_log_proceso = None
+_loggers_configurados = set()
+_bloqueo_logger = threading.Lock()
+
+def _nombre_archivo_log() -> str:
+    """
+    Nombre del archivo de log del proceso; bajo pytest-xdist incluye el id del worker (p. ej. '_gw0').
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    sufijo = f"_{worker}" if worker else ""
+    return f"automation_log_{timestamp}{sufijo}.log"
+
+def _iniciar_listener(console_level, file_level):
+    """
+    Crea la cola y el QueueListener del proceso. Los handlers de consola y archivo se ejecutan
+    en el hilo del listener, de modo que la E/S no ocurre en el hilo de la prueba.
+    """
+    global _cola_logs, _listener, _ruta_log_proceso
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level) # Nivel de log específico para la consola
+    console_handler.setFormatter(formatter)
+
+    _ruta_log_proceso = os.path.join(LOGGER_DIR, _nombre_archivo_log())
+    file_handler = logging.FileHandler(_ruta_log_proceso, encoding='utf-8')
+    file_handler.setLevel(file_level) # Nivel de log específico para el archivo
+    file_handler.setFormatter(formatter)
+
+    _cola_logs = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(_cola_logs, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(detener_logger)
+
+def detener_logger():
+    """
+    Procesa los mensajes pendientes en la cola, detiene el QueueListener y cierra el archivo de log.
+    Se registra con atexit; puede llamarse explícitamente al terminar la sesión.
+    """
+    global _listener
+    with _bloqueo_logger:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+def obtener_ruta_log():
+    """
+    Devuelve la ruta del archivo de log del proceso (None si aún no se configuró ningún logger).
+    """
+    return _ruta_log_proceso
+
+class LoggerPerezoso:
+    """
+    Fachada sobre `logging.Logger` que difiere la construcción de los mensajes.
+
+    Además de los argumentos estilo `%` de logging (que ya se formatean solo si el mensaje se emite),
+    acepta como mensaje un callable sin argumentos (p. ej. `lambda: f"... {locator} ..."`), que solo se
+    invoca si el nivel está habilitado. Así, con DEBUG deshabilitado (perfil 'ci-fast') no se pagan
+    las f-strings ni los `repr` de Locators de los mensajes de depuración.
+
+    Ejemplo:
+        self.logger.debug(lambda: f"\nFilas encontradas: {filas.count()}.")
+        self.logger.info("\nValor '%s' en la fila %d.", valor, fila)
+    """
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    def _log(self, nivel, msg, args, kwargs):
+        if not self._logger.isEnabledFor(nivel):
+            return
+        if callable(msg):
+            msg = msg()
+        kwargs.setdefault("stacklevel", 3) # Atribuye el registro a quien llamó a la fachada
+        self._logger.log(nivel, msg, *args, **kwargs)
+
+    def debug(self, msg, *args, **kwargs):
+        # Camino rápido: es el nivel que más se filtra, así que se comprueba antes de cualquier otra cosa
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        self._log(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self._log(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        self._log(logging.ERROR, msg, args, kwargs)
+
+    def critical(self, msg, *args, **kwargs):
+        self._log(logging.CRITICAL, msg, args, kwargs)
+
+    def exception(self, msg, *args, exc_info=True, **kwargs):
+        self._log(logging.ERROR, msg, args, dict(kwargs, exc_info=exc_info))
+
+    def isEnabledFor(self, nivel) -> bool:
+        return self._logger.isEnabledFor(nivel)
+
+    def __getattr__(self, nombre):
+        # Cualquier otro atributo (handlers, level, name...) se delega al logger real
+        return getattr(self._logger, nombre)
+
 def setup_logger(name='playwright_automation', console_level=logging.INFO, file_level=logging.DEBUG):
     """
     Configura y devuelve una instancia de logger para el framework de automatización,
     permitiendo niveles de logging separados para consola y archivo.
 
+    La configuración se hace una sola vez por proceso (o por worker de pytest-xdist, con un archivo
+    de log con el sufijo del worker). Las llamadas siguientes con el mismo nombre devuelven el logger
+    ya configurado, sin abrir archivos nuevos. Los mensajes se envían a una cola (QueueHandler) y un
+    QueueListener en segundo plano los escribe en consola y archivo; los niveles de los handlers
+    quedan fijados por la primera llamada del proceso.
+
     Args:
         name (str): El nombre del logger. Por defecto, 'playwright_automation'.
         console_level (int): El nivel mínimo de logging para los mensajes que se muestran en la consola.
@@ -21,36 +143,27 @@ def setup_logger(name='playwright_automation', console_level=logging.INFO, file_
     # 1. Obtener o crear una instancia del logger
     logger = logging.getLogger(name)
 
-    # 2. Establecer el nivel mínimo para el logger. Este será el nivel más bajo (más detallado)
-    # de los dos niveles de los handlers, para asegurar que todos los mensajes estén disponibles.
-    logger.setLevel(min(console_level, file_level))
+    with _bloqueo_logger:
+        # 2. Si este logger ya se configuró en el proceso, devolverlo tal cual (sin abrir otro archivo)
+        if name in _loggers_configurados and _listener is not None:
+            return logger
 
-    # 3. Evitar que los logs se propaguen a handlers de loggers padre, lo que evita duplicación
-    logger.propagate = False
+        # 3. Iniciar la cola y el listener compartidos la primera vez (o si se detuvieron)
+        if _listener is None:
+            _iniciar_listener(console_level, file_level)
 
-    # 4. Limpiar handlers existentes para evitar duplicación si la función se llama varias veces
-    if logger.handlers:
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-
-    # 5. Definir el formato de los mensajes de log
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        # 4. Establecer el nivel mínimo para el logger. Este será el nivel más bajo (más detallado)
+        # de los dos niveles de los handlers, para asegurar que todos los mensajes estén disponibles.
+        logger.setLevel(min(console_level, file_level))
 
-    # 6. Configurar el handler para la consola (StreamHandler)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(console_level) # Nivel de log específico para la consola
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        # 5. Evitar que los logs se propaguen a handlers de loggers padre, lo que evita duplicación
+        logger.propagate = False
 
-    # 7. Configurar el handler para el archivo (FileHandler)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file_name = f"automation_log_{timestamp}.log"
-    log_file_path = os.path.join(LOGGER_DIR, log_file_name)
-
-    file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-    file_handler.setLevel(file_level) # Nivel de log específico para el archivo
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+        # 6. Sustituir los handlers existentes por un único QueueHandler hacia la cola del proceso
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        logger.addHandler(logging.handlers.QueueHandler(_cola_logs))
+        _loggers_configurados.add(name)
 
     return logger
 
@@ -0,0 +1,224 @@
+import csv
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Percentiles que se exportan por acción
+PERCENTILES = (50, 95, 99)
+
+# Etiquetas con las que se indexa cada muestra (además del nombre de la acción/métrica)
+ETIQUETAS = ("id_prueba", "navegador", "dispositivo")
+
+def percentil(valores_ordenados: List[float], p: float) -> Optional[float]:
+    """
+    Percentil por el método del rango más cercano sobre una lista ya ordenada.
+    """
+    if not valores_ordenados:
+        return None
+    rango = max(1, math.ceil(p / 100 * len(valores_ordenados)))
+    return valores_ordenados[rango - 1]
+
+def resumir(valores: Iterable[float]) -> Dict[str, Optional[float]]:
+    """
+    Devuelve número de muestras, mínimo, media, máximo y los percentiles de PERCENTILES.
+    """
+    ordenados = sorted(valores)
+    resumen = {
+        "muestras": len(ordenados),
+        "min": ordenados[0] if ordenados else None,
+        "media": sum(ordenados) / len(ordenados) if ordenados else None,
+        "max": ordenados[-1] if ordenados else None,
+    }
+    for p in PERCENTILES:
+        resumen[f"p{p}"] = percentil(ordenados, p)
+    return resumen
+
+class RegistroMetricas:
+    """
+    Registro de métricas en memoria del proceso: temporizadores, contadores e histogramas.
+
+    Cada muestra se indexa por el nombre de la acción y por el contexto de la prueba en curso
+    (id de prueba, navegador y dispositivo), que fija conftest.py con `establecer_contexto`.
+    Las duraciones se guardan en nanosegundos (`time.perf_counter_ns`). Al final de la sesión
+    se exportan a JSON (muestras crudas + resumen) y CSV (resumen con p50/p95/p99 por acción).
+    """
+
+    def __init__(self):
+        self._bloqueo = threading.Lock()
+        self._contexto = {etiqueta: "" for etiqueta in ETIQUETAS}
+        # Muestras de duración: (accion, id_prueba, navegador, dispositivo, nanosegundos)
+        self._duraciones: List[Tuple[str, str, str, str, int]] = []
+        self._contadores: Dict[Tuple[str, str, str, str], float] = defaultdict(float)
+        self._histogramas: Dict[Tuple[str, str, str, str], List[float]] = defaultdict(list)
+
+    # --- Contexto de la prueba en curso ---
+
+    def establecer_contexto(self, id_prueba: str = "", navegador: str = "", dispositivo: str = "") -> None:
+        with self._bloqueo:
+            self._contexto = {"id_prueba": id_prueba, "navegador": navegador, "dispositivo": dispositivo}
+
+    def limpiar_contexto(self) -> None:
+        self.establecer_contexto()
+
+    def _clave(self, nombre: str) -> Tuple[str, str, str, str]:
+        return (nombre, self._contexto["id_prueba"], self._contexto["navegador"], self._contexto["dispositivo"])
+
+    # --- Registro de muestras ---
+
+    def registrar_duracion_ns(self, accion: str, nanosegundos: int) -> None:
+        """
+        Registra la duración de una acción en nanosegundos.
+        """
+        with self._bloqueo:
+            self._duraciones.append(self._clave(accion) + (int(nanosegundos),))
+
+    def registrar_duracion(self, accion: str, segundos: float) -> None:
+        """
+        Registra la duración de una acción medida en segundos (p. ej. con `time.perf_counter()`).
+        """
+        self.registrar_duracion_ns(accion, int(segundos * 1_000_000_000))
+
+    @contextmanager
+    def cronometro(self, accion: str):
+        """
+        Context manager que mide con `time.perf_counter_ns` el bloque y registra su duración.
+        """
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.registrar_duracion_ns(accion, time.perf_counter_ns() - inicio)
+
+    def incrementar(self, contador: str, valor: float = 1) -> None:
+        with self._bloqueo:
+            self._contadores[self._clave(contador)] += valor
+
+    def observar(self, histograma: str, valor: float) -> None:
+        with self._bloqueo:
+            self._histogramas[self._clave(histograma)].append(valor)
+
+    # --- Consultas ---
+
+    @property
+    def total_muestras(self) -> int:
+        return len(self._duraciones)
+
+    def duraciones_ms(self, accion: str, **filtros) -> List[float]:
+        """
+        Devuelve las duraciones (en milisegundos) de una acción, opcionalmente filtradas por etiqueta.
+        """
+        indices = {etiqueta: i + 1 for i, etiqueta in enumerate(ETIQUETAS)}
+        return [m[4] / 1_000_000 for m in self._duraciones
+                if m[0] == accion and all(m[indices[k]] == v for k, v in filtros.items())]
+
+    def contador(self, nombre: str) -> float:
+        """
+        Total de un contador sumado sobre todas las pruebas, navegadores y dispositivos.
+        """
+        return sum(valor for clave, valor in self._contadores.items() if clave[0] == nombre)
+
+    def resumen_por_accion(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Resumen (en milisegundos) de cada acción sobre todas sus muestras.
+        """
+        agrupadas: Dict[str, List[float]] = defaultdict(list)
+        for accion, _, _, _, ns in self._duraciones:
+            agrupadas[accion].append(ns / 1_000_000)
+        return {accion: resumir(valores) for accion, valores in sorted(agrupadas.items())}
+
+    def resumen_por_accion_y_navegador(self) -> List[Dict]:
+        """
+        Resumen (en milisegundos) por acción, navegador y dispositivo.
+        """
+        agrupadas: Dict[Tuple[str, str, str], List[float]] = defaultdict(list)
+        for accion, _, navegador, dispositivo, ns in self._duraciones:
+            agrupadas[(accion, navegador, dispositivo)].append(ns / 1_000_000)
+        return [dict(accion=a, navegador=n, dispositivo=d, **resumir(v)) for (a, n, d), v in sorted(agrupadas.items())]
+
+    # --- Exportación ---
+
+    def a_diccionario(self) -> Dict:
+        with self._bloqueo:
+            return {
+                "generado": datetime.now().isoformat(timespec="seconds"),
+                "unidad_duraciones": "ms",
+                "acciones": self.resumen_por_accion(),
+                "acciones_por_navegador": self.resumen_por_accion_y_navegador(),
+                "contadores": [dict(zip(("nombre",) + ETIQUETAS, clave), valor=valor) for clave, valor in sorted(self._contadores.items())],
+                "histogramas": [dict(zip(("nombre",) + ETIQUETAS, clave), **resumir(valores)) for clave, valores in sorted(self._histogramas.items())],
+                "muestras": [dict(zip(("accion",) + ETIQUETAS + ("ns",), muestra)) for muestra in self._duraciones],
+            }
+
+    def a_datos(self) -> Dict[str, List]:
+        """
+        Devuelve las muestras, contadores e histogramas en crudo (solo listas, serializables por
+        execnet) para enviarlos del worker de pytest-xdist al proceso principal.
+        """
+        with self._bloqueo:
+            return {
+                "duraciones": [list(muestra) for muestra in self._duraciones],
+                "contadores": [list(clave) + [valor] for clave, valor in self._contadores.items()],
+                "histogramas": [list(clave) + [list(valores)] for clave, valores in self._histogramas.items()],
+            }
+
+    def incorporar(self, datos: Dict[str, List]) -> None:
+        """
+        Añade al registro los datos en crudo de otro registro (ver `a_datos`), p. ej. los de un worker.
+        """
+        with self._bloqueo:
+            self._duraciones.extend(tuple(muestra[:4]) + (int(muestra[4]),) for muestra in datos.get("duraciones", []))
+            for *clave, valor in datos.get("contadores", []):
+                self._contadores[tuple(clave)] += valor
+            for *clave, valores in datos.get("histogramas", []):
+                self._histogramas[tuple(clave)].extend(valores)
+
+    def exportar_json(self, ruta: str) -> str:
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.a_diccionario(), archivo, ensure_ascii=False, indent=2)
+        return ruta
+
+    def exportar_csv(self, ruta: str) -> str:
+        """
+        Exporta el resumen por acción (en milisegundos) a CSV.
+        """
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        columnas = ["accion", "muestras", "min", "media"] + [f"p{p}" for p in PERCENTILES] + ["max"]
+        with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=columnas)
+            escritor.writeheader()
+            for accion, resumen in self.resumen_por_accion().items():
+                fila = {"accion": accion}
+                fila.update({k: (f"{v:.3f}" if isinstance(v, float) else v) for k, v in resumen.items()})
+                escritor.writerow(fila)
+        return ruta
+
+    def exportar(self, directorio: str, prefijo: str = "metricas") -> Tuple[str, str]:
+        """
+        Exporta JSON y CSV al directorio indicado con un nombre con marca de tiempo
+        (y el id del worker de pytest-xdist, si aplica).
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        base = f"{prefijo}_{timestamp}" + (f"_{worker}" if worker else "")
+        return (self.exportar_json(os.path.join(directorio, f"{base}.json")),
+                self.exportar_csv(os.path.join(directorio, f"{base}.csv")))
+
+
+# Registro compartido por todo el proceso (o worker de pytest-xdist)
+_registro: Optional[RegistroMetricas] = None
+
+def obtener_registro_metricas() -> RegistroMetricas:
+    """
+    Devuelve el registro de métricas del proceso, creándolo la primera vez que se necesita.
+    """
+    global _registro
+    if _registro is None:
+        _registro = RegistroMetricas()
+    return _registro
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from Simples.utils.metrics import RegistroMetricas
+
+# Nombre del fixture parametrizado con la matriz de navegadores y dispositivos (ver conftest.py)
+FIXTURE_MATRIZ = "playwright_page"
+
+# Identificador del proceso cuando la ejecución no es paralela
+PROCESO_PRINCIPAL = "principal"
+
+def grupo_navegador(item) -> Optional[str]:
+    """
+    Devuelve el motor de navegador ('chromium', 'firefox', 'webkit') con el que se ejecuta la prueba,
+    o None si la prueba no está parametrizada por la matriz de navegadores.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    parametro = callspec.params.get(FIXTURE_MATRIZ)
+    if not isinstance(parametro, dict):
+        return None
+    return parametro.get("browser")
+
+def aplicar_afinidad_navegador(items: list, marcador) -> int:
+    """
+    Marca cada prueba de la matriz con `xdist_group(<motor>)` para que el reparto 'loadgroup' de
+    pytest-xdist envíe todas las pruebas de un mismo motor al mismo worker, y guarda el motor en
+    `user_properties` (viaja con los reportes del worker al proceso principal).
+
+    Args:
+        items (list): Pruebas recolectadas por pytest.
+        marcador: `pytest.mark.xdist_group`.
+
+    Returns:
+        int: Número de pruebas marcadas.
+    """
+    marcadas = 0
+    for item in items:
+        navegador = grupo_navegador(item)
+        if navegador is None:
+            continue
+        item.add_marker(marcador(name=navegador))
+        item.user_properties.append(("navegador", navegador))
+        marcadas += 1
+    return marcadas
+
+def id_worker(reporte) -> str:
+    """
+    Devuelve el id del worker de pytest-xdist que generó el reporte ('gw0', ...) o 'principal'.
+    En el proceso principal de xdist, cada reporte recibido lleva el nodo del worker en 'reporte.node'.
+    """
+    nodo = getattr(reporte, "node", None)
+    gateway = getattr(nodo, "gateway", None)
+    if gateway is not None:
+        return gateway.id
+    return os.environ.get("PYTEST_XDIST_WORKER", PROCESO_PRINCIPAL)
+
+class ResultadosMatriz:
+    """
+    Resultados de las pruebas de la sesión agrupados por worker y por navegador.
+
+    En una ejecución con pytest-xdist el proceso principal recibe los reportes de todos los workers,
+    así que registrándolos allí (hook `pytest_runtest_logreport`) se obtiene el resultado combinado.
+    Al finalizar la sesión, junto con las métricas combinadas, se exporta a JSON.
+    """
+
+    def __init__(self):
+        self._bloqueo = threading.Lock()
+        self._pruebas: Dict[str, Dict] = {}
+
+    def registrar(self, reporte) -> None:
+        """
+        Registra el reporte de una fase. El resultado de la prueba es el de la fase 'call', salvo
+        que falle (o se omita) el setup o falle el teardown.
+        """
+        if reporte.when != "call" and not (reporte.failed or reporte.skipped):
+            return
+        with self._bloqueo:
+            prueba = self._pruebas.setdefault(reporte.nodeid, {
+                "id_prueba": reporte.nodeid,
+                "worker": id_worker(reporte),
+                "navegador": dict(reporte.user_properties).get("navegador", ""),
+                "resultado": "passed",
+                "duracion_s": 0.0,
+            })
+            prueba["duracion_s"] = round(prueba["duracion_s"] + reporte.duration, 4)
+            if reporte.failed:
+                prueba["resultado"] = "error" if reporte.when != "call" else "failed"
+            elif reporte.skipped and prueba["resultado"] == "passed":
+                prueba["resultado"] = "skipped"
+
+    @property
+    def total(self) -> int:
+        return len(self._pruebas)
+
+    def resumen(self, campo: str) -> Dict[str, Dict[str, int]]:
+        """
+        Cuenta los resultados por 'worker' o por 'navegador'.
+        """
+        conteo: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for prueba in self._pruebas.values():
+            conteo[prueba[campo] or "-"][prueba["resultado"]] += 1
+        return {clave: dict(valores) for clave, valores in sorted(conteo.items())}
+
+    def a_diccionario(self) -> Dict:
+        with self._bloqueo:
+            return {
+                "generado": datetime.now().isoformat(timespec="seconds"),
+                "total": self.total,
+                "por_worker": self.resumen("worker"),
+                "por_navegador": self.resumen("navegador"),
+                "pruebas": sorted(self._pruebas.values(), key=lambda p: (p["worker"], p["id_prueba"])),
+            }
+
+    def exportar(self, directorio: str, prefijo: str = "resultados") -> str:
+        ruta = os.path.join(directorio, f"{prefijo}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        os.makedirs(directorio, exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.a_diccionario(), archivo, ensure_ascii=False, indent=2)
+        return ruta
+
+def combinar_metricas(datos_workers: List[Dict]) -> RegistroMetricas:
+    """
+    Combina en un único registro las métricas en crudo enviadas por cada worker (ver `RegistroMetricas.a_datos`).
+    """
+    registro = RegistroMetricas()
+    for datos in datos_workers:
+        registro.incorporar(datos)
+    return registro
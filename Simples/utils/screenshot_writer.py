@@ -0,0 +1,154 @@
+import io
+import os
+import queue
+import threading
+import time
+import logging
+from typing import Optional
+
+# Pillow es opcional: solo se necesita para transcodificar las capturas a WebP.
+try:
+    from PIL import Image
+except ImportError: # pragma: no cover - depende del entorno
+    Image = None
+
+# Formatos de captura soportados. 'png' y 'jpeg' los codifica el propio navegador;
+# 'webp' se captura como PNG y se transcodifica en el hilo escritor (requiere Pillow).
+FORMATOS_CAPTURA = ("png", "jpeg", "webp")
+
+# Objeto centinela que indica al hilo escritor que debe terminar
+_FIN = object()
+
+class EscritorCapturas:
+    """
+    Escritor de capturas de pantalla en segundo plano.
+
+    El hilo de la prueba solo obtiene los bytes de la captura (`page.screenshot()` sin `path`)
+    y los encola; un hilo escritor se encarga de la transcodificación opcional (WebP) y de la
+    escritura en disco. La cola es acotada: si el disco no da abasto y se llena, `encolar`
+    bloquea al hilo de la prueba hasta que haya sitio (backpressure), de modo que la memoria
+    usada por capturas pendientes nunca supera `max_pendientes` imágenes.
+    """
+
+    def __init__(self, max_pendientes: int = 16, formato: str = "png", calidad: int = 80):
+        if formato not in FORMATOS_CAPTURA:
+            raise ValueError(f"\nEl formato de captura '{formato}' no es compatible. Formatos disponibles: {', '.join(FORMATOS_CAPTURA)}")
+        if formato == "webp" and Image is None:
+            logging.getLogger("playwright_automation").warning(
+                "\n⚠️ Pillow no está instalado; las capturas se guardarán en PNG en lugar de WebP.")
+            formato = "png"
+        self.formato = formato
+        self.calidad = calidad
+        self._cola: "queue.Queue" = queue.Queue(maxsize=max(1, max_pendientes))
+        # Estadísticas del escritor (útiles para benchmarks y para el resumen de la sesión)
+        self.escritas = 0
+        self.errores = 0
+        self.segundos_bloqueado = 0.0
+        self._hilo = threading.Thread(target=self._procesar, name="escritor-capturas", daemon=True)
+        self._hilo.start()
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.formato == "jpeg" else self.formato
+
+    def opciones_captura(self) -> dict:
+        """
+        Devuelve las opciones de `page.screenshot()` que corresponden al formato configurado.
+        """
+        if self.formato == "jpeg":
+            return {"type": "jpeg", "quality": self.calidad}
+        # PNG y WebP: el navegador entrega PNG (WebP se transcodifica en segundo plano)
+        return {"type": "png"}
+
+    def encolar(self, ruta_sin_extension: str, datos: bytes) -> str:
+        """
+        Encola los bytes de una captura para escribirlos en segundo plano.
+
+        Args:
+            ruta_sin_extension (str): Ruta del archivo de destino sin extensión.
+            datos (bytes): Bytes de la imagen tal como los devolvió `page.screenshot()`.
+
+        Returns:
+            str: La ruta completa (con extensión) donde quedará guardada la captura.
+        """
+        ruta_completa = f"{ruta_sin_extension}.{self.extension}"
+        inicio = time.perf_counter()
+        self._cola.put((ruta_completa, datos)) # Bloquea si la cola está llena (backpressure)
+        self.segundos_bloqueado += time.perf_counter() - inicio
+        return ruta_completa
+
+    def _procesar(self) -> None:
+        while True:
+            elemento = self._cola.get()
+            try:
+                if elemento is _FIN:
+                    return
+                ruta_completa, datos = elemento
+                self._escribir(ruta_completa, datos)
+                self.escritas += 1
+            except Exception as e:
+                self.errores += 1
+                logging.getLogger("playwright_automation").error(f"\n ❌ Error al escribir la captura de pantalla en segundo plano: {e}")
+            finally:
+                self._cola.task_done()
+
+    def _escribir(self, ruta_completa: str, datos: bytes) -> None:
+        if self.formato == "webp":
+            with Image.open(io.BytesIO(datos)) as imagen:
+                buffer = io.BytesIO()
+                imagen.save(buffer, format="WEBP", quality=self.calidad)
+                datos = buffer.getvalue()
+        os.makedirs(os.path.dirname(ruta_completa) or ".", exist_ok=True)
+        with open(ruta_completa, "wb") as archivo:
+            archivo.write(datos)
+
+    def vaciar(self) -> None:
+        """
+        Bloquea hasta que todas las capturas encoladas estén escritas en disco.
+        """
+        self._cola.join()
+
+    def cerrar(self) -> None:
+        """
+        Escribe las capturas pendientes y detiene el hilo escritor.
+        """
+        if not self._hilo.is_alive():
+            return
+        self._cola.put(_FIN)
+        self._hilo.join()
+
+
+# Escritor compartido por todo el proceso (o worker de pytest-xdist)
+_escritor: Optional[EscritorCapturas] = None
+_bloqueo_escritor = threading.Lock()
+
+def obtener_escritor_capturas() -> EscritorCapturas:
+    """
+    Devuelve el escritor de capturas del proceso, creándolo con la configuración de config.py
+    la primera vez que se necesita.
+    """
+    global _escritor
+    with _bloqueo_escritor:
+        if _escritor is None:
+            from Simples.utils import config
+            _escritor = EscritorCapturas(max_pendientes=config.CAPTURA_MAX_PENDIENTES,
+                                         formato=config.CAPTURA_FORMATO,
+                                         calidad=config.CAPTURA_CALIDAD)
+        return _escritor
+
+def vaciar_escritor_capturas() -> None:
+    """
+    Espera a que se escriban las capturas pendientes, si hay un escritor activo.
+    """
+    if _escritor is not None:
+        _escritor.vaciar()
+
+def cerrar_escritor_capturas() -> None:
+    """
+    Escribe las capturas pendientes y detiene el escritor del proceso. Se llama al finalizar la sesión.
+    """
+    global _escritor
+    with _bloqueo_escritor:
+        if _escritor is not None:
+            _escritor.cerrar()
+            _escritor = None
@@ -0,0 +1,127 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext # Importa clases necesarias de Playwright
+from Simples.utils.browser_pool import NAVEGADORES_SOPORTADOS
+
+class CacheEstadoAlmacenamiento:
+    """
+    Caché de instantáneas de `storage_state` (cookies y localStorage) por tipo de navegador.
+
+    La primera vez que una prueba pide el estado de un navegador en la sesión, se comprueba la instantánea
+    guardada en disco: si no existe, se generó para otra BASE_URL o es más antigua que `max_edad` segundos,
+    se abre un contexto temporal, se visita BASE_URL y se guarda el estado resultante. Las pruebas crean
+    sus contextos con `storage_state=<ruta>`, así que empiezan con las cookies y el almacenamiento local
+    ya inicializados (consentimientos, preferencias, identificadores de la aplicación) en lugar de vacíos.
+
+    Cada instantánea '<navegador>.<origen>.json' va acompañada de '<navegador>.<origen>.meta.json' con la
+    BASE_URL y la fecha de creación. El origen (host y puerto) forma parte del nombre, así que sesiones o
+    workers con BASE_URL distintas no se sobrescriben las instantáneas entre sí. La escritura es atómica
+    (archivo temporal + `os.replace`), de modo que varios workers de pytest-xdist pueden compartir el
+    directorio sin leer archivos a medio escribir.
+    """
+
+    def __init__(self, directorio: str, base_url: str, max_edad: float,
+                 obtener_navegador: Callable[[str], Browser], timeout_ms: float = 30000,
+                 preparar_contexto: Optional[Callable[[BrowserContext], object]] = None):
+        self.directorio = directorio
+        self.base_url = base_url
+        self.max_edad = max_edad
+        self.timeout_ms = timeout_ms
+        self._obtener_navegador = obtener_navegador
+        # Origen de BASE_URL apto para nombre de archivo ('demoqa.com', '127.0.0.1_8000')
+        self._origen = re.sub(r"[^A-Za-z0-9.-]", "_", urlsplit(base_url).netloc or base_url)
+        # Se aplica al contexto temporal antes de visitar BASE_URL (p. ej. el filtro de red)
+        self._preparar_contexto = preparar_contexto
+        self._bloqueo = threading.Lock()
+        # Ruta validada (o None si no se pudo generar) por tipo de navegador durante la sesión
+        self._rutas: Dict[str, Optional[str]] = {}
+        # Instantáneas generadas en esta sesión (las demás se reutilizaron del disco)
+        self.generadas: Dict[str, int] = {}
+
+    def _ruta(self, browser_type: str) -> str:
+        return os.path.join(self.directorio, f"{browser_type}.{self._origen}.json")
+
+    def _ruta_meta(self, browser_type: str) -> str:
+        return os.path.join(self.directorio, f"{browser_type}.{self._origen}.meta.json")
+
+    def es_valida(self, browser_type: str) -> bool:
+        """
+        Indica si la instantánea en disco del navegador existe, es de la BASE_URL actual y no ha caducado.
+        """
+        if not os.path.exists(self._ruta(browser_type)):
+            return False
+        try:
+            with open(self._ruta_meta(browser_type), encoding="utf-8") as archivo:
+                meta = json.load(archivo)
+        except (OSError, ValueError):
+            return False
+        if meta.get("base_url") != self.base_url:
+            return False
+        return time.time() - float(meta.get("creado", 0)) <= self.max_edad
+
+    def _escribir_atomico(self, ruta: str, contenido: str) -> None:
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+
+    def _generar(self, browser_type: str) -> str:
+        """
+        Visita BASE_URL en un contexto temporal del navegador y guarda su `storage_state` en disco.
+        """
+        contexto = self._obtener_navegador(browser_type).new_context()
+        try:
+            if self._preparar_contexto is not None:
+                self._preparar_contexto(contexto)
+            pagina = contexto.new_page()
+            pagina.goto(self.base_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+            estado = contexto.storage_state()
+        finally:
+            contexto.close()
+        os.makedirs(self.directorio, exist_ok=True)
+        self._escribir_atomico(self._ruta(browser_type), json.dumps(estado, ensure_ascii=False))
+        self._escribir_atomico(self._ruta_meta(browser_type),
+                               json.dumps({"base_url": self.base_url, "creado": time.time()}))
+        self.generadas[browser_type] = self.generadas.get(browser_type, 0) + 1
+        return self._ruta(browser_type)
+
+    def obtener(self, browser_type: str) -> Optional[str]:
+        """
+        Devuelve la ruta de la instantánea del navegador para `Browser.new_context(storage_state=...)`,
+        generándola si hace falta. Se comprueba una sola vez por navegador y sesión. Si no se puede
+        generar (p. ej. la aplicación no responde) devuelve None y las pruebas usan un contexto vacío.
+        """
+        with self._bloqueo:
+            if browser_type in self._rutas:
+                return self._rutas[browser_type]
+            ruta = self._ruta(browser_type)
+            if not self.es_valida(browser_type):
+                try:
+                    ruta = self._generar(browser_type)
+                except Exception as e:
+                    logging.getLogger("playwright_automation").warning(
+                        f"\n⚠️ No se pudo generar el storage_state de '{browser_type}': {e}. Las pruebas usarán un contexto vacío.")
+                    ruta = None
+            self._rutas[browser_type] = ruta
+            return ruta
+
+    def invalidar(self, browser_type: Optional[str] = None) -> None:
+        """
+        Borra la instantánea de un navegador (o de todos) para que se regenere en el siguiente uso.
+        """
+        with self._bloqueo:
+            tipos = [browser_type] if browser_type else NAVEGADORES_SOPORTADOS
+            for tipo in tipos:
+                self._rutas.pop(tipo, None)
+                for ruta in (self._ruta(tipo), self._ruta_meta(tipo)):
+                    try:
+                        os.remove(ruta)
+                    except FileNotFoundError:
+                        pass
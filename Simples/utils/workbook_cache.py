@@ -0,0 +1,137 @@
+import os
+import threading
+from collections import OrderedDict
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Tuple
+
+import openpyxl # Librería para hacer uso del excel (para archivos .xlsx)
+
+class TablaHoja:
+    """
+    Contenido de una hoja de Excel guardado por columnas: 'columnas[c][f]' es el valor de la celda
+    de la columna física c+1 y la fila física f+1. Incluye un mapa del encabezado (primera fila física,
+    normalizado con strip().lower()) a su índice de columna, así que buscar una columna por nombre
+    y leer una celda son consultas O(1).
+    """
+
+    def __init__(self, filas: List[Tuple[Any, ...]]):
+        self.num_filas = len(filas)
+        self.columnas: List[Tuple[Any, ...]] = list(zip_longest(*filas)) if filas else []
+        self.num_columnas = len(self.columnas)
+        self.encabezados: Dict[str, int] = {}
+        if filas:
+            for indice, valor in enumerate(filas[0], 1):
+                # Si hay encabezados repetidos gana el primero, como en la búsqueda lineal original
+                if valor is not None:
+                    self.encabezados.setdefault(str(valor).strip().lower(), indice)
+
+    def indice_columna(self, nombre: str) -> Optional[int]:
+        """
+        Índice físico (basado en 1) de la columna cuyo encabezado coincide con 'nombre', o None.
+        """
+        return self.encabezados.get(nombre.strip().lower())
+
+    def celda(self, fila: int, columna: int) -> Any:
+        """
+        Valor de la celda en la fila y columna físicas (basadas en 1). Las posiciones deben estar validadas.
+        """
+        return self.columnas[columna - 1][fila - 1]
+
+class CacheLibrosExcel:
+    """
+    Caché LRU de libros de Excel para los lectores de datos de 'Funciones_Globales'.
+
+    Cada entrada se identifica por la ruta absoluta del libro y su fecha de modificación y tamaño,
+    así que si el archivo cambia en disco la siguiente consulta lo vuelve a leer. Las hojas se cargan
+    bajo demanda con `load_workbook(read_only=True, data_only=True)` (lectura en streaming y valores
+    calculados de las fórmulas) y se guardan como `TablaHoja`. Al superar 'max_libros' se descarta el
+    libro usado hace más tiempo.
+    """
+
+    def __init__(self, max_libros: int = 8):
+        self.max_libros = max(1, max_libros)
+        self._libros: "OrderedDict[Tuple[str, int, int], Dict[str, TablaHoja]]" = OrderedDict()
+        self._bloqueo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    @staticmethod
+    def _clave(ruta: str) -> Tuple[str, int, int]:
+        # os.stat lanza FileNotFoundError si el archivo no existe, igual que openpyxl.load_workbook
+        estado = os.stat(ruta)
+        return (os.path.abspath(ruta), estado.st_mtime_ns, estado.st_size)
+
+    @staticmethod
+    def _leer_hoja(ruta: str, hoja: str) -> TablaHoja:
+        libro = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
+        try:
+            sheet = libro[hoja] # Lanza KeyError si la hoja no existe
+            # En modo solo lectura openpyxl confía en la dimensión que declara el archivo, que algunos
+            # generadores escriben mal; se descarta para recorrer todas las filas realmente presentes.
+            sheet.reset_dimensions()
+            return TablaHoja(list(sheet.iter_rows(values_only=True)))
+        finally:
+            libro.close() # En modo solo lectura el archivo queda abierto hasta cerrar el libro
+
+    def obtener_hoja(self, ruta: str, hoja: str) -> Tuple[TablaHoja, bool]:
+        """
+        Devuelve la tabla de la hoja y si se sirvió desde la caché.
+
+        Raises:
+            FileNotFoundError: Si el libro no existe.
+            KeyError: Si la hoja no existe en el libro.
+        """
+        clave = self._clave(ruta)
+        with self._bloqueo:
+            hojas = self._libros.get(clave)
+            if hojas is not None:
+                self._libros.move_to_end(clave)
+                if hoja in hojas:
+                    self.aciertos += 1
+                    return hojas[hoja], True
+
+        # La lectura se hace fuera del bloqueo: dos hilos pueden leer la misma hoja a la vez,
+        # pero ninguno bloquea a los que consultan otros libros ya cargados.
+        tabla = self._leer_hoja(ruta, hoja)
+        with self._bloqueo:
+            self.fallos += 1
+            # Se descartan las versiones anteriores del mismo libro (otra fecha de modificación o tamaño)
+            for clave_antigua in [c for c in self._libros if c[0] == clave[0] and c != clave]:
+                del self._libros[clave_antigua]
+            self._libros.setdefault(clave, {})[hoja] = tabla
+            self._libros.move_to_end(clave)
+            while len(self._libros) > self.max_libros:
+                self._libros.popitem(last=False)
+        return tabla, False
+
+    def invalidar(self, ruta: Optional[str] = None) -> None:
+        """
+        Descarta de la caché un libro o, sin 'ruta', todos.
+        """
+        with self._bloqueo:
+            if ruta is None:
+                self._libros.clear()
+                return
+            ruta_absoluta = os.path.abspath(ruta)
+            for clave in [c for c in self._libros if c[0] == ruta_absoluta]:
+                del self._libros[clave]
+
+    def __len__(self) -> int:
+        return len(self._libros)
+
+
+# Caché compartida por todo el proceso (o worker de pytest-xdist)
+_cache: Optional[CacheLibrosExcel] = None
+_bloqueo_cache = threading.Lock()
+
+def obtener_cache_libros() -> CacheLibrosExcel:
+    """
+    Devuelve la caché de libros de Excel del proceso, creándola con la configuración de config.py
+    la primera vez que se necesita.
+    """
+    global _cache
+    with _bloqueo_cache:
+        if _cache is None:
+            from Simples.utils import config
+            _cache = CacheLibrosExcel(max_libros=config.EXCEL_CACHE_MAX_LIBROS)
+        return _cache
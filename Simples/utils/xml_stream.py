@@ -0,0 +1,101 @@
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+def _coincide(ruta_actual: Tuple[str, ...], etiqueta: Optional[str]) -> bool:
+    """
+    Indica si el elemento con la ruta 'ruta_actual' (etiquetas desde la raíz) es un registro.
+    - None: los hijos directos de la raíz.
+    - 'record': cualquier elemento con esa etiqueta.
+    - 'dataset/record' o '/dataset/record': la ruta completa desde la raíz.
+    - './/grupo/record': los elementos cuya ruta termina así, a cualquier profundidad.
+    En las rutas, '*' sustituye a una etiqueta cualquiera ('*/record').
+    """
+    if etiqueta is None:
+        return len(ruta_actual) == 2
+    if "/" not in etiqueta:
+        return ruta_actual[-1] == etiqueta
+    absoluta = etiqueta.startswith("/")
+    partes = [parte for parte in etiqueta.lstrip("./").split("/") if parte]
+    if absoluta or not etiqueta.startswith("."):
+        if len(partes) != len(ruta_actual):
+            return False
+    elif len(partes) > len(ruta_actual):
+        return False
+    return all(parte in ("*", actual) for parte, actual in zip(partes, ruta_actual[-len(partes):]))
+
+def _valor_campo(elemento: ET.Element, campo: str) -> Optional[str]:
+    # '@nombre' es un atributo del registro; cualquier otro campo, el texto del primer hijo con esa etiqueta
+    if campo.startswith("@"):
+        return elemento.get(campo[1:])
+    hijo = elemento.find(campo)
+    if hijo is None:
+        return None
+    return (hijo.text or "").strip()
+
+def iterar_registros_xml(ruta: str, etiqueta: Optional[str] = None,
+                         campos: Optional[Sequence[str]] = None) -> Iterator[Union[ET.Element, tuple]]:
+    """
+    Recorre en streaming (`ET.iterparse`) los registros de un archivo XML, sin construir el árbol completo.
+
+    Cada registro procesado (y cada contenedor ya cerrado fuera de un registro) se vacía (`clear`) y se retira
+    de su padre en cuanto el consumidor pide el siguiente, así que la memoria no crece con el tamaño del
+    archivo: solo se mantiene el registro en curso y la cadena de sus antecesores.
+
+    Args:
+        ruta (str): Ruta del archivo XML.
+        etiqueta (Optional[str]): Qué elementos son registros: una etiqueta ('record'), una ruta desde la raíz
+                                  ('dataset/record') o relativa ('.//record'). Por defecto, los hijos de la raíz.
+        campos (Optional[Sequence[str]]): Si se indican, cada registro se proyecta en una tupla con nombre
+                                          con esos campos: el texto del hijo con esa etiqueta o, con el
+                                          prefijo '@', el atributo del registro (None si no existe).
+
+    Yields:
+        ET.Element o tuple: El elemento del registro (válido solo hasta pedir el siguiente, porque después se
+                            vacía) o su proyección en una tupla, que sí puede conservarse.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ET.ParseError: Si el XML no está bien formado.
+    """
+    tipo_tupla = namedtuple("RegistroXml", [campo.lstrip("@") for campo in campos], rename=True) if campos else None
+    pila = [] # Elementos abiertos, desde la raíz hasta el actual
+    registros = [] # Si cada elemento de 'pila' es un registro
+    registros_abiertos = 0
+    # Solo las rutas necesitan las etiquetas de todos los antecesores; una etiqueta simple se compara directamente
+    por_ruta = etiqueta is not None and "/" in etiqueta
+    ruta_actual = [] # Etiquetas de 'pila' (solo con 'por_ruta')
+    for evento, elemento in ET.iterparse(ruta, events=("start", "end")):
+        if evento == "start":
+            pila.append(elemento)
+            if por_ruta:
+                ruta_actual.append(elemento.tag)
+                es_registro = _coincide(tuple(ruta_actual), etiqueta)
+            elif etiqueta is None:
+                es_registro = len(pila) == 2
+            else:
+                es_registro = elemento.tag == etiqueta
+            registros.append(es_registro)
+            registros_abiertos += es_registro
+            continue
+        pila.pop()
+        if por_ruta:
+            ruta_actual.pop()
+        es_registro = registros.pop()
+        if es_registro:
+            registros_abiertos -= 1
+            if tipo_tupla is not None:
+                yield tipo_tupla(*(_valor_campo(elemento, campo) for campo in campos))
+            else:
+                yield elemento
+            if registros_abiertos:
+                # Registro anidado en otro registro: forma parte del contenido del exterior
+                continue
+        elif registros_abiertos or not pila:
+            # Un campo de un registro todavía abierto (o la raíz): se conserva
+            continue
+        # Se libera el elemento ya procesado (un registro o un contenedor fuera de cualquier registro):
+        # su contenido y la referencia desde su padre
+        elemento.clear()
+        if pila:
+            pila[-1].remove(elemento)